@@ -0,0 +1,31 @@
+"""Add term_results to dice_rolls
+
+Revision ID: 3c1f6a2d9b47
+Revises: eef7a1859ae9
+Create Date: 2026-10-18 09:12:31.482113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f6a2d9b47"
+down_revision: Union[str, None] = "eef7a1859ae9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("dice_rolls", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("term_results", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("dice_rolls", schema=None) as batch_op:
+        batch_op.drop_column("term_results")
@@ -0,0 +1,51 @@
+"""Add scene and act context digests
+
+Revision ID: 7b2d0e6f4c19
+Revises: e3a9c15b7d40
+Create Date: 2026-10-18 20:41:37.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2d0e6f4c19"
+down_revision: Union[str, None] = "e3a9c15b7d40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "context_digests",
+        sa.Column("owner_id", sa.String(), nullable=False),
+        sa.Column("scope", sa.String(length=10), nullable=False),
+        sa.Column("act_id", sa.String(), nullable=False),
+        sa.Column("scene_id", sa.String(), nullable=True),
+        sa.Column("digest", sa.Text(), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("through_created_at", sa.DateTime(), nullable=True),
+        sa.Column("through_event_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["act_id"], ["acts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["scene_id"], ["scenes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("owner_id"),
+    )
+    with op.batch_alter_table("context_digests", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_context_digests_act_id"), ["act_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("context_digests", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_context_digests_act_id"))
+
+    op.drop_table("context_digests")
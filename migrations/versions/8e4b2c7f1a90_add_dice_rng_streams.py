@@ -0,0 +1,58 @@
+"""Add seeded dice streams to games and dice_rolls
+
+Revision ID: 8e4b2c7f1a90
+Revises: 3c1f6a2d9b47
+Create Date: 2026-10-18 10:03:47.215906
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from sologm.utils.dice_rng import new_seed
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b2c7f1a90"
+down_revision: Union[str, None] = "3c1f6a2d9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("games", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rng_seed", sa.BigInteger(), nullable=True))
+        batch_op.add_column(
+            sa.Column("rng_counter", sa.Integer(), nullable=False, server_default="0")
+        )
+
+    # Existing games each get their own random seed.
+    connection = op.get_bind()
+    games = sa.table("games", sa.column("id", sa.String), sa.column("rng_seed"))
+    for (game_id,) in connection.execute(sa.select(games.c.id)).fetchall():
+        connection.execute(
+            games.update()
+            .where(games.c.id == game_id)
+            .values(rng_seed=new_seed())
+        )
+
+    with op.batch_alter_table("games", schema=None) as batch_op:
+        batch_op.alter_column("rng_seed", existing_type=sa.BigInteger(), nullable=False)
+
+    with op.batch_alter_table("dice_rolls", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("rng_seed", sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column("rng_counter", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("dice_rolls", schema=None) as batch_op:
+        batch_op.drop_column("rng_counter")
+        batch_op.drop_column("rng_seed")
+
+    with op.batch_alter_table("games", schema=None) as batch_op:
+        batch_op.drop_column("rng_counter")
+        batch_op.drop_column("rng_seed")
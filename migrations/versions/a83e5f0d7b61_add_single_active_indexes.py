@@ -0,0 +1,81 @@
+"""Allow at most one active game, act per game and scene per act
+
+Revision ID: a83e5f0d7b61
+Revises: f61b0a9d3c25
+Create Date: 2026-10-18 16:40:09.215733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a83e5f0d7b61"
+down_revision: Union[str, None] = "f61b0a9d3c25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, scope column or None, ordering column, index name)
+ACTIVE_INDEXES = (
+    ("games", None, "modified_at", "uix_single_active_game"),
+    ("acts", "game_id", "sequence", "uix_game_active_act"),
+    ("scenes", "act_id", "sequence", "uix_act_active_scene"),
+)
+
+# Partial indexes are only available on these backends
+SUPPORTED_DIALECTS = ("sqlite", "postgresql")
+
+
+def _deactivate_extras(table_name: str, scope: Union[str, None], order: str) -> None:
+    """Keep only the latest active row per scope active.
+
+    Concurrent activations could previously leave several rows active.
+    """
+    connection = op.get_bind()
+    columns = [sa.column("id", sa.String), sa.column("is_active", sa.Boolean)]
+    columns.append(sa.column(order))
+    if scope is not None:
+        columns.append(sa.column(scope, sa.String))
+    table = sa.table(table_name, *columns)
+    scope_col = table.c[scope] if scope is not None else sa.literal(None)
+
+    rows = connection.execute(
+        sa.select(table.c.id, scope_col)
+        .where(table.c.is_active == sa.true())
+        .order_by(table.c[order].desc())
+    ).fetchall()
+
+    seen = set()
+    for row_id, scope_id in rows:
+        if scope_id not in seen:
+            seen.add(scope_id)
+            continue
+        connection.execute(
+            table.update().where(table.c.id == row_id).values(is_active=False)
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    for table_name, scope, order, index in ACTIVE_INDEXES:
+        _deactivate_extras(table_name, scope, order)
+        if dialect in SUPPORTED_DIALECTS:
+            op.create_index(
+                index,
+                table_name,
+                [scope or "is_active"],
+                unique=True,
+                sqlite_where=sa.text("is_active"),
+                postgresql_where=sa.text("is_active"),
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name not in SUPPORTED_DIALECTS:
+        return
+    for table_name, _, _, index in reversed(ACTIVE_INDEXES):
+        op.drop_index(index, table_name=table_name)
@@ -0,0 +1,95 @@
+"""Denormalize act_id and game_id onto scene-owned tables
+
+Revision ID: b5d93e0c4f12
+Revises: 8e4b2c7f1a90
+Create Date: 2026-10-18 11:26:05.731448
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d93e0c4f12"
+down_revision: Union[str, None] = "8e4b2c7f1a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, nullable) for every table that gains act_id/game_id columns
+TABLES = [
+    ("events", False),
+    ("dice_rolls", True),
+    ("interpretation_sets", False),
+    ("interpretations", False),
+]
+
+
+def _add_columns(table: str) -> None:
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.add_column(sa.Column("act_id", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("game_id", sa.String(), nullable=True))
+
+
+def _finalize_columns(table: str, nullable: bool) -> None:
+    with op.batch_alter_table(table, schema=None) as batch_op:
+        batch_op.alter_column("act_id", existing_type=sa.String(), nullable=nullable)
+        batch_op.alter_column("game_id", existing_type=sa.String(), nullable=nullable)
+        batch_op.create_index(f"ix_{table}_act_id", ["act_id"])
+        batch_op.create_index(f"ix_{table}_game_id", ["game_id"])
+        batch_op.create_foreign_key(
+            f"fk_{table}_act_id_acts", "acts", ["act_id"], ["id"], ondelete="CASCADE"
+        )
+        batch_op.create_foreign_key(
+            f"fk_{table}_game_id_games",
+            "games",
+            ["game_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, _ in TABLES:
+        _add_columns(table)
+
+    # Backfill from the scene hierarchy. Interpretations copy from their set,
+    # so interpretation_sets must be filled first.
+    for table in ("events", "dice_rolls", "interpretation_sets"):
+        op.execute(
+            f"""
+            UPDATE {table} SET
+                act_id = (SELECT scenes.act_id FROM scenes
+                          WHERE scenes.id = {table}.scene_id),
+                game_id = (SELECT acts.game_id FROM scenes
+                           JOIN acts ON acts.id = scenes.act_id
+                           WHERE scenes.id = {table}.scene_id)
+            """
+        )
+    op.execute(
+        """
+        UPDATE interpretations SET
+            act_id = (SELECT interpretation_sets.act_id FROM interpretation_sets
+                      WHERE interpretation_sets.id = interpretations.set_id),
+            game_id = (SELECT interpretation_sets.game_id FROM interpretation_sets
+                       WHERE interpretation_sets.id = interpretations.set_id)
+        """
+    )
+
+    for table, nullable in TABLES:
+        _finalize_columns(table, nullable)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in reversed(TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f"fk_{table}_game_id_games", type_="foreignkey")
+            batch_op.drop_constraint(f"fk_{table}_act_id_acts", type_="foreignkey")
+            batch_op.drop_index(f"ix_{table}_game_id")
+            batch_op.drop_index(f"ix_{table}_act_id")
+            batch_op.drop_column("game_id")
+            batch_op.drop_column("act_id")
@@ -0,0 +1,39 @@
+"""Add version columns for optimistic concurrency
+
+Revision ID: c4f7e2a91d58
+Revises: a83e5f0d7b61
+Create Date: 2026-10-18 17:58:44.120394
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f7e2a91d58"
+down_revision: Union[str, None] = "a83e5f0d7b61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("games", "acts", "scenes", "events")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in VERSIONED_TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    "version_id", sa.Integer(), nullable=False, server_default="1"
+                )
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(VERSIONED_TABLES):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column("version_id")
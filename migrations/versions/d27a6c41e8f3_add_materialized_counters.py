@@ -0,0 +1,66 @@
+"""Add materialized relationship counters
+
+Revision ID: d27a6c41e8f3
+Revises: b5d93e0c4f12
+Create Date: 2026-10-18 13:41:09.552183
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d27a6c41e8f3"
+down_revision: Union[str, None] = "b5d93e0c4f12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (parent table, counter column, child table, child foreign key)
+COUNTERS = (
+    ("games", "act_count", "acts", "game_id"),
+    ("acts", "scene_count", "scenes", "act_id"),
+    ("acts", "event_count", "events", "act_id"),
+    ("acts", "dice_roll_count", "dice_rolls", "act_id"),
+    ("acts", "interpretation_count", "interpretations", "act_id"),
+    ("scenes", "event_count", "events", "scene_id"),
+    ("scenes", "dice_roll_count", "dice_rolls", "scene_id"),
+    ("scenes", "interpretation_set_count", "interpretation_sets", "scene_id"),
+    ("interpretation_sets", "interpretation_count", "interpretations", "set_id"),
+    ("interpretations", "event_count", "events", "interpretation_id"),
+)
+
+
+def _parents() -> dict:
+    parents: dict = {}
+    for parent, column, _, _ in COUNTERS:
+        parents.setdefault(parent, []).append(column)
+    return parents
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for parent, columns in _parents().items():
+        with op.batch_alter_table(parent, schema=None) as batch_op:
+            for column in columns:
+                batch_op.add_column(
+                    sa.Column(column, sa.Integer(), nullable=False, server_default="0")
+                )
+
+    # Backfill from the child tables.
+    for parent, column, child, foreign_key in COUNTERS:
+        op.execute(
+            f"UPDATE {parent} SET {column} = ("
+            f"SELECT COUNT(*) FROM {child} "
+            f"WHERE {child}.{foreign_key} = {parent}.id)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for parent, columns in reversed(list(_parents().items())):
+        with op.batch_alter_table(parent, schema=None) as batch_op:
+            for column in reversed(columns):
+                batch_op.drop_column(column)
@@ -0,0 +1,91 @@
+"""Add sequence counters and unique sequences for acts and scenes
+
+Revision ID: f61b0a9d3c25
+Revises: d27a6c41e8f3
+Create Date: 2026-10-18 15:12:36.804117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f61b0a9d3c25"
+down_revision: Union[str, None] = "d27a6c41e8f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (parent table, counter column, child table, child foreign key, constraint)
+SEQUENCES = (
+    ("games", "last_act_sequence", "acts", "game_id", "uix_game_act_sequence"),
+    ("acts", "last_scene_sequence", "scenes", "act_id", "uix_act_scene_sequence"),
+)
+
+
+def _renumber_duplicates(child: str, foreign_key: str) -> None:
+    """Move rows that share a sequence with a sibling to the end of the list.
+
+    Concurrent writers could previously allocate the same number twice.
+    """
+    connection = op.get_bind()
+    table = sa.table(
+        child,
+        sa.column("id", sa.String),
+        sa.column(foreign_key, sa.String),
+        sa.column("sequence", sa.Integer),
+        sa.column("created_at", sa.DateTime),
+    )
+    parent_col = table.c[foreign_key]
+    rows = connection.execute(
+        sa.select(table.c.id, parent_col, table.c.sequence).order_by(
+            parent_col, table.c.sequence, table.c.created_at
+        )
+    ).fetchall()
+
+    highest = {}
+    for _, parent_id, sequence in rows:
+        highest[parent_id] = max(highest.get(parent_id, 0), sequence)
+
+    seen = set()
+    for row_id, parent_id, sequence in rows:
+        if (parent_id, sequence) not in seen:
+            seen.add((parent_id, sequence))
+            continue
+        highest[parent_id] += 1
+        connection.execute(
+            table.update()
+            .where(table.c.id == row_id)
+            .values(sequence=highest[parent_id])
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for parent, counter, child, foreign_key, constraint in SEQUENCES:
+        with op.batch_alter_table(parent, schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(counter, sa.Integer(), nullable=False, server_default="0")
+            )
+
+        _renumber_duplicates(child, foreign_key)
+        op.execute(
+            f"UPDATE {parent} SET {counter} = ("
+            f"SELECT COALESCE(MAX(sequence), 0) FROM {child} "
+            f"WHERE {child}.{foreign_key} = {parent}.id)"
+        )
+
+        with op.batch_alter_table(child, schema=None) as batch_op:
+            batch_op.create_unique_constraint(constraint, [foreign_key, "sequence"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for parent, counter, child, _, constraint in reversed(SEQUENCES):
+        with op.batch_alter_table(child, schema=None) as batch_op:
+            batch_op.drop_constraint(constraint, type_="unique")
+
+        with op.batch_alter_table(parent, schema=None) as batch_op:
+            batch_op.drop_column(counter)
@@ -26,10 +26,12 @@ from sologm.cli.utils.structured_editor import (  # Updated import
 from sologm.core.act import ActManager
 from sologm.core.game import GameManager
 from sologm.core.prompts.act import ActPrompts  # Added for --show-prompt
+from sologm.daemon import require_terminal
 from sologm.database.session import get_db_context
+from sologm.integrations.anthropic import BATCH_POLL_INTERVAL
 from sologm.models.act import Act
 from sologm.models.game import Game
-from sologm.utils.errors import APIError, GameError
+from sologm.utils.errors import APIError, ConflictError, GameError
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -511,7 +513,7 @@ def edit_act(
                 if updated_act.summary:
                     renderer.display_message(f"Summary: {updated_act.summary}")
 
-            except (GameError, ValueError) as e:
+            except (GameError, ConflictError, ValueError) as e:
                 # Catch error ONLY from the edit_act manager call
                 logger.error(f"Error during act update: {e}", exc_info=True)
                 renderer.display_error(f"Error updating act: {str(e)}")
@@ -557,6 +559,7 @@ def _check_existing_content(act: Act, force: bool) -> bool:
     logger.debug("Existing content found, asking for confirmation.")
     # Use Confirm directly for the prompt itself.
     # The message could potentially use renderer.display_warning if needed.
+    require_terminal()
     confirmed = Confirm.ask(
         f"[yellow]{confirm_message} Continue?[/yellow]", default=False
     )
@@ -905,6 +908,7 @@ def _edit_ai_content(
 
     # Ask for confirmation
     logger.debug("Asking user to confirm edited content")
+    require_terminal()
     confirmed = Confirm.ask(
         "[yellow]Use this edited content?[/yellow]",
         default=True,
@@ -1563,6 +1567,110 @@ def complete_act(
     logger.debug("[complete_act] Exiting command")
 
 
+@act_app.command("summarize-all")
+def summarize_all_acts(
+    ctx: typer.Context,
+    context: Optional[str] = typer.Option(
+        None,
+        "--context",
+        "-c",
+        help="Additional context to include in every act summary",
+    ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Send all acts as one batch job (cheaper, may take minutes)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help="Requests sent at once without --batch "
+        "(defaults to the summary_concurrency setting)",
+    ),
+    poll_interval: float = typer.Option(
+        BATCH_POLL_INTERVAL,
+        "--poll-interval",
+        min=0.1,
+        help="Seconds between checks on the batch job",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Replace existing titles and summaries without confirmation",
+    ),
+) -> None:
+    """[bold]Generate titles and summaries for every act in the game.[/bold]
+
+    Prepares each act with scenes and sends them to the AI together, either
+    as concurrent requests or, with `--batch`, as a single batch job. The
+    results are saved in one transaction once every request has finished.
+    Acts that fail keep their current title and summary.
+
+    [yellow]Examples:[/yellow]
+        [green]Summarize every act:[/green]
+        $ sologm act summarize-all
+
+        [green]Summarize every act as a batch job:[/green]
+        $ sologm act summarize-all --batch --force
+    """
+    logger.debug(f"[summarize_all_acts] batch={batch}, workers={workers}")
+    renderer: "Renderer" = ctx.obj["renderer"]
+
+    with get_db_context() as session:
+        game_manager = GameManager(session=session)
+        act_manager = game_manager.act_manager
+
+        active_game = game_manager.get_active_game()
+        if not active_game:
+            renderer.display_error("No active game. Activate a game first.")
+            raise typer.Exit(1)
+
+        acts = act_manager.list_acts(active_game.id)
+        if not acts:
+            renderer.display_warning(f"No acts in game '{active_game.name}'.")
+            return
+
+        if not force and any(act.title or act.summary for act in acts):
+            require_terminal()
+            if not Confirm.ask(
+                "[yellow]This will replace existing act titles and summaries. "
+                "Continue?[/yellow]",
+                default=False,
+            ):
+                renderer.display_warning("Operation cancelled.")
+                return
+
+        renderer.display_message(
+            f"Summarizing {len(acts)} acts" + (" as a batch job..." if batch else "...")
+        )
+        try:
+            summaries, errors = act_manager.summarize_acts(
+                active_game.id,
+                additional_context=context,
+                use_batch=batch,
+                max_workers=workers,
+                poll_interval=poll_interval,
+            )
+            updated = act_manager.apply_act_summaries(summaries)
+        except (APIError, GameError) as e:
+            logger.error(f"Failed to summarize acts: {e}", exc_info=True)
+            renderer.display_error(f"Error: {str(e)}")
+            raise typer.Exit(1) from e
+
+        acts_by_id = {act.id: act for act in acts}
+        for act_id, message in errors.items():
+            act = acts_by_id[act_id]
+            renderer.display_warning(
+                f"Act {act.sequence} ({act.title or 'Untitled'}) "
+                f"was not summarized: {message}"
+            )
+        if updated:
+            renderer.display_success(f"Summarized {len(updated)} of {len(acts)} acts.")
+        elif errors:
+            raise typer.Exit(1)
+
+
 # --- Helper Functions for `act narrative` ---
 
 
@@ -1822,6 +1930,7 @@ def generate_narrative(
                 break
             elif choice == "E":  # Edit
                 logger.debug("User chose to edit the narrative.")
+                require_terminal()
                 edited_text = click.edit(current_narrative)
                 if edited_text is not None and edited_text != current_narrative:
                     current_narrative = edited_text
@@ -0,0 +1,42 @@
+"""Database maintenance commands for Solo RPG Helper."""
+
+import logging
+from typing import TYPE_CHECKING
+
+import typer
+
+from sologm.database.session import get_db_context
+from sologm.models.counters import recount
+
+if TYPE_CHECKING:
+    from sologm.cli.rendering.base import Renderer
+
+
+logger = logging.getLogger(__name__)
+db_app = typer.Typer(help="Database maintenance commands")
+
+
+@db_app.command("recount")
+def recount_command(ctx: typer.Context) -> None:
+    """Rebuild the stored scene, event, dice roll and interpretation counts.
+
+    Counts are normally kept up to date automatically. Run this after editing
+    the database by hand or if listings show counts that look wrong.
+
+    Args:
+        ctx: Typer context.
+    """
+    renderer: "Renderer" = ctx.obj["renderer"]
+    logger.debug("Recounting materialized counters")
+
+    with get_db_context() as session:
+        results = recount(session)
+
+    corrected = {label: rows for label, rows in results.items() if rows}
+    if not corrected:
+        renderer.display_success("All stored counts are correct.")
+        return
+
+    for label, rows in corrected.items():
+        renderer.display_message(f"{label}: corrected {rows} row(s)")
+    renderer.display_success(f"Corrected {sum(corrected.values())} stored count(s).")
@@ -77,6 +77,13 @@ def roll_dice_command(
         1d20    Roll a single 20-sided die
         2d6+3   Roll two 6-sided dice and add 3
         3d8-1   Roll three 8-sided dice and subtract 1
+        4d6kh3  Roll four 6-sided dice and keep the highest three
+        2d20kl1 Roll two 20-sided dice and keep the lowest
+        1d6!    Roll an exploding 6-sided die
+        3d6r<2  Roll three 6-sided dice, rerolling 1s
+        2d6+1d4 Roll several dice pools together
+        4dF     Roll four Fudge/FATE dice
+        6d10>=8 Count the dice that roll 8 or higher
     """
     renderer: "Renderer" = ctx.obj["renderer"]
     try:
@@ -8,7 +8,7 @@ import typer
 # Console import removed
 # display_events_table import removed
 from sologm.core.event import EventManager
-from sologm.utils.errors import EventError
+from sologm.utils.errors import ConflictError, EventError
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -314,7 +314,7 @@ def edit_event(
                 events = [updated_event]
                 renderer.display_events_table(events, scene)
 
-        except EventError as e:
+        except (EventError, ConflictError) as e:
             renderer.display_error(f"Error: {str(e)}")
             raise typer.Exit(1) from e
 
@@ -15,7 +15,7 @@ from sologm.cli.utils.structured_editor import (
 )
 from sologm.core.game import GameManager
 from sologm.database.session import get_db_context
-from sologm.utils.errors import GameError
+from sologm.utils.errors import ConflictError, GameError
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -309,7 +309,7 @@ def edit_game(
                 # caught below
                 raise typer.Exit(1)
 
-    except GameError as e:
+    except (GameError, ConflictError) as e:
         renderer.display_error(f"Error editing game: {str(e)}")
         raise typer.Exit(1) from e
     except Exception as e:
@@ -372,8 +372,9 @@ def dump_game(
                 include_concepts=include_concepts,
             )
 
-            # Print directly to stdout, bypassing the renderer
-            print(markdown_content)
+            # Print raw markdown to the console's stream (stdout, or the
+            # client's output when served by the daemon), bypassing the renderer
+            print(markdown_content, file=ctx.obj["console"].file)
 
     except GameError as e:  # Catch GameError specifically
         renderer.display_error(f"Error exporting game: {str(e)}")
@@ -1,23 +1,32 @@
 """Main CLI entry point for Solo RPG Helper."""
 
 import logging
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
 
 from sologm import __version__
 from sologm.cli.act import act_app
+from sologm.cli.db import db_app
 from sologm.cli.dice import dice_app
 from sologm.cli.event import event_app
 from sologm.cli.game import game_app
 from sologm.cli.oracle import oracle_app
 from sologm.cli.rendering.base import Renderer
 from sologm.cli.scene import scene_app
+from sologm.cli.serve import serve
+from sologm.cli.stats import stats_app
+from sologm.daemon import is_remote
 from sologm.database import init_db
-from sologm.utils.config import Config
+from sologm.utils.config import Config, get_config
 from sologm.utils.logger import setup_root_logger
+from sologm.utils.profiling import startup_profiler
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +61,9 @@ app.add_typer(event_app, name="event", no_args_is_help=True)
 app.add_typer(dice_app, name="dice", no_args_is_help=True)
 app.add_typer(oracle_app, name="oracle", no_args_is_help=True)
 app.add_typer(act_app, name="act", no_args_is_help=True)
+app.add_typer(db_app, name="db", no_args_is_help=True)
+app.add_typer(stats_app, name="stats", no_args_is_help=True)
+app.command("serve")(serve)
 
 
 @app.callback()
@@ -73,6 +85,17 @@ def main(
         False, "--no-ui", help="Disable rich UI elements and use Markdown output."
     ),
     # --- End Added no_ui option ---
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Print how long each startup phase took when the command ends.",
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        help="With --profile-startup, also write a cProfile (.prof) or "
+        "speedscope (.json) file.",
+    ),
 ) -> None:
     """Solo RPG Helper - A command-line tool for solo roleplaying games.
 
@@ -84,43 +107,68 @@ def main(
         version: Show the application version and exit.
         config_path: Optional path to a custom configuration file.
         no_ui: Disable rich UI elements and use Markdown output instead.
+        profile_startup: Print a breakdown of startup time.
+        profile_output: File for the full profile (.prof or .json).
     """
+    # Commands forwarded to the daemon run in a process that already set up
+    # logging and the database, and bring their own output console
+    remote = is_remote()
+    if ctx.obj is None:
+        ctx.obj = {}  # type: Dict[str, Any]
+    output: Console = ctx.obj.get("console", console)
+
+    if profile_startup:
+        # Already running if started by the entry point, which also times
+        # imports; otherwise (e.g. python -m sologm.cli.main) start here
+        startup_profiler.start(profile_output)
+        ctx.call_on_close(lambda: startup_profiler.finish(sys.stderr))
+
+    # Load config before logging, which reads its settings from it
+    with startup_profiler.phase("config"):
+        if config_path:
+            Config.get_instance(Path(config_path))
+        elif startup_profiler.enabled:
+            # Otherwise it loads lazily; load it now to time it on its own
+            get_config()
+
     # Set up root logger with debug flag
-    setup_root_logger(debug)
+    if not remote:
+        with startup_profiler.phase("logging"):
+            setup_root_logger(debug)
     logger.debug("CLI startup with debug=%s", debug)
-
-    # Initialize config first if custom path provided
     if config_path:
-        logger.debug("Loading config from %s", config_path)
-        Config.get_instance(Path(config_path))
+        logger.debug("Loaded config from %s", config_path)
 
     # --- Added Renderer Selection Logic ---
+    startup_profiler.begin("renderer")
     # Import renderers here to avoid potential circular imports if they import main
     from sologm.cli.rendering.markdown_renderer import MarkdownRenderer
     from sologm.cli.rendering.rich_renderer import RichRenderer
 
     selected_renderer: Renderer  # Define type hint
     if no_ui:
-        selected_renderer = MarkdownRenderer(console=console)
+        selected_renderer = MarkdownRenderer(console=output)
         logger.debug("MarkdownRenderer selected and instantiated")
     else:
-        selected_renderer = RichRenderer(console=console)
+        selected_renderer = RichRenderer(console=output)
         logger.debug("RichRenderer selected and instantiated")
+    startup_profiler.end("renderer")
 
     # Store renderer and console on context object
-    # Ensure ctx.obj is a dictionary
-    if ctx.obj is None:
-        ctx.obj = {}  # type: Dict[str, Any]
-
     ctx.obj["renderer"] = selected_renderer
-    ctx.obj["console"] = console
+    ctx.obj["console"] = output
     logger.debug("Renderer and console stored in Typer context.")
     # --- End Added Renderer Selection Logic ---
 
+    if remote:
+        logger.debug("Serving forwarded command; database already initialized.")
+        return
+
     # Initialize database (now uses the renderer for errors)
     try:
         # Initialize the database - this will use the singleton pattern internally
-        _ = init_db()  # Returns DatabaseManager instance, not needed here.
+        with startup_profiler.phase("database"):
+            db_manager = init_db()
 
     except Exception as e:
         # Use the selected renderer to display the error
@@ -137,8 +185,24 @@ def main(
         )
         raise typer.Exit(code=1) from e
 
+    if startup_profiler.enabled:
+        _profile_command(db_manager.engine)
+
     logger.debug("Exiting main callback without errors.")
 
 
+def _profile_command(engine: "Engine") -> None:
+    """Time the command body, marking when it first queries the database."""
+    from sqlalchemy import event
+
+    startup_profiler.begin("command")
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *_: startup_profiler.mark("first query"),
+        once=True,
+    )
+
+
 if __name__ == "__main__":
     app()
@@ -15,6 +15,7 @@ from sologm.cli.utils.structured_editor import (
     edit_structured_data,
 )
 from sologm.core.oracle import OracleManager
+from sologm.daemon import require_terminal
 from sologm.database.session import get_db_context
 from sologm.models.oracle import Interpretation, InterpretationSet
 from sologm.utils.config import get_config
@@ -222,6 +223,7 @@ def _get_event_description_from_interpretation(
     )
 
     event_description = default_description
+    require_terminal()
     if edit_flag or typer.confirm("Would you like to edit the event description?"):
         editor_config = EditorConfig(
             edit_message="Edit the event description:",
@@ -323,7 +325,7 @@ def interpret_oracle(
             # Determine the number of interpretations
             if count is None:
                 config = get_config()
-                count_int = int(config.get("default_interpretations", 5))
+                count_int = config.get_int("default_interpretations", 5)
             else:
                 count_int = count  # Already an int if provided
 
@@ -398,7 +400,7 @@ def retry_interpretation(
             # Determine the number of interpretations
             if count is None:
                 config = get_config()
-                count_int = int(config.get("default_interpretations", 5))
+                count_int = config.get_int("default_interpretations", 5)
             else:
                 count_int = count  # Already an int if provided
 
@@ -620,6 +622,7 @@ def select_interpretation(
             renderer.display_message("\nSelected interpretation:")
             renderer.display_interpretation(selected)
 
+            require_terminal()
             if typer.confirm("\nAdd this interpretation as an event?"):
                 # Get event description, potentially editing it
                 event_description = _get_event_description_from_interpretation(
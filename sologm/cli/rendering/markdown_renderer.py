@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 import click
 from rich.console import Console
 
+from sologm.daemon import require_terminal
+
 # Import necessary models for type hinting
 from sologm.models.act import Act
 from sologm.models.dice import DiceRoll
@@ -799,6 +801,7 @@ class MarkdownRenderer(Renderer):
         logger.debug("Displaying narrative feedback prompt (MarkdownRenderer)")
         try:
             # Use click.prompt with case-insensitive Choice
+            require_terminal()
             choice = click.prompt(
                 "Choose action [A]ccept/[E]dit/[R]egenerate/[C]ancel",
                 type=click.Choice(
@@ -20,6 +20,7 @@ from sologm.cli.utils.display import (
 
 # Import utilities that RichRenderer will use directly
 from sologm.cli.utils.styled_text import BORDER_STYLES, StyledText
+from sologm.daemon import require_terminal
 
 # Import necessary models
 from sologm.models.act import Act
@@ -1705,6 +1706,7 @@ class RichRenderer(Renderer):
             "(A)ccept / (E)dit / (R)egenerate"
         )
 
+        require_terminal()
         choice = Prompt.ask(
             prompt_message,
             choices=["A", "E", "R", "a", "e", "r"],
@@ -1785,6 +1787,7 @@ class RichRenderer(Renderer):
         while True:
             try:
                 # Ask without using the 'choices' argument for validation
+                require_terminal()
                 raw_choice = Prompt.ask(
                     prompt_text,
                     default="A",
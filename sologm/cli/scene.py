@@ -15,7 +15,7 @@ from sologm.cli.utils.structured_editor import (
 )
 from sologm.core.scene import SceneManager
 from sologm.database.session import get_db_context
-from sologm.utils.errors import ActError, GameError, SceneError
+from sologm.utils.errors import ActError, ConflictError, GameError, SceneError
 
 if TYPE_CHECKING:
     from rich.console import Console
@@ -429,7 +429,7 @@ def edit_scene(
                 # Message should be displayed by edit_structured_data or caught below
                 raise typer.Exit(0)  # Exit cleanly on abort
 
-    except (SceneError, ActError, GameError) as e:
+    except (SceneError, ActError, GameError, ConflictError) as e:
         logger.error("Error editing scene: %s", e, exc_info=True)
         renderer.display_error(f"Error: {str(e)}")
         raise typer.Exit(1) from e
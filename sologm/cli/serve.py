@@ -0,0 +1,70 @@
+"""Command that runs the background daemon for Solo RPG Helper."""
+
+import logging
+import signal
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+
+from sologm.daemon.protocol import socket_path
+from sologm.daemon.server import DEFAULT_WORKERS, create_server
+
+if TYPE_CHECKING:
+    from sologm.cli.rendering.base import Renderer
+
+
+logger = logging.getLogger(__name__)
+
+
+def serve(
+    ctx: typer.Context,
+    socket: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Socket path (default: $SOLOGM_DAEMON_SOCKET or ~/.sologm/sologm.sock).",
+    ),
+    workers: int = typer.Option(
+        DEFAULT_WORKERS,
+        "--workers",
+        min=1,
+        help="Maximum number of commands served at the same time.",
+    ),
+) -> None:
+    """Run a background daemon that serves sologm commands.
+
+    While it runs, other sologm invocations forward their command to it and
+    skip interpreter and database startup. Commands that need to prompt or
+    open an editor still run in the calling terminal. Stop it with Ctrl-C or
+    SIGTERM.
+
+    Args:
+        ctx: Typer context.
+        socket: Unix socket path to listen on.
+        workers: Size of the worker pool.
+    """
+    renderer: "Renderer" = ctx.obj["renderer"]
+    path = socket or socket_path()
+
+    try:
+        server = create_server(path, workers=workers)
+    except (OSError, RuntimeError) as e:
+        renderer.display_error(f"Could not start daemon: {e}")
+        raise typer.Exit(1) from e
+
+    # serve_forever() must be stopped from another thread
+    signal.signal(
+        signal.SIGTERM,
+        lambda *_: threading.Thread(target=server.shutdown, daemon=True).start(),
+    )
+
+    renderer.display_success(f"Serving on {path} with {workers} worker(s)")
+    logger.info("Daemon listening on %s with %d workers", path, workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        renderer.display_message("Shutting down")
+    finally:
+        server.server_close()
+        logger.info("Daemon stopped")
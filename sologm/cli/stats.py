@@ -0,0 +1,101 @@
+"""Usage statistics commands for Solo RPG Helper."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import typer
+
+from sologm.integrations.metrics import (
+    CallSiteStats,
+    MetricsLog,
+    configured_log,
+    summarize,
+)
+
+if TYPE_CHECKING:
+    from sologm.cli.rendering.base import Renderer
+
+
+logger = logging.getLogger(__name__)
+stats_app = typer.Typer(help="Usage statistics")
+
+
+def _ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def _count(value: int) -> str:
+    """Abbreviate a token count, e.g. 1.2k or 3.4M."""
+    for limit, suffix in ((1_000_000, "M"), (1_000, "k")):
+        if value >= limit:
+            return f"{value / limit:.1f}{suffix}"
+    return str(value)
+
+
+def format_ai_stats(stats: List[CallSiteStats]) -> str:
+    """Format AI call site stats as a Markdown table with a totals row."""
+    lines = [
+        "| Call site | Calls | Errors | Retries | Unparsed "
+        "| Tokens in/out/cached | ms p50/p90/p99 | TTFT ms | Cost |",
+        "|---|--:|--:|--:|--:|--:|--:|--:|--:|",
+    ]
+    for site in stats:
+        lines.append(
+            f"| {site.call_site} | {site.requests} | {site.errors} | {site.retries} "
+            f"| {site.parse_failures} | {_count(site.input_tokens)}/"
+            f"{_count(site.output_tokens)}/{_count(site.cached_tokens)} "
+            f"| {_ms(site.latency_p50_ms)}/{_ms(site.latency_p90_ms)}/"
+            f"{_ms(site.latency_p99_ms)} | {_ms(site.ttft_p50_ms)} "
+            f"| ${site.cost:.4f} |"
+        )
+    lines.append(
+        f"| **Total** | {sum(s.requests for s in stats)} "
+        f"| {sum(s.errors for s in stats)} | {sum(s.retries for s in stats)} "
+        f"| {sum(s.parse_failures for s in stats)} "
+        f"| {_count(sum(s.input_tokens for s in stats))}/"
+        f"{_count(sum(s.output_tokens for s in stats))}/"
+        f"{_count(sum(s.cached_tokens for s in stats))} | | "
+        f"| **${sum(s.cost for s in stats):.4f}** |"
+    )
+    return "\n".join(lines)
+
+
+@stats_app.command("ai")
+def ai_stats(
+    ctx: typer.Context,
+    days: Optional[int] = typer.Option(
+        None, "--days", "-d", min=1, help="Only include the last N days"
+    ),
+    metrics_file: Optional[Path] = typer.Option(
+        None,
+        "--file",
+        help="Metrics file to read (defaults to the ai_metrics_file setting)",
+    ),
+) -> None:
+    """Show AI token usage, latency percentiles and estimated cost.
+
+    Requests are grouped by call site (oracle interpretations, act summaries,
+    narratives and so on). Costs are estimates from list prices.
+
+    Args:
+        ctx: Typer context.
+        days: Only include requests from the last N days.
+        metrics_file: Metrics file to read instead of the configured one.
+    """
+    renderer: "Renderer" = ctx.obj["renderer"]
+    log = MetricsLog(metrics_file) if metrics_file else configured_log()
+    if log is None:
+        renderer.display_warning(
+            "AI metrics are turned off. Set ai_metrics to true to collect them."
+        )
+        return
+
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+    logger.debug("Reading AI metrics from %s since %s", log.path, since)
+    stats = summarize(log.read(), since=since)
+    if not stats:
+        renderer.display_message(f"No AI requests recorded in {log.path}.")
+        return
+    renderer.display_markdown(format_ai_stats(stats))
@@ -23,7 +23,7 @@ def truncate_text(text: str, max_length: int = 60) -> str:
     Returns:
         Truncated text with ellipsis if needed
     """
-    logger.debug(f"Truncating text of length {len(text)} to max_length {max_length}")
+    logger.debug("Truncating text of length %s to max_length %s", len(text), max_length)
 
     # Handle edge cases
     if not text:
@@ -36,7 +36,7 @@ def truncate_text(text: str, max_length: int = 60) -> str:
         return text
 
     # Ensure we keep exactly max_length characters including the ellipsis
-    logger.debug(f"Truncating text to {max_length - 3} chars plus ellipsis")
+    logger.debug("Truncating text to %s chars plus ellipsis", max_length - 3)
     return text[: max_length - 3] + "..."
 
 
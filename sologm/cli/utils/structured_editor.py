@@ -12,6 +12,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from sologm.daemon import require_terminal
+
 logger = logging.getLogger(__name__)
 
 
@@ -370,6 +372,7 @@ class ClickEditorStrategy:
             # The editor will show the text, no need to print it here.
 
         try:
+            require_terminal()
             new_text = click.edit(text)
 
             if new_text is None:
@@ -1,28 +1,38 @@
 """Act manager for SoloGM."""
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from sologm.core.activation import activate_exclusively
 from sologm.core.base_manager import BaseManager
 from sologm.core.prompts.act import ActPrompts
+from sologm.core.prompts.budget import TokenCounter
+from sologm.core.sequence import allocate_sequence
+from sologm.core.versioning import update_versioned
 from sologm.integrations.anthropic import (
+    BATCH_POLL_INTERVAL,
     NARRATIVE_MAX_TOKENS,
     AnthropicClient,  # Ensure AnthropicClient is imported
 )
+from sologm.integrations.metrics import record_parse_failure
 from sologm.models.act import Act
+from sologm.models.event import Event
 from sologm.models.game import Game
 
 # Ensure Session is imported if not already (it is in the provided snippet)
 # from sqlalchemy.orm import Session
 # Ensure Optional is imported if not already (it is in the provided snippet)
 # from typing import Optional
+from sologm.utils.concurrency import wait_all
 from sologm.utils.errors import APIError, GameError
 
 if TYPE_CHECKING:
     from sologm.core.game import GameManager
     from sologm.core.scene import SceneManager
+    from sologm.core.summarization import SceneSummaryManager
 
 
 logger = logging.getLogger(__name__)
@@ -50,8 +60,8 @@ class ActManager(BaseManager[Act, Act]):
         # Store the provided client or create a default one
         self.anthropic_client = anthropic_client or AnthropicClient()
         logger.debug(
-            f"ActManager initialized with AnthropicClient: "
-            f"{'Provided' if anthropic_client else 'Created Default'}"
+            "ActManager initialized with AnthropicClient: %s",
+            "Provided" if anthropic_client else "Created Default",
         )
 
     # Parent manager access
@@ -68,6 +78,15 @@ class ActManager(BaseManager[Act, Act]):
             "_scene_manager", "sologm.core.scene.SceneManager", act_manager=self
         )
 
+    @property
+    def scene_summary_manager(self) -> "SceneSummaryManager":
+        """Lazy-initialize the scene summary manager."""
+        return self._lazy_init_manager(
+            "_scene_summary_manager",
+            "sologm.core.summarization.SceneSummaryManager",
+            anthropic_client=self.anthropic_client,
+        )
+
     def create_act(
         self,
         game_id: Optional[str] = None,
@@ -91,10 +110,11 @@ class ActManager(BaseManager[Act, Act]):
             GameError: If the game doesn't exist or no active game is found
         """
         logger.debug(
-            f"Creating act in game_id={game_id or 'active game'}: "
-            f"title='{title or 'Untitled'}', "
-            f"summary='{summary[:20] + '...' if summary else 'None'}', "
-            f"make_active={make_active}"
+            "Creating act in game_id=%s: title='%s', summary='%s', make_active=%s",
+            game_id or "active game",
+            title or "Untitled",
+            summary[:20] + "..." if summary else "None",
+            make_active,
         )
 
         # Get game_id from active context if not provided
@@ -105,7 +125,7 @@ class ActManager(BaseManager[Act, Act]):
                 logger.warning(msg)
                 raise GameError(msg)
             game_id = active_game.id
-            logger.debug(f"Using active game with ID {game_id}")
+            logger.debug("Using active game with ID %s", game_id)
 
         # Validate that we can create a new act if it will be active
         if make_active:
@@ -122,21 +142,18 @@ class ActManager(BaseManager[Act, Act]):
                 GameError,
                 f"Game with ID {game_id} not found",
             )
-            logger.debug(f"Found game: {game.name}")
+            logger.debug("Found game: %s", game.name)
 
-            # Get the next sequence number for this game
-            acts = self.list_entities(
-                Act,
-                filters={"game_id": game_id},
-                order_by="sequence",
-                order_direction="desc",
-                limit=1,
+            # Reserve the next sequence number (safe across processes)
+            next_sequence = allocate_sequence(
+                session,
+                Game,
+                game_id,
+                Game.last_act_sequence,
+                Act.sequence,
+                Act.game_id,
             )
-
-            next_sequence = 1
-            if acts:
-                next_sequence = acts[0].sequence + 1
-            logger.debug(f"Using sequence number {next_sequence}")
+            logger.debug("Using sequence number %s", next_sequence)
 
             # Create the new act
             act = Act.create(
@@ -147,20 +164,18 @@ class ActManager(BaseManager[Act, Act]):
             )
             session.add(act)
             session.flush()
-            logger.debug(f"Created act with ID {act.id}")
+            logger.debug("Created act with ID %s", act.id)
 
             if make_active:
-                # Deactivate all other acts in this game
-                self._deactivate_all_acts(session, game_id)
-                logger.debug(f"Deactivated all other acts in game {game_id}")
-
-                # Set this act as active
-                act.is_active = True
-                logger.debug(f"Set act {act.id} as active")
+                # Make this the only active act in the game
+                activate_exclusively(session, Act, act.id, [Act.game_id == game_id])
+                logger.debug("Set act %s as active", act.id)
 
             logger.info(
-                f"Created act with ID {act.id} in game {game_id}: "
-                f"title='{act.title or 'Untitled'}'"
+                "Created act with ID %s in game %s: title='%s'",
+                act.id,
+                game_id,
+                act.title or "Untitled",
             )
             return act
 
@@ -175,11 +190,11 @@ class ActManager(BaseManager[Act, Act]):
         Returns:
             The act, or None if not found
         """
-        logger.debug(f"Getting act with ID {act_id}")
+        logger.debug("Getting act with ID %s", act_id)
 
         acts = self.list_entities(Act, filters={"id": act_id}, limit=1)
         result = acts[0] if acts else None
-        logger.debug(f"Found act: {result.id if result else 'None'}")
+        logger.debug("Found act: %s", result.id if result else "None")
         return result
 
     def get_act_by_identifier_or_error(self, identifier: str) -> Act:
@@ -194,7 +209,7 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If the act is not found.
         """
-        logger.debug(f"Getting act by identifier or error: {identifier}")
+        logger.debug("Getting act by identifier or error: %s", identifier)
 
         def _get_act(session: Session) -> Act:
             return self.get_entity_by_identifier_or_error(
@@ -209,7 +224,9 @@ class ActManager(BaseManager[Act, Act]):
         act = self._execute_db_operation(
             f"get act by identifier or error {identifier}", _get_act
         )
-        logger.debug(f"Retrieved act by identifier: {act.id} (Input: '{identifier}')")
+        logger.debug(
+            "Retrieved act by identifier: %s (Input: '%s')", act.id, identifier
+        )
         return act
 
     def list_acts(self, game_id: Optional[str] = None) -> List[Act]:
@@ -225,7 +242,7 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If game_id is not provided and no active game is found
         """
-        logger.debug(f"Listing acts for game_id={game_id or 'active game'}")
+        logger.debug("Listing acts for game_id=%s", game_id or "active game")
 
         if not game_id:
             active_game = self.game_manager.get_active_game()
@@ -234,12 +251,12 @@ class ActManager(BaseManager[Act, Act]):
                 logger.warning(msg)
                 raise GameError(msg)
             game_id = active_game.id
-            logger.debug(f"Using active game with ID {game_id}")
+            logger.debug("Using active game with ID %s", game_id)
 
         acts = self.list_entities(
             Act, filters={"game_id": game_id}, order_by="sequence"
         )
-        logger.debug(f"Found {len(acts)} acts in game {game_id}")
+        logger.debug("Found %s acts in game %s", len(acts), game_id)
         return acts
 
     def get_active_act(self, game_id: Optional[str] = None) -> Optional[Act]:
@@ -255,7 +272,7 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If game_id is not provided and no active game is found
         """
-        logger.debug(f"Getting active act for game_id={game_id or 'active game'}")
+        logger.debug("Getting active act for game_id=%s", game_id or "active game")
 
         if not game_id:
             active_game = self.game_manager.get_active_game()
@@ -264,7 +281,7 @@ class ActManager(BaseManager[Act, Act]):
                 logger.warning(msg)
                 raise GameError(msg)
             game_id = active_game.id
-            logger.debug(f"Using active game with ID {game_id}")
+            logger.debug("Using active game with ID %s", game_id)
 
         acts = self.list_entities(
             Act, filters={"game_id": game_id, "is_active": True}, limit=1
@@ -272,7 +289,7 @@ class ActManager(BaseManager[Act, Act]):
 
         result = acts[0] if acts else None
         act_info = f"{result.id} ({result.title or 'Untitled'})" if result else "None"
-        logger.debug(f"Active act for game {game_id}: {act_info}")
+        logger.debug("Active act for game %s: %s", game_id, act_info)
         return result
 
     def edit_act(
@@ -294,11 +311,14 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If the act doesn't exist
             ValueError: If neither title nor summary is provided
+            ConflictError: If another writer changed the same fields since
+                the act was loaded
         """
         logger.debug(
-            f"Editing act {act_id}: "
-            f"title={title or '(unchanged)'}, "
-            f"summary={summary[:20] + '...' if summary else '(unchanged)'}"
+            "Editing act %s: title=%s, summary=%s",
+            act_id,
+            title or "(unchanged)",
+            summary[:20] + "..." if summary else "(unchanged)",
         )
 
         # Validate input
@@ -310,31 +330,33 @@ class ActManager(BaseManager[Act, Act]):
             act = self.get_entity_or_error(
                 session, Act, act_id, GameError, f"Act with ID {act_id} not found"
             )
-            logger.debug(f"Found act: {act.title or 'Untitled'}")
+            logger.debug("Found act: %s", act.title or "Untitled")
 
-            # Update fields if provided
+            # Collect changes, then write them with conflict detection
+            changes = {}
             if title is not None:
-                old_title = act.title
-                act.title = title
+                changes["title"] = title
                 logger.debug(
-                    f"Updated title from '{old_title or 'Untitled'}' "
-                    f"to '{title or 'Untitled'}'"
+                    "Updating title from '%s' to '%s'",
+                    act.title or "Untitled",
+                    title or "Untitled",
                 )
 
                 # Update slug if title changes
                 if title:
                     from sologm.models.utils import slugify
 
-                    act.slug = f"act-{act.sequence}-{slugify(title)}"
+                    changes["slug"] = f"act-{act.sequence}-{slugify(title)}"
                 else:
-                    act.slug = f"act-{act.sequence}-untitled"
-                logger.debug(f"Updated slug to '{act.slug}'")
+                    changes["slug"] = f"act-{act.sequence}-untitled"
+                logger.debug("Updating slug to '%s'", changes["slug"])
 
             if summary is not None:
-                act.summary = summary
-                logger.debug("Updated summary")
+                changes["summary"] = summary
+                logger.debug("Updating summary")
 
-            logger.info(f"Edited act {act_id}: title='{act.title or 'Untitled'}'")
+            update_versioned(session, act, changes)
+            logger.info("Edited act %s: title='%s'", act_id, act.title or "Untitled")
             return act
 
         return self._execute_db_operation("edit_act", _edit_act)
@@ -359,9 +381,10 @@ class ActManager(BaseManager[Act, Act]):
             GameError: If the act doesn't exist
         """
         logger.debug(
-            f"Completing act {act_id}: "
-            f"title={title or '(unchanged)'}, "
-            f"summary={summary[:20] + '...' if summary else '(unchanged)'}"
+            "Completing act %s: title=%s, summary=%s",
+            act_id,
+            title or "(unchanged)",
+            summary[:20] + "..." if summary else "(unchanged)",
         )
 
         def _complete_act(session: Session) -> Act:
@@ -369,15 +392,16 @@ class ActManager(BaseManager[Act, Act]):
             act = self.get_entity_or_error(
                 session, Act, act_id, GameError, f"Act with ID {act_id} not found"
             )
-            logger.debug(f"Found act: {act.title or 'Untitled'}")
+            logger.debug("Found act: %s", act.title or "Untitled")
 
             # Update fields if provided
             if title is not None:
                 old_title = act.title
                 act.title = title
                 logger.debug(
-                    f"Updated title from '{old_title or 'Untitled'}' "
-                    f"to '{title or 'Untitled'}'"
+                    "Updated title from '%s' to '%s'",
+                    old_title or "Untitled",
+                    title or "Untitled",
                 )
 
                 # Update slug if title changes
@@ -385,7 +409,7 @@ class ActManager(BaseManager[Act, Act]):
                     from sologm.models.utils import slugify
 
                     act.slug = f"act-{act.sequence}-{slugify(title)}"
-                    logger.debug(f"Updated slug to '{act.slug}'")
+                    logger.debug("Updated slug to '%s'", act.slug)
 
             if summary is not None:
                 act.summary = summary
@@ -395,7 +419,7 @@ class ActManager(BaseManager[Act, Act]):
             act.is_active = False
             logger.debug("Set is_active to False")
 
-            logger.info(f"Completed act {act_id}: title='{act.title or 'Untitled'}'")
+            logger.info("Completed act %s: title='%s'", act_id, act.title or "Untitled")
             return act
 
         return self._execute_db_operation("complete_act", _complete_act)
@@ -412,36 +436,24 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If the act doesn't exist
         """
-        logger.debug(f"Setting act {act_id} as active")
+        logger.debug("Setting act %s as active", act_id)
 
         def _set_active(session: Session) -> Act:
             # Use get_entity_or_error instead of manual query and check
             act = self.get_entity_or_error(
                 session, Act, act_id, GameError, f"Act with ID {act_id} not found"
             )
-            logger.debug(f"Found act: {act.title or 'Untitled'} in game {act.game_id}")
-
-            # Deactivate all acts in this game
-            self._deactivate_all_acts(session, act.game_id)
-            logger.debug(f"Deactivated all acts in game {act.game_id}")
+            logger.debug(
+                "Found act: %s in game %s", act.title or "Untitled", act.game_id
+            )
 
-            # Set this act as active
-            act.is_active = True
-            logger.info(f"Set act {act_id} as active")
+            # Make this the only active act in the game
+            activate_exclusively(session, Act, act.id, [Act.game_id == act.game_id])
+            logger.info("Set act %s as active", act_id)
             return act
 
         return self._execute_db_operation("set_active", _set_active)
 
-    def _deactivate_all_acts(self, session: Session, game_id: str) -> None:
-        """Deactivate all acts in a game.
-
-        Args:
-            session: Database session
-            game_id: ID of the game to deactivate acts for
-        """
-        logger.debug(f"Deactivating all acts in game {game_id}")
-        session.query(Act).filter(Act.game_id == game_id).update({Act.is_active: False})
-
     def validate_can_create_act(self, game_id: str) -> None:
         """Validate that a new act can be created in the game.
 
@@ -473,7 +485,7 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If there is no active act or no active game
         """
-        logger.debug(f"Validating active act for game_id={game_id or 'active game'}")
+        logger.debug("Validating active act for game_id=%s", game_id or "active game")
 
         if not game_id:
             active_game = self.game_manager.get_active_game()
@@ -482,7 +494,7 @@ class ActManager(BaseManager[Act, Act]):
                 logger.warning(msg)
                 raise GameError(msg)
             game_id = active_game.id
-            logger.debug(f"Using active game with ID {game_id}")
+            logger.debug("Using active game with ID %s", game_id)
 
         active_act = self.get_active_act(game_id)
         if not active_act:
@@ -493,7 +505,7 @@ class ActManager(BaseManager[Act, Act]):
             raise GameError(msg)
 
         logger.debug(
-            f"Found active act: {active_act.id} ({active_act.title or 'Untitled'})"
+            "Found active act: %s (%s)", active_act.id, active_act.title or "Untitled"
         )
         return active_act
 
@@ -507,7 +519,7 @@ class ActManager(BaseManager[Act, Act]):
             The most recent Act instance or None if no acts exist.
         """
         self.logger.debug(
-            f"Getting most recent act for game_id='{game_id or 'active game'}'"
+            "Getting most recent act for game_id='%s'", game_id or "active game"
         )
 
         if game_id is None:
@@ -518,7 +530,7 @@ class ActManager(BaseManager[Act, Act]):
                 # Returning None for status cmd.
                 return None
             game_id = active_game.id
-            self.logger.debug(f"Using active game ID: {game_id}")
+            self.logger.debug("Using active game ID: %s", game_id)
 
         def _operation(session: Session, game_id: str) -> Optional[Act]:
             # Ensure correct model is used and order_by is applied
@@ -551,14 +563,14 @@ class ActManager(BaseManager[Act, Act]):
             SceneError: If there's an issue retrieving scenes
             EventError: If there's an issue retrieving events
         """
-        logger.debug(f"Preparing data for act {act_id} summary")
+        logger.debug("Preparing data for act %s summary", act_id)
 
         def _prepare_data(session: Session) -> Dict:
             # Get the act
             act = self.get_entity_or_error(
                 session, Act, act_id, GameError, f"Act with ID {act_id} not found"
             )
-            logger.debug(f"Found act: {act.title or 'Untitled'}")
+            logger.debug("Found act: %s", act.title or "Untitled")
 
             # Get the game
             from sologm.models.game import Game
@@ -570,21 +582,17 @@ class ActManager(BaseManager[Act, Act]):
                 GameError,
                 f"Game with ID {act.game_id} not found",
             )
-            logger.debug(f"Found game: {game.name}")
+            logger.debug("Found game: %s", game.name)
 
             # Get all scenes in the act
             scenes = self.scene_manager.list_scenes(act_id)
-            logger.debug(f"Found {len(scenes)} scenes")
+            logger.debug("Found %s scenes", len(scenes))
 
-            # Collect all events from all scenes
-            events_by_scene = {}
-            for scene in scenes:
-                # Get events for this scene
-                scene_events = self.scene_manager.event_manager.list_events(
-                    scene_id=scene.id
-                )
-                events_by_scene[scene.id] = scene_events
-                logger.debug(f"Found {len(scene_events)} events for scene {scene.id}")
+            # Collect all events in the act with one query, grouped by scene
+            events_by_scene: Dict[str, List[Event]] = {}
+            for event in self.scene_manager.event_manager.list_events_for_act(act_id):
+                events_by_scene.setdefault(event.scene_id, []).append(event)
+            logger.debug("Found events for %s scenes", len(events_by_scene))
 
             # Format the data
             act_data = {
@@ -604,6 +612,7 @@ class ActManager(BaseManager[Act, Act]):
             # Add scene data
             for scene in scenes:
                 scene_data = {
+                    "id": scene.id,
                     "sequence": scene.sequence,
                     "title": scene.title,
                     "description": scene.description,
@@ -616,9 +625,11 @@ class ActManager(BaseManager[Act, Act]):
                         {
                             "description": event.description,
                             "source": event.source_name,
-                            "created_at": event.created_at.isoformat()
-                            if event.created_at
-                            else None,
+                            "created_at": (
+                                event.created_at.isoformat()
+                                if event.created_at
+                                else None
+                            ),
                         }
                     )
 
@@ -629,6 +640,65 @@ class ActManager(BaseManager[Act, Act]):
 
         return self._execute_db_operation("prepare_act_data_for_summary", _prepare_data)
 
+    def fits_prompt_budget(self, prompt: str) -> bool:
+        """Check whether a prompt is small enough to send in one request.
+
+        The limit is the ``act_prompt_max_tokens`` setting. Prompts are
+        measured with the local token estimate, or exactly through the API
+        when ``exact_token_counts`` is set and the estimate is close to the
+        limit.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            True if the prompt fits.
+        """
+        from sologm.utils.config import get_config
+
+        config = get_config()
+        max_tokens = config.get_int("act_prompt_max_tokens", 15000)
+        counter = TokenCounter(
+            self.anthropic_client if config.get_bool("exact_token_counts") else None
+        )
+        estimate = counter.estimate(prompt)
+        # The estimate is good to about 15%; only pay for an exact count
+        # when it could change the answer
+        if counter.exact and 0.85 * max_tokens < estimate < 1.15 * max_tokens:
+            return counter.count(prompt) <= max_tokens
+        return estimate <= max_tokens
+
+    def condense_act_data(self, act_data: Dict) -> Dict:
+        """Replace each scene's events with a generated summary.
+
+        Used when an act is too long to send whole. Scene summaries are
+        cached, so only scenes whose events changed since the last call are
+        summarized again.
+
+        Args:
+            act_data: Summary or narrative data, with scene IDs
+
+        Returns:
+            A copy of the data whose scenes carry a ``summary``.
+
+        Raises:
+            APIError: If a scene summary can't be generated
+        """
+        logger.info(
+            "Act %s is too long for one prompt, summarizing %s scenes first",
+            act_data["act"].get("sequence"),
+            len(act_data["scenes"]),
+        )
+        summaries = self.scene_summary_manager.summarize_scenes(
+            act_data["game"], act_data["act"], act_data["scenes"]
+        )
+        condensed = dict(act_data)
+        condensed["scenes"] = [
+            {**scene, "summary": summaries.get(scene["id"])}
+            for scene in act_data["scenes"]
+        ]
+        return condensed
+
     def generate_act_summary(
         self, act_id: str, additional_context: Optional[str] = None
     ) -> Dict[str, str]:
@@ -647,7 +717,7 @@ class ActManager(BaseManager[Act, Act]):
             SceneError: If there's an issue retrieving scenes
             EventError: If there's an issue retrieving events
         """
-        logger.debug(f"Generating summary for act {act_id}")
+        logger.debug("Generating summary for act %s", act_id)
 
         # Prepare the data
         act_data = self.prepare_act_data_for_summary(act_id, additional_context)
@@ -658,6 +728,9 @@ class ActManager(BaseManager[Act, Act]):
 
         # Build the prompt (no change here)
         prompt = ActPrompts.build_summary_prompt(act_data)
+        if not self.fits_prompt_budget(prompt):
+            act_data = self.condense_act_data(act_data)
+            prompt = ActPrompts.build_summary_prompt(act_data)
         logger.debug("Built summary prompt")
 
         # Remove local client creation:
@@ -671,19 +744,23 @@ class ActManager(BaseManager[Act, Act]):
                 prompt=prompt,
                 max_tokens=1000,  # Consider making these configurable
                 temperature=0.7,  # Consider making these configurable
+                call_site="act.summary",
             )
             logger.debug("Received response from Anthropic")
 
             # Parse the response
             summary_data = ActPrompts.parse_summary_response(response)
+            if not summary_data["title"] and not summary_data["summary"]:
+                record_parse_failure("act.summary")
             logger.debug(
-                f"Parsed summary response: title='{summary_data['title']}', "
-                f"summary='{summary_data['summary'][:50]}...'"
+                "Parsed summary response: title='%s', summary='%s...'",
+                summary_data["title"],
+                summary_data["summary"][:50],
             )
 
             return summary_data
         except Exception as e:
-            logger.error(f"Error generating act summary: {str(e)}", exc_info=True)
+            logger.error("Error generating act summary: %s", str(e), exc_info=True)
             if "anthropic" in str(e).lower() or "api" in str(e).lower():
                 raise APIError(f"Failed to generate act summary: {str(e)}") from e
             raise
@@ -714,7 +791,7 @@ class ActManager(BaseManager[Act, Act]):
             GameError: If the act doesn't exist
             APIError: If there's an error with the AI API
         """
-        logger.debug(f"Generating summary with feedback for act {act_id}")
+        logger.debug("Generating summary with feedback for act %s", act_id)
 
         if previous_generation and feedback:
             # Format feedback with previous generation
@@ -771,7 +848,7 @@ class ActManager(BaseManager[Act, Act]):
             "mentioned wanting to keep."
         )
 
-        logger.debug(f"Regeneration context prepared: {context[:100]}...")
+        logger.debug("Regeneration context prepared: %s...", context[:100])
         return context
 
     def complete_act_with_ai(
@@ -792,7 +869,7 @@ class ActManager(BaseManager[Act, Act]):
         Raises:
             GameError: If the act doesn't exist
         """
-        logger.debug(f"Completing act {act_id} with AI-generated content")
+        logger.debug("Completing act %s with AI-generated content", act_id)
         return self.complete_act(act_id=act_id, title=title, summary=summary)
 
     def generate_and_update_act_summary(
@@ -827,6 +904,173 @@ class ActManager(BaseManager[Act, Act]):
             "act": updated_act,
         }
 
+    def summarize_acts(
+        self,
+        game_id: Optional[str] = None,
+        additional_context: Optional[str] = None,
+        use_batch: bool = False,
+        max_workers: Optional[int] = None,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        """Generate a title and summary for every act in a game.
+
+        All prompts are prepared first. They are then sent either as one
+        Message Batches job, which is cheaper but may take a while, or as
+        concurrent requests bounded by ``max_workers``. Nothing is saved;
+        pass the summaries to apply_act_summaries.
+
+        Args:
+            game_id: ID of the game, or None for the active game
+            additional_context: Optional additional context for every act
+            use_batch: Send the prompts as one batch job
+            max_workers: Requests run at once when not batching; defaults
+                to the ``summary_concurrency`` setting
+            poll_interval: Seconds between checks on the batch job
+
+        Returns:
+            Summaries (dicts with title and summary) by act ID, and error
+            messages by act ID for the acts that couldn't be summarized.
+
+        Raises:
+            GameError: If there's no active game
+            APIError: If the batch job can't be created or checked
+        """
+        acts = self.list_acts(game_id)
+        errors: Dict[str, str] = {}
+        prompts: Dict[str, str] = {}
+        for act in acts:
+            act_data = self.prepare_act_data_for_summary(act.id, additional_context)
+            if not act_data["scenes"]:
+                errors[act.id] = "Act has no scenes"
+                continue
+            prompt = ActPrompts.build_summary_prompt(act_data)
+            if not self.fits_prompt_budget(prompt):
+                try:
+                    act_data = self.condense_act_data(act_data)
+                except APIError as e:
+                    errors[act.id] = str(e)
+                    continue
+                prompt = ActPrompts.build_summary_prompt(act_data)
+            prompts[act.id] = prompt
+        logger.debug(
+            "Prepared %s act summary prompts (%s skipped)", len(prompts), len(errors)
+        )
+        if not prompts:
+            return {}, errors
+
+        if use_batch:
+            # Batch request IDs are limited to 64 characters, so number them
+            request_ids = {
+                f"act-{index}": act_id for index, act_id in enumerate(prompts)
+            }
+            results = self.anthropic_client.send_batch(
+                {
+                    request_id: prompts[act_id]
+                    for request_id, act_id in request_ids.items()
+                },
+                max_tokens=1000,
+                temperature=0.7,
+                poll_interval=poll_interval,
+                call_site="act.summary",
+            )
+            responses = {
+                request_ids[request_id]: text
+                for request_id, text in results.texts.items()
+            }
+            errors.update(
+                {
+                    request_ids[request_id]: message
+                    for request_id, message in results.errors.items()
+                }
+            )
+        else:
+            responses = self._send_summary_prompts(prompts, max_workers, errors)
+
+        summaries: Dict[str, Dict[str, str]] = {}
+        for act_id, response in responses.items():
+            summary_data = ActPrompts.parse_summary_response(response)
+            if not summary_data["title"] and not summary_data["summary"]:
+                record_parse_failure("act.summary")
+                errors[act_id] = "Could not parse the summary response"
+            else:
+                summaries[act_id] = summary_data
+        logger.info(
+            "Summarized %s acts, %s failed or skipped", len(summaries), len(errors)
+        )
+        return summaries, errors
+
+    def _send_summary_prompts(
+        self,
+        prompts: Dict[str, str],
+        max_workers: Optional[int],
+        errors: Dict[str, str],
+    ) -> Dict[str, str]:
+        """Send summary prompts concurrently, collecting failures in ``errors``.
+
+        Runs no database work, since the session is not shared across threads.
+        """
+        if max_workers is None:
+            from sologm.core.summarization import DEFAULT_CONCURRENCY
+            from sologm.utils.config import get_config
+
+            max_workers = get_config().get_int(
+                "summary_concurrency", DEFAULT_CONCURRENCY
+            )
+        workers = max(1, min(max_workers, len(prompts)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="act-summary"
+        ) as pool:
+            futures = {
+                act_id: pool.submit(
+                    self.anthropic_client.send_message,
+                    prompt=prompt,
+                    max_tokens=1000,
+                    temperature=0.7,
+                    call_site="act.summary",
+                )
+                for act_id, prompt in prompts.items()
+            }
+            wait_all(futures.values())
+
+        responses: Dict[str, str] = {}
+        for act_id, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.error("Act %s summary failed: %s", act_id, error)
+                errors[act_id] = str(error)
+            else:
+                responses[act_id] = future.result()
+        return responses
+
+    def apply_act_summaries(self, summaries: Dict[str, Dict[str, str]]) -> List[Act]:
+        """Save generated titles and summaries to their acts.
+
+        The updates are made together: if one fails, none are kept.
+
+        Args:
+            summaries: Dicts with title and summary by act ID, as returned by
+                summarize_acts. An empty title leaves the act's title as is.
+
+        Returns:
+            The updated acts
+
+        Raises:
+            GameError: If an act doesn't exist
+        """
+
+        def _apply(session: Session) -> List[Act]:
+            with session.begin_nested():
+                return [
+                    self.edit_act(
+                        act_id=act_id,
+                        title=summary_data.get("title") or None,
+                        summary=summary_data.get("summary"),
+                    )
+                    for act_id, summary_data in summaries.items()
+                ]
+
+        return self._execute_db_operation("apply act summaries", _apply)
+
     def prepare_act_data_for_narrative(self, act_id: str) -> Dict:
         """Prepare act data for the narrative generation prompt.
 
@@ -846,14 +1090,14 @@ class ActManager(BaseManager[Act, Act]):
             SceneError: If there's an issue retrieving scenes.
             EventError: If there's an issue retrieving events.
         """
-        logger.debug(f"Preparing data for act {act_id} narrative generation")
+        logger.debug("Preparing data for act %s narrative generation", act_id)
 
         def _prepare_data(session: Session) -> Dict:
             # Get the target act
             act = self.get_entity_or_error(
                 session, Act, act_id, GameError, f"Act with ID {act_id} not found"
             )
-            logger.debug(f"Found act: {act.id} ({act.title or 'Untitled'})")
+            logger.debug("Found act: %s (%s)", act.id, act.title or "Untitled")
 
             # Get the associated game
             game = self.get_entity_or_error(
@@ -863,7 +1107,7 @@ class ActManager(BaseManager[Act, Act]):
                 GameError,
                 f"Game with ID {act.game_id} not found for act {act_id}",
             )
-            logger.debug(f"Found game: {game.id} ({game.name})")
+            logger.debug("Found game: %s (%s)", game.id, game.name)
 
             # Get the previous act's summary (if exists)
             previous_act = (
@@ -874,33 +1118,39 @@ class ActManager(BaseManager[Act, Act]):
             )
             previous_act_summary = previous_act.summary if previous_act else None
             logger.debug(
-                f"Previous act summary found: {'Yes' if previous_act_summary else 'No'}"
+                "Previous act summary found: %s",
+                "Yes" if previous_act_summary else "No",
             )
 
             # Get all scenes in the act (ordered by sequence)
             # Assuming scene_manager.list_scenes orders by sequence
             scenes = self.scene_manager.list_scenes(act_id=act.id)
-            logger.debug(f"Found {len(scenes)} scenes for act {act.id}")
+            logger.debug("Found %s scenes for act %s", len(scenes), act.id)
+
+            # Fetch all events in the act in chronological order (oldest first)
+            events_by_scene: Dict[str, List[Event]] = {}
+            for event in self.scene_manager.event_manager.list_events_for_act(
+                act.id, order_direction="asc"
+            ):
+                events_by_scene.setdefault(event.scene_id, []).append(event)
 
             # Prepare scene and event data
             scene_list_data = []
             for scene in scenes:
-                # Fetch events for the scene, ensuring chronological order
-                # (oldest first)
-                events = self.scene_manager.event_manager.list_events(
-                    scene_id=scene.id, order_direction="asc"
-                )
+                events = events_by_scene.get(scene.id, [])
                 logger.debug(
-                    f"Found {len(events)} events for scene {scene.id} (chronological)"
+                    "Found %s events for scene %s (chronological)",
+                    len(events),
+                    scene.id,
                 )
                 event_list_data = [
                     {
                         "id": event.id,
                         "description": event.description,
                         "source_name": event.source_name,
-                        "created_at": event.created_at.isoformat()
-                        if event.created_at
-                        else None,
+                        "created_at": (
+                            event.created_at.isoformat() if event.created_at else None
+                        ),
                     }
                     for event in events  # Already sorted correctly
                 ]
@@ -963,8 +1213,9 @@ class ActManager(BaseManager[Act, Act]):
             APIError: If there's an error communicating with the AI service.
         """
         logger.debug(
-            f"Generating narrative for act {act_id}. "
-            f"Regeneration: {'Yes' if previous_narrative else 'No'}"
+            "Generating narrative for act %s. Regeneration: %s",
+            act_id,
+            "Yes" if previous_narrative else "No",
         )
 
         # 1. Prepare the data
@@ -972,25 +1223,32 @@ class ActManager(BaseManager[Act, Act]):
         narrative_data["user_guidance"] = user_guidance or {}
         act_title = narrative_data.get("act", {}).get("title")
         logger.debug(
-            f"Act data prepared for narrative generation. Existing title: '{act_title}'"
+            "Act data prepared for narrative generation. Existing title: '%s'",
+            act_title,
         )
 
         # 2. Build the appropriate prompt (prompt logic now depends on act_title)
-        if previous_narrative and feedback:
-            logger.debug(
-                f"Building narrative regeneration prompt "
-                f"(Act has title: {bool(act_title)})."
-            )
-            prompt = ActPrompts.build_narrative_regeneration_prompt(
-                narrative_data=narrative_data,
-                previous_narrative=previous_narrative,
-                feedback=feedback,
-            )
-        else:
+        def _build_prompt(data: Dict) -> str:
+            if previous_narrative and feedback:
+                logger.debug(
+                    "Building narrative regeneration prompt (Act has title: %s).",
+                    bool(act_title),
+                )
+                return ActPrompts.build_narrative_regeneration_prompt(
+                    narrative_data=data,
+                    previous_narrative=previous_narrative,
+                    feedback=feedback,
+                )
             logger.debug(
-                f"Building initial narrative prompt (Act has title: {bool(act_title)})."
+                "Building initial narrative prompt (Act has title: %s).",
+                bool(act_title),
             )
-            prompt = ActPrompts.build_narrative_prompt(narrative_data=narrative_data)
+            return ActPrompts.build_narrative_prompt(narrative_data=data)
+
+        prompt = _build_prompt(narrative_data)
+        if not self.fits_prompt_budget(prompt):
+            # Too long to send whole: retell from per-scene summaries instead
+            prompt = _build_prompt(self.condense_act_data(narrative_data))
 
         # 3. Call the AI service
         try:
@@ -998,13 +1256,15 @@ class ActManager(BaseManager[Act, Act]):
             # logger.debug("Instantiating AnthropicClient.")
             # client = AnthropicClient()
 
-            logger.info(f"Sending narrative prompt to AI for act {act_id}...")
+            logger.info("Sending narrative prompt to AI for act %s...", act_id)
             # Use the instance client:
             logger.debug("Sending narrative prompt using self.anthropic_client")
             ai_response = self.anthropic_client.send_message(
-                prompt=prompt, max_tokens=NARRATIVE_MAX_TOKENS
+                prompt=prompt,
+                max_tokens=NARRATIVE_MAX_TOKENS,
+                call_site="act.narrative",
             )
-            logger.info(f"Received narrative response from AI for act {act_id}.")
+            logger.info("Received narrative response from AI for act %s.", act_id)
 
             # 4. Format the final response based on whether the act had a title
             if act_title:
@@ -1023,7 +1283,7 @@ class ActManager(BaseManager[Act, Act]):
                 # AI was instructed to include the title, return its response directly
                 return ai_response
         except Exception as e:
-            logger.error(f"Error generating act narrative: {str(e)}", exc_info=True)
+            logger.error("Error generating act narrative: %s", str(e), exc_info=True)
             # Import APIError if not already imported at top
             from sologm.utils.errors import APIError
 
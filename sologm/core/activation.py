@@ -0,0 +1,51 @@
+"""Exclusive activation of games, acts and scenes."""
+
+import logging
+from typing import Any, Sequence
+
+from sqlalchemy import ColumnElement, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def activate_exclusively(
+    session: Session,
+    model: Any,
+    target_id: str,
+    scope: Sequence[ColumnElement[bool]] = (),
+) -> None:
+    """Make one row the only active row within its scope.
+
+    Emits two UPDATEs and no SELECTs: one clears ``is_active`` on the other
+    active rows, one sets it on the target. Rows already in the right state
+    aren't touched. Both run in the caller's transaction, and the partial
+    unique index on ``is_active`` rejects a concurrent writer that would
+    leave two active rows.
+
+    A single ``SET is_active = (id = :target)`` statement would be
+    simpler, but SQLite and PostgreSQL check unique indexes row by row.
+    That statement fails whenever the target row is visited before the
+    row it replaces.
+
+    Args:
+        session: Database session
+        model: Model with ``id`` and ``is_active`` columns
+        target_id: ID of the row to activate
+        scope: Conditions selecting the parent's rows, e.g.
+            ``[Act.game_id == game_id]``. Empty for games, which are
+            exclusive across the whole database.
+    """
+    logger.debug("Activating %s %s", model.__name__, target_id)
+    session.execute(
+        update(model)
+        .where(*scope, model.is_active.is_(True), model.id != target_id)
+        .values(is_active=False)
+        .execution_options(synchronize_session="evaluate")
+    )
+    session.execute(
+        update(model)
+        .where(*scope, model.id == target_id, model.is_active.is_(False))
+        .values(is_active=True)
+        .execution_options(synchronize_session="evaluate")
+    )
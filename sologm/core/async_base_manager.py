@@ -0,0 +1,237 @@
+"""Base class for asyncio managers in SoloGM."""
+
+import functools
+import logging
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sologm.core.base_manager import BaseManager
+from sologm.utils.concurrency import call_blocking
+
+# Type variables for domain and database models
+T = TypeVar("T")  # Domain model type
+M = TypeVar("M")  # Database model type
+
+
+class AsyncBaseManager(Generic[T, M]):
+    """Base class for managers used from asyncio code.
+
+    An async manager wraps the synchronous manager of the same domain and
+    runs its methods through ``AsyncSession.run_sync``. Queries, validation
+    and error handling are therefore exactly those of the sync managers,
+    while database I/O goes through the async driver and yields to the event
+    loop instead of blocking it.
+
+    Subclasses set ``_sync_class`` and list the sync methods to expose in
+    ``_delegated``; an awaitable wrapper is generated for each of them. Like
+    BaseManager, it does NOT manage the session lifecycle; that is the job of
+    AsyncSessionContext.
+
+    The Anthropic client handed to the sync managers is wrapped in an
+    EventLoopClient, so their model calls are awaited on the loop rather
+    than blocking it.
+
+    Relationships that haven't been loaded can't be read lazily from async
+    code. Load them with ``await session.refresh(entity, ["<name>"])``.
+
+    Attributes:
+        logger: Logger instance specific to the subclass.
+        sync: The wrapped synchronous manager.
+    """
+
+    _sync_class: ClassVar[Type[BaseManager]]
+    _delegated: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in cls._delegated:
+            setattr(cls, name, _delegate(getattr(cls._sync_class, name)))
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        sync_manager: Optional[BaseManager] = None,
+        **manager_kwargs: Any,
+    ) -> None:
+        """Initialize with an active async session.
+
+        Args:
+            session: The AsyncSession to use for all database operations.
+            sync_manager: Existing sync manager bound to ``session.sync_session``
+                to wrap. Created from ``manager_kwargs`` if None.
+            manager_kwargs: Keyword arguments for the sync manager, such as
+                an ``anthropic_client``.
+        """
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._session = session
+        if manager_kwargs.get("anthropic_client") is not None:
+            manager_kwargs["anthropic_client"] = EventLoopClient.wrap(
+                manager_kwargs["anthropic_client"]
+            )
+        self.sync = sync_manager or self._sync_class(
+            session=session.sync_session, **manager_kwargs
+        )
+        self.logger.debug(
+            "Initialized %s with async session ID: %s",
+            self.__class__.__name__,
+            id(self._session),
+        )
+
+    async def _run(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a synchronous callable with database access on the event loop.
+
+        Args:
+            function: Callable using the sync session, typically a bound
+                method of the wrapped manager.
+            *args: Positional arguments for ``function``.
+            **kwargs: Keyword arguments for ``function``.
+
+        Returns:
+            The result of ``function``.
+        """
+        return await self._session.run_sync(lambda _: function(*args, **kwargs))
+
+    async def get_entity_or_error(
+        self,
+        model_class: Type[M],
+        entity_id: str,
+        error_class: Type[Exception],
+        error_message: Optional[str] = None,
+    ) -> M:
+        """Get an entity by ID or raise an error if not found.
+
+        See BaseManager.get_entity_or_error.
+        """
+        return await self._session.run_sync(
+            self.sync.get_entity_or_error,
+            model_class,
+            entity_id,
+            error_class,
+            error_message,
+        )
+
+    async def get_entity_by_identifier(
+        self, model_class: Type[M], identifier: str
+    ) -> Optional[M]:
+        """Find an entity by its ID (UUID) or slug.
+
+        See BaseManager.get_entity_by_identifier.
+        """
+        return await self._session.run_sync(
+            self.sync.get_entity_by_identifier, model_class, identifier
+        )
+
+    async def get_entity_by_identifier_or_error(
+        self,
+        model_class: Type[M],
+        identifier: str,
+        error_class: Type[Exception],
+        error_message: Optional[str] = None,
+    ) -> M:
+        """Find an entity by its ID (UUID) or slug, raising an error if not found.
+
+        See BaseManager.get_entity_by_identifier_or_error.
+        """
+        return await self._session.run_sync(
+            self.sync.get_entity_by_identifier_or_error,
+            model_class,
+            identifier,
+            error_class,
+            error_message,
+        )
+
+    async def list_entities(
+        self,
+        model_class: Type[M],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        order_direction: str = "asc",
+        limit: Optional[int] = None,
+    ) -> List[M]:
+        """List entities with optional filtering, ordering, and limit.
+
+        See BaseManager.list_entities.
+        """
+        return await self._run(
+            self.sync.list_entities,
+            model_class,
+            filters=filters,
+            order_by=order_by,
+            order_direction=order_direction,
+            limit=limit,
+        )
+
+
+class EventLoopClient:
+    """Anthropic client proxy that doesn't block the event loop.
+
+    Sync managers call the client from inside ``AsyncSession.run_sync``, on
+    the event loop thread. This proxy awaits the async variant of each call
+    there (``send_message_async`` and ``count_tokens_async``, which wait on
+    the rate limiter and back off with ``CallGuard.call_async``), and runs
+    batch jobs in a worker thread. Calls from any other thread go straight
+    to the wrapped client.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """Wrap a client.
+
+        Args:
+            client: The AnthropicClient (or a stand-in) to forward calls to.
+        """
+        self.client = client
+
+    @classmethod
+    def wrap(cls, client: Any) -> "EventLoopClient":
+        """Wrap ``client``, unless it is already wrapped."""
+        return client if isinstance(client, cls) else cls(client)
+
+    def send_message(self, *args: Any, **kwargs: Any) -> str:
+        """See AnthropicClient.send_message."""
+        return call_blocking(
+            self.client.send_message,
+            *args,
+            async_function=self.client.send_message_async,
+            **kwargs,
+        )
+
+    def count_tokens(self, *args: Any, **kwargs: Any) -> int:
+        """See AnthropicClient.count_tokens."""
+        return call_blocking(
+            self.client.count_tokens,
+            *args,
+            async_function=self.client.count_tokens_async,
+            **kwargs,
+        )
+
+    def send_batch(self, *args: Any, **kwargs: Any) -> Any:
+        """See AnthropicClient.send_batch."""
+        return call_blocking(self.client.send_batch, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+def _delegate(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Build an awaitable wrapper around a sync manager method."""
+
+    @functools.wraps(method)
+    async def wrapper(self: AsyncBaseManager, *args: Any, **kwargs: Any) -> Any:
+        return await self._run(getattr(self.sync, method.__name__), *args, **kwargs)
+
+    return wrapper
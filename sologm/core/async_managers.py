@@ -0,0 +1,193 @@
+"""Asyncio counterparts of the core managers.
+
+Each class exposes the public methods of its synchronous manager as
+coroutines. See AsyncBaseManager for how calls are executed.
+
+Example:
+    async with get_async_db_context() as session:
+        managers = create_all_async_managers(session)
+        scene = await managers.scene.get_active_scene()
+        await managers.event.add_event("The door creaks open", scene.id)
+
+Methods that call the AI (act summaries and narratives, oracle
+interpretations) keep their database work in ``run_sync`` and await the model
+requests on the loop through EventLoopClient, so other tasks keep running
+while a request is in flight.
+"""
+
+import logging
+from types import SimpleNamespace
+from typing import Optional, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from sologm.core.act import ActManager
+from sologm.core.async_base_manager import AsyncBaseManager, EventLoopClient
+from sologm.core.dice import DiceManager
+from sologm.core.event import EventManager
+from sologm.core.factory import create_all_managers
+from sologm.core.game import GameManager
+from sologm.core.oracle import OracleManager
+from sologm.core.scene import SceneManager
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.models.act import Act
+from sologm.models.dice import DiceRoll
+from sologm.models.event import Event
+from sologm.models.game import Game
+from sologm.models.oracle import InterpretationSet
+from sologm.models.scene import Scene
+from sologm.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGameManager(AsyncBaseManager[Game, Game]):
+    """Manages game operations from asyncio code."""
+
+    _sync_class = GameManager
+    _delegated = (
+        "create_game",
+        "list_games",
+        "get_game",
+        "get_game_by_identifier",
+        "get_game_by_identifier_or_error",
+        "get_game_by_id",
+        "get_game_by_slug",
+        "get_active_game",
+        "activate_game",
+        "deactivate_game",
+        "update_game",
+        "delete_game",
+        "get_latest_context_status",
+    )
+
+
+class AsyncActManager(AsyncBaseManager[Act, Act]):
+    """Manages act operations from asyncio code."""
+
+    _sync_class = ActManager
+    _delegated = (
+        "create_act",
+        "get_act",
+        "get_act_by_identifier_or_error",
+        "list_acts",
+        "get_active_act",
+        "edit_act",
+        "complete_act",
+        "set_active",
+        "validate_can_create_act",
+        "validate_active_act",
+        "get_most_recent_act",
+        "prepare_act_data_for_summary",
+        "generate_act_summary",
+        "generate_act_summary_with_feedback",
+        "prepare_regeneration_context",
+        "complete_act_with_ai",
+        "generate_and_update_act_summary",
+        "prepare_act_data_for_narrative",
+        "generate_act_narrative",
+    )
+
+
+class AsyncSceneManager(AsyncBaseManager[Scene, Scene]):
+    """Manages scene operations from asyncio code."""
+
+    _sync_class = SceneManager
+    _delegated = (
+        "get_active_context",
+        "get_scene",
+        "get_scene_by_identifier",
+        "get_scene_by_identifier_or_error",
+        "get_scene_in_act",
+        "get_active_scene",
+        "create_scene",
+        "list_scenes",
+        "set_current_scene",
+        "update_scene",
+        "get_previous_scene",
+        "get_most_recent_scene",
+        "validate_active_context",
+    )
+
+
+class AsyncEventManager(AsyncBaseManager[Event, Event]):
+    """Manages event operations from asyncio code."""
+
+    _sync_class = EventManager
+    _delegated = (
+        "get_active_scene_id",
+        "validate_active_context",
+        "add_event",
+        "get_event",
+        "update_event",
+        "list_events",
+        "list_events_for_act",
+        "get_event_sources",
+    )
+
+
+class AsyncDiceManager(AsyncBaseManager[DiceRoll, DiceRoll]):
+    """Manages dice rolling operations from asyncio code."""
+
+    _sync_class = DiceManager
+    _delegated = (
+        "roll",
+        "roll_for_active_scene",
+        "get_recent_rolls",
+        "get_rolls_for_scene",
+        "get_rolls_for_active_scene",
+        "roll_batch",
+        "replay_roll",
+    )
+
+
+class AsyncOracleManager(AsyncBaseManager[InterpretationSet, InterpretationSet]):
+    """Manages oracle interpretation operations from asyncio code."""
+
+    _sync_class = OracleManager
+    _delegated = (
+        "get_active_context",
+        "get_interpretation_set",
+        "get_current_interpretation_set",
+        "get_most_recent_interpretation",
+        "build_interpretation_prompt_for_active_context",
+        "get_interpretations",
+        "find_interpretation",
+        "select_interpretation",
+        "list_interpretation_sets",
+        "add_interpretation_event",
+    )
+
+
+def create_all_async_managers(
+    session: AsyncSession,
+    anthropic_client: Optional[AnthropicClient] = None,
+) -> SimpleNamespace:
+    """Create instances of all async managers, sharing a session and client.
+
+    The wrapped sync managers are wired together exactly as
+    create_all_managers does it, sharing one client wrapped in an
+    EventLoopClient.
+
+    Args:
+        session: The AsyncSession to be used by all managers.
+        anthropic_client: Optional pre-configured Anthropic client instance.
+
+    Returns:
+        A SimpleNamespace containing instances of all async managers.
+    """
+    logger.debug("Creating all async managers with session ID: %s", id(session))
+    if anthropic_client is None:
+        config = get_config()
+        anthropic_client = AnthropicClient(api_key=config.get("anthropic_api_key"))
+    # Stands in for the client it wraps
+    client = cast(AnthropicClient, EventLoopClient.wrap(anthropic_client))
+    sync = create_all_managers(session.sync_session, client)
+    return SimpleNamespace(
+        game=AsyncGameManager(session, sync_manager=sync.game),
+        act=AsyncActManager(session, sync_manager=sync.act),
+        scene=AsyncSceneManager(session, sync_manager=sync.scene),
+        event=AsyncEventManager(session, sync_manager=sync.event),
+        dice=AsyncDiceManager(session, sync_manager=sync.dice),
+        oracle=AsyncOracleManager(session, sync_manager=sync.oracle),
+    )
@@ -9,6 +9,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
@@ -16,6 +17,9 @@ from typing import (
 
 from sqlalchemy import asc, desc
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from sologm.utils.errors import ConflictError
 
 # Type variables for domain and database models
 T = TypeVar("T")  # Domain model type
@@ -49,8 +53,9 @@ class BaseManager(Generic[T, M]):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._session = session
         self.logger.debug(
-            f"Initialized {self.__class__.__name__} with session ID: "
-            f"{id(self._session)}"
+            "Initialized %s with session ID: %s",
+            self.__class__.__name__,
+            id(self._session),
         )
 
     def _convert_to_domain(self, db_model: M) -> T:
@@ -107,17 +112,26 @@ class BaseManager(Generic[T, M]):
             The result returned by the `operation` function.
 
         Raises:
+            ConflictError: If a flush hit a row changed by another writer.
             Exception: Re-raises any exception caught during the `operation`.
         """
-        self.logger.debug(f"Executing DB operation: {operation_name}")
+        self.logger.debug("Executing DB operation: %s", operation_name)
         try:
             # Pass the manager's session to the operation function
             result = operation(self._session, *args, **kwargs)
-            self.logger.debug(f"DB operation '{operation_name}' successful")
+            self.logger.debug("DB operation '%s' successful", operation_name)
             return result
+        except StaleDataError as e:
+            # A versioned row changed underneath one of our flushes
+            self.logger.error(
+                "Conflict during DB operation '%s': %s", operation_name, e
+            )
+            raise ConflictError(
+                f"Concurrent modification during {operation_name}"
+            ) from e
         except Exception as e:
             # Log the error but let the SessionContext handle rollback
-            self.logger.error(f"Error during DB operation '{operation_name}': {e}")
+            self.logger.error("Error during DB operation '%s': %s", operation_name, e)
             raise
 
     def get_entity_or_error(
@@ -171,7 +185,7 @@ class BaseManager(Generic[T, M]):
         # Try finding by ID first (usually primary key)
         entity = session.query(model_class).filter(model_class.id == identifier).first()
         if entity:
-            self.logger.debug(f"Found {model_class.__name__} by ID: {identifier}")
+            self.logger.debug("Found %s by ID: %s", model_class.__name__, identifier)
             return entity
 
         # If not found by ID and the model has a 'slug' attribute, try by slug
@@ -182,12 +196,14 @@ class BaseManager(Generic[T, M]):
                 .first()
             )
             if entity:
-                self.logger.debug(f"Found {model_class.__name__} by slug: {identifier}")
+                self.logger.debug(
+                    "Found %s by slug: %s", model_class.__name__, identifier
+                )
                 return entity
 
         # Not found by either
         self.logger.debug(
-            f"{model_class.__name__} not found by identifier: {identifier}"
+            "%s not found by identifier: %s", model_class.__name__, identifier
         )
         return None
 
@@ -220,7 +236,7 @@ class BaseManager(Generic[T, M]):
                 error_message = (
                     f"{model_class.__name__} not found with identifier '{identifier}'"
                 )
-            self.logger.warning(f"Raising error: {error_message}")
+            self.logger.warning("Raising error: %s", error_message)
             raise error_class(error_message)
         return entity
 
@@ -231,6 +247,7 @@ class BaseManager(Generic[T, M]):
         order_by: Optional[Union[str, List[str]]] = None,
         order_direction: str = "asc",
         limit: Optional[int] = None,
+        options: Optional[Sequence[Any]] = None,
     ) -> List[M]:
         """List entities with optional filtering, ordering, and limit.
 
@@ -240,6 +257,7 @@ class BaseManager(Generic[T, M]):
             order_by: Optional attribute(s) to order by
             order_direction: Direction to order ("asc" or "desc")
             limit: Optional maximum number of results to return
+            options: Optional loader options, e.g. ``joinedload(...)``
 
         Returns:
             List of entities matching the criteria
@@ -247,6 +265,8 @@ class BaseManager(Generic[T, M]):
 
         def _list_operation(session: Session) -> List[M]:
             query = session.query(model_class)
+            if options:
+                query = query.options(*options)
 
             # Apply filters
             if filters:
@@ -293,8 +313,9 @@ class BaseManager(Generic[T, M]):
             # Ensure the current manager's session is passed to the new manager
             kwargs["session"] = self._session
             self.logger.debug(
-                f"Lazy initializing {class_name} with session ID: "
-                f"{id(kwargs['session'])}"
+                "Lazy initializing %s with session ID: %s",
+                class_name,
+                id(kwargs["session"]),
             )
 
             setattr(self, attr_name, manager_class(**kwargs))
@@ -303,12 +324,13 @@ class BaseManager(Generic[T, M]):
             new_manager = getattr(self, attr_name)
             if hasattr(new_manager, "_session"):
                 self.logger.debug(
-                    f"Newly created {class_name} has session ID: "
-                    f"{id(new_manager._session)}"
+                    "Newly created %s has session ID: %s",
+                    class_name,
+                    id(new_manager._session),
                 )
             else:
                 self.logger.warning(
-                    f"Newly created {class_name} does not have a _session attribute."
+                    "Newly created %s does not have a _session attribute.", class_name
                 )
 
         return getattr(self, attr_name)
@@ -1,17 +1,25 @@
 """Dice rolling functionality."""
 
-import random
-import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from sologm.core.act import ActManager
 from sologm.core.base_manager import BaseManager
+from sologm.core.dice_notation import (
+    DiceExpression,
+    DiceResult,
+    evaluate,
+    parse_notation,
+)
 from sologm.core.game import GameManager
 from sologm.core.scene import SceneManager
+from sologm.models.act import Act
 from sologm.models.dice import DiceRoll
+from sologm.models.game import Game
 from sologm.models.scene import Scene
+from sologm.utils.dice_rng import new_seed, stream_rng
 from sologm.utils.errors import DiceError
 
 
@@ -58,6 +66,9 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
     ) -> DiceRoll:
         """Roll dice according to the specified notation and save to database.
 
+        Rolls in a scene draw from the owning game's seeded stream and record
+        their position, so they can be reproduced with ``replay_roll``.
+
         Args:
             notation: Dice notation string (e.g., "2d6+3")
             reason: Optional reason for the roll
@@ -70,32 +81,41 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             DiceError: If notation is invalid
         """
         self.logger.debug(
-            f"Rolling dice with notation: {notation}, reason: {reason}, scene: {scene}"
+            "Rolling dice with notation: %s, reason: %s, scene: %s",
+            notation,
+            reason,
+            scene,
         )
 
         try:
-            # Parse notation and roll dice
-            count, sides, modifier = self._parse_notation(notation)
-            self.logger.debug(f"Parsed notation: {count}d{sides}{modifier:+d}")
-
-            individual_results = [random.randint(1, sides) for _ in range(count)]
-            self.logger.debug(f"Individual dice results: {individual_results}")
-
-            total = sum(individual_results) + modifier
-            self.logger.debug(
-                f"Final result: {sum(individual_results)} + {modifier} = {total}"
-            )
+            expression = self._parse_notation(notation)
+            self.logger.debug("Parsed notation: %s", expression.notation)
 
             # Define the database operation
             def create_roll_operation(session: Session) -> DiceRoll:
+                seed, counter = self._allocate_stream_position(session, scene)
+                outcome = evaluate(expression, stream_rng(seed, counter))
+                self.logger.debug(
+                    "Individual dice results: %s", outcome.individual_results
+                )
+                self.logger.debug(
+                    "Final result: %s + %s = %s",
+                    outcome.total - outcome.modifier,
+                    outcome.modifier,
+                    outcome.total,
+                )
+
                 # Create the model instance
                 dice_roll_model = DiceRoll.create(
                     notation=notation,
-                    individual_results=individual_results,
-                    modifier=modifier,
-                    total=total,
+                    individual_results=outcome.individual_results,
+                    modifier=outcome.modifier,
+                    total=outcome.total,
                     reason=reason,
                     scene_id=scene.id if scene else None,
+                    term_results=outcome.term_results,
+                    rng_seed=seed,
+                    rng_counter=counter,
                 )
 
                 session.add(dice_roll_model)
@@ -105,11 +125,11 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
 
             # Execute the operation
             result = self._execute_db_operation("roll dice", create_roll_operation)
-            self.logger.debug(f"Created dice roll with ID: {result.id}")
+            self.logger.debug("Created dice roll with ID: %s", result.id)
             return result
 
         except DiceError:
-            self.logger.error(f"Dice notation error: {notation}")
+            self.logger.error("Dice notation error: %s", notation)
             raise
         except Exception:
             raise
@@ -130,17 +150,19 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             DiceError: If notation is invalid or no active scene
         """
         self.logger.debug(
-            f"Rolling dice for active scene with notation: {notation}, reason: {reason}"
+            "Rolling dice for active scene with notation: %s, reason: %s",
+            notation,
+            reason,
         )
         # Get active scene
         _, active_scene = self.scene_manager.validate_active_context()
         self.logger.debug(
-            f"Found active scene: {active_scene.id} - {active_scene.title}"
+            "Found active scene: %s - %s", active_scene.id, active_scene.title
         )
 
         # Roll dice for this scene
         result = self.roll(notation, reason, active_scene)
-        self.logger.debug(f"Created dice roll with ID: {result.id} for active scene")
+        self.logger.debug("Created dice roll with ID: %s for active scene", result.id)
         return result
 
     def get_recent_rolls(
@@ -159,7 +181,9 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             DiceError: If operation fails
         """
         scene_desc = f"{scene.id} - {scene.title}" if scene else "any scene"
-        self.logger.debug(f"Getting recent dice rolls for {scene_desc}, limit: {limit}")
+        self.logger.debug(
+            "Getting recent dice rolls for %s, limit: %s", scene_desc, limit
+        )
         filters = {}
         if scene:
             filters["scene_id"] = scene.id
@@ -171,7 +195,7 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             order_direction="desc",
             limit=limit,
         )
-        self.logger.debug(f"Found {len(result)} recent dice rolls")
+        self.logger.debug("Found %s recent dice rolls", len(result))
         return result
 
     def get_rolls_for_scene(
@@ -190,7 +214,10 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             DiceError: If operation fails
         """
         self.logger.debug(
-            f"Getting dice rolls for scene: {scene.id} - {scene.title}, limit: {limit}"
+            "Getting dice rolls for scene: %s - %s, limit: %s",
+            scene.id,
+            scene.title,
+            limit,
         )
 
         result = self.list_entities(
@@ -200,7 +227,7 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
             order_direction="desc",
             limit=limit,
         )
-        self.logger.debug(f"Found {len(result)} dice rolls for scene {scene.id}")
+        self.logger.debug("Found %s dice rolls for scene %s", len(result), scene.id)
         return result
 
     def get_rolls_for_active_scene(self, limit: Optional[int] = None) -> List[DiceRoll]:
@@ -215,54 +242,126 @@ class DiceManager(BaseManager[DiceRoll, DiceRoll]):
         Raises:
             DiceError: If no active scene or operation fails
         """
-        self.logger.debug(f"Getting dice rolls for active scene, limit: {limit}")
+        self.logger.debug("Getting dice rolls for active scene, limit: %s", limit)
         # Get active scene
         _, active_scene = self.scene_manager.validate_active_context()
         self.logger.debug(
-            f"Found active scene: {active_scene.id} - {active_scene.title}"
+            "Found active scene: %s - %s", active_scene.id, active_scene.title
         )
 
         # Get rolls for this scene
         result = self.get_rolls_for_scene(active_scene, limit)
-        self.logger.debug(f"Found {len(result)} dice rolls for active scene")
+        self.logger.debug("Found %s dice rolls for active scene", len(result))
         return result
 
-    def _parse_notation(self, notation: str) -> tuple[int, int, int]:
-        """Parse XdY+Z notation into components.
+    def roll_batch(
+        self,
+        notation: str,
+        times: int,
+        seed: Optional[int] = None,
+        start: int = 0,
+    ) -> List[DiceResult]:
+        """Roll the same notation repeatedly without saving the results.
+
+        The notation is parsed once, so this is suited to probability
+        estimates and other bulk rolling. Roll ``i`` draws from stream
+        position ``start + i``, so callers can split a large batch into
+        disjoint ``start`` ranges and roll them in parallel with results
+        identical to a single sequential batch.
 
         Args:
-            notation: Dice notation string (e.g., "2d6+3")
+            notation: Dice notation string (e.g., "4d6kh3")
+            times: Number of times to roll
+            seed: Optional stream seed; a random one is used when omitted
+            start: Stream position of the first roll
 
         Returns:
-            Tuple of (number of dice, sides per die, modifier)
+            List of roll results, one per roll
 
         Raises:
-            DiceError: If notation is invalid
+            DiceError: If notation is invalid or times is less than 1
         """
-        self.logger.debug(f"Parsing dice notation: {notation}")
+        if times < 1:
+            raise DiceError("Must roll at least once")
+        expression = self._parse_notation(notation)
+        if seed is None:
+            seed = new_seed()
+        self.logger.debug(
+            "Rolling %s %d times from seed %d at %d",
+            expression.notation,
+            times,
+            seed,
+            start,
+        )
+        return [
+            evaluate(expression, stream_rng(seed, counter))
+            for counter in range(start, start + times)
+        ]
 
-        pattern = r"^(\d+)d(\d+)([+-]\d+)?$"
-        match = re.match(pattern, notation)
+    def replay_roll(self, roll: DiceRoll) -> DiceResult:
+        """Re-evaluate a saved roll from its recorded stream position.
 
-        if not match:
-            self.logger.error(f"Invalid dice notation: {notation}")
-            raise DiceError(f"Invalid dice notation: {notation}")
+        Args:
+            roll: The dice roll to replay
 
-        count = int(match.group(1))
-        sides = int(match.group(2))
-        modifier = int(match.group(3) or 0)
+        Returns:
+            The reproduced result, identical to the original roll
 
-        self.logger.debug(
-            f"Parsing dice notation - count: {count}, "
-            f"sides: {sides}, modifier: {modifier}"
-        )
+        Raises:
+            DiceError: If the roll predates reproducible streams
+        """
+        if roll.rng_seed is None or roll.rng_counter is None:
+            raise DiceError(f"Dice roll {roll.id} has no recorded random stream")
+        expression = self._parse_notation(roll.notation)
+        return evaluate(expression, stream_rng(roll.rng_seed, roll.rng_counter))
+
+    def _allocate_stream_position(
+        self, session: Session, scene: Optional[Scene]
+    ) -> Tuple[int, int]:
+        """Reserve the next position in the game's random stream.
+
+        The counter is bumped in a single UPDATE ... RETURNING statement so
+        concurrent rolls in the same game never share a position. Rolls
+        outside a scene get a fresh one-off stream.
+
+        Args:
+            session: Database session
+            scene: Scene the roll belongs to, if any
+
+        Returns:
+            Tuple of (seed, counter)
+        """
+        if scene is None:
+            return new_seed(), 0
+
+        game_id = select(Act.game_id).where(Act.id == scene.act_id).scalar_subquery()
+        seed, next_counter = session.execute(
+            update(Game)
+            .where(Game.id == game_id)
+            .values(rng_counter=Game.rng_counter + 1)
+            .returning(Game.rng_seed, Game.rng_counter)
+            .execution_options(synchronize_session="fetch")
+        ).one()
+        return seed, next_counter - 1
+
+    def _parse_notation(self, notation: str) -> DiceExpression:
+        """Parse dice notation into an expression tree.
 
-        if count < 1:
-            self.logger.error(f"Invalid dice count: {count}")
-            raise DiceError("Must roll at least 1 die")
-        if sides < 2:
-            self.logger.error(f"Invalid sides count: {sides}")
-            raise DiceError("Die must have at least 2 sides")
+        Parsed expressions are cached, so repeated notations are only
+        compiled once.
 
-        self.logger.debug(f"Parsed {notation} as {count}d{sides}{modifier:+d}")
-        return count, sides, modifier
+        Args:
+            notation: Dice notation string (e.g., "2d6+3", "4d6kh3")
+
+        Returns:
+            The parsed DiceExpression
+
+        Raises:
+            DiceError: If notation is invalid
+        """
+        self.logger.debug("Parsing dice notation: %s", notation)
+        try:
+            return parse_notation(notation)
+        except DiceError as e:
+            self.logger.error("Invalid dice notation %s: %s", notation, e)
+            raise
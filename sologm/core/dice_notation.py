@@ -0,0 +1,431 @@
+"""Dice notation parsing and evaluation for SoloGM.
+
+Notation strings are compiled once into an immutable expression tree and
+memoized in a bounded LRU cache, so repeated rolls of the same notation
+skip parsing entirely.
+
+Supported grammar (case-insensitive, whitespace ignored):
+
+    expression := term (("+" | "-") term)*
+    term       := dice | integer
+    dice       := count "d" (sides | "%" | "F") modifier* [success]
+    modifier   := "!" [compare]        explode on max (or on compare)
+                | "r" [compare]        reroll while matching (default: 1s)
+                | "ro" [compare]       reroll once (default: 1s)
+                | "kh" N | "k" N       keep highest N
+                | "kl" N               keep lowest N
+                | "dh" N               drop highest N
+                | "dl" N               drop lowest N
+    success    := operator integer     count dice meeting the target
+    compare    := [operator] integer   bare integer means "="
+    operator   := "=" | "<" | ">" | "<=" | ">="
+
+Keep and drop rules rank dice by their total, counting a die together with
+its explosions, so ``4d6!dl1`` always drops exactly one die.
+
+Examples: ``2d6+3``, ``4d6kh3``, ``1d6!``, ``2d20kl1``, ``2d6+1d4-1``,
+``4dF``, ``6d10>=8``, ``3d6r<2``.
+"""
+
+import functools
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+
+from sologm.utils.errors import DiceError
+
+# Upper bounds that keep a single roll cheap no matter what the user types.
+MAX_DICE_PER_TERM = 1000
+MAX_EXPLOSIONS_PER_DIE = 100
+MAX_REROLLS_PER_DIE = 100
+NOTATION_CACHE_SIZE = 256
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<dice>\d+d(?:\d+|%|f))
+    | (?P<number>\d+)
+    | (?P<sign>[+-])
+    | (?P<explode>!)
+    | (?P<reroll_once>ro)
+    | (?P<reroll>r)
+    | (?P<keep>kh|kl|k|dh|dl)
+    | (?P<operator><=|>=|<|>|=)
+    """,
+    re.VERBOSE,
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class RandomSource(Protocol):
+    """Anything that can produce uniformly distributed integers."""
+
+    def randint(self, a: int, b: int) -> int:
+        """Return a random integer N such that a <= N <= b."""
+        ...
+
+
+@dataclass(frozen=True)
+class ComparePoint:
+    """A comparison against a single die face (e.g. ``>=5``)."""
+
+    operator: str
+    value: int
+
+    def matches(self, roll: int) -> bool:
+        """Check whether a die face satisfies this comparison."""
+        if self.operator == "=":
+            return roll == self.value
+        if self.operator == "<":
+            return roll < self.value
+        if self.operator == ">":
+            return roll > self.value
+        if self.operator == "<=":
+            return roll <= self.value
+        return roll >= self.value
+
+    def __str__(self) -> str:
+        """Render the comparison in notation form."""
+        return f"{self.operator}{self.value}"
+
+
+@dataclass(frozen=True)
+class KeepRule:
+    """Which dice of a pool count towards the result."""
+
+    highest: bool
+    count: int
+
+
+@dataclass(frozen=True)
+class DiceTerm:
+    """A single pool of identical dice, such as ``4d6kh3``."""
+
+    text: str
+    count: int
+    sides: int
+    sign: int = 1
+    fudge: bool = False
+    explode: Optional[ComparePoint] = None
+    reroll: Optional[ComparePoint] = None
+    reroll_once: bool = False
+    keep: Optional[KeepRule] = None
+    success: Optional[ComparePoint] = None
+
+    @property
+    def faces(self) -> Tuple[int, int]:
+        """Lowest and highest face of a single die."""
+        return (-1, 1) if self.fudge else (1, self.sides)
+
+
+@dataclass(frozen=True)
+class ConstantTerm:
+    """A flat signed modifier, such as the ``-1`` in ``2d6-1``."""
+
+    text: str
+    value: int
+
+
+Term = Union[DiceTerm, ConstantTerm]
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """A parsed dice notation, safe to share between rolls."""
+
+    notation: str
+    terms: Tuple[Term, ...]
+
+    @property
+    def dice_terms(self) -> Tuple[DiceTerm, ...]:
+        """All dice pools in the expression, in order."""
+        return tuple(term for term in self.terms if isinstance(term, DiceTerm))
+
+    @property
+    def modifier(self) -> int:
+        """Sum of all constant terms."""
+        return sum(term.value for term in self.terms if isinstance(term, ConstantTerm))
+
+
+@dataclass
+class DiceResult:
+    """The outcome of evaluating a DiceExpression once."""
+
+    notation: str
+    total: int
+    modifier: int
+    individual_results: List[int] = field(default_factory=list)
+    term_results: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _Parser:
+    """Recursive-descent parser over the pre-tokenized notation."""
+
+    def __init__(self, notation: str, tokens: List[Tuple[str, str]]):
+        self.notation = notation
+        self.tokens = tokens
+        self.position = 0
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _take(self) -> Tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _error(self, reason: str) -> DiceError:
+        return DiceError(f"Invalid dice notation: {self.notation} ({reason})")
+
+    def parse(self) -> DiceExpression:
+        terms: List[Term] = [self._parse_term(sign=1, sign_text="")]
+        while self._peek() is not None:
+            kind, text = self._take()
+            if kind != "sign":
+                raise self._error(f"unexpected '{text}'")
+            if self._peek() is None:
+                raise self._error("expression ends with an operator")
+            sign = -1 if text == "-" else 1
+            terms.append(self._parse_term(sign=sign, sign_text=text))
+
+        if not any(isinstance(term, DiceTerm) for term in terms):
+            raise DiceError(f"Invalid dice notation: {self.notation}")
+        return DiceExpression(notation=self.notation, terms=tuple(terms))
+
+    def _parse_term(self, sign: int, sign_text: str) -> Term:
+        kind, text = self._take()
+        if kind == "number":
+            return ConstantTerm(text=f"{sign_text}{text}", value=sign * int(text))
+        if kind != "dice":
+            raise self._error(f"unexpected '{text}'")
+
+        count_text, _, sides_text = text.partition("d")
+        count = int(count_text)
+        fudge = sides_text == "f"
+        sides = 100 if sides_text == "%" else 3 if fudge else int(sides_text)
+        if count < 1:
+            raise DiceError("Must roll at least 1 die")
+        if count > MAX_DICE_PER_TERM:
+            raise DiceError(f"Cannot roll more than {MAX_DICE_PER_TERM} dice at once")
+        if sides < 2:
+            raise DiceError("Die must have at least 2 sides")
+
+        options: Dict[str, Any] = {}
+        faces = (-1, 1) if fudge else (1, sides)
+        start = self.position
+        token = self._peek()
+        while token is not None and token[0] != "sign":
+            self._parse_modifier(options, count, faces)
+            token = self._peek()
+
+        term_text = text.upper() if fudge else text
+        term_text += "".join(token for _, token in self.tokens[start : self.position])
+        term = DiceTerm(
+            text=f"{sign_text}{term_text}",
+            count=count,
+            sides=sides,
+            sign=sign,
+            fudge=fudge,
+            **options,
+        )
+        self._validate_term(term)
+        return term
+
+    def _parse_modifier(
+        self, options: Dict[str, Any], count: int, faces: Tuple[int, int]
+    ) -> None:
+        kind, text = self._take()
+        if kind == "explode":
+            compare = self._parse_compare(required=False)
+            # A bare "!" explodes on the highest face.
+            default = ComparePoint(operator="=", value=faces[1])
+            self._set_once(options, "explode", compare or default)
+        elif kind in ("reroll", "reroll_once"):
+            compare = self._parse_compare(required=False)
+            # A bare "r" rerolls the lowest face.
+            default = ComparePoint(operator="=", value=faces[0])
+            self._set_once(options, "reroll", compare or default)
+            options["reroll_once"] = kind == "reroll_once"
+        elif kind == "keep":
+            amount = self._parse_number()
+            if text in ("dh", "dl"):
+                if amount >= count:
+                    raise self._error(f"cannot drop {amount} of {count} dice")
+                rule = KeepRule(highest=text == "dl", count=count - amount)
+            else:
+                if amount < 1 or amount > count:
+                    raise self._error(f"cannot keep {amount} of {count} dice")
+                rule = KeepRule(highest=text != "kl", count=amount)
+            self._set_once(options, "keep", rule)
+        elif kind == "operator":
+            self.position -= 1
+            self._set_once(options, "success", self._parse_compare(required=True))
+        else:
+            raise self._error(f"unexpected '{text}'")
+
+    def _parse_compare(self, required: bool) -> Optional[ComparePoint]:
+        token = self._peek()
+        if token is not None and token[0] == "operator":
+            self._take()
+            return ComparePoint(operator=token[1], value=self._parse_number())
+        if token is not None and token[0] == "number":
+            return ComparePoint(operator="=", value=self._parse_number())
+        if required:
+            raise self._error("expected a comparison")
+        return None
+
+    def _parse_number(self) -> int:
+        token = self._peek()
+        if token is None or token[0] != "number":
+            raise self._error("expected a number")
+        return int(self._take()[1])
+
+    def _set_once(self, options: Dict[str, Any], key: str, value: Any) -> None:
+        if key in options:
+            raise self._error(f"'{key}' specified more than once")
+        options[key] = value
+
+    def _validate_term(self, term: DiceTerm) -> None:
+        low, high = term.faces
+        faces = range(low, high + 1)
+        if term.explode is not None:
+            if term.fudge:
+                raise self._error("fudge dice cannot explode")
+            if all(term.explode.matches(face) for face in faces):
+                raise self._error("every face would explode")
+        if term.reroll is not None and not term.reroll_once:
+            if all(term.reroll.matches(face) for face in faces):
+                raise self._error("every face would be rerolled")
+
+
+def _tokenize(notation: str) -> List[Tuple[str, str]]:
+    """Split a notation into (kind, text) tokens.
+
+    Raises:
+        DiceError: If the notation contains characters outside the grammar.
+    """
+    compact = _WHITESPACE_PATTERN.sub("", notation).lower()
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    while position < len(compact):
+        match = _TOKEN_PATTERN.match(compact, position)
+        if not match:
+            raise DiceError(f"Invalid dice notation: {notation}")
+        tokens.append((match.lastgroup or "", match.group()))
+        position = match.end()
+    return tokens
+
+
+@functools.lru_cache(maxsize=NOTATION_CACHE_SIZE)
+def parse_notation(notation: str) -> DiceExpression:
+    """Parse a dice notation string into a DiceExpression.
+
+    Results are memoized per notation string; the returned expression is
+    immutable and can be shared freely.
+
+    Args:
+        notation: Dice notation string (e.g., "4d6kh3+2").
+
+    Returns:
+        The parsed expression.
+
+    Raises:
+        DiceError: If the notation is invalid.
+    """
+    tokens = _tokenize(notation)
+    if not tokens:
+        raise DiceError(f"Invalid dice notation: {notation}")
+    return _Parser(notation, tokens).parse()
+
+
+def _roll_die(term: DiceTerm, rng: RandomSource) -> List[int]:
+    """Roll one die of a term, applying rerolls and explosions."""
+    low, high = term.faces
+    value = rng.randint(low, high)
+    if term.reroll is not None:
+        rerolls = 0
+        while term.reroll.matches(value) and rerolls < MAX_REROLLS_PER_DIE:
+            value = rng.randint(low, high)
+            rerolls += 1
+            if term.reroll_once:
+                break
+
+    results = [value]
+    explode_on = term.explode
+    if explode_on is not None:
+        explosions = 0
+        while explode_on.matches(value) and explosions < MAX_EXPLOSIONS_PER_DIE:
+            value = rng.randint(low, high)
+            results.append(value)
+            explosions += 1
+    return results
+
+
+def _evaluate_term(term: DiceTerm, rng: RandomSource) -> Dict[str, Any]:
+    """Roll a dice term and describe its outcome."""
+    # One group per die: its roll followed by any explosions, so keep/drop
+    # rules count dice rather than individual rolls
+    groups = [_roll_die(term, rng) for _ in range(term.count)]
+    rolls = [roll for group in groups for roll in group]
+
+    kept = rolls
+    if term.keep is not None:
+        ranked = sorted(range(len(groups)), key=lambda index: sum(groups[index]))
+        if term.keep.highest:
+            kept_indexes = set(ranked[-term.keep.count :])
+        else:
+            kept_indexes = set(ranked[: term.keep.count])
+        kept = [
+            roll
+            for index, group in enumerate(groups)
+            if index in kept_indexes
+            for roll in group
+        ]
+
+    result: Dict[str, Any] = {"term": term.text, "rolls": rolls, "kept": kept}
+    if term.success is not None:
+        successes = sum(1 for roll in kept if term.success.matches(roll))
+        result["successes"] = successes
+        result["total"] = term.sign * successes
+    else:
+        result["total"] = term.sign * sum(kept)
+    return result
+
+
+def evaluate(
+    expression: DiceExpression, rng: Optional[RandomSource] = None
+) -> DiceResult:
+    """Roll a parsed expression once.
+
+    Args:
+        expression: The parsed dice expression.
+        rng: Random source to draw from. Defaults to the global ``random``
+            module.
+
+    Returns:
+        The result, including per-term breakdowns.
+    """
+    source: RandomSource = rng if rng is not None else random
+    total = 0
+    individual_results: List[int] = []
+    term_results: List[Dict[str, Any]] = []
+
+    for term in expression.terms:
+        if isinstance(term, ConstantTerm):
+            total += term.value
+            term_results.append({"term": term.text, "total": term.value})
+            continue
+        term_result = _evaluate_term(term, source)
+        total += term_result["total"]
+        individual_results.extend(term_result["kept"])
+        term_results.append(term_result)
+
+    return DiceResult(
+        notation=expression.notation,
+        total=total,
+        modifier=expression.modifier,
+        individual_results=individual_results,
+        term_results=term_results,
+    )
@@ -0,0 +1,367 @@
+"""Running context digests of scenes and acts.
+
+Oracle prompts describe the story so far with a short digest of the current
+scene and act instead of the raw event history, so their size stays the
+same as a game grows. Digests are updated incrementally: only events added
+since the last update are sent to the model, together with the current
+digest.
+
+Building an oracle prompt only reads the stored digests. Updates run on a
+worker thread, at a time set by the ``context_digest_mode`` setting:
+
+- ``deferred`` (default): after each oracle interpretation is committed,
+  folding in every event added since the last update. The interpretation
+  itself never waits for it; the next one sees the result.
+- ``background``: as soon as each event is committed, so the oracle usually
+  finds the digest up to date. Suited to long-running processes such as
+  ``sologm serve``.
+- ``off``: digests are not used.
+
+A process waits for queued updates before it exits.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import ColumnElement, and_, event, or_
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from sologm.core.base_manager import BaseManager
+from sologm.core.prompts.digest import DigestPrompts
+from sologm.core.summarization import chunk_events
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.models.act import Act
+from sologm.models.context_digest import ACT_SCOPE, SCENE_SCOPE, ContextDigest
+from sologm.models.event import Event
+from sologm.models.scene import Scene
+from sologm.utils.errors import APIError
+
+logger = logging.getLogger(__name__)
+
+DIGEST_MODES = ("deferred", "background", "off")
+
+# (created_at, id) of the last event folded into a digest
+Watermark = Tuple[Optional[datetime], Optional[str]]
+# scope, owner ID, act ID, title, current digest, new events, watermark
+PendingDigest = Tuple[
+    str, str, str, Optional[str], str, List[Dict[str, Any]], Watermark
+]
+
+# Scenes to update once the session's transaction commits
+_SCHEDULED_KEY = "sologm_digest_scenes"
+
+
+def get_digest_mode() -> str:
+    """Get the configured digest mode, falling back to ``deferred``."""
+    from sologm.utils.config import get_config
+
+    mode = (get_config().get_str("context_digest_mode", "deferred") or "").lower()
+    if mode not in DIGEST_MODES:
+        logger.warning("Unknown context_digest_mode '%s', using 'deferred'", mode)
+        return "deferred"
+    return mode
+
+
+class ContextDigestManager(BaseManager[ContextDigest, ContextDigest]):
+    """Maintains the running digests of scenes and acts."""
+
+    def __init__(
+        self,
+        session: Session,
+        anthropic_client: Optional[AnthropicClient] = None,
+    ):
+        """Initialize the digest manager.
+
+        Args:
+            session: Database session
+            anthropic_client: Client used to update digests
+        """
+        super().__init__(session=session)
+        self.anthropic_client = anthropic_client or AnthropicClient()
+
+    def get_digests(self, scene_id: str) -> Dict[str, str]:
+        """Get the stored digests of a scene and its act, without updating them.
+
+        Args:
+            scene_id: ID of the scene
+
+        Returns:
+            Dict with "scene" and "act" digests (empty strings if none yet).
+        """
+
+        def _get(session: Session) -> Dict[str, str]:
+            scene = session.get(Scene, scene_id)
+            if scene is None:
+                return {"scene": "", "act": ""}
+            rows = {
+                row.owner_id: row.digest
+                for row in session.query(ContextDigest).filter(
+                    ContextDigest.owner_id.in_([scene.id, scene.act_id])
+                )
+            }
+            return {
+                "scene": rows.get(scene.id, ""),
+                "act": rows.get(scene.act_id, ""),
+            }
+
+        return self._execute_db_operation("get context digests", _get)
+
+    def refresh(self, scene_id: str) -> Dict[str, str]:
+        """Fold events added since the last update into the scene and act digests.
+
+        Makes no AI call when both digests are current.
+
+        Args:
+            scene_id: ID of the scene
+
+        Returns:
+            Dict with the updated "scene" and "act" digests.
+
+        Raises:
+            APIError: If a digest update request fails
+        """
+        from sologm.utils.config import get_config
+
+        config = get_config()
+        max_words = config.get_int("context_digest_words", 200)
+        chunk_chars = config.get_int("summary_chunk_chars", 40000)
+
+        for target in self._execute_db_operation(
+            "load pending digest events", self._load_pending, scene_id
+        ):
+            scope, owner_id, act_id, title, digest, events, watermark = target
+            if not events:
+                continue
+            logger.debug(
+                "Folding %s new events into the %s digest of %s",
+                len(events),
+                scope,
+                owner_id,
+            )
+            for chunk in chunk_events(events, chunk_chars):
+                prompt = DigestPrompts.build_update_prompt(
+                    scope, title, digest, chunk, max_words=max_words
+                )
+                try:
+                    digest = self.anthropic_client.send_message(
+                        prompt=prompt,
+                        max_tokens=max_words * 2,
+                        temperature=0.3,
+                        call_site=f"{scope}.digest",
+                    ).strip()
+                except Exception as e:
+                    raise APIError(f"Failed to update {scope} digest: {e}") from e
+            self._execute_db_operation(
+                "store context digest",
+                self._store,
+                scope,
+                owner_id,
+                act_id,
+                scene_id if scope == SCENE_SCOPE else None,
+                digest,
+                events,
+                watermark,
+            )
+        return self.get_digests(scene_id)
+
+    def schedule(self, scene_id: str) -> None:
+        """Queue a background update of a scene's digests.
+
+        The update is handed to the worker thread once the current
+        transaction commits, so it sees the new events. A scene is queued
+        once per transaction however often it is scheduled, and nothing is
+        queued if the transaction rolls back.
+
+        Args:
+            scene_id: ID of the scene that changed
+        """
+        scheduled: Dict[str, Tuple[Engine, AnthropicClient]] = (
+            self._session.info.setdefault(_SCHEDULED_KEY, {})
+        )
+        scheduled.setdefault(
+            scene_id, (self._session.get_bind().engine, self.anthropic_client)
+        )
+
+    def _load_pending(self, session: Session, scene_id: str) -> List[PendingDigest]:
+        """Get each digest of a scene with the events it doesn't cover yet."""
+        scene = session.get(Scene, scene_id)
+        if scene is None:
+            return []
+        act = session.get(Act, scene.act_id)
+        if act is None:
+            return []
+        rows = {
+            row.owner_id: row
+            for row in session.query(ContextDigest).filter(
+                ContextDigest.owner_id.in_([scene.id, act.id])
+            )
+        }
+
+        targets: List[PendingDigest] = []
+        scopes: List[Tuple[str, str, Optional[str], ColumnElement[bool]]] = [
+            (SCENE_SCOPE, scene.id, scene.title, Event.scene_id == scene.id),
+            (ACT_SCOPE, act.id, act.title, Event.act_id == act.id),
+        ]
+        for scope, owner_id, title, scope_filter in scopes:
+            row = rows.get(owner_id)
+            watermark: Watermark = (
+                (row.through_created_at, row.through_event_id) if row else (None, None)
+            )
+            query = (
+                session.query(Event, Scene.title)
+                .join(Scene, Event.scene_id == Scene.id)
+                .filter(scope_filter)
+            )
+            created_at, event_id = watermark
+            if created_at is not None:
+                query = query.filter(
+                    or_(
+                        Event.created_at > created_at,
+                        and_(Event.created_at == created_at, Event.id > event_id),
+                    )
+                )
+            events = [
+                {
+                    "id": ev.id,
+                    "created_at": ev.created_at,
+                    "description": ev.description,
+                    "scene": scene_title if scope == ACT_SCOPE else None,
+                }
+                for ev, scene_title in query.order_by(Event.created_at, Event.id)
+            ]
+            targets.append(
+                (
+                    scope,
+                    owner_id,
+                    act.id,
+                    title,
+                    row.digest if row else "",
+                    events,
+                    watermark,
+                )
+            )
+        return targets
+
+    def _store(
+        self,
+        session: Session,
+        scope: str,
+        owner_id: str,
+        act_id: str,
+        scene_id: Optional[str],
+        digest: str,
+        events: List[Dict],
+        watermark: Watermark,
+    ) -> None:
+        """Save an updated digest unless another update got there first."""
+        row = session.get(ContextDigest, owner_id)
+        if row is None:
+            row = ContextDigest(
+                owner_id=owner_id,
+                scope=scope,
+                act_id=act_id,
+                scene_id=scene_id,
+                event_count=0,
+            )
+            session.add(row)
+        elif (row.through_created_at, row.through_event_id) != watermark:
+            logger.debug("Digest of %s was updated concurrently, skipping", owner_id)
+            return
+        row.digest = digest
+        row.event_count += len(events)
+        row.through_created_at = events[-1]["created_at"]
+        row.through_event_id = events[-1]["id"]
+        session.flush()
+
+
+class DigestWorker:
+    """Background thread that updates digests after events are committed.
+
+    Updates run one at a time, each in its own session on the engine the
+    event was written to. Requests for a scene already waiting in the queue
+    are merged. The thread exits when the queue is empty and is started
+    again by the next request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle worker; the thread starts on first use."""
+        self._queue: "queue.Queue[Tuple[str, Engine, AnthropicClient]]" = queue.Queue()
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._joins_at_exit = False
+
+    def submit(self, scene_id: str, engine: Engine, client: AnthropicClient) -> None:
+        """Queue a digest update for a scene.
+
+        Args:
+            scene_id: ID of the scene
+            engine: Engine of the database the scene lives in
+            client: Client used for the update
+        """
+        with self._lock:
+            if scene_id in self._pending:
+                return
+            self._pending.add(scene_id)
+            self._queue.put((scene_id, engine, client))
+            if self._thread is None:
+                if not self._joins_at_exit:
+                    # Let a CLI command finish its update before exiting;
+                    # the thread is a daemon so a hard exit doesn't hang
+                    atexit.register(self.join)
+                    self._joins_at_exit = True
+                self._thread = threading.Thread(
+                    target=self._run, name="digest-worker", daemon=True
+                )
+                self._thread.start()
+
+    def join(self) -> None:
+        """Wait until every queued update has finished and the thread exited."""
+        self._queue.join()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                try:
+                    scene_id, engine, client = self._queue.get_nowait()
+                except queue.Empty:
+                    self._thread = None
+                    return
+                self._pending.discard(scene_id)
+            try:
+                with Session(bind=engine) as session:
+                    ContextDigestManager(
+                        session=session, anthropic_client=client
+                    ).refresh(scene_id)
+                    session.commit()
+            except Exception as e:
+                logger.warning(
+                    "Background digest update for %s failed: %s", scene_id, e
+                )
+            finally:
+                self._queue.task_done()
+
+
+# Process-wide worker that runs scheduled updates
+digest_worker = DigestWorker()
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_scheduled(session: Session) -> None:
+    scheduled = session.info.pop(_SCHEDULED_KEY, None)
+    for scene_id, (engine, client) in (scheduled or {}).items():
+        digest_worker.submit(scene_id, engine, client)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_scheduled(session: Session) -> None:
+    session.info.pop(_SCHEDULED_KEY, None)
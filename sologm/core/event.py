@@ -1,21 +1,28 @@
 """Event management functionality."""
 
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from sologm.core.act import ActManager
 from sologm.core.base_manager import BaseManager
+from sologm.core.digest import ContextDigestManager, get_digest_mode
 from sologm.core.game import GameManager
 from sologm.core.scene import SceneManager
+from sologm.core.versioning import update_versioned
 from sologm.models.event import Event
-from sologm.models.event_source import EventSource
+from sologm.models.event_source import EventSource, event_source_cache
 from sologm.models.scene import Scene
 from sologm.utils.errors import EventError
 
 logger = logging.getLogger(__name__)
 
+# Renderers and prompts show every event's source name, so load the source in
+# the same query instead of lazily once per row
+_EVENT_LOAD_OPTIONS = (joinedload(Event.source),)
+
 
 class EventManager(BaseManager[Event, Event]):
     """Manages event operations."""
@@ -41,6 +48,15 @@ class EventManager(BaseManager[Event, Event]):
             "_scene_manager", "sologm.core.scene.SceneManager", session=self._session
         )
 
+    @property
+    def digest_manager(self) -> ContextDigestManager:
+        """Lazy-initialize the context digest manager."""
+        return self._lazy_init_manager(
+            "_digest_manager",
+            "sologm.core.digest.ContextDigestManager",
+            anthropic_client=self.act_manager.anthropic_client,
+        )
+
     @property
     def act_manager(self) -> ActManager:
         """Access act manager through scene manager."""
@@ -75,7 +91,7 @@ class EventManager(BaseManager[Event, Event]):
             raise EventError("No active scene found in the active game")
 
         scene_id = game.active_scene.id
-        self.logger.debug(f"Active scene ID: {scene_id}")
+        self.logger.debug("Active scene ID: %s", scene_id)
         return scene_id
 
     def validate_active_context(self) -> tuple[str, str]:
@@ -99,13 +115,19 @@ class EventManager(BaseManager[Event, Event]):
         game_id = act.game_id
 
         self.logger.debug(
-            f"Active context validated: game={game_id}, act={act_id}, scene={scene.id}"
+            "Active context validated: game=%s, act=%s, scene=%s",
+            game_id,
+            act_id,
+            scene.id,
         )
         return game_id, scene.id
 
     def _get_source_by_name(self, session: Session, source_name: str) -> EventSource:
         """Get an event source by name.
 
+        Served from the process-wide event source cache, so no query is
+        issued once the cache is warm.
+
         Args:
             session: SQLAlchemy session
             source_name: Name of the source
@@ -116,16 +138,13 @@ class EventManager(BaseManager[Event, Event]):
         Raises:
             EventError: If the source doesn't exist
         """
-        self.logger.debug(f"Getting event source by name: {source_name}")
+        self.logger.debug("Getting event source by name: %s", source_name)
 
-        # Query for the source
-        source = (
-            session.query(EventSource).filter(EventSource.name == source_name).first()
-        )
+        source = event_source_cache.get_source(session, source_name)
 
         # If not found, provide helpful error with valid sources
         if not source:
-            valid_sources = [s.name for s in session.query(EventSource).all()]
+            valid_sources = sorted(event_source_cache.get_ids(session))
             error_msg = (
                 f"Invalid source '{source_name}'. Valid sources: "
                 f"{', '.join(valid_sources)}"
@@ -133,7 +152,7 @@ class EventManager(BaseManager[Event, Event]):
             self.logger.error(error_msg)
             raise EventError(error_msg)
 
-        self.logger.debug(f"Found source: {source.name} (ID: {source.id})")
+        self.logger.debug("Found source: %s (ID: %s)", source.name, source.id)
         return source
 
     def add_event(
@@ -158,27 +177,30 @@ class EventManager(BaseManager[Event, Event]):
             EventError: If the scene is not found or source is invalid
         """
         self.logger.debug(
-            f"Adding event: description='{description[:30]}...', "
-            f"scene_id={scene_id or 'active'}, source={source}, "
-            f"interpretation_id={interpretation_id or 'None'}"
+            "Adding event: description='%s...', scene_id=%s, source=%s, "
+            "interpretation_id=%s",
+            description[:30],
+            scene_id or "active",
+            source,
+            interpretation_id or "None",
         )
 
         # Use active scene if none provided
         if scene_id is None:
             scene_id = self.get_active_scene_id()
-            self.logger.debug(f"Using active scene ID: {scene_id}")
+            self.logger.debug("Using active scene ID: %s", scene_id)
 
         def _add_event(session: Session) -> Event:
             # Validate scene exists
             scene = self.get_entity_or_error(
                 session, Scene, scene_id, EventError, f"Scene {scene_id} not found"
             )
-            self.logger.debug(f"Found scene: {scene.title} (ID: {scene.id})")
+            self.logger.debug("Found scene: %s (ID: %s)", scene.title, scene.id)
 
             # Get source
             event_source = self._get_source_by_name(session, source)
             self.logger.debug(
-                f"Using source: {event_source.name} (ID: {event_source.id})"
+                "Using source: %s (ID: %s)", event_source.name, event_source.id
             )
 
             # Create event
@@ -188,7 +210,9 @@ class EventManager(BaseManager[Event, Event]):
                 source_id=event_source.id,
                 interpretation_id=interpretation_id,
             )
-            self.logger.debug(f"Created event with ID: {event.id}")
+            # Keep the cached source attached so event.source needs no SELECT
+            event.source = event_source
+            self.logger.debug("Created event with ID: %s", event.id)
 
             session.add(event)
             session.flush()
@@ -196,9 +220,14 @@ class EventManager(BaseManager[Event, Event]):
 
         event = self._execute_db_operation("add event", _add_event)
         self.logger.info(
-            f"Added event: ID={event.id}, scene_id={event.scene_id}, "
-            f"source={event.source_name}"
+            "Added event: ID=%s, scene_id=%s, source=%s",
+            event.id,
+            event.scene_id,
+            event.source_name,
         )
+        # Otherwise the digests catch up after the next oracle interpretation
+        if get_digest_mode() == "background":
+            self.digest_manager.schedule(event.scene_id)
         return event
 
     def get_event(self, event_id: str) -> Optional[Event]:
@@ -210,14 +239,19 @@ class EventManager(BaseManager[Event, Event]):
         Returns:
             The event if found, None otherwise
         """
-        self.logger.debug(f"Getting event by ID: {event_id}")
+        self.logger.debug("Getting event by ID: %s", event_id)
 
         def _get_event(session: Session) -> Optional[Event]:
-            event = session.query(Event).filter(Event.id == event_id).first()
+            event = (
+                session.query(Event)
+                .options(*_EVENT_LOAD_OPTIONS)
+                .filter(Event.id == event_id)
+                .first()
+            )
             if event:
-                self.logger.debug(f"Found event: {event.id}")
+                self.logger.debug("Found event: %s", event.id)
             else:
-                self.logger.debug(f"Event not found with ID: {event_id}")
+                self.logger.debug("Event not found with ID: %s", event_id)
             return event
 
         return self._execute_db_operation("get event", _get_event)
@@ -237,10 +271,14 @@ class EventManager(BaseManager[Event, Event]):
 
         Raises:
             EventError: If the event is not found or source is invalid
+            ConflictError: If another writer changed the same fields since
+                the event was loaded
         """
         self.logger.debug(
-            f"Updating event: id={event_id}, description='{description[:30]}...', "
-            f"source={source or 'unchanged'}"
+            "Updating event: id=%s, description='%s...', source=%s",
+            event_id,
+            description[:30],
+            source or "unchanged",
         )
 
         def _update_event(session: Session) -> Event:
@@ -252,34 +290,44 @@ class EventManager(BaseManager[Event, Event]):
                 EventError,
                 f"Event with ID '{event_id}' not found",
             )
-            self.logger.debug(f"Found event: {event.id} (scene: {event.scene_id})")
+            self.logger.debug("Found event: %s (scene: %s)", event.id, event.scene_id)
 
             # Store original values for logging
             original_description = event.description
             original_source_id = event.source_id
 
-            # Update description
-            event.description = description
+            changes: Dict[str, Any] = {"description": description}
             self.logger.debug(
-                f"Updated description from '{original_description[:30]}...'"
-                f"to '{description[:30]}...'"
+                "Updating description from '%s...'to '%s...'",
+                original_description[:30],
+                description[:30],
             )
 
             # Update source if provided
             if source is not None:
                 event_source = self._get_source_by_name(session, source)
-                event.source = event_source
+                changes["source_id"] = event_source.id
                 self.logger.debug(
-                    f"Updated source from ID {original_source_id} to "
-                    f"{event_source.id} ({event_source.name})"
+                    "Updating source from ID %s to %s (%s)",
+                    original_source_id,
+                    event_source.id,
+                    event_source.name,
                 )
 
+            update_versioned(session, event, changes)
+            if source is not None:
+                # Point the loaded relationship at the new source without
+                # another query
+                set_committed_value(event, "source", event_source)
+
             return event
 
         event = self._execute_db_operation("update event", _update_event)
         self.logger.info(
-            f"Updated event: ID={event.id}, scene_id={event.scene_id}, "
-            f"source={event.source_name}"
+            "Updated event: ID=%s, scene_id=%s, source=%s",
+            event.id,
+            event.scene_id,
+            event.source_name,
         )
         return event
 
@@ -305,27 +353,27 @@ class EventManager(BaseManager[Event, Event]):
             EventError: If the scene is not found
         """
         self.logger.debug(
-            f"Listing events: scene_id={scene_id or 'active'}, limit={limit or 'None'}"
+            "Listing events: scene_id=%s, limit=%s",
+            scene_id or "active",
+            limit or "None",
         )
 
         # Use active scene if none provided
         if scene_id is None:
             scene_id = self.get_active_scene_id()
-            self.logger.debug(f"Using active scene ID: {scene_id}")
+            self.logger.debug("Using active scene ID: %s", scene_id)
 
-        # Validate scene exists
-        def _validate_scene(session: Session) -> Scene:
-            scene = self.get_entity_or_error(
-                session, Scene, scene_id, EventError, f"Scene {scene_id} not found"
-            )
-            self.logger.debug(f"Found scene: {scene.title} (ID: {scene.id})")
-            return scene
+        # Validate scene exists. Query the title only, so the scene's
+        # selectin-loaded events, interpretation sets and rolls stay unloaded.
+        def _validate_scene(session: Session) -> str:
+            title = session.query(Scene.title).filter(Scene.id == scene_id).scalar()
+            if title is None:
+                raise EventError(f"Scene {scene_id} not found")
+            self.logger.debug("Found scene: %s (ID: %s)", title, scene_id)
+            return title
 
         self._execute_db_operation("validate scene", _validate_scene)
 
-        # If we have a scene with events, we could potentially use the model directly
-        # But for consistency and to handle the limit parameter, we'll use list_entities
-
         # List events
         events = self.list_entities(
             Event,
@@ -333,9 +381,40 @@ class EventManager(BaseManager[Event, Event]):
             order_by=order_by,
             order_direction=order_direction,
             limit=limit,
+            options=_EVENT_LOAD_OPTIONS,
         )
 
-        self.logger.debug(f"Found {len(events)} events")
+        self.logger.debug("Found %s events", len(events))
+        return events
+
+    def list_events_for_act(
+        self,
+        act_id: str,
+        order_by: str = "created_at",
+        order_direction: str = "desc",
+    ) -> List[Event]:
+        """List all events in an act with a single query.
+
+        Filters on the denormalized ``Event.act_id`` column, so the cost does
+        not grow with the number of scenes in the act.
+
+        Args:
+            act_id: ID of the act
+            order_by: Field to sort events by. Defaults to 'created_at'.
+            order_direction: Sort direction ('asc' or 'desc'). Defaults to 'desc'.
+
+        Returns:
+            List of Event objects across all scenes of the act
+        """
+        self.logger.debug("Listing events for act: act_id=%s", act_id)
+        events = self.list_entities(
+            Event,
+            filters={"act_id": act_id},
+            order_by=order_by,
+            order_direction=order_direction,
+            options=_EVENT_LOAD_OPTIONS,
+        )
+        self.logger.debug("Found %s events in act %s", len(events), act_id)
         return events
 
     def get_event_sources(self) -> List[EventSource]:
@@ -348,6 +427,8 @@ class EventManager(BaseManager[Event, Event]):
             EventError: If there was an error retrieving the sources
         """
         self.logger.debug("Getting all event sources")
-        sources = self.list_entities(EventSource, order_by="name")
-        self.logger.debug(f"Found {len(sources)} event sources")
+        sources = self._execute_db_operation(
+            "get event sources", event_source_cache.get_sources
+        )
+        self.logger.debug("Found %s event sources", len(sources))
         return sources
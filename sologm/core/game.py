@@ -6,7 +6,9 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from sologm.core.activation import activate_exclusively
 from sologm.core.base_manager import BaseManager
+from sologm.core.versioning import update_versioned
 from sologm.models.game import Game
 from sologm.models.utils import slugify
 from sologm.utils.errors import GameError
@@ -39,7 +41,11 @@ class GameManager(BaseManager[Game, Game]):
         )
 
     def create_game(
-        self, name: str, description: str, is_active: bool = True
+        self,
+        name: str,
+        description: str,
+        is_active: bool = True,
+        rng_seed: Optional[int] = None,
     ) -> Optional[Game]:
         """Create a new game.
 
@@ -47,6 +53,8 @@ class GameManager(BaseManager[Game, Game]):
             name: Name of the game.
             description: Description of the game.
             is_active: Whether the game should be active (defaults to True).
+            rng_seed: Optional seed for the game's dice stream, for
+                reproducible rolls. A random seed is used when omitted.
 
         Returns:
             The created Game instance.
@@ -55,27 +63,24 @@ class GameManager(BaseManager[Game, Game]):
             GameError: If the game cannot be created or a game with the same
                        name exists.
         """
-        logger.debug(f"Creating game: name='{name}', is_active={is_active}")
+        logger.debug("Creating game: name='%s', is_active=%s", name, is_active)
 
         def _create_game(session: Session) -> Game:
             # Use the create class method from the SQLAlchemy model
-            game = Game.create(name=name, description=description)
-
-            # Set active status
-            if is_active:
-                self._deactivate_all_games(session)
-                game.is_active = True
-            else:
-                game.is_active = False
+            game = Game.create(name=name, description=description, rng_seed=rng_seed)
 
+            game.is_active = False
             session.add(game)
             session.flush()  # Flush to get the ID
 
+            if is_active:
+                activate_exclusively(session, Game, game.id)
+
             return game
 
         try:
             game = self._execute_db_operation("create game", _create_game)
-            logger.debug(f"Created game: {game.id}, name='{game.name}'")
+            logger.debug("Created game: %s, name='%s'", game.id, game.name)
             return game
         except IntegrityError as e:
             self._session.rollback()
@@ -95,7 +100,7 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: With a user-friendly message
         """
-        logger.error(f"Failed to {operation} game {name}: {str(error)}")
+        logger.error("Failed to %s game %s: %s", operation, name, str(error))
         error_msg = str(error).lower()
 
         if "unique constraint" in error_msg:
@@ -114,15 +119,6 @@ class GameManager(BaseManager[Game, Game]):
         else:
             raise GameError(f"Failed to {operation} game: {str(error)}") from error
 
-    def _deactivate_all_games(self, session: Session) -> None:
-        """Deactivate all games in the database.
-
-        Args:
-            session: SQLAlchemy session
-        """
-        logger.debug("Deactivating all games")
-        session.query(Game).update({Game.is_active: False})
-
     def list_games(self) -> List[Game]:
         """List all games in the system.
 
@@ -131,7 +127,7 @@ class GameManager(BaseManager[Game, Game]):
         """
         logger.debug("Listing all games")
         games = self.list_entities(Game, order_by="created_at")
-        logger.debug(f"Listed {len(games)} games")
+        logger.debug("Listed %s games", len(games))
         return games
 
     def get_game(self, identifier: str) -> Optional[Game]:
@@ -146,7 +142,7 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: If there's a database error during retrieval.
         """
-        logger.debug(f"Getting game by identifier: {identifier}")
+        logger.debug("Getting game by identifier: %s", identifier)
         # Use the new method that handles both ID and slug
         return self.get_game_by_identifier(identifier)
 
@@ -159,7 +155,7 @@ class GameManager(BaseManager[Game, Game]):
         Returns:
             Game instance if found, None otherwise.
         """
-        logger.debug(f"Getting game by identifier: {identifier}")
+        logger.debug("Getting game by identifier: %s", identifier)
 
         def _get_game(session: Session) -> Optional[Game]:
             return self.get_entity_by_identifier(session, Game, identifier)
@@ -168,8 +164,9 @@ class GameManager(BaseManager[Game, Game]):
             f"get game by identifier {identifier}", _get_game
         )
         logger.debug(
-            f"Retrieved game by identifier: {game.id if game else 'None'} "
-            f"(Input: '{identifier}')"
+            "Retrieved game by identifier: %s (Input: '%s')",
+            game.id if game else "None",
+            identifier,
         )
         return game
 
@@ -185,7 +182,7 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: If the game is not found.
         """
-        logger.debug(f"Getting game by identifier or error: {identifier}")
+        logger.debug("Getting game by identifier or error: %s", identifier)
 
         def _get_game(session: Session) -> Game:
             return self.get_entity_by_identifier_or_error(
@@ -199,7 +196,9 @@ class GameManager(BaseManager[Game, Game]):
         game = self._execute_db_operation(
             f"get game by identifier or error {identifier}", _get_game
         )
-        logger.debug(f"Retrieved game by identifier: {game.id} (Input: '{identifier}')")
+        logger.debug(
+            "Retrieved game by identifier: %s (Input: '%s')", game.id, identifier
+        )
         return game
 
     # Keep existing get_game_by_id and get_game_by_slug if needed elsewhere,
@@ -213,13 +212,13 @@ class GameManager(BaseManager[Game, Game]):
         Returns:
             Game instance if found, None otherwise.
         """
-        logger.debug(f"Getting game by ID: {game_id}")
+        logger.debug("Getting game by ID: %s", game_id)
 
         def _get_game(session: Session) -> Optional[Game]:
             return session.query(Game).filter(Game.id == game_id).first()
 
         game = self._execute_db_operation(f"get game {game_id}", _get_game)
-        logger.debug(f"Retrieved game: {game.id if game else 'None'}")
+        logger.debug("Retrieved game: %s", game.id if game else "None")
         return game
 
     def get_game_by_slug(self, slug: str) -> Optional[Game]:
@@ -231,13 +230,13 @@ class GameManager(BaseManager[Game, Game]):
         Returns:
             Game instance if found, None otherwise.
         """
-        logger.debug(f"Getting game by slug: {slug}")
+        logger.debug("Getting game by slug: %s", slug)
 
         def _get_game(session: Session) -> Optional[Game]:
             return session.query(Game).filter(Game.slug == slug).first()
 
         game = self._execute_db_operation(f"get game by slug {slug}", _get_game)
-        logger.debug(f"Retrieved game by slug: {game.id if game else 'None'}")
+        logger.debug("Retrieved game by slug: %s", game.id if game else "None")
         return game
 
     def get_active_game(self) -> Optional[Game]:
@@ -253,7 +252,7 @@ class GameManager(BaseManager[Game, Game]):
         if not game:
             logger.debug("No active game found")
         else:
-            logger.debug(f"Found active game: {game.id}")
+            logger.debug("Found active game: %s", game.id)
 
         return game
 
@@ -269,19 +268,18 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: If the game doesn't exist
         """
-        logger.debug(f"Activating game: {game_id}")
+        logger.debug("Activating game: %s", game_id)
 
         def _activate_game(session: Session) -> Game:
             # Use get_entity_or_error as this method expects a specific ID
             game = self.get_entity_or_error(
                 session, Game, game_id, GameError, f"Game not found: {game_id}"
             )
-            self._deactivate_all_games(session)
-            game.is_active = True
+            activate_exclusively(session, Game, game.id)
             return game
 
         game = self._execute_db_operation("activate game", _activate_game)
-        logger.debug(f"Activated game: {game.id}")
+        logger.debug("Activated game: %s", game.id)
         return game
 
     def deactivate_game(self, game_id: str) -> Game:
@@ -296,7 +294,7 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: If the game doesn't exist
         """
-        logger.debug(f"Deactivating game: {game_id}")
+        logger.debug("Deactivating game: %s", game_id)
 
         def _deactivate_game(session: Session) -> Game:
             # Use get_entity_or_error as this method expects a specific ID
@@ -308,7 +306,7 @@ class GameManager(BaseManager[Game, Game]):
             return game
 
         game = self._execute_db_operation("deactivate game", _deactivate_game)
-        logger.debug(f"Deactivated game: {game.id}")
+        logger.debug("Deactivated game: %s", game.id)
         return game
 
     def update_game(
@@ -331,10 +329,14 @@ class GameManager(BaseManager[Game, Game]):
         Raises:
             GameError: If the game doesn't exist or a game with the same name exists
             ValueError: If neither name nor description is provided
+            ConflictError: If another writer changed the same fields since
+                the game was loaded
         """
         logger.debug(
-            f"Updating game: {game_id}, name={name}, "
-            f"description={description is not None}"
+            "Updating game: %s, name=%s, description=%s",
+            game_id,
+            name,
+            description is not None,
         )
         if name is None and description is None:
             raise ValueError("At least one of name or description must be provided")
@@ -344,23 +346,22 @@ class GameManager(BaseManager[Game, Game]):
             game = self.get_entity_or_error(
                 session, Game, game_id, GameError, f"Game not found: {game_id}"
             )
+            changes = {}
             if name is not None:
-                old_name = game.name
-                game.name = name
+                changes["name"] = name
 
                 # Only update the slug if the name changed
-                if old_name != name:
-                    game.slug = slugify(name)
+                if game.name != name:
+                    changes["slug"] = slugify(name)
 
             if description is not None:
-                game.description = description
+                changes["description"] = description
 
-            session.flush()
-            return game
+            return update_versioned(session, game, changes)
 
         try:
             game = self._execute_db_operation("update game", _update_game)
-            logger.debug(f"Updated game: {game.id}")
+            logger.debug("Updated game: %s", game.id)
             return game
         except IntegrityError as e:
             self._session.rollback()
@@ -376,7 +377,7 @@ class GameManager(BaseManager[Game, Game]):
         Returns:
             True if the game was deleted, False otherwise
         """
-        logger.debug(f"Deleting game: {game_id}")
+        logger.debug("Deleting game: %s", game_id)
 
         def _delete_game(session: Session) -> bool:
             # Use get_entity_or_error to ensure it exists before deleting
@@ -388,14 +389,14 @@ class GameManager(BaseManager[Game, Game]):
                 session.flush()
                 return True
             except GameError:  # Catch the specific error if not found
-                logger.debug(f"Cannot delete nonexistent game: {game_id}")
+                logger.debug("Cannot delete nonexistent game: %s", game_id)
                 return False
 
         result = self._execute_db_operation("delete game", _delete_game)
         if result:
-            logger.debug(f"Deleted game: {game_id}")
+            logger.debug("Deleted game: %s", game_id)
         else:
-            logger.debug(f"Game not found for deletion: {game_id}")
+            logger.debug("Game not found for deletion: %s", game_id)
         return result
 
     def get_latest_context_status(self) -> Dict[str, Any]:
@@ -432,17 +433,19 @@ class GameManager(BaseManager[Game, Game]):
                 act_id=latest_act.id
             )
             self.logger.debug(
-                f"Found latest act: {latest_act.id}, latest scene: "
-                f"{latest_scene.id if latest_scene else 'None'}"
+                "Found latest act: %s, latest scene: %s",
+                latest_act.id,
+                latest_scene.id if latest_scene else "None",
             )
         else:
-            self.logger.debug(f"No acts found in active game {game.id}.")
+            self.logger.debug("No acts found in active game %s.", game.id)
 
         is_act_active = latest_act.is_active if latest_act else False
         is_scene_active = latest_scene.is_active if latest_scene else False
         self.logger.debug(
-            f"Latest Act Active: {is_act_active}, Latest Scene Active: "
-            f"{is_scene_active}"
+            "Latest Act Active: %s, Latest Scene Active: %s",
+            is_act_active,
+            is_scene_active,
         )
 
         return {
@@ -4,14 +4,18 @@ import logging
 import re
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from sologm.core.base_manager import BaseManager
+from sologm.core.digest import ContextDigestManager, get_digest_mode
 from sologm.core.event import EventManager
 from sologm.core.game import GameManager
+from sologm.core.prompts.budget import TokenCounter
 from sologm.core.prompts.oracle import OraclePrompts
 from sologm.core.scene import SceneManager
 from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.metrics import record_parse_failure
 from sologm.models.act import Act
 from sologm.models.event import Event
 from sologm.models.game import Game
@@ -56,6 +60,15 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
         else:
             self.anthropic_client = anthropic_client
 
+    @property
+    def digest_manager(self) -> ContextDigestManager:
+        """Lazy-initialize the context digest manager."""
+        return self._lazy_init_manager(
+            "_digest_manager",
+            "sologm.core.digest.ContextDigestManager",
+            anthropic_client=self.anthropic_client,
+        )
+
     @property
     def scene_manager(self) -> SceneManager:
         """Lazy-initialize scene manager if not provided."""
@@ -102,22 +115,27 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
             # Get active act from game
             if not game.has_active_act:
-                self.logger.error(f"No active act found in game '{game.name}'")
+                self.logger.error("No active act found in game '%s'", game.name)
                 raise OracleError(f"No active act found in game '{game.name}'")
 
             act = game.active_act
 
             # Get active scene from act
             if not act.has_active_scene:
-                self.logger.error(f"No active scene found in act '{act.title}'")
+                self.logger.error("No active scene found in act '%s'", act.title)
                 raise OracleError(f"No active scene found in act '{act.title}'")
 
             scene = act.active_scene
 
             self.logger.debug(
-                f"Found active context: game='{game.name}' (ID: {game.id}), "
-                f"act='{act.title}' (ID: {act.id}), "
-                f"scene='{scene.title}' (ID: {scene.id})"
+                "Found active context: game='%s' (ID: %s), act='%s' (ID: %s), "
+                "scene='%s' (ID: %s)",
+                game.name,
+                game.id,
+                act.title,
+                act.id,
+                scene.title,
+                scene.id,
             )
 
             return scene, act, game
@@ -125,7 +143,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             # Re-raise OracleError directly
             raise
         except Exception as e:
-            self.logger.error(f"Error getting active context: {str(e)}")
+            self.logger.error("Error getting active context: %s", str(e))
             raise OracleError(f"Failed to get active context: {str(e)}") from e
 
     def get_interpretation_set(self, set_id: str) -> InterpretationSet:
@@ -140,7 +158,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
         Raises:
             OracleError: If set not found
         """
-        self.logger.debug(f"Getting interpretation set by ID: {set_id}")
+        self.logger.debug("Getting interpretation set by ID: %s", set_id)
 
         def _get_interpretation_set(session: Session, set_id: str) -> InterpretationSet:
             interp_set = self.get_entity_or_error(
@@ -151,7 +169,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 f"Interpretation set {set_id} not found",
             )
             self.logger.debug(
-                f"Found interpretation set for scene ID: {interp_set.scene_id}"
+                "Found interpretation set for scene ID: %s", interp_set.scene_id
             )
             return interp_set
 
@@ -160,7 +178,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 f"get interpretation set {set_id}", _get_interpretation_set, set_id
             )
         except Exception as e:
-            self.logger.error(f"Failed to get interpretation set {set_id}: {str(e)}")
+            self.logger.error("Failed to get interpretation set %s: %s", set_id, str(e))
             raise OracleError(f"Failed to get interpretation set: {str(e)}") from e
 
     def get_current_interpretation_set(
@@ -175,45 +193,43 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             Optional[InterpretationSet]: Current interpretation set or None
         """
         self.logger.debug(
-            f"Getting current interpretation set for scene ID: {scene_id}"
+            "Getting current interpretation set for scene ID: %s", scene_id
         )
 
         try:
 
-            def _get_scene_with_current_set(
-                session: Session,
-            ) -> Optional[InterpretationSet]:
-                scene = self.get_entity_or_error(
-                    session, Scene, scene_id, OracleError, f"Scene {scene_id} not found"
+            def _get_current_set(session: Session) -> Optional[InterpretationSet]:
+                # Only the current row is read, however many sets the scene has
+                current_set = (
+                    session.query(InterpretationSet)
+                    .filter(
+                        InterpretationSet.scene_id == scene_id,
+                        InterpretationSet.is_current.is_(True),
+                    )
+                    .first()
                 )
 
-                # Explicitly refresh the scene with its interpretation_sets relationship
-                session.refresh(scene, ["interpretation_sets"])
-
-                # Use the scene's current_interpretation_set property
-                current_set = scene.current_interpretation_set
-
                 if current_set:
                     self.logger.debug(
-                        f"Found current interpretation set ID: {current_set.id}"
+                        "Found current interpretation set ID: %s", current_set.id
                     )
                 else:
                     self.logger.debug(
-                        f"No current interpretation set found for scene: {scene.title}"
+                        "No current interpretation set found for scene: %s", scene_id
                     )
 
                 return current_set
 
             return self._execute_db_operation(
                 f"get current interpretation set for scene {scene_id}",
-                _get_scene_with_current_set,
+                _get_current_set,
             )
         except OracleError:
             # If scene not found, just return None
-            self.logger.debug(f"Scene {scene_id} not found, returning None")
+            self.logger.debug("Scene %s not found, returning None", scene_id)
             return None
         except Exception as e:
-            self.logger.error(f"Error getting current interpretation set: {str(e)}")
+            self.logger.error("Error getting current interpretation set: %s", str(e))
             # For this method, we'll return None on error rather than raising
             return None
 
@@ -230,7 +246,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             none found
         """
         self.logger.debug(
-            f"Getting most recent interpretation for scene ID: {scene_id}"
+            "Getting most recent interpretation for scene ID: %s", scene_id
         )
 
         def _get_most_recent_interpretation(
@@ -250,7 +266,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
                 if not selected_interpretations:
                     self.logger.debug(
-                        f"No selected interpretations found for scene: {scene.title}"
+                        "No selected interpretations found for scene: %s", scene.title
                     )
                     return None
 
@@ -261,14 +277,16 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 interp_set = most_recent.interpretation_set
 
                 self.logger.debug(
-                    f"Found most recent interpretation: '{most_recent.title}' "
-                    f"(ID: {most_recent.id}) in set ID: {interp_set.id}"
+                    "Found most recent interpretation: '%s' (ID: %s) in set ID: %s",
+                    most_recent.title,
+                    most_recent.id,
+                    interp_set.id,
                 )
 
                 return (interp_set, most_recent)
             except OracleError:
                 # If scene not found, return None
-                self.logger.debug(f"Scene {scene_id} not found, returning None")
+                self.logger.debug("Scene %s not found, returning None", scene_id)
                 return None
 
         try:
@@ -281,15 +299,16 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             if result:
                 interp_set, interp = result
                 self.logger.debug(
-                    f"Returning interpretation set ID: {interp_set.id} and "
-                    f"interpretation ID: {interp.id}"
+                    "Returning interpretation set ID: %s and interpretation ID: %s",
+                    interp_set.id,
+                    interp.id,
                 )
             else:
                 self.logger.debug("No interpretation found, returning None")
 
             return result
         except Exception as e:
-            self.logger.error(f"Error getting most recent interpretation: {str(e)}")
+            self.logger.error("Error getting most recent interpretation: %s", str(e))
             return None
 
     def _build_prompt(
@@ -314,6 +333,12 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
         Returns:
             str: The formatted prompt
         """
+        from sologm.utils.config import get_config
+
+        config = get_config()
+        budget = config.get_int("oracle_prompt_max_tokens", 4000)
+        exact = config.get_bool("exact_token_counts", False)
+        digests = self._get_context_digests(scene.id)
         return OraclePrompts.build_interpretation_prompt(
             scene,
             context,
@@ -321,8 +346,30 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             count,
             previous_interpretations,
             retry_attempt,
+            max_events=config.get_int("oracle_recent_events", 5),
+            token_budget=budget or None,
+            token_counter=TokenCounter(self.anthropic_client if exact else None),
+            scene_digest=digests.get("scene"),
+            act_digest=digests.get("act"),
         )
 
+    def _get_context_digests(self, scene_id: str) -> Dict[str, str]:
+        """Get the stored scene and act digests.
+
+        Only reads them: digests are brought up to date after each
+        interpretation (see get_interpretations), so building a prompt makes
+        no AI calls and writes nothing.
+
+        Args:
+            scene_id: ID of the scene
+
+        Returns:
+            Dict with "scene" and "act" digests; empty when digests are off.
+        """
+        if get_digest_mode() == "off":
+            return {}
+        return self.digest_manager.get_digests(scene_id)
+
     def build_interpretation_prompt_for_active_context(
         self,
         context: str = "",
@@ -364,7 +411,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
         from sologm.utils.config import get_config
 
         config = get_config()
-        return int(config.get("oracle_retries", 2))
+        return config.get_int("oracle_retries", 2)
 
     def _get_previous_interpretations(
         self, session: Session, previous_set_id: str
@@ -379,7 +426,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             Optional list of interpretation dictionaries
         """
         self.logger.debug(
-            f"Getting previous interpretations for set ID: {previous_set_id}"
+            "Getting previous interpretations for set ID: %s", previous_set_id
         )
 
         try:
@@ -394,7 +441,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
             # Use the relationship to get interpretations
             if not interp_set.interpretations:
-                self.logger.debug(f"No interpretations found in set {previous_set_id}")
+                self.logger.debug("No interpretations found in set %s", previous_set_id)
                 return None
 
             # Convert to dictionaries
@@ -407,14 +454,14 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             ]
 
             self.logger.debug(
-                f"Found {len(previous_interpretations)} previous interpretations"
+                "Found %s previous interpretations", len(previous_interpretations)
             )
             return previous_interpretations
         except OracleError:
             # Re-raise OracleError
             raise
         except Exception as e:
-            self.logger.error(f"Error getting previous interpretations: {str(e)}")
+            self.logger.error("Error getting previous interpretations: %s", str(e))
             return None
 
     def _clear_current_interpretation_sets(
@@ -422,32 +469,25 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
     ) -> None:
         """Clear any current interpretation sets for a scene.
 
+        Runs a single UPDATE on the current rows only, without loading the
+        scene's other sets. Sets already in the session are kept in sync.
+
         Args:
             session: Database session
             scene_id: ID of the scene
         """
         self.logger.debug(
-            f"Clearing current interpretation sets for scene ID: {scene_id}"
+            "Clearing current interpretation sets for scene ID: %s", scene_id
         )
-
-        # Get the scene
-        scene = self.get_entity_or_error(
-            session, Scene, scene_id, OracleError, f"Scene {scene_id} not found"
-        )
-
-        # Refresh the scene with specific relationship
-        session.refresh(scene, ["interpretation_sets"])
-
-        # Get current interpretation set using the scene relationship
-        current_set = scene.current_interpretation_set
-
-        if current_set:
-            self.logger.debug(
-                f"Clearing current flag on interpretation set ID: {current_set.id}"
+        session.execute(
+            update(InterpretationSet)
+            .where(
+                InterpretationSet.scene_id == scene_id,
+                InterpretationSet.is_current.is_(True),
             )
-            current_set.is_current = False
-        else:
-            self.logger.debug("No current interpretation sets found")
+            .values(is_current=False)
+            .execution_options(synchronize_session="evaluate")
+        )
 
     def _parse_interpretations(self, response_text: str) -> List[dict]:
         """Parse interpretations from Claude's response using Markdown format.
@@ -459,7 +499,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             List[dict]: List of parsed interpretations.
         """
         self.logger.debug(
-            f"Parsing interpretations from response of length {len(response_text)}"
+            "Parsing interpretations from response of length %s", len(response_text)
         )
 
         # Clean up the response to handle potential formatting issues
@@ -478,7 +518,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 {"title": title.strip(), "description": description.strip()}
             )
 
-        self.logger.debug(f"Parsed {len(interpretations)} interpretations")
+        self.logger.debug("Parsed %s interpretations", len(interpretations))
         return interpretations
 
     def get_interpretations(
@@ -510,11 +550,15 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             OracleError: If interpretations cannot be generated after max retries.
         """
         self.logger.debug(
-            f"Getting interpretations: scene_id={scene_id}, context='{context}', "
-            f"oracle_results='{oracle_results}', count={count}, "
-            f"retry_attempt={retry_attempt}, "
-            f"max_retries={max_retries or 'from config'}, "
-            f"previous_set_id={previous_set_id or 'None'}"
+            "Getting interpretations: scene_id=%s, context='%s', oracle_results='%s', "
+            "count=%s, retry_attempt=%s, max_retries=%s, previous_set_id=%s",
+            scene_id,
+            context,
+            oracle_results,
+            count,
+            retry_attempt,
+            max_retries or "from config",
+            previous_set_id or "None",
         )
 
         # If this is a retry but no previous_set_id was provided,
@@ -524,34 +568,38 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             if current_set:
                 previous_set_id = current_set.id
                 self.logger.debug(
-                    f"Using current set ID as previous set: {previous_set_id}"
+                    "Using current set ID as previous set: %s", previous_set_id
                 )
 
         # Get max_retries from config if not provided
         if max_retries is None:
             max_retries = self._get_max_retries()
-            self.logger.debug(f"Using max_retries from config: {max_retries}")
+            self.logger.debug("Using max_retries from config: %s", max_retries)
 
         def _get_interpretations(session: Session) -> InterpretationSet:
             # Get scene using BaseManager helper
             scene = self.get_entity_or_error(
                 session, Scene, scene_id, OracleError, f"Scene {scene_id} not found"
             )
-            self.logger.debug(f"Found scene: {scene.title} (ID: {scene.id})")
+            self.logger.debug("Found scene: %s (ID: %s)", scene.title, scene.id)
+
+            previous: Optional[List[Dict[str, str]]] = None
 
             # Try to get interpretations with automatic retry
             for attempt in range(retry_attempt, retry_attempt + max_retries + 1):
                 self.logger.debug(
-                    f"Attempt {attempt + 1}/{retry_attempt + max_retries + 1}"
+                    "Attempt %s/%s", attempt + 1, retry_attempt + max_retries + 1
                 )
 
                 try:
-                    # Get previous interpretations if this is a retry
-                    previous_interpretations = None
-                    if attempt > 0 and previous_set_id:
-                        previous_interpretations = self._get_previous_interpretations(
-                            session, previous_set_id
+                    # Previous interpretations are only needed for retries,
+                    # and are loaded once however many attempts are made
+                    if attempt > 0 and previous_set_id and previous is None:
+                        previous = (
+                            self._get_previous_interpretations(session, previous_set_id)
+                            or []
                         )
+                    previous_interpretations = previous or None
 
                     # Build prompt and get response
                     prompt = self._build_prompt(
@@ -562,24 +610,27 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                         previous_interpretations,
                         attempt,
                     )
-                    self.logger.debug(f"Built prompt with {len(prompt)} characters")
+                    self.logger.debug("Built prompt with %s characters", len(prompt))
+                    call_site = "oracle.retry" if attempt > 0 else "oracle.interpret"
 
                     # Get response from AI
                     try:
                         self.logger.debug("Sending prompt to Claude API")
-                        response = self.anthropic_client.send_message(prompt)
+                        response = self.anthropic_client.send_message(
+                            prompt, call_site=call_site
+                        )
                         self.logger.debug(
-                            f"Received response with {len(response)} characters"
+                            "Received response with %s characters", len(response)
                         )
                     except Exception as e:
-                        self.logger.error(f"Error from AI service: {str(e)}")
+                        self.logger.error("Error from AI service: %s", str(e))
                         raise OracleError(
                             f"Failed to get interpretations from AI service: {str(e)}"
                         ) from e
 
                     # Parse interpretations
                     parsed = self._parse_interpretations(response)
-                    self.logger.debug(f"Parsed {len(parsed)} interpretations")
+                    self.logger.debug("Parsed %s interpretations", len(parsed))
 
                     # If parsing succeeded, create and return interpretation set
                     if parsed:
@@ -594,39 +645,45 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                             retry_attempt=attempt,
                             is_current=True,
                         )
+                        # The set is flushed on its own so the stored
+                        # interpretation count on it is kept up to date; the
+                        # interpretations then go out as one multi-row INSERT
                         session.add(interp_set)
-                        session.flush()  # Flush to get the ID
-                        self.logger.debug(
-                            f"Created interpretation set with ID: {interp_set.id}"
-                        )
-
-                        # Create interpretations
-                        for i, interp_data in enumerate(parsed):
-                            interpretation = Interpretation.create(
+                        session.flush()
+                        interpretations = [
+                            Interpretation.create(
                                 set_id=interp_set.id,
                                 title=interp_data["title"],
                                 description=interp_data["description"],
                                 is_selected=False,
                             )
-                            session.add(interpretation)
-                            self.logger.debug(
-                                f"Created interpretation {i + 1}/{len(parsed)}: "
-                                f"'{interp_data['title']}' (ID: {interpretation.id})"
-                            )
+                            for interp_data in parsed
+                        ]
+                        session.add_all(interpretations)
+                        session.flush()
+                        self.logger.debug(
+                            "Created interpretation set with ID: %s and %s "
+                            "interpretations",
+                            interp_set.id,
+                            len(interpretations),
+                        )
 
                         self.logger.info(
-                            f"Successfully created interpretation set with "
-                            f"{len(parsed)} "
-                            f"interpretations for scene '{scene.title}'"
+                            "Successfully created interpretation set with %s "
+                            "interpretations for scene '%s'",
+                            len(parsed),
+                            scene.title,
                         )
                         return interp_set
 
+                    record_parse_failure(call_site)
+
                     # If we're on the last attempt and parsing failed, raise error
                     if attempt >= retry_attempt + max_retries:
                         self.logger.warning(
                             "Failed to parse any interpretations from response"
                         )
-                        self.logger.debug(f"Raw response: {response}")
+                        self.logger.debug("Raw response: %s", response)
                         raise OracleError(
                             f"Failed to parse interpretations from AI response after "
                             f"{attempt + 1} attempts"
@@ -634,9 +691,10 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
                     # Otherwise, continue to next attempt
                     self.logger.warning(
-                        f"Failed to parse interpretations (attempt "
-                        f"{attempt + 1}/{retry_attempt + max_retries + 1}). "
-                        f"Retrying automatically."
+                        "Failed to parse interpretations (attempt %s/%s). Retrying "
+                        "automatically.",
+                        attempt + 1,
+                        retry_attempt + max_retries + 1,
                     )
 
                 except OracleError:
@@ -647,13 +705,19 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             raise OracleError("Failed to get interpretations after maximum retries")
 
         try:
-            return self._execute_db_operation(
+            interp_set = self._execute_db_operation(
                 "get interpretations", _get_interpretations
             )
         except Exception as e:
-            self.logger.error(f"Failed to get interpretations: {str(e)}")
+            self.logger.error("Failed to get interpretations: %s", str(e))
             raise OracleError(f"Failed to get interpretations: {str(e)}") from e
 
+        # Fold the events added since the last update into the digests once
+        # this transaction commits, off the interpretation path
+        if get_digest_mode() == "deferred":
+            self.digest_manager.schedule(scene_id)
+        return interp_set
+
     def find_interpretation(
         self, interpretation_set_id: str, identifier: str
     ) -> Interpretation:
@@ -670,8 +734,9 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             OracleError: If interpretation not found
         """
         self.logger.debug(
-            f"Finding interpretation with identifier '{identifier}' "
-            f"in set ID: {interpretation_set_id}"
+            "Finding interpretation with identifier '%s' in set ID: %s",
+            identifier,
+            interpretation_set_id,
         )
 
         def _find_interpretation(
@@ -686,14 +751,14 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 f"Interpretation set {set_id} not found",
             )
             self.logger.debug(
-                f"Found interpretation set for scene ID: {interp_set.scene_id}"
+                "Found interpretation set for scene ID: %s", interp_set.scene_id
             )
 
             # Get all interpretations in the set
             interpretations = interp_set.interpretations
 
             if not interpretations:
-                self.logger.error(f"No interpretations found in set {set_id}")
+                self.logger.error("No interpretations found in set %s", set_id)
                 raise OracleError(f"No interpretations found in set {set_id}")
 
             # Try to parse as sequence number
@@ -702,20 +767,26 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 if 1 <= seq_num <= len(interpretations):
                     interp = interpretations[seq_num - 1]  # Convert to 0-based index
                     self.logger.debug(
-                        f"Found interpretation by sequence number {seq_num}: "
-                        f"'{interp.title}' (ID: {interp.id})"
+                        "Found interpretation by sequence number %s: '%s' (ID: %s)",
+                        seq_num,
+                        interp.title,
+                        interp.id,
                     )
                     return interp
             except ValueError:
-                self.logger.debug(f"Identifier '{identifier}' is not a sequence number")
+                self.logger.debug(
+                    "Identifier '%s' is not a sequence number", identifier
+                )
                 pass  # Not a number, continue
 
             # Try as slug
             for interp in interpretations:
                 if interp.slug == identifier:
                     self.logger.debug(
-                        f"Found interpretation by slug '{identifier}': "
-                        f"'{interp.title}' (ID: {interp.id})"
+                        "Found interpretation by slug '%s': '%s' (ID: %s)",
+                        identifier,
+                        interp.title,
+                        interp.id,
                     )
                     return interp
 
@@ -730,13 +801,15 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
             if interp:
                 self.logger.debug(
-                    f"Found interpretation by UUID '{identifier}': "
-                    f"'{interp.title}' (ID: {interp.id})"
+                    "Found interpretation by UUID '%s': '%s' (ID: %s)",
+                    identifier,
+                    interp.title,
+                    interp.id,
                 )
                 return interp
 
             self.logger.error(
-                f"Interpretation '{identifier}' not found in set {set_id}"
+                "Interpretation '%s' not found in set %s", identifier, set_id
             )
             raise OracleError(
                 f"Interpretation '{identifier}' not found in set {set_id}. "
@@ -752,7 +825,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 identifier,
             )
         except Exception as e:
-            self.logger.error(f"Failed to find interpretation: {str(e)}")
+            self.logger.error("Failed to find interpretation: %s", str(e))
             raise OracleError(f"Failed to find interpretation: {str(e)}") from e
 
     def select_interpretation(
@@ -771,8 +844,9 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             Interpretation: The selected interpretation.
         """
         self.logger.debug(
-            f"Selecting interpretation with identifier '{interpretation_identifier}' "
-            f"in set ID: {interpretation_set_id}"
+            "Selecting interpretation with identifier '%s' in set ID: %s",
+            interpretation_identifier,
+            interpretation_set_id,
         )
 
         # Find the interpretation using the flexible identifier
@@ -780,8 +854,9 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             interpretation_set_id, interpretation_identifier
         )
         self.logger.debug(
-            f"Found interpretation to select: '{interpretation.title}' "
-            f"(ID: {interpretation.id})"
+            "Found interpretation to select: '%s' (ID: %s)",
+            interpretation.title,
+            interpretation.id,
         )
 
         def _select_interpretation(
@@ -797,7 +872,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 f"Interpretation {interpretation_id} not found",
             )
             self.logger.debug(
-                f"Retrieved interpretation: '{interp.title}' (ID: {interp.id})"
+                "Retrieved interpretation: '%s' (ID: %s)", interp.title, interp.id
             )
 
             # Get the set
@@ -808,21 +883,21 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 OracleError,
                 f"Interpretation set {interp.set_id} not found",
             )
-            self.logger.debug(f"Retrieved interpretation set ID: {interp_set.id}")
+            self.logger.debug("Retrieved interpretation set ID: %s", interp_set.id)
 
             # Clear any previously selected interpretations in this set
             for other_interp in interp_set.interpretations:
                 if other_interp.is_selected:
                     self.logger.debug(
-                        f"Clearing selection from interpretation: "
-                        f"'{other_interp.title}' "
-                        f"(ID: {other_interp.id})"
+                        "Clearing selection from interpretation: '%s' (ID: %s)",
+                        other_interp.title,
+                        other_interp.id,
                     )
                     other_interp.is_selected = False
 
             # Mark this interpretation as selected
             interp.is_selected = True
-            self.logger.debug(f"Marked interpretation '{interp.title}' as selected")
+            self.logger.debug("Marked interpretation '%s' as selected", interp.title)
 
             return interp
 
@@ -833,12 +908,13 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 interpretation.id,
             )
             self.logger.info(
-                f"Successfully selected interpretation: '{selected_interp.title}' "
-                f"(ID: {selected_interp.id})"
+                "Successfully selected interpretation: '%s' (ID: %s)",
+                selected_interp.title,
+                selected_interp.id,
             )
             return selected_interp
         except Exception as e:
-            self.logger.error(f"Failed to select interpretation: {str(e)}")
+            self.logger.error("Failed to select interpretation: %s", str(e))
             raise OracleError(f"Failed to select interpretation: {str(e)}") from e
 
     def list_interpretation_sets(
@@ -861,8 +937,10 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             OracleError: If neither scene_id nor act_id is provided
         """
         self.logger.debug(
-            f"Listing interpretation sets: scene_id={scene_id}, "
-            f"act_id={act_id}, limit={limit}"
+            "Listing interpretation sets: scene_id=%s, act_id=%s, limit=%s",
+            scene_id,
+            act_id,
+            limit,
         )
 
         if not scene_id and not act_id:
@@ -880,13 +958,13 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             if scene_id:
                 # If scene_id is provided, filter by scene_id
                 self.logger.debug(
-                    f"Filtering interpretation sets by scene_id: {scene_id}"
+                    "Filtering interpretation sets by scene_id: %s", scene_id
                 )
                 query = query.filter(InterpretationSet.scene_id == scene_id)
             elif act_id:
-                # If act_id is provided, filter by scenes in the act
-                self.logger.debug(f"Filtering interpretation sets by act_id: {act_id}")
-                query = query.join(Scene).filter(Scene.act_id == act_id)
+                # If act_id is provided, filter on the denormalized act_id
+                self.logger.debug("Filtering interpretation sets by act_id: %s", act_id)
+                query = query.filter(InterpretationSet.act_id == act_id)
 
             # Order by created_at descending to get most recent first
             query = query.order_by(InterpretationSet.created_at.desc())
@@ -897,7 +975,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
 
             # Execute query
             interp_sets = query.all()
-            self.logger.debug(f"Found {len(interp_sets)} interpretation sets")
+            self.logger.debug("Found %s interpretation sets", len(interp_sets))
 
             return interp_sets
 
@@ -910,7 +988,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 limit,
             )
         except Exception as e:
-            self.logger.error(f"Failed to list interpretation sets: {str(e)}")
+            self.logger.error("Failed to list interpretation sets: %s", str(e))
             raise OracleError(f"Failed to list interpretation sets: {str(e)}") from e
 
     def add_interpretation_event(
@@ -929,8 +1007,10 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
             Event: The created event.
         """
         self.logger.debug(
-            f"Adding interpretation as event: interpretation_id={interpretation.id}, "
-            f"custom_description={custom_description is not None}"
+            "Adding interpretation as event: interpretation_id=%s, "
+            "custom_description=%s",
+            interpretation.id,
+            custom_description is not None,
         )
 
         def _add_interpretation_event(
@@ -947,13 +1027,14 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 f"Interpretation {interpretation_id} not found",
             )
             self.logger.debug(
-                f"Found interpretation: '{interpretation.title}' "
-                f"(ID: {interpretation.id})"
+                "Found interpretation: '%s' (ID: %s)",
+                interpretation.title,
+                interpretation.id,
             )
 
             # Use model relationships to get scene_id
             scene_id = interpretation.scene_id
-            self.logger.debug(f"Using scene ID from interpretation: {scene_id}")
+            self.logger.debug("Using scene ID from interpretation: %s", scene_id)
 
             # Use custom description if provided, otherwise generate from interpretation
             description = (
@@ -961,7 +1042,7 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 if custom_description is not None
                 else f"{interpretation.title}: {interpretation.description}"
             )
-            self.logger.debug(f"Using description: '{description[:50]}...'")
+            self.logger.debug("Using description: '%s...'", description[:50])
 
             # Add event using event_manager
             event = self.event_manager.add_event(
@@ -970,10 +1051,11 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 description=description,
                 interpretation_id=interpretation.id,
             )
-            self.logger.debug(f"Event created with ID: {event.id}")
+            self.logger.debug("Event created with ID: %s", event.id)
             self.logger.info(
-                f"Added interpretation as event: event_id={event.id}, "
-                f"interpretation_id={interpretation.id}"
+                "Added interpretation as event: event_id=%s, interpretation_id=%s",
+                event.id,
+                interpretation.id,
             )
             return event
 
@@ -985,5 +1067,5 @@ class OracleManager(BaseManager[InterpretationSet, InterpretationSet]):
                 custom_description,
             )
         except Exception as e:
-            self.logger.error(f"Failed to add interpretation as event: {str(e)}")
+            self.logger.error("Failed to add interpretation as event: %s", str(e))
             raise OracleError(f"Failed to add interpretation as event: {str(e)}") from e
@@ -1,6 +1,114 @@
-"""Prompt templates for act-related AI interactions."""
+"""Prompt templates for act-related AI interactions.
 
-from typing import Dict
+Prompts are written segment by segment into a text stream (``write_*``
+methods) rather than grown with repeated string concatenation, and the
+fixed instruction blocks are module constants. Scene ``events`` may be any
+iterable of mappings, including a generator streaming rows from the
+database, and are consumed once.
+"""
+
+import io
+from typing import Dict, Iterable, List, Mapping, Optional, TextIO, Tuple
+
+# Bump when the scene summary prompt changes, so cached summaries are redone
+SCENE_SUMMARY_VERSION = 1
+
+_NO_EVENTS = "No events recorded for this scene.\n"
+
+_SUMMARY_TASK = """
+TASK:
+1. Create a compelling title for this act (1-7 words)
+2. Write a concise summary of the act (3-5 paragraphs)
+
+The title should capture the essence or theme of the act.
+The summary should highlight key events, character developments, and narrative arcs.
+
+Format your response exactly as follows:
+
+TITLE: [Your suggested title]
+
+SUMMARY:
+[Your 3-5 paragraph summary]
+
+Do not include any other text or explanations outside this format.
+"""
+
+_SCENE_SUMMARY_INTRO = """You are summarizing part of a tabletop roleplaying game session.
+The summary will replace the raw event log when the whole act is summarized
+or retold, so keep every plot point, character, decision and consequence.
+
+"""
+
+_SCENE_SUMMARY_TASK = """
+TASK:
+Write a factual summary of these events in one or two paragraphs of plain
+text. Do not add events, interpretation or a title.
+"""
+
+_NARRATIVE_INTRO = """You are a master storyteller tasked with writing a narrative chapter
+based on the following game events. Your goal is to weave the structured information
+into a compelling prose story in Markdown format.
+
+GAME INFORMATION:
+"""
+
+_TASK_MARKER = "\nTASK:\n"
+
+_NARRATIVE_TASK_BODY = """Write a compelling narrative body for the current act
+based on all the information provided (game context, previous act summary,
+current act scenes/events, and user guidance).
+The narrative should flow logically, connecting the events into a coherent story.
+Use the user guidance to shape the tone, style, focus, and point of view.
+Output the narrative body in **Markdown format**.
+**Do not include a title or main heading in your response.**
+The title is already known and will be added separately.
+Do not include any introductory phrases like "Here is the narrative:" or
+summaries of your own work. Just provide the Markdown narrative body itself.
+"""
+
+_NARRATIVE_TASK_WITH_TITLE = """Write a compelling narrative for the current act based on all
+the information provided (game context, previous act summary, current act
+scenes/events, and user guidance).
+The narrative should flow logically, connecting the events into a coherent story.
+Use the user guidance to shape the tone, style, focus, and point of view.
+Output the entire narrative in **Markdown format**.
+**Start your response with a suitable title for the narrative as a Level 1
+Markdown heading (e.g., `# Narrative Title`).**
+Do not include any other introductory phrases like "Here is the narrative:"
+or summaries of your own work. Just provide the Markdown narrative itself,
+starting with the title heading.
+"""
+
+_REGENERATION_TASK = (
+    "Generate a *new* narrative for the act. "
+    "Carefully consider the user's feedback provided above and "
+    "incorporate it into the revised narrative, while still adhering "
+    "to the original context and user guidance (unless the feedback "
+    "specifically overrides it).\n"
+)
+
+_REGENERATION_TASK_BODY = (
+    "Output the *entire new* narrative body in "
+    "**Markdown format**. **Do not include a title or main heading.** "
+    "Do not just describe the changes. Do not include any introductory "
+    "phrases. Just provide the new Markdown narrative body."
+)
+
+_REGENERATION_TASK_WITH_TITLE = (
+    "Output the *entire new* narrative in "
+    "**Markdown format**. **Start your response with a suitable title "
+    "for the narrative as a Level 1 Markdown heading (e.g., "
+    "`# Narrative Title`).** Do not just describe the changes. "
+    "Do not include any introductory phrases. Just provide the new "
+    "Markdown narrative itself, starting with the title heading."
+)
+
+
+def _render(write, *args) -> str:
+    """Run a ``write_*`` method into a string buffer and return the text."""
+    out = io.StringIO()
+    write(out, *args)
+    return out.getvalue()
 
 
 class ActPrompts:
@@ -16,13 +124,22 @@ class ActPrompts:
         Returns:
             String prompt for AI model
         """
+        return _render(ActPrompts.write_summary_prompt, act_data)
+
+    @staticmethod
+    def write_summary_prompt(out: TextIO, act_data: Mapping) -> None:
+        """Write the act summary prompt to a text stream.
+
+        Args:
+            out: Stream to write to
+            act_data: Same as for build_summary_prompt
+        """
         game = act_data["game"]
         act = act_data["act"]
-        scenes = act_data["scenes"]
         additional_context = act_data.get("additional_context")
+        write = out.write
 
-        # Build the prompt
-        prompt = f"""You are an expert storyteller and narrative analyst.
+        write(f"""You are an expert storyteller and narrative analyst.
 I need you to create a concise summary and title for an act in a tabletop
 roleplaying game.
 
@@ -36,49 +153,74 @@ Current Title: {act["title"] or "Untitled"}
 Current Summary: {act["summary"] or "No summary"}
 
 SCENES IN THIS ACT:
-"""
+""")
 
         # Add scenes and their events
-        for scene in scenes:
-            prompt += f"\nSCENE {scene['sequence']}: {scene['title'] or 'Untitled'}\n"
-            prompt += f"Description: {scene['description'] or 'No description'}\n"
-
-            if scene["events"]:
-                prompt += "Events:\n"
-                for event in scene["events"]:
-                    prompt += f"- {event['description']}\n"
-            else:
-                prompt += "No events recorded for this scene.\n"
+        for scene in act_data["scenes"]:
+            write(
+                f"\nSCENE {scene['sequence']}: {scene['title'] or 'Untitled'}\n"
+                f"Description: {scene['description'] or 'No description'}\n"
+            )
+            if scene.get("summary"):
+                write(f"Summary of events:\n{scene['summary']}\n")
+                continue
+            header = "Events:\n"
+            for event in scene["events"]:
+                write(f"{header}- {event['description']}\n")
+                header = ""
+            if header:
+                write(_NO_EVENTS)
 
         # Add additional context if provided, with special handling for
         # regeneration requests
         if additional_context:
             # Check if this is a regeneration request (contains PREVIOUS GENERATION)
             if "PREVIOUS GENERATION:" in additional_context:
-                prompt += f"\nREGENERATION REQUEST:\n{additional_context}\n"
+                write(f"\nREGENERATION REQUEST:\n{additional_context}\n")
             else:
-                prompt += f"\nADDITIONAL CONTEXT:\n{additional_context}\n"
+                write(f"\nADDITIONAL CONTEXT:\n{additional_context}\n")
 
-        # Add instructions
-        prompt += """
-TASK:
-1. Create a compelling title for this act (1-7 words)
-2. Write a concise summary of the act (3-5 paragraphs)
-
-The title should capture the essence or theme of the act.
-The summary should highlight key events, character developments, and narrative arcs.
+        write(_SUMMARY_TASK)
 
-Format your response exactly as follows:
-
-TITLE: [Your suggested title]
+    @staticmethod
+    def build_scene_summary_prompt(
+        game: Dict,
+        act: Dict,
+        scene: Dict,
+        events: Iterable[Mapping],
+        part: Optional[Tuple[int, int]] = None,
+    ) -> str:
+        """Build the prompt for summarizing one scene of a long act.
 
-SUMMARY:
-[Your 3-5 paragraph summary]
+        Scene summaries stand in for the scene's events when the act is too
+        long to send whole.
 
-Do not include any other text or explanations outside this format.
-"""
+        Args:
+            game: Game name and description
+            act: Act sequence and title
+            scene: Scene sequence, title and description
+            events: The scene's events (or a slice of them), oldest first
+            part: (index, total) when the events are one slice of the scene
 
-        return prompt
+        Returns:
+            String prompt for AI model
+        """
+        parts: List[str] = [
+            _SCENE_SUMMARY_INTRO,
+            f"""GAME: {game["name"]}
+ACT {act["sequence"]}: {act["title"] or "Untitled"}
+SCENE {scene["sequence"]}: {scene["title"] or "Untitled"}
+Description: {scene["description"] or "No description"}
+""",
+        ]
+        if part is not None:
+            parts.append(f"(Events part {part[0]} of {part[1]})\n")
+        parts.append("\nEvents (in chronological order):\n")
+        for event in events:
+            source = event.get("source_name") or event.get("source") or "unknown"
+            parts.append(f"- ({source}): {event['description']}\n")
+        parts.append(_SCENE_SUMMARY_TASK)
+        return "".join(parts)
 
     @staticmethod
     def parse_summary_response(response: str) -> Dict[str, str]:
@@ -133,94 +275,80 @@ Do not include any other text or explanations outside this format.
         Returns:
             String prompt for the AI model to generate a narrative.
         """
+        return _render(ActPrompts.write_narrative_prompt, narrative_data)
+
+    @staticmethod
+    def write_narrative_prompt(out: TextIO, narrative_data: Mapping) -> None:
+        """Write the act narrative prompt to a text stream.
+
+        Args:
+            out: Stream to write to
+            narrative_data: Same as for build_narrative_prompt
+        """
+        ActPrompts._write_narrative_context(out, narrative_data)
+        out.write(_TASK_MARKER)
+        # --- Task Instruction (Conditional based on Act Title) ---
+        if narrative_data["act"].get("title"):
+            # Act has a title, instruct AI to only write the body
+            out.write(_NARRATIVE_TASK_BODY)
+        else:
+            # Act does not have a title, instruct AI to include one
+            out.write(_NARRATIVE_TASK_WITH_TITLE)
+
+    @staticmethod
+    def _write_narrative_context(out: TextIO, narrative_data: Mapping) -> None:
+        """Write everything in the narrative prompt before the task."""
         game = narrative_data["game"]
         act = narrative_data["act"]
         previous_act_summary = narrative_data.get("previous_act_summary")
         scenes = narrative_data["scenes"]
         user_guidance = narrative_data.get("user_guidance")
+        write = out.write
 
-        prompt = """You are a master storyteller tasked with writing a narrative chapter
-based on the following game events. Your goal is to weave the structured information
-into a compelling prose story in Markdown format.
-
-GAME INFORMATION:
-Title: {game_name}
-Description: {game_description}
-""".format(
-            game_name=game.get("name", "Untitled Game"),
-            game_description=game.get("description", "No description provided."),
+        write(_NARRATIVE_INTRO)
+        write(
+            f"Title: {game.get('name', 'Untitled Game')}\n"
+            f"Description: {game.get('description', 'No description provided.')}\n"
         )
 
         if previous_act_summary:
-            prompt += f"""
-PREVIOUS ACT SUMMARY (Context):
-{previous_act_summary}
-"""
+            write(f"\nPREVIOUS ACT SUMMARY (Context):\n{previous_act_summary}\n")
 
-        prompt += f"""
+        write(f"""
 CURRENT ACT INFORMATION:
 Sequence: Act {act.get("sequence", "?")}
 Title: {act.get("title", "Untitled Act")}
 Summary: {act.get("summary", "No summary provided.")}
 
 SCENES IN THIS ACT:
-"""
+""")
 
         if not scenes:
-            prompt += "No scenes recorded for this act.\n"
-        else:
-            for scene in scenes:
-                scene_seq = scene.get("sequence", "?")
-                scene_title = scene.get("title", "Untitled Scene")
-                prompt += f"\nSCENE {scene_seq}: {scene_title}\n"
-                prompt += f"Description: {scene.get('description', 'No description')}\n"
-
-                events = scene.get("events", [])
-                if events:
-                    prompt += "Events (in chronological order):\n"
-                    for event in events:
-                        source = event.get("source_name", "Unknown source")
-                        description = event.get("description", "No description")
-                        prompt += f"- ({source}): {description}\n"
-                else:
-                    prompt += "No events recorded for this scene.\n"
+            write("No scenes recorded for this act.\n")
+        for scene in scenes:
+            write(
+                f"\nSCENE {scene.get('sequence', '?')}: "
+                f"{scene.get('title', 'Untitled Scene')}\n"
+                f"Description: {scene.get('description', 'No description')}\n"
+            )
+            if scene.get("summary"):
+                write(f"Summary of events:\n{scene['summary']}\n")
+                continue
+            header = "Events (in chronological order):\n"
+            for event in scene.get("events", ()):
+                write(
+                    f"{header}- ({event.get('source_name', 'Unknown source')}): "
+                    f"{event.get('description', 'No description')}\n"
+                )
+                header = ""
+            if header:
+                write(_NO_EVENTS)
 
         if user_guidance:
-            prompt += "\nUSER GUIDANCE:\n"
+            write("\nUSER GUIDANCE:\n")
             for key, value in user_guidance.items():
                 if value:  # Only include guidance if a value was provided
-                    prompt += f"- {key.replace('_', ' ').title()}: {value}\n"
-
-        # --- Task Instruction (Conditional based on Act Title) ---
-        prompt += "\nTASK:\n"
-        if act.get("title"):
-            # Act has a title, instruct AI to only write the body
-            prompt += """Write a compelling narrative body for the current act
-based on all the information provided (game context, previous act summary,
-current act scenes/events, and user guidance).
-The narrative should flow logically, connecting the events into a coherent story.
-Use the user guidance to shape the tone, style, focus, and point of view.
-Output the narrative body in **Markdown format**.
-**Do not include a title or main heading in your response.**
-The title is already known and will be added separately.
-Do not include any introductory phrases like "Here is the narrative:" or
-summaries of your own work. Just provide the Markdown narrative body itself.
-"""
-        else:
-            # Act does not have a title, instruct AI to include one
-            prompt += """Write a compelling narrative for the current act based on all
-the information provided (game context, previous act summary, current act
-scenes/events, and user guidance).
-The narrative should flow logically, connecting the events into a coherent story.
-Use the user guidance to shape the tone, style, focus, and point of view.
-Output the entire narrative in **Markdown format**.
-**Start your response with a suitable title for the narrative as a Level 1
-Markdown heading (e.g., `# Narrative Title`).**
-Do not include any other introductory phrases like "Here is the narrative:"
-or summaries of your own work. Just provide the Markdown narrative itself,
-starting with the title heading.
-"""
-        return prompt
+                    write(f"- {key.replace('_', ' ').title()}: {value}\n")
 
     @staticmethod
     def build_narrative_regeneration_prompt(
@@ -236,72 +364,41 @@ starting with the title heading.
         Returns:
             String prompt for the AI model to regenerate a narrative.
         """
-        # Reuse the initial prompt structure but modify the task
-        base_prompt = ActPrompts.build_narrative_prompt(narrative_data)
+        return _render(
+            ActPrompts.write_narrative_regeneration_prompt,
+            narrative_data,
+            previous_narrative,
+            feedback,
+        )
 
-        # Find the TASK section and insert regeneration context before it
-        task_marker = "\nTASK:\n"
-        task_index = base_prompt.find(task_marker)
+    @staticmethod
+    def write_narrative_regeneration_prompt(
+        out: TextIO, narrative_data: Mapping, previous_narrative: str, feedback: str
+    ) -> None:
+        """Write the narrative regeneration prompt to a text stream.
 
-        if task_index == -1:
-            # Fallback if TASK marker isn't found (shouldn't happen)
-            regeneration_context = f"""
+        Args:
+            out: Stream to write to
+            narrative_data: Same as for build_narrative_prompt
+            previous_narrative: The previously generated narrative text
+            feedback: User's feedback on the previous narrative
+        """
+        # Same context as the initial prompt, with the previous attempt and
+        # the feedback inserted before a different task
+        ActPrompts._write_narrative_context(out, narrative_data)
+        out.write(f"""
 PREVIOUS NARRATIVE:
 {previous_narrative}
 
 USER FEEDBACK ON PREVIOUS NARRATIVE:
 {feedback}
-"""
-            prompt = (
-                base_prompt
-                + regeneration_context
-                + task_marker
-                + """Generate a *new* narrative for the act. Carefully consider the
-user's feedback provided above and incorporate it into the revised narrative,
-while still adhering to the original context and user guidance. Output the
-*entire new* narrative in **Markdown format**. Do not just describe the changes.
-Do not include any introductory phrases. Just provide the new Markdown narrative."""
-            )
+""")
+        out.write(_TASK_MARKER)
+        out.write(_REGENERATION_TASK)
+        # --- Task Instruction (Conditional based on Act Title) ---
+        if narrative_data.get("act", {}).get("title"):
+            # Act has a title, instruct AI to only write the body
+            out.write(_REGENERATION_TASK_BODY)
         else:
-            regeneration_context = f"""
-PREVIOUS NARRATIVE:
-{previous_narrative}
-
-USER FEEDBACK ON PREVIOUS NARRATIVE:
-{feedback}
-"""
-            # --- Task Instruction (Conditional based on Act Title) ---
-            task_instruction = (
-                "Generate a *new* narrative for the act. "
-                "Carefully consider the user's feedback provided above and "
-                "incorporate it into the revised narrative, while still adhering "
-                "to the original context and user guidance (unless the feedback "
-                "specifically overrides it).\n"
-            )
-            if narrative_data.get("act", {}).get("title"):
-                # Act has a title, instruct AI to only write the body
-                task_instruction += (
-                    "Output the *entire new* narrative body in "
-                    "**Markdown format**. **Do not include a title or main heading.** "
-                    "Do not just describe the changes. Do not include any introductory "
-                    "phrases. Just provide the new Markdown narrative body."
-                )
-            else:
-                # Act does not have a title, instruct AI to include one
-                task_instruction += (
-                    "Output the *entire new* narrative in "
-                    "**Markdown format**. **Start your response with a suitable title "
-                    "for the narrative as a Level 1 Markdown heading (e.g., "
-                    "`# Narrative Title`).** Do not just describe the changes. "
-                    "Do not include any introductory phrases. Just provide the new "
-                    "Markdown narrative itself, starting with the title heading."
-                )
-
-            prompt = (
-                base_prompt[:task_index]
-                + regeneration_context
-                + task_marker
-                + task_instruction
-            )
-
-        return prompt
+            # Act does not have a title, instruct AI to include one
+            out.write(_REGENERATION_TASK_WITH_TITLE)
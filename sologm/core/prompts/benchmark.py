@@ -0,0 +1,201 @@
+"""Micro-benchmark for building act and oracle prompts.
+
+Builds prompts for a synthetic act and reports the mean build time and the
+peak memory allocated while building, so changes to the prompt builders can
+be compared. Run with::
+
+    python -m sologm.core.prompts.benchmark --events 20000 --scenes 40
+
+The ``narrative (streamed)`` case generates the events lazily and writes the
+prompt to a discarding stream, the way a caller streaming an act snapshot
+from the database would.
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from sologm.core.prompts.act import ActPrompts
+from sologm.core.prompts.oracle import OraclePrompts
+from sologm.models.act import Act
+from sologm.models.event import Event
+from sologm.models.game import Game
+from sologm.models.scene import Scene
+
+DESCRIPTION = "The party searches the ruined chapel and finds a hidden stair"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark case.
+
+    Attributes:
+        name: Case name
+        seconds: Mean build time in seconds
+        peak_bytes: Peak memory allocated during one build
+        length: Length of the built prompt in characters
+    """
+
+    name: str
+    seconds: float
+    peak_bytes: int
+    length: int
+
+
+class _NullStream(io.StringIO):
+    """Text stream that counts what is written and discards it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.length = 0
+
+    def write(self, text: str) -> int:
+        self.length += len(text)
+        return len(text)
+
+
+def _events(scene: int, count: int) -> Iterator[Dict]:
+    for i in range(count):
+        yield {
+            "description": f"{DESCRIPTION} ({scene}.{i})",
+            "source_name": "oracle" if i % 3 else "manual",
+        }
+
+
+def make_act_data(events: int, scenes: int, streamed: bool = False) -> Dict:
+    """Build synthetic act data in the shape ActManager prepares.
+
+    Args:
+        events: Total number of events, spread evenly over the scenes
+        scenes: Number of scenes
+        streamed: Give each scene a generator of events instead of a list
+
+    Returns:
+        Act data usable for both summary and narrative prompts
+    """
+    per_scene = max(events // max(scenes, 1), 0)
+    scene_data = []
+    for sequence in range(1, scenes + 1):
+        scene_events = _events(sequence, per_scene)
+        scene_data.append(
+            {
+                "sequence": sequence,
+                "title": f"Scene {sequence}",
+                "description": "Somewhere dark and damp",
+                "events": scene_events if streamed else list(scene_events),
+            }
+        )
+    return {
+        "game": {"name": "Benchmark", "description": "Synthetic game"},
+        "act": {"sequence": 1, "title": "Benchmark Act", "summary": None},
+        "previous_act_summary": None,
+        "scenes": scene_data,
+        "user_guidance": {"tone_style": "grim"},
+        "additional_context": None,
+    }
+
+
+def _measure(name: str, build: Callable[[], int], repeat: int) -> BenchmarkResult:
+    """Time ``build`` and measure the peak memory of one extra run."""
+    length = build()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        build()
+    seconds = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    try:
+        build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, seconds, peak, length)
+
+
+def run_benchmark(
+    events: int = 5000, scenes: int = 20, repeat: int = 5
+) -> List[BenchmarkResult]:
+    """Run every benchmark case.
+
+    Args:
+        events: Number of events in the synthetic act
+        scenes: Number of scenes in the synthetic act
+        repeat: Number of timed builds per case
+
+    Returns:
+        One result per case
+    """
+    act_data = make_act_data(events, scenes)
+    # Transient scene with its act, game and events loaded
+    started = datetime(2024, 1, 1)
+    scene = Scene(
+        description="Somewhere dark and damp",
+        act=Act(summary="Synthetic act", game=Game(description="Synthetic game")),
+        events=[
+            Event(
+                description=f"{DESCRIPTION} ({i})",
+                created_at=started + timedelta(seconds=i),
+            )
+            for i in range(events // max(scenes, 1))
+        ],
+    )
+    previous = [
+        {"title": f"Interpretation {i}", "description": DESCRIPTION} for i in range(20)
+    ]
+
+    def streamed() -> int:
+        out = _NullStream()
+        ActPrompts.write_narrative_prompt(
+            out, make_act_data(events, scenes, streamed=True)
+        )
+        return out.length
+
+    cases = {
+        "summary": lambda: len(ActPrompts.build_summary_prompt(act_data)),
+        "narrative": lambda: len(ActPrompts.build_narrative_prompt(act_data)),
+        "narrative (streamed)": streamed,
+        "regeneration": lambda: len(
+            ActPrompts.build_narrative_regeneration_prompt(
+                act_data, "Previous narrative", "More dread"
+            )
+        ),
+        "oracle": lambda: len(
+            OraclePrompts.build_interpretation_prompt(
+                scene,
+                "What is below?",
+                "Danger, Secret",
+                previous_interpretations=previous,
+                retry_attempt=1,
+            )
+        ),
+    }
+    return [_measure(name, build, repeat) for name, build in cases.items()]
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Format results as a table."""
+    lines = [f"{'case':<22} {'ms':>9} {'peak KiB':>10} {'chars':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<22} {result.seconds * 1000:>9.2f} "
+            f"{result.peak_bytes / 1024:>10.1f} {result.length:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--scenes", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(format_results(run_benchmark(args.events, args.scenes, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Prompt templates for scene and act context digests."""
+
+from typing import Dict, List
+
+
+class DigestPrompts:
+    """Prompt templates for folding new events into a running digest."""
+
+    @staticmethod
+    def build_update_prompt(
+        scope: str,
+        title: str,
+        digest: str,
+        events: List[Dict],
+        max_words: int = 200,
+    ) -> str:
+        """Build the prompt for updating a digest with new events.
+
+        Args:
+            scope: What the digest describes ("scene" or "act")
+            title: Title of the scene or act
+            digest: The current digest (empty if there is none yet)
+            events: New events, oldest first, with description and optional scene
+            max_words: Maximum length of the updated digest
+
+        Returns:
+            String prompt for AI model
+        """
+        prompt = f"""You keep the running summary of one {scope} of a solo
+tabletop roleplaying game. It is given to an oracle as the story so far, so it must
+stay short while keeping every fact that matters later: characters, places,
+open questions, threats and consequences.
+
+{scope.upper()}: {title or "Untitled"}
+
+CURRENT SUMMARY:
+{digest or "(nothing has happened yet)"}
+
+NEW EVENTS (in chronological order):
+"""
+        for event in events:
+            if event.get("scene"):
+                prompt += f"- [{event['scene']}] {event['description']}\n"
+            else:
+                prompt += f"- {event['description']}\n"
+        prompt += f"""
+TASK:
+Rewrite the summary so it also covers the new events. Use at most
+{max_words} words of plain text. Condense older details before dropping
+anything still relevant. Reply with the summary only.
+"""
+        return prompt
@@ -1,9 +1,23 @@
 """Prompt templates for oracle interpretations."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
+from sologm.core.prompts.budget import PromptPacker, PromptSection, TokenCounter
 from sologm.models.scene import Scene
 
+_EXAMPLE_FORMAT = """## The Mysterious Footprints
+The footprints suggest someone sneaked into the cellar during the night. Based on
+their size and depth, they likely belong to a heavier individual carrying something
+substantial - possibly the stolen brandy barrel.
+
+## An Inside Job
+The lack of forced entry and the selective theft of only the special brandy barrel
+suggests this was done by someone familiar with the cellar layout and the value of
+that specific barrel."""
+
+_PREVIOUS_HEADER = "\n=== PREVIOUS INTERPRETATIONS (DO NOT REPEAT THESE) ===\n\n"
+_PREVIOUS_FOOTER = "=== END OF PREVIOUS INTERPRETATIONS ===\n\n"
+
 
 class OraclePrompts:
     """Prompt templates for oracle interpretations."""
@@ -16,9 +30,21 @@ class OraclePrompts:
         count: int = 5,
         previous_interpretations: Optional[List[dict]] = None,
         retry_attempt: int = 0,
+        max_events: int = 5,
+        token_budget: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
+        scene_digest: Optional[str] = None,
+        act_digest: Optional[str] = None,
     ) -> str:
         """Build the complete prompt for interpretation generation.
 
+        Context digests, when given, stand in for the act summary and add a
+        running summary of the scene, so the prompt covers the whole story
+        without the raw history. With a token budget, the scene digest, game
+        description, act context, recent events and previous interpretations
+        are kept in that order of importance; the oldest events and
+        interpretations are dropped first.
+
         Args:
             scene: Scene object with loaded relationships
             context: User's question or context
@@ -26,6 +52,11 @@ class OraclePrompts:
             count: Number of interpretations to generate
             previous_interpretations: Optional list of previous interpretations to avoid
             retry_attempt: Current retry attempt number
+            max_events: Most recent scene events to include
+            token_budget: Optional maximum size of the prompt in tokens
+            token_counter: Counter used to measure the prompt against the budget
+            scene_digest: Optional running summary of the scene so far
+            act_digest: Optional running summary of the act so far
 
         Returns:
             Complete prompt for the AI
@@ -34,36 +65,61 @@ class OraclePrompts:
         act = scene.act
         game = act.game
 
-        # Get recent events through scene relationship (limited to 5)
-        recent_events = [event.description for event in scene.events[:5]]
-
-        # Format the events
-        events_text = OraclePrompts._format_events(recent_events)
+        # Most recent events through the scene relationship, oldest first
+        events = sorted(
+            scene.events,
+            key=lambda event: (
+                event.created_at.timestamp() if event.created_at else float("inf")
+            ),
+        )
+        recent = events[max(len(events) - max_events, 0) :] if max_events > 0 else []
+        recent_events = [event.description for event in recent]
 
         # Get example format
         example_format = OraclePrompts._get_example_format()
 
-        # Format previous interpretations if any
-        previous_interps_text = OraclePrompts._format_previous_interpretations(
-            previous_interpretations, retry_attempt
-        )
-
         # Get retry-specific text if applicable
         retry_text = OraclePrompts._get_retry_text(retry_attempt)
 
-        # Build the complete prompt
-        return f"""You are interpreting oracle results for a solo RPG player.
-
-Game: {game.description or ""}
-Act: {act.summary or ""}
+        sections = [
+            PromptSection(
+                "scene_digest",
+                text=f"Scene So Far: {scene_digest}\n" if scene_digest else "",
+                priority=4,
+            ),
+            PromptSection("game", text=game.description or "", priority=3),
+            PromptSection("act", text=act_digest or act.summary or "", priority=2),
+            PromptSection(
+                "events",
+                items=recent_events,
+                format_items=OraclePrompts._format_events,
+                priority=1,
+            ),
+            PromptSection(
+                "previous",
+                items=previous_interpretations or [],
+                format_items=lambda items: (
+                    OraclePrompts._format_previous_interpretations(
+                        list(items), retry_attempt
+                    )
+                ),
+                priority=0,
+            ),
+        ]
+
+        def render(values: Dict[str, str]) -> str:
+            return f"""You are interpreting oracle results for a solo RPG player.
+
+Game: {values["game"]}
+Act: {values["act"]}
 Current Scene: {scene.description or ""}
-Recent Events:
-{events_text}
+{values["scene_digest"]}Recent Events:
+{values["events"]}
 
 Player's Question/Context: {context}
 Oracle Results: {oracle_results}
 
-{previous_interps_text}
+{values["previous"]}
 {retry_text}
 
 Please provide {count} different interpretations of these oracle results.
@@ -96,12 +152,15 @@ Important:
 - Do not number the interpretations
 """
 
+        packed = PromptPacker(token_budget, token_counter).pack(sections, render)
+        return packed.text
+
     @staticmethod
-    def _format_events(recent_events: List[str]) -> str:
+    def _format_events(recent_events: Sequence[str]) -> str:
         """Format recent events for the prompt.
 
         Args:
-            recent_events: List of recent event descriptions
+            recent_events: Recent event descriptions
 
         Returns:
             Formatted events text for the prompt
@@ -117,15 +176,7 @@ Important:
         Returns:
             Example interpretations to show the AI the expected format
         """
-        return """## The Mysterious Footprints
-The footprints suggest someone sneaked into the cellar during the night. Based on
-their size and depth, they likely belong to a heavier individual carrying something
-substantial - possibly the stolen brandy barrel.
-
-## An Inside Job
-The lack of forced entry and the selective theft of only the special brandy barrel
-suggests this was done by someone familiar with the cellar layout and the value of
-that specific barrel."""
+        return _EXAMPLE_FORMAT
 
     @staticmethod
     def _format_previous_interpretations(
@@ -144,11 +195,16 @@ that specific barrel."""
         if not previous_interpretations or retry_attempt <= 0:
             return ""
 
-        text = "\n=== PREVIOUS INTERPRETATIONS (DO NOT REPEAT THESE) ===\n\n"
-        for interp in previous_interpretations:
-            text += f"## {interp['title']}\n{interp['description']}\n\n"
-        text += "=== END OF PREVIOUS INTERPRETATIONS ===\n\n"
-        return text
+        return "".join(
+            [
+                _PREVIOUS_HEADER,
+                *(
+                    f"## {interp['title']}\n{interp['description']}\n\n"
+                    for interp in previous_interpretations
+                ),
+                _PREVIOUS_FOOTER,
+            ]
+        )
 
     @staticmethod
     def _get_retry_text(retry_attempt: int) -> str:
@@ -1,5 +1,7 @@
 """Unit tests for the ActPrompts class."""
 
+import io
+
 from sologm.core.prompts.act import ActPrompts
 
 
@@ -186,3 +188,24 @@ class TestActPrompts:
         assert "Generate a *new* narrative" in prompt
         assert "consider the user's feedback" in prompt
         assert "Markdown format" in prompt
+
+    def test_prompts_accept_streamed_events(self):
+        """Test scene events can be a generator, e.g. rows streamed from the db."""
+        data = self._get_full_narrative_data()
+        data["additional_context"] = None
+        events = {scene["id"]: scene["events"] for scene in data["scenes"]}
+        expected_narrative = ActPrompts.build_narrative_prompt(data)
+        expected_summary = ActPrompts.build_summary_prompt(data)
+
+        def stream() -> None:
+            for scene in data["scenes"]:
+                scene["events"] = (event for event in events[scene["id"]])
+
+        stream()
+        out = io.StringIO()
+        ActPrompts.write_narrative_prompt(out, data)
+        assert out.getvalue() == expected_narrative
+        assert "No events recorded for this scene." in expected_narrative
+
+        stream()
+        assert ActPrompts.build_summary_prompt(data) == expected_summary
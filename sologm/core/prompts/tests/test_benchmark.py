@@ -0,0 +1,26 @@
+"""Tests for the prompt building micro-benchmark."""
+
+from sologm.core.prompts.benchmark import format_results, main, run_benchmark
+
+
+def test_run_benchmark_small() -> None:
+    """Test every case runs and streamed and buffered prompts match."""
+    results = {r.name: r for r in run_benchmark(events=40, scenes=4, repeat=1)}
+
+    assert set(results) == {
+        "summary",
+        "narrative",
+        "narrative (streamed)",
+        "regeneration",
+        "oracle",
+    }
+    assert results["narrative (streamed)"].length == results["narrative"].length
+    assert all(r.seconds >= 0 and r.peak_bytes > 0 for r in results.values())
+    assert "narrative (streamed)" in format_results(list(results.values()))
+
+
+def test_main_prints_table(capsys) -> None:
+    """Test the command line entry point prints a results table."""
+    main(["--events", "10", "--scenes", "2", "--repeat", "1"])
+
+    assert "peak KiB" in capsys.readouterr().out
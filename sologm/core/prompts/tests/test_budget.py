@@ -0,0 +1,105 @@
+"""Tests for token-budgeted prompt assembly."""
+
+from typing import Dict, Sequence
+from unittest.mock import MagicMock
+
+from sologm.core.prompts.budget import (
+    TRUNCATION_MARKER,
+    PromptPacker,
+    PromptSection,
+    TokenCounter,
+    estimate_tokens,
+)
+from sologm.utils.errors import APIError
+
+
+def _lines(items: Sequence[str]) -> str:
+    return "\n".join(items) if items else "none"
+
+
+def _render(values: Dict[str, str]) -> str:
+    return f"Question: {values['question']}\nLore: {values['lore']}\n{values['log']}"
+
+
+def _sections() -> list:
+    return [
+        PromptSection("question", text="Who rang the bell?", required=True),
+        PromptSection("lore", text=" ".join(["ancient"] * 40), priority=2),
+        PromptSection(
+            "log",
+            items=[f"event number {index}" for index in range(20)],
+            format_items=_lines,
+            priority=1,
+        ),
+    ]
+
+
+def test_estimate_tokens() -> None:
+    """Test the local estimate counts words, long words and punctuation."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("The cat sat.") == 4
+    assert estimate_tokens("extraordinary") == 4
+    assert estimate_tokens("a\nb") == 3
+
+
+def test_pack_without_budget_keeps_everything() -> None:
+    """Test an unlimited packer renders every section in full."""
+    packed = PromptPacker().pack(_sections(), _render)
+
+    assert "event number 0\n" in packed.text
+    assert "event number 19" in packed.text
+    assert packed.trimmed == {}
+    assert packed.tokens == estimate_tokens(packed.text)
+
+
+def test_pack_drops_oldest_items_first() -> None:
+    """Test lower priority list sections lose their oldest items."""
+    full = PromptPacker().pack(_sections(), _render)
+    budget = full.tokens - 20
+
+    packed = PromptPacker(budget).pack(_sections(), _render)
+
+    assert packed.tokens <= budget
+    assert packed.sections["lore"] == " ".join(["ancient"] * 40)
+    assert "event number 19" in packed.text
+    assert "event number 0\n" not in packed.text
+    assert 0 < packed.trimmed["log"] < 20
+    assert "lore" not in packed.trimmed
+
+
+def test_pack_truncates_text_and_keeps_required_sections() -> None:
+    """Test required sections survive a budget too small for anything else."""
+    packed = PromptPacker(budget=20).pack(_sections(), _render)
+
+    assert "Who rang the bell?" in packed.text
+    assert packed.sections["log"] == "none"
+    assert packed.trimmed["log"] == 20
+    assert packed.sections["lore"].endswith(TRUNCATION_MARKER) or (
+        packed.sections["lore"] == ""
+    )
+
+
+def test_pack_repacks_when_exact_count_is_higher() -> None:
+    """Test an exact count over the budget shrinks the prompt once more."""
+    client = MagicMock()
+    # The API reports twice the estimate
+    client.count_tokens.side_effect = lambda text: 2 * estimate_tokens(text)
+    full = PromptPacker().pack(_sections(), _render)
+
+    packed = PromptPacker(full.tokens, TokenCounter(client)).pack(_sections(), _render)
+
+    assert client.count_tokens.call_count == 2
+    assert packed.tokens == 2 * estimate_tokens(packed.text)
+    assert estimate_tokens(packed.text) <= full.tokens // 2
+    assert packed.trimmed
+
+
+def test_token_counter_falls_back_to_estimate() -> None:
+    """Test API failures during exact counting fall back to the estimate."""
+    client = MagicMock()
+    client.count_tokens.side_effect = APIError("offline")
+
+    counter = TokenCounter(client)
+
+    assert counter.exact
+    assert counter.count("The cat sat.") == 4
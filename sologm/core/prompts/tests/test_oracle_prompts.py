@@ -2,6 +2,7 @@
 
 from typing import Callable  # Import Callable for type hinting factory fixtures
 
+from sologm.core.prompts.budget import estimate_tokens
 from sologm.core.prompts.oracle import OraclePrompts  # Import the class being tested
 
 # Import necessary model types for type hinting if needed
@@ -174,3 +175,76 @@ class TestOraclePrompts:
             assert "COMPLETELY DIFFERENT" in result
             # Add assertion for event if created:
             # assert "- Retry Test Event" in result
+
+    def test_build_interpretation_prompt_with_token_budget(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable[..., Game],
+        create_test_act: Callable[..., Act],
+        create_test_scene: Callable[..., Scene],
+        create_test_event: Callable[..., Event],
+        initialize_event_sources: Callable[[Session], None],
+    ):
+        """Test a tight token budget drops the oldest events first."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session, description="A long saga " * 20)
+            act = create_test_act(session, game_id=game.id, summary="Act Summary")
+            scene = create_test_scene(session, act_id=act.id)
+            for index in range(5):
+                create_test_event(
+                    session,
+                    scene_id=scene.id,
+                    description=f"Event {index} with several more words",
+                )
+            session.refresh(scene, attribute_names=["act", "events"])
+            session.refresh(act, attribute_names=["game"])
+
+            full = OraclePrompts.build_interpretation_prompt(
+                scene, "What happens next?", "Mystery", 3
+            )
+            budgeted = OraclePrompts.build_interpretation_prompt(
+                scene,
+                "What happens next?",
+                "Mystery",
+                3,
+                token_budget=estimate_tokens(full) - 10,
+            )
+
+            assert estimate_tokens(budgeted) <= estimate_tokens(full) - 10
+            assert "- Event 4 with several more words" in budgeted
+            assert "- Event 0 with several more words" not in budgeted
+            assert f"Game: {game.description}" in budgeted
+            assert "Player's Question/Context: What happens next?" in budgeted
+
+    def test_build_interpretation_prompt_max_events(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable[..., Game],
+        create_test_act: Callable[..., Act],
+        create_test_scene: Callable[..., Scene],
+        create_test_event: Callable[..., Event],
+        initialize_event_sources: Callable[[Session], None],
+    ):
+        """Test max_events keeps the newest events, and zero keeps none."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+            for index in range(3):
+                create_test_event(
+                    session, scene_id=scene.id, description=f"Event {index}"
+                )
+            session.refresh(scene, attribute_names=["act", "events"])
+            session.refresh(act, attribute_names=["game"])
+
+            def build(max_events: int) -> str:
+                return OraclePrompts.build_interpretation_prompt(
+                    scene, "What happens next?", "Mystery", 3, max_events=max_events
+                )
+
+            assert "No recent events" in build(0)
+            assert "- Event 0" not in build(2)
+            assert "- Event 1\n- Event 2" in build(2)
+            assert "- Event 0\n- Event 1\n- Event 2" in build(10)
@@ -6,7 +6,10 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+from sologm.core.activation import activate_exclusively
 from sologm.core.base_manager import BaseManager
+from sologm.core.sequence import allocate_sequence
+from sologm.core.versioning import update_versioned
 from sologm.models.act import Act
 from sologm.models.scene import Scene
 from sologm.utils.errors import ActError, SceneError
@@ -99,7 +102,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             SceneError: If no act_id provided and no active act found
         """
         if act_id:
-            logger.debug(f"Using provided act ID: {act_id}")
+            logger.debug("Using provided act ID: %s", act_id)
             return act_id
 
         logger.debug("No act_id provided, retrieving active act")
@@ -115,7 +118,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             logger.warning(msg)
             raise SceneError(msg)
 
-        logger.debug(f"Using active act with ID {active_act.id}")
+        logger.debug("Using active act with ID %s", active_act.id)
         return active_act.id
 
     def _check_title_uniqueness(
@@ -167,7 +170,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             msg = "No active game. Use 'sologm game activate' to set one."
             logger.warning(msg)
             raise SceneError(msg)
-        logger.debug(f"Active game: {active_game.id} ({active_game.name})")
+        logger.debug("Active game: %s (%s)", active_game.id, active_game.name)
 
         # Get the active act for this game
         active_act = self.act_manager.get_active_act(active_game.id)
@@ -175,7 +178,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             msg = "No active act. Create one with 'sologm act create'."
             logger.warning(msg)
             raise SceneError(msg)
-        logger.debug(f"Active act: {active_act.id} ({active_act.title})")
+        logger.debug("Active act: %s (%s)", active_act.id, active_act.title)
 
         # Get the active scene for this act
         active_scene = self.get_active_scene(active_act.id)
@@ -183,7 +186,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             msg = "No active scene. Add one with 'sologm scene add'."
             logger.warning(msg)
             raise SceneError(msg)
-        logger.debug(f"Active scene: {active_scene.id} ({active_scene.title})")
+        logger.debug("Active scene: %s (%s)", active_scene.id, active_scene.title)
 
         logger.debug("Active context retrieved successfully")
         return {"game": active_game, "act": active_act, "scene": active_scene}
@@ -197,11 +200,11 @@ class SceneManager(BaseManager[Scene, Scene]):
         Returns:
             Scene object if found, None otherwise.
         """
-        logger.debug(f"Getting scene with ID {scene_id}")
+        logger.debug("Getting scene with ID %s", scene_id)
 
         scenes = self.list_entities(Scene, filters={"id": scene_id}, limit=1)
         result = scenes[0] if scenes else None
-        logger.debug(f"Found scene: {result.id if result else 'None'}")
+        logger.debug("Found scene: %s", result.id if result else "None")
         return result
 
     def get_scene_by_identifier(self, identifier: str) -> Optional[Scene]:
@@ -213,7 +216,7 @@ class SceneManager(BaseManager[Scene, Scene]):
         Returns:
             Scene instance if found, None otherwise.
         """
-        logger.debug(f"Getting scene by identifier: {identifier}")
+        logger.debug("Getting scene by identifier: %s", identifier)
 
         def _get_scene(session: Session) -> Optional[Scene]:
             return self.get_entity_by_identifier(session, Scene, identifier)
@@ -222,8 +225,9 @@ class SceneManager(BaseManager[Scene, Scene]):
             f"get scene by identifier {identifier}", _get_scene
         )
         logger.debug(
-            f"Retrieved scene by identifier: {scene.id if scene else 'None'} "
-            f"(Input: '{identifier}')",
+            "Retrieved scene by identifier: %s (Input: '%s')",
+            scene.id if scene else "None",
+            identifier,
         )
         return scene
 
@@ -240,7 +244,7 @@ class SceneManager(BaseManager[Scene, Scene]):
         Raises:
             SceneError: If the scene is not found.
         """
-        logger.debug(f"Getting scene by identifier or error: {identifier}")
+        logger.debug("Getting scene by identifier or error: %s", identifier)
 
         def _get_scene(session: Session) -> Scene:
             # Call the base manager method correctly
@@ -256,7 +260,7 @@ class SceneManager(BaseManager[Scene, Scene]):
             f"get scene by identifier or error {identifier}", _get_scene
         )
         logger.debug(
-            f"Retrieved scene by identifier: {scene.id} (Input: '{identifier}')",
+            "Retrieved scene by identifier: %s (Input: '%s')", scene.id, identifier
         )
         return scene
 
@@ -270,13 +274,15 @@ class SceneManager(BaseManager[Scene, Scene]):
         Returns:
             Scene object if found, None otherwise.
         """
-        logger.debug(f"Getting scene {scene_id} in act {act_id}")
+        logger.debug("Getting scene %s in act %s", scene_id, act_id)
 
         scenes = self.list_entities(
             Scene, filters={"act_id": act_id, "id": scene_id}, limit=1
         )
         result = scenes[0] if scenes else None
-        logger.debug(f"Found scene in act {act_id}: {result.id if result else 'None'}")
+        logger.debug(
+            "Found scene in act %s: %s", act_id, result.id if result else "None"
+        )
         return result
 
     def get_active_scene(self, act_id: Optional[str] = None) -> Optional[Scene]:
@@ -294,7 +300,7 @@ class SceneManager(BaseManager[Scene, Scene]):
                         or if the underlying act/game retrieval fails.
         """
         logger.debug(
-            f"Getting active scene for act_id={act_id or 'from active context'}",
+            "Getting active scene for act_id=%s", act_id or "from active context"
         )
 
         act_id = self._get_act_id_or_active(act_id)
@@ -305,7 +311,7 @@ class SceneManager(BaseManager[Scene, Scene]):
 
         result = scenes[0] if scenes else None
         logger.debug(
-            f"Active scene for act {act_id}: {result.id if result else 'None'}"
+            "Active scene for act %s: %s", act_id, result.id if result else "None"
         )
         return result
 
@@ -354,25 +360,22 @@ class SceneManager(BaseManager[Scene, Scene]):
                 error_class=ActError,
                 error_message=f"Act with ID '{act_id}' does not exist",
             )
-            logger.debug(f"Found act: {act.id} ('{act.title}')")
+            logger.debug("Found act: %s ('%s')", act.id, act.title)
 
             # Check for duplicate titles
             self._check_title_uniqueness(session, act_id, title)
-            logger.debug(f"Title '{title}' is unique in act {act_id}")
-
-            # Get the next sequence number
-            scenes = self.list_entities(
-                Scene,
-                filters={"act_id": act_id},
-                order_by="sequence",
-                order_direction="desc",
-                limit=1,
+            logger.debug("Title '%s' is unique in act %s", title, act_id)
+
+            # Reserve the next sequence number (safe across processes)
+            sequence = allocate_sequence(
+                session,
+                Act,
+                act_id,
+                Act.last_scene_sequence,
+                Scene.sequence,
+                Scene.act_id,
             )
-
-            sequence = 1
-            if scenes:
-                sequence = scenes[0].sequence + 1
-            logger.debug(f"Using sequence number {sequence}")
+            logger.debug("Using sequence number %s", sequence)
 
             # Create new scene
             scene = Scene.create(
@@ -381,27 +384,21 @@ class SceneManager(BaseManager[Scene, Scene]):
                 description=description,
                 sequence=sequence,
             )
-            logger.debug(f"Created scene with ID {scene.id}")
-
-            if make_active:
-                # Deactivate all other scenes
-                session.query(Scene).filter(
-                    and_(Scene.act_id == act_id, Scene.is_active)
-                ).update({"is_active": False})
-                logger.debug(f"Deactivated all other scenes in act {act_id}")
-
-                # Set this scene as active
-                scene.is_active = True
-                logger.debug(f"Set scene {scene.id} as active")
+            logger.debug("Created scene with ID %s", scene.id)
 
             session.add(scene)
-            logger.debug(f"Added scene {scene.title} to session")
+            logger.debug("Added scene %s to session", scene.title)
 
             # --- MODIFICATION START ---
             # Flush to send the INSERT to the DB and generate timestamps/ID
             logger.debug("Flushing session to persist scene and generate timestamps")
             session.flush()
-            logger.debug(f"Scene flushed. DB ID should now be: {scene.id}")
+            logger.debug("Scene flushed. DB ID should now be: %s", scene.id)
+
+            if make_active:
+                # Make this the only active scene in the act
+                activate_exclusively(session, Scene, scene.id, [Scene.act_id == act_id])
+                logger.debug("Set scene %s as active", scene.id)
 
             # Refresh to load DB-generated values (ID, timestamps) and relationships
             try:
@@ -424,12 +421,16 @@ class SceneManager(BaseManager[Scene, Scene]):
             except Exception as e:
                 # Log a warning if refresh fails, but proceed cautiously
                 logger.warning(
-                    f"Warning: Failed to refresh scene {scene.id} after creation: {e}"
+                    "Warning: Failed to refresh scene %s after creation: %s",
+                    scene.id,
+                    e,
                 )
                 # The scene object might have stale data, but the DB record exists.
             # --- MODIFICATION END ---
 
-            logger.info(f"Created scene '{title}' with ID {scene.id} in act {act_id}")
+            logger.info(
+                "Created scene '%s' with ID %s in act %s", title, scene.id, act_id
+            )
             return scene
 
         return self._execute_db_operation("create scene", _create_scene)
@@ -449,14 +450,14 @@ class SceneManager(BaseManager[Scene, Scene]):
                         or if the underlying act/game retrieval fails.
             ActError: If the specified act doesn't exist.
         """
-        logger.debug(f"Listing scenes for act_id={act_id or 'from active context'}")
+        logger.debug("Listing scenes for act_id=%s", act_id or "from active context")
 
         act_id = self._get_act_id_or_active(act_id)
 
         scenes = self.list_entities(
             Scene, filters={"act_id": act_id}, order_by="sequence"
         )
-        logger.debug(f"Found {len(scenes)} scenes in act {act_id}")
+        logger.debug("Found %s scenes in act %s", len(scenes), act_id)
         return scenes
 
     def set_current_scene(self, scene_id: str) -> Scene:
@@ -471,7 +472,7 @@ class SceneManager(BaseManager[Scene, Scene]):
         Raises:
             SceneError: If the scene doesn't exist
         """
-        logger.debug(f"Setting scene {scene_id} as current")
+        logger.debug("Setting scene %s as current", scene_id)
 
         def _set_current_scene(session: Session) -> Scene:
             # Get the scene and raise error if not found
@@ -482,22 +483,13 @@ class SceneManager(BaseManager[Scene, Scene]):
                 error_class=SceneError,
                 error_message=f"Scene {scene_id} not found",
             )
-            logger.debug(f"Found scene: {scene.id} ('{scene.title}')")
-
-            # Deactivate all scenes in this act
-            session.query(Scene).filter(
-                and_(Scene.act_id == scene.act_id, Scene.is_active)
-            ).update({"is_active": False})
-            logger.debug(f"Deactivated all scenes in act {scene.act_id}")
-
-            # Set this scene as active
-            scene.is_active = True
-            session.add(scene)  # Ensure change is tracked
-            logger.debug(f"Marked scene {scene_id} as active in session")
+            logger.debug("Found scene: %s ('%s')", scene.id, scene.title)
 
-            # Flush to send UPDATEs (for deactivated scenes and the new active one)
-            logger.debug("Flushing session to persist active status changes")
-            session.flush()
+            # Make this the only active scene in the act
+            activate_exclusively(
+                session, Scene, scene.id, [Scene.act_id == scene.act_id]
+            )
+            logger.debug("Marked scene %s as active", scene_id)
 
             # Refresh the newly activated scene to get updated modified_at
             try:
@@ -515,11 +507,12 @@ class SceneManager(BaseManager[Scene, Scene]):
                 )
             except Exception as e:
                 logger.warning(
-                    f"Warning: Failed to refresh scene {scene.id} "
-                    f"after setting current: {e}"
+                    "Warning: Failed to refresh scene %s after setting current: %s",
+                    scene.id,
+                    e,
                 )
 
-            logger.info(f"Set scene {scene_id} as current")
+            logger.info("Set scene %s as current", scene_id)
             return scene
 
         return self._execute_db_operation("set current scene", _set_current_scene)
@@ -545,6 +538,8 @@ class SceneManager(BaseManager[Scene, Scene]):
         Raises:
             SceneError: If the scene doesn't exist or title isn't unique.
             ValueError: If neither title nor description is provided.
+            ConflictError: If another writer changed the same fields since
+                the scene was loaded.
         """
         logger.debug(
             "Updating scene %s: title=%s, description=%s...",
@@ -566,24 +561,22 @@ class SceneManager(BaseManager[Scene, Scene]):
                 error_class=SceneError,
                 error_message=f"Scene {scene_id} not found",
             )
-            logger.debug(f"Found scene: {scene.id} ('{scene.title}')")
+            logger.debug("Found scene: %s ('%s')", scene.id, scene.title)
 
             # Only update attributes that are provided
+            changes = {}
             if title and scene.title != title:
-                logger.debug(f"Checking uniqueness for new title: {title}")
+                logger.debug("Checking uniqueness for new title: %s", title)
                 self._check_title_uniqueness(session, scene.act_id, title, scene_id)
-                logger.debug(f"Title '{title}' is unique in act {scene.act_id}")
-                scene.title = title
+                logger.debug("Title '%s' is unique in act %s", title, scene.act_id)
+                changes["title"] = title
 
             if description is not None:
-                scene.description = description
+                changes["description"] = description
 
-            session.add(scene)  # Ensure changes are tracked
-            logger.debug(f"Marked scene {scene_id} for update in session")
-
-            # Flush to send UPDATE and update modified_at in DB
-            logger.debug("Flushing session to persist scene updates")
-            session.flush()
+            # Send the UPDATE, checking no one else edited the same fields
+            logger.debug("Writing scene %s updates", scene_id)
+            update_versioned(session, scene, changes)
 
             # Refresh to load updated modified_at
             try:
@@ -608,7 +601,7 @@ class SceneManager(BaseManager[Scene, Scene]):
                     e,
                 )
 
-            logger.info(f"Updated scene {scene_id}")
+            logger.info("Updated scene %s", scene_id)
             return scene
 
         return self._execute_db_operation("update scene", _update_scene)
@@ -625,18 +618,18 @@ class SceneManager(BaseManager[Scene, Scene]):
         Raises:
             SceneError: If the specified scene is not found.
         """
-        logger.debug(f"Getting previous scene for scene_id={scene_id}")
+        logger.debug("Getting previous scene for scene_id=%s", scene_id)
 
         scene = self.get_scene(scene_id)
         if not scene:
-            logger.warning(f"Scene with ID {scene_id} not found")
+            logger.warning("Scene with ID %s not found", scene_id)
             return None
 
-        logger.debug(f"Found scene {scene_id}, sequence={scene.sequence}")
+        logger.debug("Found scene %s, sequence=%s", scene_id, scene.sequence)
 
         if scene.sequence <= 1:
             logger.debug(
-                f"Scene {scene_id} is the first scene (sequence {scene.sequence})"
+                "Scene %s is the first scene (sequence %s)", scene_id, scene.sequence
             )
             return None
 
@@ -648,7 +641,7 @@ class SceneManager(BaseManager[Scene, Scene]):
 
         result = scenes[0] if scenes else None
         logger.debug(
-            f"Previous scene for {scene_id}: {result.id if result else 'None'}"
+            "Previous scene for %s: %s", scene_id, result.id if result else "None"
         )
         return result
 
@@ -661,7 +654,7 @@ class SceneManager(BaseManager[Scene, Scene]):
         Returns:
             The most recent Scene instance in the act or None if no scenes exist.
         """
-        self.logger.debug(f"Getting most recent scene for act_id='{act_id}'")
+        self.logger.debug("Getting most recent scene for act_id='%s'", act_id)
 
         def _operation(session: Session, act_id: str) -> Optional[Scene]:
             # Ensure correct model is used and order_by is applied
@@ -0,0 +1,61 @@
+"""Allocation of per-parent sequence numbers for acts and scenes."""
+
+import logging
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+logger = logging.getLogger(__name__)
+
+
+def allocate_sequence(
+    session: Session,
+    parent_model: Any,
+    parent_id: str,
+    counter: InstrumentedAttribute,
+    child_sequence: InstrumentedAttribute,
+    child_foreign_key: InstrumentedAttribute,
+) -> int:
+    """Reserve the next sequence number under a parent row.
+
+    The parent keeps the last number it handed out. A single
+    ``UPDATE ... RETURNING`` bumps it, which locks the parent row until the
+    transaction ends, so concurrent writers in other processes are
+    serialized and never receive the same number. Rows inserted without
+    going through this function (imports, fixtures) are accounted for by
+    never returning less than the current highest child sequence + 1.
+
+    Args:
+        session: Database session
+        parent_model: Model owning the counter (e.g. Act)
+        parent_id: ID of the parent row
+        counter: The parent's last-allocated column (e.g. Act.last_scene_sequence)
+        child_sequence: The children's sequence column (e.g. Scene.sequence)
+        child_foreign_key: The children's parent column (e.g. Scene.act_id)
+
+    Returns:
+        The allocated sequence number.
+    """
+    highest = (
+        select(func.coalesce(func.max(child_sequence), 0))
+        .where(child_foreign_key == parent_id)
+        .scalar_subquery()
+    )
+    # Written as CASE rather than GREATEST/MAX so it works on SQLite and
+    # PostgreSQL alike. The counter is re-read after waiting on the row
+    # lock, which is what keeps PostgreSQL READ COMMITTED writers apart.
+    allocated = session.execute(
+        update(parent_model)
+        .where(parent_model.id == parent_id)
+        .values({counter: case((counter >= highest, counter), else_=highest) + 1})
+        .returning(counter)
+        .execution_options(synchronize_session="fetch")
+    ).scalar_one()
+    logger.debug(
+        "Allocated sequence %s under %s %s",
+        allocated,
+        parent_model.__name__,
+        parent_id,
+    )
+    return allocated
@@ -0,0 +1,271 @@
+"""Scene-by-scene summarization of long acts.
+
+Acts with many events are too large to send to the model in one prompt. The
+SceneSummaryManager summarizes each scene separately (the map step, run
+concurrently) and caches the results keyed by a hash of the scene's content,
+so the act summary and narrative prompts (the reduce step) can use the short
+scene summaries instead of every event. Only scenes whose content changed
+since the last run are summarized again.
+"""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from sologm.core.base_manager import BaseManager
+from sologm.core.prompts.act import SCENE_SUMMARY_VERSION, ActPrompts
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.models.scene_summary import SceneSummary
+from sologm.utils.concurrency import wait_all
+from sologm.utils.errors import APIError
+
+logger = logging.getLogger(__name__)
+
+# Events sent in one scene summary request, measured in characters
+DEFAULT_CHUNK_CHARS = 40000
+DEFAULT_CONCURRENCY = 4
+
+
+def scene_content_hash(scene: Dict) -> str:
+    """Hash the parts of a scene that its summary is generated from.
+
+    Accepts both the summary and the narrative scene data layouts, which
+    name the event source ``source`` and ``source_name`` respectively.
+
+    Args:
+        scene: Scene data with title, description and events
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    content = {
+        "version": SCENE_SUMMARY_VERSION,
+        "title": scene.get("title"),
+        "description": scene.get("description"),
+        "events": [
+            [
+                event.get("source_name") or event.get("source"),
+                event.get("description"),
+            ]
+            for event in scene.get("events", [])
+        ],
+    }
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def chunk_events(events: Sequence[Dict], max_chars: int) -> List[List[Dict]]:
+    """Split a scene's events into consecutive chunks of bounded size.
+
+    A single event longer than the limit gets a chunk of its own.
+
+    Args:
+        events: Events in chronological order
+        max_chars: Approximate size limit of each chunk's descriptions
+
+    Returns:
+        List of non-empty chunks.
+    """
+    chunks: List[List[Dict]] = []
+    current: List[Dict] = []
+    size = 0
+    for event in events:
+        length = len(event.get("description") or "")
+        if current and size + length > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(event)
+        size += length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class SceneSummaryManager(BaseManager[SceneSummary, SceneSummary]):
+    """Generates and caches per-scene summaries."""
+
+    def __init__(
+        self,
+        session: Session,
+        anthropic_client: Optional[AnthropicClient] = None,
+        max_workers: Optional[int] = None,
+        chunk_chars: Optional[int] = None,
+    ):
+        """Initialize the scene summary manager.
+
+        Args:
+            session: Database session
+            anthropic_client: Client used for the summary requests
+            max_workers: Summary requests run at once; defaults to the
+                ``summary_concurrency`` setting
+            chunk_chars: Event characters per request; defaults to the
+                ``summary_chunk_chars`` setting
+        """
+        super().__init__(session=session)
+        self.anthropic_client = anthropic_client or AnthropicClient()
+        if max_workers is None or chunk_chars is None:
+            from sologm.utils.config import get_config
+
+            config = get_config()
+            if max_workers is None:
+                max_workers = config.get_int("summary_concurrency", DEFAULT_CONCURRENCY)
+            if chunk_chars is None:
+                chunk_chars = config.get_int("summary_chunk_chars", DEFAULT_CHUNK_CHARS)
+        self.max_workers = max(1, max_workers)
+        self.chunk_chars = max(1, chunk_chars)
+
+    def summarize_scenes(
+        self, game: Dict, act: Dict, scenes: Sequence[Dict]
+    ) -> Dict[str, str]:
+        """Get a summary of each scene, generating only the stale ones.
+
+        Summaries are generated concurrently. Those that succeed are saved
+        even if others fail, so a retry only repeats the failed scenes.
+
+        Args:
+            game: Game data (name and description)
+            act: Act data (sequence and title)
+            scenes: Scene data with id, sequence, title, description and events
+
+        Returns:
+            Dict mapping scene ID to summary. Scenes without events are left out.
+
+        Raises:
+            APIError: If a summary request fails
+        """
+        wanted = {
+            scene["id"]: scene_content_hash(scene)
+            for scene in scenes
+            if scene.get("events")
+        }
+        if not wanted:
+            return {}
+
+        summaries = self._load_cached(wanted)
+        stale = [
+            scene
+            for scene in scenes
+            if scene["id"] in wanted and scene["id"] not in summaries
+        ]
+        logger.debug(
+            "Scene summaries: %s cached, %s to generate",
+            len(summaries),
+            len(stale),
+        )
+        if not stale:
+            return summaries
+
+        generated, errors = self._generate(game, act, stale)
+        if generated:
+            self._store(
+                {
+                    scene_id: (wanted[scene_id], text)
+                    for scene_id, text in generated.items()
+                }
+            )
+            summaries.update(generated)
+        if errors:
+            raise APIError(
+                f"Failed to summarize {len(errors)} of {len(stale)} scenes: {errors[0]}"
+            ) from errors[0]
+        return summaries
+
+    def _load_cached(self, wanted: Dict[str, str]) -> Dict[str, str]:
+        """Get the cached summaries whose hash still matches."""
+
+        def _load(session: Session) -> Dict[str, str]:
+            rows = (
+                session.query(SceneSummary)
+                .filter(SceneSummary.scene_id.in_(list(wanted)))
+                .all()
+            )
+            return {
+                row.scene_id: row.summary
+                for row in rows
+                if row.content_hash == wanted[row.scene_id]
+            }
+
+        return self._execute_db_operation("load scene summaries", _load)
+
+    def _store(self, entries: Dict[str, Tuple[str, str]]) -> None:
+        """Insert or replace cached summaries (scene ID -> (hash, summary))."""
+
+        def _save(session: Session) -> None:
+            existing = {
+                row.scene_id: row
+                for row in session.query(SceneSummary)
+                .filter(SceneSummary.scene_id.in_(list(entries)))
+                .all()
+            }
+            for scene_id, (content_hash, summary) in entries.items():
+                row = existing.get(scene_id)
+                if row is None:
+                    session.add(
+                        SceneSummary(
+                            scene_id=scene_id,
+                            content_hash=content_hash,
+                            summary=summary,
+                        )
+                    )
+                else:
+                    row.content_hash = content_hash
+                    row.summary = summary
+            session.flush()
+
+        self._execute_db_operation("store scene summaries", _save)
+
+    def _generate(
+        self, game: Dict, act: Dict, scenes: Sequence[Dict]
+    ) -> Tuple[Dict[str, str], List[Exception]]:
+        """Summarize scenes concurrently.
+
+        Runs no database work, since the session is not shared across threads.
+
+        Returns:
+            Summaries by scene ID, and the errors of the requests that failed.
+        """
+        requests: List[Tuple[str, str]] = []
+        for scene in scenes:
+            chunks = chunk_events(scene["events"], self.chunk_chars)
+            for index, chunk in enumerate(chunks, start=1):
+                part = (index, len(chunks)) if len(chunks) > 1 else None
+                prompt = ActPrompts.build_scene_summary_prompt(
+                    game, act, scene, chunk, part=part
+                )
+                requests.append((scene["id"], prompt))
+
+        workers = min(self.max_workers, len(requests))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="scene-summary"
+        ) as pool:
+            futures = [
+                (scene_id, pool.submit(self._summarize, prompt))
+                for scene_id, prompt in requests
+            ]
+            wait_all(future for _, future in futures)
+
+        parts: Dict[str, List[str]] = {}
+        failed: Dict[str, Exception] = {}
+        for scene_id, future in futures:
+            error = future.exception()
+            if isinstance(error, Exception):
+                logger.error("Scene %s summary failed: %s", scene_id, error)
+                failed.setdefault(scene_id, error)
+            else:
+                parts.setdefault(scene_id, []).append(future.result())
+
+        generated = {
+            scene_id: "\n\n".join(texts)
+            for scene_id, texts in parts.items()
+            if scene_id not in failed
+        }
+        return generated, list(failed.values())
+
+    def _summarize(self, prompt: str) -> str:
+        return self.anthropic_client.send_message(
+            prompt=prompt, max_tokens=600, temperature=0.3, call_site="scene.summary"
+        ).strip()
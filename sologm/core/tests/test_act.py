@@ -262,8 +262,17 @@ class TestActManager:
                 assert active_act is not None
                 assert active_act.id == test_act.id
 
-            # Deactivate all acts
-            managers.act._deactivate_all_acts(session, test_game.id)
+            # Activating another act switches the active act
+            other_act = create_test_act(
+                session, game_id=test_game.id, title="Other", is_active=False
+            )
+            managers.act.set_active(other_act.id)
+            active_act = managers.act.get_active_act(test_game.id)
+            assert active_act is not None
+            assert active_act.id == other_act.id
+
+            # Deactivate it, leaving no active act
+            other_act.is_active = False
             session.flush()  # Flush changes within the context
 
             # Get active act when none is active
@@ -496,8 +505,8 @@ class TestActManager:
                 act = managers.act.validate_active_act()
                 assert act.id == test_act.id
 
-            # Deactivate all acts
-            managers.act._deactivate_all_acts(session, test_game.id)
+            # Deactivate the act
+            test_act.is_active = False
             session.flush()
 
             # Invalid context - no active act
@@ -1031,7 +1040,9 @@ class TestActManager:
             mock_build_regen.assert_not_called()
             # Assert against the fixture mock
             mock_anthropic_client.send_message.assert_called_once_with(
-                prompt="Initial Prompt", max_tokens=NARRATIVE_MAX_TOKENS
+                prompt="Initial Prompt",
+                max_tokens=NARRATIVE_MAX_TOKENS,
+                call_site="act.narrative",
             )
 
             # Reset mocks for next call
@@ -1062,7 +1073,9 @@ class TestActManager:
             mock_build_narrative.assert_not_called()
             # Assert against the fixture mock
             mock_anthropic_client.send_message.assert_called_once_with(
-                prompt="Regen Prompt", max_tokens=NARRATIVE_MAX_TOKENS
+                prompt="Regen Prompt",
+                max_tokens=NARRATIVE_MAX_TOKENS,
+                call_site="act.narrative",
             )
 
     def test_generate_act_narrative_api_error(
@@ -0,0 +1,127 @@
+"""Tests for summarizing every act of a game at once."""
+
+from pathlib import Path
+from typing import Callable, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from sologm.core.factory import create_all_managers
+from sologm.database.session import SessionContext
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.cassette import Cassette, ReplayTransport
+from sologm.integrations.throttle import CallGuard, RetryPolicy
+from sologm.models.act import Act
+from sologm.utils.errors import GameError
+
+
+def _response(title: str) -> str:
+    return f"TITLE: {title}\n\nSUMMARY:\nThe story of {title.lower()}."
+
+
+@pytest.fixture
+def three_acts(
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+) -> Callable:
+    """Create a game with two acts that have scenes and one that doesn't."""
+
+    def _create(session) -> List[Act]:
+        game = create_test_game(session)
+        acts = []
+        for sequence, scenes in ((1, ["Harbor"]), (2, ["Tower", "Vault"]), (3, [])):
+            act = create_test_act(
+                session,
+                game_id=game.id,
+                title=f"Act {sequence}",
+                is_active=sequence == 3,
+                sequence=sequence,
+            )
+            for title in scenes:
+                create_test_scene(session, act_id=act.id, title=title)
+            acts.append(act)
+        return acts
+
+    return _create
+
+
+def test_summarize_acts_as_batch(
+    tmp_path: Path, session_context: SessionContext, three_acts: Callable
+) -> None:
+    """Test acts are summarized through one batch job and saved together."""
+    cassette = Cassette(tmp_path / "acts.json")
+    cassette.record("create", {}, {"text": _response("The Crossing")}, 0)
+    cassette.record("create", {}, {"text": "No structure at all"}, 0)
+    transport = ReplayTransport(cassette, match="sequence", batch_polls=2)
+    client = AnthropicClient(
+        transport=transport, call_guard=CallGuard(retry=RetryPolicy(max_retries=0))
+    )
+
+    with session_context as session:
+        first, second, empty = three_acts(session)
+        managers = create_all_managers(session, client)
+        summaries, errors = managers.act.summarize_acts(
+            first.game_id, use_batch=True, poll_interval=0.01
+        )
+
+        assert summaries == {
+            first.id: {
+                "title": "The Crossing",
+                "summary": "The story of the crossing.",
+            }
+        }
+        assert errors == {
+            empty.id: "Act has no scenes",
+            second.id: "Could not parse the summary response",
+        }
+
+        updated = managers.act.apply_act_summaries(summaries)
+        assert updated == [first]
+        assert first.title == "The Crossing"
+        assert first.summary == "The story of the crossing."
+        assert second.title == "Act 2"
+
+
+def test_summarize_acts_concurrently(
+    session_context: SessionContext,
+    three_acts: Callable,
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test bounded concurrent requests, keeping failures out of the results."""
+
+    def reply(prompt: str, **kwargs) -> str:
+        if "Vault" in prompt:
+            raise RuntimeError("overloaded")
+        return _response("The Crossing")
+
+    mock_anthropic_client.send_message.side_effect = reply
+
+    with session_context as session:
+        first, second, empty = three_acts(session)
+        managers = create_all_managers(session, mock_anthropic_client)
+        summaries, errors = managers.act.summarize_acts(first.game_id, max_workers=2)
+
+        assert list(summaries) == [first.id]
+        assert errors == {empty.id: "Act has no scenes", second.id: "overloaded"}
+        assert mock_anthropic_client.send_message.call_count == 2
+
+
+def test_apply_act_summaries_is_all_or_nothing(
+    session_context: SessionContext, three_acts: Callable
+) -> None:
+    """Test no act is updated when one of the updates fails."""
+    with session_context as session:
+        first, second, _ = three_acts(session)
+        managers = create_all_managers(session)
+
+        with pytest.raises(GameError):
+            managers.act.apply_act_summaries(
+                {
+                    first.id: {"title": "Changed", "summary": "Changed"},
+                    "missing-act": {"title": "Lost", "summary": "Lost"},
+                }
+            )
+
+        session.expire_all()
+        assert session.get(Act, first.id).title == "Act 1"
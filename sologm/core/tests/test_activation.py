@@ -0,0 +1,80 @@
+"""Tests for exclusive activation of games, acts and scenes."""
+
+from typing import Callable, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from sologm.core.activation import activate_exclusively
+from sologm.database.session import SessionContext
+from sologm.models.act import Act
+from sologm.models.game import Game
+
+
+def test_activate_exclusively_uses_two_updates(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test activation switches rows without reading them first."""
+    with session_context as session:
+        game = create_test_game(session)
+        first = create_test_act(session, game_id=game.id, sequence=1)
+        second = create_test_act(session, game_id=game.id, sequence=2, is_active=False)
+        session.flush()
+
+        statements: List[str] = []
+
+        def record(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            activate_exclusively(session, Act, second.id, [Act.game_id == game.id])
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 2
+        assert all(s.lstrip().upper().startswith("UPDATE") for s in statements)
+        # In-session objects are synchronized without a refresh
+        assert first.is_active is False
+        assert second.is_active is True
+
+
+def test_activate_exclusively_respects_scope(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test activation leaves rows under other parents alone."""
+    with session_context as session:
+        game = create_test_game(session, name="One")
+        other_game = create_test_game(session, name="Two", is_active=False)
+        act = create_test_act(session, game_id=game.id, sequence=1)
+        other_act = create_test_act(session, game_id=other_game.id, sequence=1)
+        replacement = create_test_act(
+            session, game_id=game.id, title="Replacement", sequence=2, is_active=False
+        )
+
+        activate_exclusively(session, Act, replacement.id, [Act.game_id == game.id])
+        session.expire_all()
+
+        assert session.get(Act, act.id).is_active is False
+        assert session.get(Act, replacement.id).is_active is True
+        assert session.get(Act, other_act.id).is_active is True
+
+
+def test_second_active_game_rejected(
+    session_context: SessionContext, create_test_game: Callable
+) -> None:
+    """Test the partial unique index refuses a second active game."""
+    with session_context as session:
+        create_test_game(session, name="One")
+        rogue = Game.create(name="Two", description="Rogue writer")
+        rogue.is_active = True
+        session.add(rogue)
+        with pytest.raises(IntegrityError):
+            session.flush()
+        session.rollback()
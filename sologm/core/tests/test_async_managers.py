@@ -0,0 +1,171 @@
+"""Tests for the asyncio manager layer."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Callable, Coroutine
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from sologm.core.async_managers import create_all_async_managers  # noqa: E402
+from sologm.database.async_session import (  # noqa: E402
+    AsyncDatabaseManager,
+    AsyncSessionContext,
+    to_async_url,
+)
+from sologm.utils.errors import GameError  # noqa: E402
+
+
+def _run(
+    tmp_path: Path,
+    initialize_event_sources: Callable[[Session], None],
+    body: Callable[[AsyncDatabaseManager], Coroutine[Any, Any, Any]],
+) -> Any:
+    """Run a coroutine against a fresh file database with async drivers."""
+
+    async def main() -> Any:
+        db = AsyncDatabaseManager(db_url=f"sqlite:///{tmp_path / 'async.db'}")
+        try:
+            await db.create_tables()
+            async with AsyncSessionContext(db) as session:
+                await session.run_sync(initialize_event_sources)
+            return await body(db)
+        finally:
+            await db.dispose()
+
+    return asyncio.run(main())
+
+
+def test_to_async_url() -> None:
+    """Test sync URLs are switched to asyncio drivers."""
+    assert to_async_url("sqlite:///tmp/x.db") == "sqlite+aiosqlite:///tmp/x.db"
+    assert (
+        to_async_url("postgresql://u:p@host/db") == "postgresql+asyncpg://u:p@host/db"
+    )
+    assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+def test_async_managers_round_trip(
+    tmp_path: Path,
+    mock_anthropic_client: MagicMock,
+    initialize_event_sources: Callable[[Session], None],
+) -> None:
+    """Test the async managers create and read a game hierarchy."""
+
+    async def body(db: AsyncDatabaseManager) -> None:
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            game = await managers.game.create_game("Async Game", "Over asyncio")
+            act = await managers.act.create_act(game_id=game.id, title="Act One")
+            scene = await managers.scene.create_scene("Gate", "A gate", act.id)
+            await managers.event.add_event("The gate opens", scene.id)
+
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            active = await managers.scene.get_active_context()
+            events = await managers.event.list_events(scene_id=scene.id)
+            await session.refresh(active["game"], ["acts"])
+            acts = active["game"].acts
+
+        assert active["game"].name == "Async Game"
+        assert active["scene"].id == scene.id
+        assert [event.description for event in events] == ["The gate opens"]
+        assert [a.title for a in acts] == ["Act One"]
+
+    _run(tmp_path, initialize_event_sources, body)
+
+
+def test_async_errors_roll_back(
+    tmp_path: Path,
+    mock_anthropic_client: MagicMock,
+    initialize_event_sources: Callable[[Session], None],
+) -> None:
+    """Test manager errors propagate and discard the session's changes."""
+
+    async def body(db: AsyncDatabaseManager) -> None:
+        with pytest.raises(GameError):
+            async with AsyncSessionContext(db) as session:
+                managers = create_all_async_managers(session, mock_anthropic_client)
+                await managers.game.create_game("Doomed", "Rolled back")
+                await managers.game.get_game_by_identifier_or_error("missing")
+
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            assert await managers.game.list_games() == []
+
+    _run(tmp_path, initialize_event_sources, body)
+
+
+def test_concurrent_sessions_share_one_loop(
+    tmp_path: Path,
+    mock_anthropic_client: MagicMock,
+    initialize_event_sources: Callable[[Session], None],
+) -> None:
+    """Test several sessions are served concurrently from one event loop."""
+
+    async def body(db: AsyncDatabaseManager) -> None:
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            for index in range(5):
+                await managers.game.create_game(f"Game {index}", "Concurrent")
+
+        async def read_games() -> int:
+            async with AsyncSessionContext(db) as session:
+                managers = create_all_async_managers(session, mock_anthropic_client)
+                return len(await managers.game.list_games())
+
+        counts = await asyncio.gather(*(read_games() for _ in range(10)))
+        assert counts == [5] * 10
+
+    _run(tmp_path, initialize_event_sources, body)
+
+
+def test_ai_calls_do_not_block_the_loop(
+    tmp_path: Path,
+    mock_anthropic_client: MagicMock,
+    initialize_event_sources: Callable[[Session], None],
+) -> None:
+    """Test other tasks keep running while a manager waits on the model."""
+
+    async def slow_reply(*args: Any, **kwargs: Any) -> str:
+        await asyncio.sleep(0.3)
+        return "A narrative"
+
+    mock_anthropic_client.send_message_async.side_effect = slow_reply
+
+    async def body(db: AsyncDatabaseManager) -> None:
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            game = await managers.game.create_game("Async Game", "Over asyncio")
+            act = await managers.act.create_act(game_id=game.id, title="Act One")
+
+        ticks = 0
+        longest_gap = 0.0
+
+        async def tick() -> None:
+            nonlocal ticks, longest_gap
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.02)
+                now = time.perf_counter()
+                ticks += 1
+                longest_gap = max(longest_gap, now - last)
+                last = now
+
+        ticker = asyncio.create_task(tick())
+        async with AsyncSessionContext(db) as session:
+            managers = create_all_async_managers(session, mock_anthropic_client)
+            narrative = await managers.act.generate_act_narrative(act.id)
+        ticker.cancel()
+
+        assert narrative.endswith("A narrative")
+        mock_anthropic_client.send_message.assert_not_called()
+        assert ticks >= 5
+        assert longest_gap < 0.2
+
+    _run(tmp_path, initialize_event_sources, body)
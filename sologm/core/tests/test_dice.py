@@ -43,10 +43,11 @@ class TestDiceManager:
         """Test parsing basic XdY notation."""
         with session_context as session:
             managers = create_all_managers(session)
-            count, sides, modifier = managers.dice._parse_notation("2d6")
-            assert count == 2
-            assert sides == 6
-        assert modifier == 0
+            expression = managers.dice._parse_notation("2d6")
+            (term,) = expression.dice_terms
+            assert term.count == 2
+            assert term.sides == 6
+        assert expression.modifier == 0
 
     def test_parse_notation_with_positive_modifier(
         self, session_context: SessionContext
@@ -54,10 +55,11 @@ class TestDiceManager:
         """Test parsing notation with positive modifier."""
         with session_context as session:
             managers = create_all_managers(session)
-            count, sides, modifier = managers.dice._parse_notation("3d8+2")
-            assert count == 3
-            assert sides == 8
-            assert modifier == 2
+            expression = managers.dice._parse_notation("3d8+2")
+            (term,) = expression.dice_terms
+            assert term.count == 3
+            assert term.sides == 8
+            assert expression.modifier == 2
 
     def test_parse_notation_with_negative_modifier(
         self, session_context: SessionContext
@@ -65,10 +67,11 @@ class TestDiceManager:
         """Test parsing notation with negative modifier."""
         with session_context as session:
             managers = create_all_managers(session)
-            count, sides, modifier = managers.dice._parse_notation("4d10-3")
-            assert count == 4
-            assert sides == 10
-            assert modifier == -3
+            expression = managers.dice._parse_notation("4d10-3")
+            (term,) = expression.dice_terms
+            assert term.count == 4
+            assert term.sides == 10
+            assert expression.modifier == -3
 
     def test_parse_invalid_notation(self, session_context: SessionContext) -> None:
         """Test parsing invalid notation formats."""
@@ -263,8 +266,104 @@ class TestDiceManager:
         """Test parsing various dice notations."""
         with session_context as session:
             managers = create_all_managers(session)
-            count, sides, modifier = managers.dice._parse_notation(notation)
-            assert (count, sides, modifier) == expected
+            expression = managers.dice._parse_notation(notation)
+            (term,) = expression.dice_terms
+            assert (term.count, term.sides, expression.modifier) == expected
+
+    def test_roll_compound_notation(self, session_context: SessionContext):
+        """Test rolling a multi-term notation records per-term results."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            roll = managers.dice.roll("2d6+1d4-1")
+
+            assert roll.modifier == -1
+            assert len(roll.individual_results) == 3
+            assert roll.total == sum(roll.individual_results) - 1
+            assert [term["term"] for term in roll.term_results] == [
+                "2d6",
+                "+1d4",
+                "-1",
+            ]
+
+            db_roll = session.get(DiceRollModel, roll.id)
+            assert db_roll.term_results == roll.term_results
+
+    def test_roll_keep_highest(self, session_context: SessionContext):
+        """Test that keep-highest only counts the kept dice."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            roll = managers.dice.roll("4d6kh3")
+
+            (term,) = roll.term_results
+            assert len(term["rolls"]) == 4
+            assert roll.individual_results == term["kept"]
+            assert len(roll.individual_results) == 3
+            assert min(roll.individual_results) >= min(term["rolls"])
+            assert roll.total == sum(roll.individual_results)
+
+    def test_roll_batch(self, session_context: SessionContext):
+        """Test batch rolling parses once and does not persist rolls."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            results = managers.dice.roll_batch("3d6", 50)
+
+            assert len(results) == 50
+            assert all(3 <= result.total <= 18 for result in results)
+            assert session.query(DiceRollModel).count() == 0
+
+            with pytest.raises(DiceError):
+                managers.dice.roll_batch("3d6", 0)
+
+    def test_roll_batch_split_streams(self, session_context: SessionContext):
+        """Test a seeded batch can be split into ranges with identical results."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            whole = managers.dice.roll_batch("4d6kh3", 20, seed=1234)
+            first = managers.dice.roll_batch("4d6kh3", 8, seed=1234)
+            rest = managers.dice.roll_batch("4d6kh3", 12, seed=1234, start=8)
+
+            assert whole == first + rest
+
+    def test_rolls_are_reproducible(
+        self,
+        session_context: SessionContext,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+    ):
+        """Test scene rolls advance the game stream and can be replayed."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            game = managers.game.create_game("Seeded", "A seeded game", rng_seed=42)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+
+            rolls = [managers.dice.roll("3d6!+1d4", scene=scene) for _ in range(3)]
+
+            assert [roll.rng_seed for roll in rolls] == [42, 42, 42]
+            assert [roll.rng_counter for roll in rolls] == [0, 1, 2]
+            assert game.rng_counter == 3
+            for roll in rolls:
+                replayed = managers.dice.replay_roll(roll)
+                assert replayed.total == roll.total
+                assert replayed.term_results == roll.term_results
+
+            expected = managers.dice.roll_batch("3d6!+1d4", 3, seed=42)
+            assert [result.total for result in expected] == [
+                roll.total for roll in rolls
+            ]
+
+    def test_replay_roll_without_stream(self, session_context: SessionContext):
+        """Test replaying a roll saved before streams existed fails cleanly."""
+        with session_context as session:
+            managers = create_all_managers(session)
+            legacy = DiceRollModel.create(
+                notation="1d6", individual_results=[4], modifier=0, total=4
+            )
+            session.add(legacy)
+            session.flush()
+
+            with pytest.raises(DiceError, match="no recorded random stream"):
+                managers.dice.replay_roll(legacy)
 
     def test_execute_db_operation(self, session_context: SessionContext):
         """Test the _execute_db_operation method."""
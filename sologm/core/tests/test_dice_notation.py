@@ -0,0 +1,155 @@
+"""Tests for dice notation parsing and evaluation."""
+
+import random
+from typing import List
+
+import pytest
+
+from sologm.core.dice_notation import (
+    ComparePoint,
+    ConstantTerm,
+    DiceTerm,
+    evaluate,
+    parse_notation,
+)
+from sologm.utils.errors import DiceError
+
+
+class ScriptedRandom:
+    """Random source that returns a fixed sequence of values."""
+
+    def __init__(self, values: List[int]):
+        self.values = list(values)
+
+    def randint(self, a: int, b: int) -> int:
+        value = self.values.pop(0)
+        assert a <= value <= b
+        return value
+
+
+class TestParseNotation:
+    """Tests for parse_notation."""
+
+    def test_parse_multiple_terms(self) -> None:
+        """Test that dice and constant terms are parsed in order with signs."""
+        expression = parse_notation("2d6 + 1d4 - 1")
+
+        first, second, third = expression.terms
+        assert isinstance(first, DiceTerm) and (first.count, first.sides) == (2, 6)
+        assert isinstance(second, DiceTerm) and second.sign == 1
+        assert isinstance(third, ConstantTerm) and third.value == -1
+        assert expression.modifier == -1
+
+    @pytest.mark.parametrize(
+        "notation,highest,count",
+        [
+            ("4d6kh3", True, 3),
+            ("4d6k3", True, 3),
+            ("2d20kl1", False, 1),
+            ("4d6dl1", True, 3),
+            ("4d6dh1", False, 3),
+        ],
+    )
+    def test_parse_keep_and_drop(self, notation, highest, count) -> None:
+        """Test keep/drop modifiers normalize to a keep rule."""
+        (term,) = parse_notation(notation).dice_terms
+        assert term.keep.highest is highest
+        assert term.keep.count == count
+
+    def test_parse_modifier_defaults(self) -> None:
+        """Test bare explode and reroll modifiers use sensible defaults."""
+        (term,) = parse_notation("3d6!r").dice_terms
+        assert term.explode == ComparePoint("=", 6)
+        assert term.reroll == ComparePoint("=", 1)
+        assert term.reroll_once is False
+
+    def test_parse_success_and_special_dice(self) -> None:
+        """Test target numbers, percentile and fudge dice."""
+        (pool,) = parse_notation("6d10>=8").dice_terms
+        assert pool.success == ComparePoint(">=", 8)
+
+        (percentile,) = parse_notation("1d%").dice_terms
+        assert percentile.sides == 100
+
+        (fudge,) = parse_notation("4dF").dice_terms
+        assert fudge.fudge and fudge.faces == (-1, 1)
+
+    def test_parse_is_cached(self) -> None:
+        """Test that the same notation returns the same compiled expression."""
+        assert parse_notation("3d8+2") is parse_notation("3d8+2")
+
+    @pytest.mark.parametrize(
+        "notation",
+        [
+            "",
+            "2d6+",
+            "2d6++1",
+            "2d6k3",
+            "2d6dl2",
+            "1d6!<7",
+            "1d6r<=6",
+            "4dF!",
+            "2d6kh1kh1",
+            "1001d6",
+            "2x6",
+        ],
+    )
+    def test_parse_invalid(self, notation) -> None:
+        """Test invalid notations raise DiceError."""
+        with pytest.raises(DiceError):
+            parse_notation(notation)
+
+
+class TestEvaluate:
+    """Tests for evaluate."""
+
+    def test_keep_highest(self) -> None:
+        """Test only the highest dice count towards the total."""
+        result = evaluate(parse_notation("4d6kh3"), ScriptedRandom([1, 5, 3, 6]))
+        assert result.individual_results == [5, 3, 6]
+        assert result.term_results[0]["rolls"] == [1, 5, 3, 6]
+        assert result.total == 14
+
+    def test_exploding_and_reroll(self) -> None:
+        """Test explosions append dice and rerolls replace them."""
+        exploded = evaluate(parse_notation("1d6!"), ScriptedRandom([6, 6, 2]))
+        assert exploded.individual_results == [6, 6, 2]
+        assert exploded.total == 14
+
+        rerolled = evaluate(parse_notation("2d6r"), ScriptedRandom([1, 1, 4, 3]))
+        assert rerolled.individual_results == [4, 3]
+
+        once = evaluate(parse_notation("1d6ro"), ScriptedRandom([1, 1]))
+        assert once.individual_results == [1]
+
+    def test_keep_and_drop_count_exploded_dice_once(self) -> None:
+        """Test a die and its explosions are kept or dropped together."""
+        # Dice: 2, 3, 1, 6+4 (exploded)
+        dropped = evaluate(parse_notation("4d6!dl1"), ScriptedRandom([2, 3, 1, 6, 4]))
+        assert dropped.term_results[0]["rolls"] == [2, 3, 1, 6, 4]
+        assert dropped.individual_results == [2, 3, 6, 4]
+        assert dropped.total == 15
+
+        # Dice: 6+1 (exploded, 7 in all), 5
+        kept = evaluate(parse_notation("2d6!kh1"), ScriptedRandom([6, 1, 5]))
+        assert kept.individual_results == [6, 1]
+        assert kept.total == 7
+
+    def test_success_counting(self) -> None:
+        """Test target-number pools total their successes, not their faces."""
+        result = evaluate(parse_notation("4d10>=8+1"), ScriptedRandom([8, 2, 10, 7]))
+        assert result.term_results[0]["successes"] == 2
+        assert result.total == 3
+
+    def test_negative_dice_term(self) -> None:
+        """Test subtracted dice pools reduce the total."""
+        result = evaluate(parse_notation("2d6-1d4"), ScriptedRandom([3, 4, 2]))
+        assert result.total == 5
+        assert [term["total"] for term in result.term_results] == [7, -2]
+
+    def test_seeded_rng_is_reproducible(self) -> None:
+        """Test the same seed yields the same results."""
+        expression = parse_notation("3d6!+4dF")
+        first = evaluate(expression, random.Random(42))
+        second = evaluate(expression, random.Random(42))
+        assert first == second
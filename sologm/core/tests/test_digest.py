@@ -0,0 +1,237 @@
+"""Tests for running scene and act context digests."""
+
+from pathlib import Path
+from typing import Callable, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from sologm.core.digest import digest_worker
+from sologm.core.factory import create_all_managers
+from sologm.database.session import SessionContext
+from sologm.models.base import Base
+from sologm.models.context_digest import ContextDigest
+
+
+def _digest_reply(prompts: List[str]) -> Callable[..., str]:
+    """Fake model that records prompts and names the events it saw."""
+
+    def reply(prompt: str, **kwargs) -> str:
+        prompts.append(prompt)
+        scope = "act" if "\nACT: " in prompt else "scene"
+        events = [
+            line.rsplit("] ", 1)[-1].removeprefix("- ")
+            for line in prompt.splitlines()
+            if line.startswith("- ")
+        ]
+        return f"{scope} digest: " + "; ".join(events)
+
+    return reply
+
+
+@pytest.fixture
+def scene_with_events(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+    create_test_event: Callable,
+    initialize_event_sources: Callable,
+) -> Dict[str, str]:
+    """Create a scene with two events, returning the scene and act IDs."""
+    with session_context as session:
+        initialize_event_sources(session)
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        scene = create_test_scene(session, act_id=act.id, title="Crypt")
+        create_test_event(session, scene.id, description="The door creaks")
+        create_test_event(session, scene.id, description="A torch gutters")
+        return {"scene": scene.id, "act": act.id}
+
+
+def test_refresh_folds_only_new_events(
+    session_context: SessionContext,
+    scene_with_events: Dict[str, str],
+    create_test_event: Callable,
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test digests are built once and then updated with new events only."""
+    prompts: List[str] = []
+    mock_anthropic_client.send_message.side_effect = _digest_reply(prompts)
+    scene_id = scene_with_events["scene"]
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        digests = managers.oracle.digest_manager.refresh(scene_id)
+        assert digests == {
+            "scene": "scene digest: The door creaks; A torch gutters",
+            "act": "act digest: The door creaks; A torch gutters",
+        }
+        assert len(prompts) == 2
+
+        # Up to date: no model calls
+        managers.oracle.digest_manager.refresh(scene_id)
+        assert len(prompts) == 2
+
+        create_test_event(session, scene_id, description="Bones rattle")
+        digests = managers.oracle.digest_manager.refresh(scene_id)
+
+        assert len(prompts) == 4
+        scene_prompt = prompts[2]
+        assert "scene digest: The door creaks; A torch gutters" in scene_prompt
+        assert "- Bones rattle" in scene_prompt
+        assert "- The door creaks" not in scene_prompt
+        assert "- [Crypt] Bones rattle" in prompts[3]
+        row = session.get(ContextDigest, scene_id)
+        assert row.event_count == 3
+
+
+def test_oracle_prompt_uses_digests(
+    session_context: SessionContext,
+    scene_with_events: Dict[str, str],
+    create_test_event: Callable,
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test interpretation prompts carry the stored scene and act digests."""
+    prompts: List[str] = []
+    mock_anthropic_client.send_message.side_effect = _digest_reply(prompts)
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        managers.oracle.digest_manager.refresh(scene_with_events["scene"])
+        create_test_event(session, scene_with_events["scene"], "Bones rattle")
+        prompt = managers.oracle.build_interpretation_prompt_for_active_context(
+            "What lurks here?", "Danger"
+        )
+
+    # Building the prompt didn't fold in the new event
+    assert len(prompts) == 2
+    assert "Scene So Far: scene digest: The door creaks" in prompt
+    assert "Act: act digest: The door creaks" in prompt
+    assert "- Bones rattle" in prompt
+
+
+def test_oracle_prompt_is_read_only(
+    session_context: SessionContext,
+    scene_with_events: Dict[str, str],
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test building a prompt makes no AI calls and stores no digests."""
+    with session_context as session:
+        managers = create_all_managers(session)
+        prompt = managers.oracle.build_interpretation_prompt_for_active_context(
+            "What lurks here?", "Danger"
+        )
+        assert session.query(ContextDigest).count() == 0
+
+    mock_anthropic_client.send_message.assert_not_called()
+    assert "Scene So Far" not in prompt
+    assert "- A torch gutters" in prompt
+
+
+def test_schedule_queues_each_scene_once_per_commit(
+    session_context: SessionContext,
+    scene_with_events: Dict[str, str],
+    create_test_event: Callable,
+    mock_anthropic_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test repeated schedules submit once, and rolled back ones never."""
+    submit = MagicMock()
+    monkeypatch.setattr(digest_worker, "submit", submit)
+    scene_id = scene_with_events["scene"]
+
+    with session_context as session:
+        digests = create_all_managers(session).oracle.digest_manager
+        digests.schedule(scene_id)
+        digests.schedule(scene_id)
+        session.commit()
+        assert submit.call_count == 1
+        assert submit.call_args.args[0] == scene_id
+
+        create_test_event(session, scene_id, "Lost to the rollback")
+        digests.schedule(scene_id)
+        session.rollback()
+        session.commit()
+        assert submit.call_count == 1
+
+
+def test_deferred_mode_updates_after_interpretation(
+    tmp_path: Path,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+    initialize_event_sources: Callable,
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test deferred mode digests new events once an interpretation commits."""
+    prompts: List[str] = []
+    digest_reply = _digest_reply(prompts)
+
+    def reply(prompt: str, call_site: str = "other", **kwargs) -> str:
+        if call_site.endswith(".digest"):
+            return digest_reply(prompt)
+        return "## The Lights\nSomething put them out."
+
+    mock_anthropic_client.send_message.side_effect = reply
+    # A file database, so the worker thread sees the same data
+    engine = create_engine(f"sqlite:///{tmp_path / 'digest.db'}")
+    Base.metadata.create_all(engine)
+
+    with Session(bind=engine) as session:
+        initialize_event_sources(session)
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        scene = create_test_scene(session, act_id=act.id)
+        managers = create_all_managers(session, mock_anthropic_client)
+        managers.event.add_event("The lights go out", scene.id)
+        session.commit()
+        managers.oracle.get_interpretations(scene.id, "Why?", "Sabotage", count=1)
+        assert prompts == []
+        session.commit()
+        scene_id = scene.id
+
+    digest_worker.join()
+
+    with Session(bind=engine) as session:
+        row = session.get(ContextDigest, scene_id)
+        assert row.digest == "scene digest: The lights go out"
+    engine.dispose()
+
+
+def test_background_mode_updates_after_commit(
+    tmp_path: Path,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+    initialize_event_sources: Callable,
+    mock_anthropic_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test background mode digests new events on the worker thread."""
+    monkeypatch.setattr("sologm.core.event.get_digest_mode", lambda: "background")
+    prompts: List[str] = []
+    mock_anthropic_client.send_message.side_effect = _digest_reply(prompts)
+    # A file database, so the worker thread sees the same data
+    engine = create_engine(f"sqlite:///{tmp_path / 'digest.db'}")
+    Base.metadata.create_all(engine)
+
+    with Session(bind=engine) as session:
+        initialize_event_sources(session)
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        scene = create_test_scene(session, act_id=act.id)
+        managers = create_all_managers(session, mock_anthropic_client)
+        managers.event.add_event("The lights go out", scene.id)
+        assert prompts == []
+        session.commit()
+        scene_id = scene.id
+
+    digest_worker.join()
+
+    with Session(bind=engine) as session:
+        row = session.get(ContextDigest, scene_id)
+        assert row.digest == "scene digest: The lights go out"
+    engine.dispose()
@@ -4,6 +4,8 @@ import logging
 from typing import Callable  # Added for type hinting
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy import select
 from sqlalchemy.orm import Session  # Added for type hinting
 
 # Import factory and models needed for test setup
@@ -11,6 +13,7 @@ from sologm.core.factory import create_all_managers
 from sologm.database.session import SessionContext
 from sologm.models.act import Act
 from sologm.models.event import Event
+from sologm.models.event_source import EventSource
 from sologm.models.game import Game
 from sologm.models.scene import Scene
 from sologm.utils.errors import EventError
@@ -500,3 +503,106 @@ class TestEventManager:
             assert "manual" in source_names
             assert "oracle" in source_names
             assert "dice" in source_names
+
+    def test_event_source_cache_avoids_queries(
+        self,
+        session_context: SessionContext,
+        db_engine,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        initialize_event_sources: Callable,
+    ):
+        """Test that a warm source cache serves lookups without querying."""
+        with session_context as session:
+            initialize_event_sources(session)
+            managers = create_all_managers(session)
+            _, _, scene = create_base_test_data(
+                session, create_test_game, create_test_act, create_test_scene
+            )
+            managers.event.get_event_sources()  # Warm the cache
+
+            statements = []
+
+            def _record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            sqlalchemy_event.listen(db_engine, "before_cursor_execute", _record)
+            try:
+                event = managers.event.add_event(
+                    description="Cached source", scene_id=scene.id, source="oracle"
+                )
+                managers.event.update_event(event.id, "Rolled", source="dice")
+                assert event.source_name == "dice"
+                assert event.is_dice_generated
+                assert not event.is_manual
+            finally:
+                sqlalchemy_event.remove(db_engine, "before_cursor_execute", _record)
+
+            assert not [s for s in statements if "FROM event_sources" in s]
+
+    def test_list_events_loads_sources_in_one_query(
+        self,
+        session_context: SessionContext,
+        db_engine,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        initialize_event_sources: Callable,
+    ):
+        """Test that event listings load sources without a query per row."""
+        with session_context as session:
+            initialize_event_sources(session)
+            managers = create_all_managers(session)
+            _, _, scene = create_base_test_data(
+                session, create_test_game, create_test_act, create_test_scene
+            )
+            for i, source in enumerate(["manual", "oracle", "dice"] * 4):
+                managers.event.add_event(
+                    description=f"Event {i}", scene_id=scene.id, source=source
+                )
+            session.flush()
+            # Start from an empty identity map, as a fresh CLI invocation would
+            session.expunge_all()
+
+            statements = []
+
+            def _record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            sqlalchemy_event.listen(db_engine, "before_cursor_execute", _record)
+            try:
+                events = managers.event.list_events(scene_id=scene.id, limit=10)
+                source_names = [event.source_name for event in events]
+                act_events = managers.event.list_events_for_act(scene.act_id)
+                act_source_names = {event.source_name for event in act_events}
+            finally:
+                sqlalchemy_event.remove(db_engine, "before_cursor_execute", _record)
+
+            assert len(events) == 10
+            assert set(source_names) == {"manual", "oracle", "dice"}
+            assert act_source_names == {"manual", "oracle", "dice"}
+            # Scene check plus one query per listing, whatever the row count
+            assert len(statements) == 3
+            assert not [
+                s for s in statements if s.lstrip().startswith("SELECT event_sources")
+            ]
+
+    def test_event_source_cache_invalidated_on_insert(
+        self, session_context: SessionContext, initialize_event_sources: Callable
+    ):
+        """Test that adding a source makes it visible to cached lookups."""
+        with session_context as session:
+            initialize_event_sources(session)
+            managers = create_all_managers(session)
+            assert "journal" not in [s.name for s in managers.event.get_event_sources()]
+
+            session.add(EventSource.create(name="journal"))
+            session.flush()
+
+            assert "journal" in [s.name for s in managers.event.get_event_sources()]
+
+            # With the cache warm, the SQL hybrid compares IDs without a join
+            assert "event_sources" not in str(select(Event.id).where(Event.is_manual))
+            with pytest.raises(EventError, match="Valid sources: dice, journal"):
+                managers.event._get_source_by_name(session, "nope")
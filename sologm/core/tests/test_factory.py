@@ -2,7 +2,11 @@
 
 import logging
 from types import SimpleNamespace
+from unittest.mock import MagicMock
 
+import pytest
+
+from sologm.core import factory
 from sologm.core.act import ActManager
 from sologm.core.dice import DiceManager
 from sologm.core.event import EventManager
@@ -10,6 +14,7 @@ from sologm.core.factory import create_all_managers
 from sologm.core.game import GameManager
 from sologm.core.oracle import OracleManager
 from sologm.core.scene import SceneManager
+from sologm.utils.profiling import StartupProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -84,3 +89,22 @@ def test_create_all_managers(session_context):
         logger.debug("Manager dependencies correctly wired")
 
         logger.debug("Finished test_create_all_managers successfully")
+
+
+def test_create_all_managers_is_profiled(session_context, monkeypatch):
+    """Verify manager creation is timed as a phase, closed even on errors."""
+    profiler = StartupProfiler()
+    monkeypatch.setattr(factory, "startup_profiler", profiler)
+    profiler.start()
+
+    with session_context as session:
+        create_all_managers(session, anthropic_client=MagicMock())
+        monkeypatch.setattr(factory, "GameManager", MagicMock(side_effect=OSError))
+        with pytest.raises(OSError):
+            create_all_managers(session, anthropic_client=MagicMock())
+
+    assert profiler.root is not None
+    phases = profiler.root.children
+    assert [phase.name for phase in phases] == ["managers", "managers"]
+    assert all(phase.end is not None for phase in phases)
+    assert not profiler.running("managers")
@@ -216,14 +216,7 @@ class TestGameManager:
                 for i in range(1, 4)
             ]
 
-            # Manually set all games to active (this shouldn't happen in practice)
-            # Note: The create_game logic already deactivates others, so this
-            # simulates a potentially inconsistent state before activation.
-            for game in games:
-                game.is_active = True
-            session.flush()  # Flush the manual changes
-
-            # Now activate one specific game
+            # The last game created is the active one; switch to another
             activated_game = managers.game.activate_game(games[1].id)
             assert activated_game.id == games[1].id
             assert activated_game.is_active is True
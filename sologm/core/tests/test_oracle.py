@@ -5,6 +5,7 @@ from typing import Callable  # Added for type hinting
 from unittest.mock import MagicMock  # Added for mock_anthropic_client
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.orm import Session  # Added for type hinting
 
 # Import factory and models needed for test setup
@@ -318,9 +319,9 @@ Test Description"""
                 session.query(EventSource).filter(EventSource.name == "oracle").first()
             )
             # Add an assertion to ensure the source was found after initialization
-            assert oracle_source is not None, (
-                "Oracle event source not found after initialization"
-            )
+            assert (
+                oracle_source is not None
+            ), "Oracle event source not found after initialization"
 
             events = (
                 session.query(Event)
@@ -487,6 +488,80 @@ Test Description"""
             assert "retry attempt #2" in retry_call[0][0].lower()
             assert "different" in retry_call[0][0].lower()
 
+    def test_interpretation_writes_independent_of_history(
+        self,
+        session_context: SessionContext,
+        db_engine,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        mock_anthropic_client: MagicMock,
+    ) -> None:
+        """Test a retry runs the same statements however many sets exist."""
+        mock_anthropic_client.send_message.side_effect = [
+            "Not markdown",
+            "## First\nOne\n\n## Second\nTwo\n\n## Third\nThree",
+        ] * 2
+
+        def retry_statements(history: int) -> list:
+            with session_context as session:
+                managers = create_all_managers(session)
+                game = create_test_game(session, name=f"History {history}")
+                act = create_test_act(session, game_id=game.id)
+                scene = create_test_scene(session, act_id=act.id)
+                for _ in range(history):
+                    interp_set = InterpretationSet.create(
+                        scene_id=scene.id, context="Old", oracle_results="Old"
+                    )
+                    session.add(interp_set)
+                    session.add(Interpretation.create(interp_set.id, "Old", "Old idea"))
+                interp_set.is_current = True
+                session.flush()
+                session.expire_all()
+
+                statements = []
+
+                def _record(conn, cursor, statement, *args):
+                    statements.append(" ".join(statement.split()))
+
+                sqlalchemy_event.listen(db_engine, "before_cursor_execute", _record)
+                try:
+                    result = managers.oracle.get_interpretations(
+                        scene.id, "What now?", "Omen", 3, retry_attempt=1
+                    )
+                finally:
+                    sqlalchemy_event.remove(db_engine, "before_cursor_execute", _record)
+
+                assert len(result.interpretations) == 3
+                current = (
+                    session.query(InterpretationSet)
+                    .filter_by(scene_id=scene.id, is_current=True)
+                    .all()
+                )
+                assert current == [result]
+                assert result.interpretation_count == 3
+                return [
+                    s for s in statements if "interpretation" in s.split(" WHERE")[0]
+                ]
+
+        few = retry_statements(1)
+        many = retry_statements(8)
+
+        assert len(few) == len(many)
+        assert (
+            len(
+                [
+                    s
+                    for s in many
+                    if s.startswith("UPDATE interpretation_sets SET is_current")
+                ]
+            )
+            == 1
+        )
+        assert (
+            len([s for s in many if s.startswith("INSERT INTO interpretations")]) == 1
+        )
+
     def test_automatic_retry_on_parse_failure(
         self,
         session_context: SessionContext,
@@ -741,9 +816,9 @@ It also has multiple lines."""
                 session.query(EventSource).filter(EventSource.name == "oracle").first()
             )
             # Add assertion to ensure oracle_source is found after initialization
-            assert oracle_source is not None, (
-                "Oracle event source not found after initialization"
-            )
+            assert (
+                oracle_source is not None
+            ), "Oracle event source not found after initialization"
 
             # Verify event was created
             events = (
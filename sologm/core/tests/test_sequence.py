@@ -0,0 +1,87 @@
+"""Tests for act and scene sequence allocation."""
+
+import multiprocessing
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pytest
+
+from sologm.core.game import GameManager
+from sologm.core.scene import SceneManager
+from sologm.database.session import DatabaseManager, SessionContext
+
+WORKERS = 4
+SCENES_PER_WORKER = 8
+
+
+def _create_scenes(args: Tuple[str, str, int]) -> List[int]:
+    """Create scenes from a separate process with its own engine."""
+    db_url, act_id, worker = args
+    db_manager = DatabaseManager(db_url=db_url, connect_args={"timeout": 60})
+    sequences = []
+    try:
+        for i in range(SCENES_PER_WORKER):
+            with SessionContext(db_manager) as session:
+                scene = SceneManager(session=session).create_scene(
+                    title=f"Worker {worker} scene {i}",
+                    description=None,
+                    act_id=act_id,
+                    make_active=False,
+                )
+                sequences.append(scene.sequence)
+    finally:
+        db_manager.dispose()
+    return sequences
+
+
+def test_sequence_skips_rows_inserted_directly(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+) -> None:
+    """Test allocation stays ahead of sequences set outside the allocator."""
+    with session_context as session:
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id, sequence=4)
+        scene = create_test_scene(session, act_id=act.id, title="First")
+        scene.sequence = 7
+        session.flush()
+
+        scene_manager = SceneManager(session=session)
+        following = scene_manager.create_scene("Second", None, act_id=act.id)
+        next_act = GameManager(session=session).act_manager.create_act(
+            game_id=game.id, title="Next", make_active=False
+        )
+
+        assert following.sequence == 8
+        assert next_act.sequence == 5
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+def test_create_scene_concurrent_processes(tmp_path: Path) -> None:
+    """Test parallel writers in separate processes get distinct sequences."""
+    db_url = f"sqlite:///{tmp_path / 'stress.db'}"
+    db_manager = DatabaseManager(db_url=db_url)
+    db_manager.create_tables()
+    try:
+        with SessionContext(db_manager) as session:
+            game = GameManager(session=session).create_game("Stress", "Parallel")
+            act = GameManager(session=session).act_manager.create_act(
+                game_id=game.id, title="Only act"
+            )
+            act_id = act.id
+    finally:
+        db_manager.dispose()
+
+    context = multiprocessing.get_context("fork")
+    with context.Pool(WORKERS) as pool:
+        results = pool.map(
+            _create_scenes, [(db_url, act_id, worker) for worker in range(WORKERS)]
+        )
+
+    sequences = sorted(seq for worker in results for seq in worker)
+    assert sequences == list(range(1, WORKERS * SCENES_PER_WORKER + 1))
@@ -0,0 +1,207 @@
+"""Tests for scene-by-scene summarization of long acts."""
+
+import threading
+import time
+from typing import Callable, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from sologm.core.factory import create_all_managers
+from sologm.core.summarization import (
+    SceneSummaryManager,
+    chunk_events,
+    scene_content_hash,
+)
+from sologm.database.session import SessionContext
+from sologm.models.scene_summary import SceneSummary
+from sologm.utils.errors import APIError
+
+
+def _scene_from_prompt(prompt: str) -> str:
+    """Get the scene title out of a scene summary prompt."""
+    line = next(line for line in prompt.splitlines() if line.startswith("SCENE "))
+    return line.split(": ", 1)[1]
+
+
+@pytest.fixture
+def long_act(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+    create_test_event: Callable,
+    initialize_event_sources: Callable,
+) -> Dict[str, str]:
+    """Create an act with two scenes of events, returning their IDs."""
+    with session_context as session:
+        initialize_event_sources(session)
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        first = create_test_scene(session, act_id=act.id, title="Harbor")
+        create_test_event(session, first.id, description="The ship docks")
+        create_test_event(session, first.id, description="A smuggler flees")
+        second = create_test_scene(
+            session, act_id=act.id, title="Market", is_active=True
+        )
+        create_test_event(session, second.id, description="Prices are rising")
+        return {"act": act.id, "first": first.id, "second": second.id}
+
+
+def test_scene_content_hash_tracks_events() -> None:
+    """Test the hash changes with the events but not the data layout."""
+    scene = {
+        "title": "Harbor",
+        "description": "Docks",
+        "events": [{"description": "The ship docks", "source": "Manual"}],
+    }
+    narrative_scene = {
+        **scene,
+        "events": [{"description": "The ship docks", "source_name": "Manual"}],
+    }
+    changed = {**scene, "events": [{"description": "The ship sinks"}]}
+
+    assert scene_content_hash(scene) == scene_content_hash(narrative_scene)
+    assert scene_content_hash(scene) != scene_content_hash(changed)
+
+
+def test_chunk_events() -> None:
+    """Test events are split into consecutive chunks of bounded size."""
+    events = [{"description": "x" * size} for size in (4, 4, 4, 20, 1)]
+
+    chunks = chunk_events(events, max_chars=10)
+
+    assert [[len(e["description"]) for e in chunk] for chunk in chunks] == [
+        [4, 4],
+        [4],
+        [20],
+        [1],
+    ]
+
+
+def test_summarize_scenes_caches_until_events_change(
+    session_context: SessionContext,
+    long_act: Dict[str, str],
+    create_test_event: Callable,
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test only scenes whose events changed are summarized again."""
+    mock_anthropic_client.send_message.side_effect = (
+        lambda prompt, **kwargs: f"Summary of {_scene_from_prompt(prompt)}"
+    )
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        data = managers.act.prepare_act_data_for_narrative(long_act["act"])
+        summaries = managers.act.scene_summary_manager.summarize_scenes(
+            data["game"], data["act"], data["scenes"]
+        )
+        assert summaries == {
+            long_act["first"]: "Summary of Harbor",
+            long_act["second"]: "Summary of Market",
+        }
+        assert mock_anthropic_client.send_message.call_count == 2
+        assert session.query(SceneSummary).count() == 2
+
+        # Nothing changed: everything comes from the cache
+        managers.act.scene_summary_manager.summarize_scenes(
+            data["game"], data["act"], data["scenes"]
+        )
+        assert mock_anthropic_client.send_message.call_count == 2
+
+        # A new event only invalidates its own scene
+        create_test_event(session, long_act["second"], description="A riot starts")
+        data = managers.act.prepare_act_data_for_narrative(long_act["act"])
+        managers.act.scene_summary_manager.summarize_scenes(
+            data["game"], data["act"], data["scenes"]
+        )
+        assert mock_anthropic_client.send_message.call_count == 3
+        last_prompt = mock_anthropic_client.send_message.call_args.kwargs["prompt"]
+        assert _scene_from_prompt(last_prompt) == "Market"
+        assert "A riot starts" in last_prompt
+
+
+def test_summarize_scenes_runs_concurrently(
+    session_context: SessionContext,
+    long_act: Dict[str, str],
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test scene summaries are requested in parallel."""
+    running: List[int] = []
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_reply(prompt: str, **kwargs) -> str:
+        nonlocal peak
+        with lock:
+            running.append(1)
+            peak = max(peak, len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+        return "Summary"
+
+    mock_anthropic_client.send_message.side_effect = slow_reply
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        data = managers.act.prepare_act_data_for_narrative(long_act["act"])
+        manager = SceneSummaryManager(
+            session=session, anthropic_client=mock_anthropic_client, max_workers=4
+        )
+        manager.summarize_scenes(data["game"], data["act"], data["scenes"])
+
+    assert peak == 2
+
+
+def test_summarize_scenes_keeps_successes_on_failure(
+    session_context: SessionContext,
+    long_act: Dict[str, str],
+    mock_anthropic_client: MagicMock,
+) -> None:
+    """Test a failed scene doesn't discard the summaries that succeeded."""
+
+    def reply(prompt: str, **kwargs) -> str:
+        if _scene_from_prompt(prompt) == "Market":
+            raise RuntimeError("overloaded")
+        return "Summary of Harbor"
+
+    mock_anthropic_client.send_message.side_effect = reply
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        data = managers.act.prepare_act_data_for_narrative(long_act["act"])
+        with pytest.raises(APIError, match="1 of 2 scenes"):
+            managers.act.scene_summary_manager.summarize_scenes(
+                data["game"], data["act"], data["scenes"]
+            )
+        cached = session.query(SceneSummary).all()
+        assert [row.scene_id for row in cached] == [long_act["first"]]
+
+
+def test_generate_act_summary_condenses_long_acts(
+    session_context: SessionContext,
+    long_act: Dict[str, str],
+    mock_anthropic_client: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test acts over the prompt budget are summarized from scene summaries."""
+
+    def reply(prompt: str, **kwargs) -> str:
+        if prompt.startswith("You are summarizing part"):
+            return f"Summary of {_scene_from_prompt(prompt)}"
+        return "TITLE: Storm\n\nSUMMARY:\nThe harbor burns."
+
+    mock_anthropic_client.send_message.side_effect = reply
+
+    with session_context as session:
+        managers = create_all_managers(session)
+        monkeypatch.setattr(managers.act, "fits_prompt_budget", lambda prompt: False)
+
+        result = managers.act.generate_act_summary(long_act["act"])
+
+        assert result == {"title": "Storm", "summary": "The harbor burns."}
+        final_prompt = mock_anthropic_client.send_message.call_args.kwargs["prompt"]
+        assert "Summary of events:\nSummary of Harbor" in final_prompt
+        assert "The ship docks" not in final_prompt
+        assert mock_anthropic_client.send_message.call_count == 3
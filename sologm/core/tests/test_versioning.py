@@ -0,0 +1,95 @@
+"""Tests for optimistic concurrency on versioned models."""
+
+from typing import Any, Callable
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from sologm.core.act import ActManager
+from sologm.core.versioning import update_versioned
+from sologm.database.session import SessionContext
+from sologm.models.act import Act
+from sologm.utils.errors import ConflictError
+
+
+def _concurrent_edit(session: Session, act_id: str, **values: Any) -> None:
+    """Change an act row the way another process would, behind the ORM."""
+    table = Act.__table__
+    session.execute(
+        update(table)
+        .where(table.c.id == act_id)
+        .values(**values, version_id=table.c.version_id + 1)
+    )
+
+
+def test_non_overlapping_edits_are_merged(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test an edit is reapplied on top of a concurrent edit to other fields."""
+    with session_context as session:
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id, title="Opening")
+        _concurrent_edit(session, act.id, title="Renamed elsewhere")
+
+        # A full edit form resubmits the title the user saw, unchanged
+        ActManager(session=session).edit_act(
+            act.id, title="Opening", summary="Written here"
+        )
+        session.refresh(act)
+
+        assert act.title == "Renamed elsewhere"
+        assert act.summary == "Written here"
+        assert act.version_id == 3
+
+
+def test_overlapping_edit_raises_conflict(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test an edit to a field someone else changed is rejected."""
+    with session_context as session:
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        _concurrent_edit(session, act.id, summary="Theirs")
+
+        with pytest.raises(ConflictError) as exc:
+            ActManager(session=session).edit_act(act.id, summary="Mine")
+
+        assert exc.value.fields == ("summary",)
+        assert act.summary == "Theirs"
+
+
+def test_update_of_deleted_row_raises_conflict(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test writing to a row deleted by another writer is rejected."""
+    with session_context as session:
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        session.execute(Act.__table__.delete().where(Act.__table__.c.id == act.id))
+
+        with pytest.raises(ConflictError, match="deleted"):
+            update_versioned(session, act, {"summary": "Too late"})
+
+
+def test_stale_flush_raises_conflict_on_commit(
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+) -> None:
+    """Test plain attribute edits are version-checked when committed."""
+    with session_context as session:
+        game = create_test_game(session)
+        act_id = create_test_act(session, game_id=game.id).id
+
+    with pytest.raises(ConflictError):
+        with session_context as session:
+            act = session.get(Act, act_id)
+            _concurrent_edit(session, act_id, summary="Theirs")
+            act.summary = "Mine"
@@ -0,0 +1,126 @@
+"""Conflict-checked updates for versioned models."""
+
+import logging
+from typing import Any, Dict, Mapping, Protocol, TypeVar, cast
+
+from sqlalchemy import CursorResult, inspect, update
+from sqlalchemy.orm import Session
+
+from sologm.utils.errors import ConflictError
+
+logger = logging.getLogger(__name__)
+
+
+class Versioned(Protocol):
+    """A mapped model using VersionedMixin, keyed by a string ``id``."""
+
+    id: str
+    version_id: int
+
+
+M = TypeVar("M", bound=Versioned)
+
+DEFAULT_ATTEMPTS = 3
+
+
+def update_versioned(
+    session: Session,
+    entity: M,
+    changes: Mapping[str, Any],
+    attempts: int = DEFAULT_ATTEMPTS,
+) -> M:
+    """Write field changes to a versioned row, merging concurrent edits.
+
+    The entity's current attribute values are taken as the state the edit
+    was based on, typically what the user saw before opening an editor. The
+    UPDATE only matches the row if its version is still the one loaded, so
+    nothing is locked in the meantime. When another writer got there first
+    the row is reloaded: if that writer touched none of the fields being
+    changed here, the edit is reapplied on top of theirs; otherwise the edit
+    is rejected.
+
+    The model's ``@validates`` hooks run on the new values first, as they
+    would for attribute assignment. Fields whose new value equals the base
+    value are treated as untouched, so submitting an unchanged field from a
+    full edit form never reverts someone else's change to it.
+
+    Args:
+        session: Database session
+        entity: Loaded instance of a model using VersionedMixin
+        changes: New values keyed by column attribute name
+        attempts: How many times to try before giving up
+
+    Returns:
+        The updated entity.
+
+    Raises:
+        ConflictError: If another writer changed one of the same fields,
+            deleted the row, or kept winning for every attempt.
+    """
+    model = type(entity)
+    name = model.__name__
+    # Pending changes must go out first, or autoflush would bump the
+    # version underneath the statement below.
+    session.flush()
+
+    # The mapped class attributes, which a Protocol can only describe as
+    # the instance values
+    attributes: Any = model
+    validators = inspect(model, raiseerr=True).validators
+    pending: Dict[str, Any] = {}
+    for field, value in changes.items():
+        if field in validators:
+            validator, _ = validators[field]
+            value = validator(entity, field, value)
+        pending[field] = value
+    base: Dict[str, Any] = {field: getattr(entity, field) for field in pending}
+
+    for attempt in range(1, attempts + 1):
+        version = entity.version_id
+        result = cast(
+            CursorResult[Any],
+            session.execute(
+                update(model)
+                .where(attributes.id == entity.id, attributes.version_id == version)
+                .values(**pending, version_id=version + 1)
+                .execution_options(synchronize_session="evaluate")
+            ),
+        )
+        if result.rowcount == 1:
+            # onupdate values are generated by the statement, not evaluated
+            session.expire(entity, ["modified_at"])
+            logger.debug("Updated %s %s to version %s", name, entity.id, version + 1)
+            return entity
+
+        logger.debug(
+            "%s %s changed since version %s (attempt %s of %s)",
+            name,
+            entity.id,
+            version,
+            attempt,
+            attempts,
+        )
+        if session.get(model, entity.id, populate_existing=True) is None:
+            raise ConflictError(f"{name} {entity.id} was deleted by another writer")
+
+        pending = {
+            field: value for field, value in pending.items() if value != base[field]
+        }
+        overlapping = [
+            field
+            for field, value in pending.items()
+            if getattr(entity, field) not in (base[field], value)
+        ]
+        if overlapping:
+            raise ConflictError(
+                f"{name} {entity.id} was changed by another writer: "
+                f"{', '.join(overlapping)}",
+                fields=overlapping,
+            )
+        if not pending:
+            return entity
+        base = {field: getattr(entity, field) for field in pending}
+
+    raise ConflictError(
+        f"{name} {entity.id} kept changing; gave up after {attempts} attempts"
+    )
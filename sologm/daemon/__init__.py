@@ -0,0 +1,10 @@
+"""Background daemon that serves CLI commands over a local socket.
+
+``sologm serve`` keeps the database engine, imports and API client warm in
+one long-running process. The ``sologm`` entry point forwards commands to it
+when it is running and runs them in-process otherwise.
+"""
+
+from sologm.daemon.context import TerminalRequired, is_remote, require_terminal
+
+__all__ = ["TerminalRequired", "is_remote", "require_terminal"]
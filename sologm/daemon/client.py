@@ -0,0 +1,123 @@
+"""Thin client that forwards CLI invocations to a running daemon."""
+
+import os
+import shutil
+import socket
+import sys
+from typing import Optional, Sequence
+
+from sologm.daemon.protocol import (
+    DISABLE_ENV,
+    environment_fingerprint,
+    read_message,
+    socket_path,
+    write_message,
+)
+
+# Options that change process-wide state or print from outside the renderer
+LOCAL_OPTIONS = frozenset(
+    {
+        "--help",
+        "--version",
+        "--config",
+        "--debug",
+        "--install-completion",
+        "--show-completion",
+        "--profile-startup",
+        "--profile-output",
+    }
+)
+
+# Commands that call the AI before prompting, or manage the daemon itself.
+# They always run in-process so a prompt never forces a second AI call.
+LOCAL_COMMANDS = (
+    ("serve",),
+    ("oracle",),
+    ("act", "complete"),
+    ("act", "narrative"),
+)
+
+
+def _is_forwardable(argv: Sequence[str]) -> bool:
+    if not argv or os.environ.get(DISABLE_ENV) or "_SOLOGM_COMPLETE" in os.environ:
+        return False
+    if any(arg.split("=", 1)[0] in LOCAL_OPTIONS for arg in argv):
+        return False
+    words = tuple(arg for arg in argv if not arg.startswith("-"))
+    return not any(words[: len(command)] == command for command in LOCAL_COMMANDS)
+
+
+def _color_system() -> Optional[str]:
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        return None
+    if os.environ.get("COLORTERM") in ("truecolor", "24bit"):
+        return "truecolor"
+    return "256"
+
+
+def forward(argv: Sequence[str]) -> Optional[int]:
+    """Run a command on the daemon if one is listening.
+
+    Args:
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The command's exit code, or None if the command should run
+        in-process instead (no daemon, or the daemon declined it).
+    """
+    if not _is_forwardable(argv):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path()))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock, sock.makefile("rwb") as stream:
+        write_message(
+            stream,
+            {
+                "argv": list(argv),
+                "cwd": os.getcwd(),
+                "width": shutil.get_terminal_size().columns,
+                "color_system": _color_system(),
+                "env": environment_fingerprint(),
+            },
+        )
+        try:
+            response = read_message(stream)
+        except (OSError, ValueError):
+            response = None
+
+    if response is None:
+        # The request was sent, so it may have run; don't run it twice
+        sys.stderr.write("sologm: lost connection to the daemon\n")
+        return 1
+    if response.get("status") != "ok":
+        return None
+    sys.stdout.write(response["output"])
+    sys.stdout.flush()
+    return response["exit_code"]
+
+
+def main() -> None:
+    """Entry point for the ``sologm`` command."""
+    argv = sys.argv[1:]
+    if "--profile-startup" in argv:
+        from sologm.utils.profiling import startup_profiler
+
+        startup_profiler.start_from_argv(argv)
+        with startup_profiler.phase("imports"):
+            from sologm.cli.main import app
+        app()
+        return
+
+    exit_code = forward(argv)
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from sologm.cli.main import app
+
+    app()
@@ -0,0 +1,41 @@
+"""Per-request state for commands executed by the daemon."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_remote: ContextVar[bool] = ContextVar("sologm_remote", default=False)
+
+
+class TerminalRequired(BaseException):
+    """Raised when a command served by the daemon needs the user's terminal.
+
+    Derives from BaseException so that the broad ``except Exception``
+    handlers in CLI commands let it through. Any open SessionContext rolls
+    back, and the client re-runs the command in its own process.
+    """
+
+
+def is_remote() -> bool:
+    """Check whether the current command is being served by the daemon."""
+    return _remote.get()
+
+
+def require_terminal() -> None:
+    """Declare that the caller is about to prompt or open an editor.
+
+    Raises:
+        TerminalRequired: If the command is being served by the daemon.
+    """
+    if _remote.get():
+        raise TerminalRequired()
+
+
+@contextmanager
+def remote_execution() -> Iterator[None]:
+    """Mark commands run in this context as served by the daemon."""
+    token = _remote.set(True)
+    try:
+        yield
+    finally:
+        _remote.reset(token)
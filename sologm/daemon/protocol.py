@@ -0,0 +1,74 @@
+"""Wire format shared by the daemon and the CLI client.
+
+Each message is a single JSON object followed by a newline. This module is
+imported by the client on every invocation, so it only uses the standard
+library.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol
+
+SOCKET_ENV = "SOLOGM_DAEMON_SOCKET"
+DISABLE_ENV = "SOLOGM_NO_DAEMON"
+
+# Variables besides SOLOGM_* that change what a command does
+_RELEVANT_ENV = ("HOME", "ANTHROPIC_API_KEY")
+
+
+class MessageStream(Protocol):
+    """A binary stream such as a socket file or a request handler's rfile."""
+
+    def readline(self, size: int = -1, /) -> bytes: ...
+
+    def write(self, data: bytes, /) -> int: ...
+
+    def flush(self) -> None: ...
+
+
+def socket_path() -> Path:
+    """Get the daemon's socket path.
+
+    Returns:
+        The path from SOLOGM_DAEMON_SOCKET, or ~/.sologm/sologm.sock.
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".sologm" / "sologm.sock"
+
+
+def environment_fingerprint() -> str:
+    """Hash the environment variables that affect command behavior.
+
+    The daemon only serves clients whose fingerprint matches its own, so a
+    command never runs against a different database or configuration than
+    it would in-process. Values are hashed rather than sent.
+    """
+    relevant = sorted(
+        (key, value)
+        for key, value in os.environ.items()
+        if key in _RELEVANT_ENV
+        or (key.startswith("SOLOGM_") and key not in (SOCKET_ENV, DISABLE_ENV))
+    )
+    return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()
+
+
+def write_message(stream: MessageStream, message: Dict[str, Any]) -> None:
+    """Send one message and flush it."""
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def read_message(stream: MessageStream) -> Optional[Dict[str, Any]]:
+    """Receive one message.
+
+    Returns:
+        The decoded message, or None if the peer closed the connection.
+    """
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
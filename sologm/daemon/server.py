@@ -0,0 +1,235 @@
+"""Socket server that runs CLI commands inside one warm process."""
+
+import io
+import logging
+import os
+import socket
+import socketserver
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Set
+
+import typer
+from rich.console import Console
+
+from sologm.daemon.context import TerminalRequired, remote_execution
+from sologm.daemon.protocol import environment_fingerprint, read_message, write_message
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+
+
+class CommandRunner:
+    """Executes forwarded command lines against the Typer app."""
+
+    def __init__(self) -> None:
+        from sologm.cli.main import app
+
+        self._command = typer.main.get_command(app)
+        self._fingerprint = environment_fingerprint()
+
+    def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request and build the response.
+
+        Args:
+            request: Message from the client with ``argv``, ``cwd``,
+                ``width``, ``color_system`` and ``env``.
+
+        Returns:
+            ``{"status": "ok", "exit_code": ..., "output": ...}``, or
+            ``{"status": "fallback", "reason": ...}`` when the client should
+            run the command itself. A fallback never leaves changes behind:
+            it's only returned before a command starts or when it stopped at
+            a prompt, which rolls its session back.
+        """
+        if request.get("env") != self._fingerprint:
+            return _fallback("client environment differs from the daemon's")
+
+        buffer = io.StringIO()
+        color_system = request.get("color_system")
+        console = Console(
+            file=buffer,
+            width=request.get("width") or 80,
+            force_terminal=color_system is not None,
+            color_system=color_system,
+        )
+        argv = request.get("argv", [])
+        if request.get("cwd"):
+            argv = _resolve_path_options(self._command, argv, request["cwd"])
+        logger.debug("Running forwarded command: %s", argv)
+        try:
+            with remote_execution():
+                result = self._command.main(
+                    args=argv,
+                    prog_name="sologm",
+                    obj={"console": console},
+                    standalone_mode=False,
+                )
+            exit_code = result if isinstance(result, int) else 0
+        except TerminalRequired:
+            return _fallback("command needs a terminal")
+        except typer.TyperException:
+            # Usage errors are rendered best by the client's own Typer
+            return _fallback("invalid usage")
+        except typer.Abort:
+            console.print("Aborted!")
+            exit_code = 1
+        except Exception:
+            logger.exception("Forwarded command failed: %s", argv)
+            console.print_exception()
+            exit_code = 1
+        return {"status": "ok", "exit_code": exit_code, "output": buffer.getvalue()}
+
+
+def _resolve_path_options(command: Any, argv: Sequence[str], cwd: str) -> List[str]:
+    """Make relative path options absolute against the client's directory.
+
+    The daemon serves clients from any directory and can't change its own
+    working directory per request, so ``--file metrics.jsonl`` is rewritten
+    to the path the client meant before the command parses it.
+
+    Args:
+        command: The root command the arguments are for
+        argv: Forwarded command-line arguments
+        cwd: The client's working directory
+
+    Returns:
+        The arguments with relative path option values made absolute.
+    """
+    resolved = list(argv)
+    current = command
+    path_options = _path_options(current)
+    expects_path = False
+    for index, arg in enumerate(resolved):
+        if expects_path:
+            expects_path = False
+            resolved[index] = _absolute(cwd, arg)
+            continue
+        name, has_value, value = arg.partition("=")
+        if name in path_options:
+            if has_value:
+                resolved[index] = f"{name}={_absolute(cwd, value)}"
+            else:
+                expects_path = True
+        elif arg in getattr(current, "commands", {}):
+            current = current.commands[arg]
+            path_options = _path_options(current)
+    return resolved
+
+
+def _path_options(command: Any) -> Set[str]:
+    # Matched by name: Typer may bring its own copy of the click classes
+    return {
+        opt
+        for param in command.params
+        if param.param_type_name == "option" and param.type.name in ("path", "filename")
+        for opt in param.opts
+    }
+
+
+def _absolute(cwd: str, path: str) -> str:
+    # "-" is stdin/stdout for file options
+    if path == "-" or path.startswith("~"):
+        return path
+    return os.path.join(cwd, path)
+
+
+def _fallback(reason: str) -> Dict[str, Any]:
+    logger.debug("Declining forwarded command: %s", reason)
+    return {"status": "fallback", "reason": reason}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        request = read_message(self.rfile)
+        if request is None:
+            return
+        write_message(self.wfile, self.server.runner.run(request))
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server handing each connection to a worker pool.
+
+    Connections are accepted on the serving thread and processed by a
+    bounded thread pool, so concurrent clients don't wait for each other
+    while the number of simultaneous database sessions stays capped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        runner: CommandRunner,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        self.runner = runner
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sologm-worker"
+        )
+        self._path = path
+        _remove_stale_socket(path)
+        # Create the socket owner-only from the start; a chmod after bind
+        # would leave a window in which other users could connect
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._pool.submit(self._process_in_worker, request, client_address)
+
+    def _process_in_worker(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file left behind by a daemon that didn't exit cleanly.
+
+    Raises:
+        RuntimeError: If another daemon is still listening on the path.
+    """
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        logger.debug("Removing stale socket %s", path)
+        path.unlink()
+    else:
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+def create_server(path: Path, workers: int = DEFAULT_WORKERS) -> DaemonServer:
+    """Create a daemon server with shared API connections enabled.
+
+    Args:
+        path: Unix socket path to listen on
+        workers: Maximum number of commands served concurrently
+
+    Returns:
+        The server, ready for ``serve_forever``.
+    """
+    from sologm.integrations.anthropic import share_connections
+
+    share_connections()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return DaemonServer(path, CommandRunner(), workers=workers)
@@ -0,0 +1,134 @@
+"""Tests for the command daemon and its client."""
+
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+import typer
+
+from sologm.cli.main import app
+from sologm.daemon.client import _is_forwardable, forward
+from sologm.daemon.protocol import SOCKET_ENV, environment_fingerprint
+from sologm.daemon.server import CommandRunner, DaemonServer, _resolve_path_options
+from sologm.database.session import DatabaseManager, SessionContext
+from sologm.models.game import Game
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["event", "add", "--description", "x"], True),
+        (["--no-ui", "dice", "roll", "2d6"], True),
+        ([], False),
+        (["game", "list", "--help"], False),
+        (["--config=/tmp/other.yaml", "game", "list"], False),
+        (["serve"], False),
+        (["--profile-startup", "game", "list"], False),
+        (["oracle", "interpret", "--context", "x"], False),
+        (["act", "complete"], False),
+    ],
+)
+def test_is_forwardable(argv, expected) -> None:
+    """Test which invocations the client sends to the daemon."""
+    assert _is_forwardable(argv) is expected
+
+
+def test_forward_without_daemon(monkeypatch, tmp_path: Path) -> None:
+    """Test the client falls back when nothing is listening."""
+    monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "missing.sock"))
+    assert forward(["game", "list"]) is None
+
+
+def test_runner_declines_other_environment() -> None:
+    """Test a client with different settings is told to run locally."""
+    response = CommandRunner().run({"argv": ["game", "list"], "env": "other"})
+    assert response["status"] == "fallback"
+
+
+def test_runner_falls_back_before_prompting(
+    session_context: SessionContext, create_test_game: Callable
+) -> None:
+    """Test a command that opens an editor is handed back to the client."""
+    with session_context as session:
+        create_test_game(session, name="Quiet")
+
+    response = CommandRunner().run(
+        {"argv": ["game", "edit"], "env": environment_fingerprint()}
+    )
+
+    assert response == {"status": "fallback", "reason": "command needs a terminal"}
+
+
+@pytest.fixture
+def daemon(monkeypatch, tmp_path: Path) -> Iterator[DaemonServer]:
+    """Serve commands from a background thread against a file database.
+
+    Worker threads need their own connections, which an in-memory database
+    can't share.
+    """
+    db_manager = DatabaseManager(db_url=f"sqlite:///{tmp_path / 'daemon.db'}")
+    db_manager.create_tables()
+    monkeypatch.setattr(DatabaseManager, "_instance", db_manager)
+
+    path = tmp_path / "sologm.sock"
+    monkeypatch.setenv(SOCKET_ENV, str(path))
+    server = DaemonServer(path, CommandRunner(), workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    db_manager.dispose()
+
+
+def test_forward_runs_command_in_daemon(daemon: DaemonServer, capsys) -> None:
+    """Test a forwarded command runs remotely and its output is relayed."""
+    exit_code = forward(["game", "create", "--name", "Remote", "--description", "d"])
+
+    assert exit_code == 0
+    assert "Game created successfully" in capsys.readouterr().out
+    with SessionContext() as session:
+        assert session.query(Game).filter_by(name="Remote").count() == 1
+
+
+def test_forward_relays_exit_code(daemon: DaemonServer, capsys) -> None:
+    """Test a failing command's exit code reaches the client."""
+    assert forward(["game", "activate", "--id", "missing"]) == 1
+    assert "missing" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (
+            ["stats", "ai", "--file", "metrics.jsonl"],
+            ["stats", "ai", "--file", "/work/metrics.jsonl"],
+        ),
+        (
+            ["stats", "ai", "--file=logs/m.jsonl", "-d", "7"],
+            ["stats", "ai", "--file=/work/logs/m.jsonl", "-d", "7"],
+        ),
+        (
+            ["stats", "ai", "--file", "/tmp/m.jsonl"],
+            ["stats", "ai", "--file", "/tmp/m.jsonl"],
+        ),
+        (
+            ["event", "add", "--description", "x"],
+            ["event", "add", "--description", "x"],
+        ),
+    ],
+)
+def test_path_options_resolve_against_client_cwd(argv, expected) -> None:
+    """Test relative path options point where the client meant them to."""
+    command = typer.main.get_command(app)
+    assert _resolve_path_options(command, argv, "/work") == expected
+
+
+def test_socket_is_owner_only(daemon: DaemonServer, tmp_path: Path) -> None:
+    """Test the socket is created without access for other users."""
+    mode = stat.S_IMODE(os.stat(tmp_path / "sologm.sock").st_mode)
+    assert mode == 0o600
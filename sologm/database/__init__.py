@@ -1,21 +1,45 @@
 """Database package for SoloGM."""
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from sqlalchemy.engine import Engine
 
 from sologm.database.session import (
+    DEFAULT_POOL_OPTIONS,
     DatabaseManager,
+    PoolStats,
     _seed_default_event_sources,
     get_db_context,
     # get_session, # Removed in Phase 1
     # initialize_database,
 )
+from sologm.utils.profiling import startup_profiler
+
+if TYPE_CHECKING:
+    from sologm.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
 
+def pool_options(config: "Config") -> Dict[str, Any]:
+    """Get connection pool settings from the configuration.
+
+    Reads ``db_pool_size``, ``db_max_overflow``, ``db_pool_timeout`` and
+    ``db_pool_recycle``, falling back to DEFAULT_POOL_OPTIONS.
+
+    Args:
+        config: Configuration to read
+
+    Returns:
+        Keyword arguments for create_engine.
+    """
+    return {
+        option: config.get_int(f"db_{option}", default)
+        for option, default in DEFAULT_POOL_OPTIONS.items()
+    }
+
+
 def init_db(engine: Optional[Engine] = None) -> DatabaseManager:
     """Initialize the database and create tables if they don't exist.
 
@@ -45,16 +69,21 @@ def init_db(engine: Optional[Engine] = None) -> DatabaseManager:
             )
 
         # Get or create the singleton instance
-        db_session = DatabaseManager.get_instance(db_url=db_url)
+        with startup_profiler.phase("engine"):
+            db_session = DatabaseManager.get_instance(
+                db_url=db_url, **pool_options(config)
+            )
     else:
         # Use provided engine
         db_session = DatabaseManager.get_instance(engine=engine)
 
     # Create tables
-    db_session.create_tables()
+    with startup_profiler.phase("create_tables"):
+        db_session.create_tables()
 
     # Seed default data
-    _seed_default_event_sources()
+    with startup_profiler.phase("seed"):
+        _seed_default_event_sources()
 
     logger.info("Database initialized successfully")
     return db_session
@@ -62,8 +91,10 @@ def init_db(engine: Optional[Engine] = None) -> DatabaseManager:
 
 __all__ = [
     "DatabaseManager",
+    "PoolStats",
     # "get_session", # Removed in Phase 1
     # "initialize_database",
     "get_db_context",
     "init_db",
+    "pool_options",
 ]
@@ -0,0 +1,205 @@
+"""Asyncio database session management for SoloGM.
+
+Mirrors ``sologm.database.session`` for applications that run an event loop,
+such as chat bots. Requires the ``async`` extra (SQLAlchemy's asyncio
+support plus aiosqlite or asyncpg).
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm.exc import StaleDataError
+
+from sologm.models.base import Base
+from sologm.models.event_source import event_source_cache
+from sologm.utils.errors import ConflictError
+
+logger = logging.getLogger(__name__)
+
+# Async drivers to use for the synchronous URLs found in config files
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def to_async_url(db_url: str) -> str:
+    """Convert a configured database URL to use an asyncio driver.
+
+    Args:
+        db_url: Database URL, e.g. ``sqlite:///path/to/sologm.db``
+
+    Returns:
+        The URL with an asyncio driver, e.g. ``sqlite+aiosqlite:///...``.
+        URLs that already name a driver not listed in ASYNC_DRIVERS are
+        returned unchanged.
+    """
+    url = make_url(db_url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        return db_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+class AsyncDatabaseManager:
+    """Manages the async engine and session factory.
+
+    The asyncio counterpart of DatabaseManager, also used as a singleton.
+    Models, validation and manager logic are shared with the synchronous
+    code; only the connection layer differs.
+
+    Attributes:
+        engine: SQLAlchemy async engine managing the connection pool
+        session: Factory for AsyncSession instances
+    """
+
+    _instance: Optional["AsyncDatabaseManager"] = None
+    _lock = threading.Lock()
+    engine: AsyncEngine
+    session: async_sessionmaker
+
+    @classmethod
+    def get_instance(
+        cls: Type["AsyncDatabaseManager"],
+        db_url: Optional[str] = None,
+        engine: Optional[AsyncEngine] = None,
+    ) -> "AsyncDatabaseManager":
+        """Get or create the singleton instance of AsyncDatabaseManager.
+
+        Args:
+            db_url: Database URL; synchronous URLs are converted to an async
+                driver
+            engine: Pre-configured async engine instance
+
+        Returns:
+            The AsyncDatabaseManager instance.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = AsyncDatabaseManager(db_url=db_url, engine=engine)
+        return cls._instance
+
+    def __init__(
+        self,
+        db_url: Optional[str] = None,
+        engine: Optional[AsyncEngine] = None,
+        **engine_kwargs: Dict[str, Any],
+    ) -> None:
+        """Initialize the async engine and session factory.
+
+        Args:
+            db_url: Database URL; synchronous URLs are converted to an async
+                driver
+            engine: Pre-configured async engine instance
+            engine_kwargs: Additional keyword arguments for engine creation
+        """
+        if engine is not None:
+            logger.debug("Using provided async engine")
+            self.engine = engine
+        elif db_url is not None:
+            async_url = to_async_url(db_url)
+            logger.debug("Creating async engine with URL: %s", async_url)
+            self.engine = create_async_engine(
+                async_url,
+                pool_recycle=1800,  # Recycle connections after 30 minutes
+                **engine_kwargs,
+            )
+        else:
+            logger.error("No engine or db_url provided")
+            raise ValueError("Either db_url or engine must be provided")
+
+        self.session = async_sessionmaker(
+            bind=self.engine,
+            autoflush=True,
+            expire_on_commit=False,  # Prevents detached instance errors
+        )
+        # Async sessions run on the engine's synchronous counterpart
+        event_source_cache.track_engine(self, self.engine.sync_engine)
+
+    async def create_tables(self) -> None:
+        """Create all tables defined in the models."""
+        logger.debug("Creating database tables")
+        async with self.engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        logger.debug("Database tables created")
+
+    async def dispose(self) -> None:
+        """Dispose of the engine and all its connections."""
+        logger.debug("Disposing async engine connections")
+        event_source_cache.untrack_engine(self)
+        await self.engine.dispose()
+
+
+class AsyncSessionContext:
+    """Async context manager for database sessions and transaction management.
+
+    Behaves like SessionContext: commits on a clean exit, rolls back when an
+    exception escapes, and always closes the session.
+
+    Example:
+        async with get_async_db_context() as session:
+            managers = create_all_async_managers(session)
+            game = await managers.game.get_active_game()
+    """
+
+    session: Optional[AsyncSession] = None
+
+    def __init__(self, db_manager: Optional[AsyncDatabaseManager] = None) -> None:
+        """Initialize with optional database manager.
+
+        Args:
+            db_manager: Async database manager to use (uses singleton if None)
+        """
+        self._db = db_manager or AsyncDatabaseManager.get_instance()
+        self.session = None
+
+    async def __aenter__(self) -> AsyncSession:
+        """Enter context and get a session."""
+        logger.debug("Entering async session context")
+        self.session = self._db.session()
+        return self.session
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        """Exit context and close session."""
+        try:
+            if exc_type is not None:
+                logger.debug("Exception in async session context: %s", exc_val)
+                await self.session.rollback()
+            elif self.session.is_active and self.session.in_transaction():
+                logger.debug("Committing async session")
+                try:
+                    await self.session.commit()
+                except StaleDataError as e:
+                    raise ConflictError(
+                        f"Concurrent modification on commit: {e}"
+                    ) from e
+        finally:
+            logger.debug("Closing async session")
+            await self.session.close()
+
+
+def get_async_db_context() -> AsyncSessionContext:
+    """Get an async database session context manager.
+
+    The asyncio counterpart of get_db_context.
+
+    Returns:
+        A context manager that yields an AsyncSession when entered
+    """
+    return AsyncSessionContext()
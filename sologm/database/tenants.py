@@ -0,0 +1,284 @@
+"""Per-tenant databases served from a single process.
+
+A hosted service gives each player (tenant) their own database. The
+TenantRegistry opens a tenant's engine on first use, keeps recently used
+engines open for the next request, and disposes of engines that have been
+idle too long or that fall off the end of its LRU list.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy.engine import make_url
+
+from sologm.database.session import (
+    DatabaseManager,
+    SessionContext,
+    _seed_default_event_sources,
+)
+from sologm.utils.errors import ConfigError
+
+logger = logging.getLogger(__name__)
+
+# Tenant names end up in file names, so keep them to a safe alphabet
+TENANT_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+
+
+class _Tenant:
+    """An open tenant database and its usage bookkeeping."""
+
+    def __init__(self, manager: DatabaseManager) -> None:
+        self.manager = manager
+        self.leases = 0
+        self.last_used = time.monotonic()
+
+
+class TenantRegistry:
+    """Lazily opened, cached database engines, one per tenant.
+
+    Engines in use by a session are never evicted; the cache can therefore
+    grow past ``max_engines`` while more tenants than that are active at once,
+    and shrinks back as their sessions finish.
+
+    Attributes:
+        url_template: Database URL with a ``{tenant}`` placeholder
+        max_engines: Number of engines kept open
+        idle_timeout: Seconds after which an unused engine is disposed
+    """
+
+    def __init__(
+        self,
+        url_template: str,
+        max_engines: int = 64,
+        idle_timeout: float = 600.0,
+        engine_kwargs: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            url_template: Database URL with a ``{tenant}`` placeholder, e.g.
+                ``sqlite:////srv/sologm/tenants/{tenant}.db``
+            max_engines: Number of engines kept open
+            idle_timeout: Seconds after which an unused engine is disposed
+            engine_kwargs: Options for each tenant's engine, e.g. pool sizes
+            clock: Monotonic time source, replaceable in tests
+
+        Raises:
+            ValueError: If the template has no ``{tenant}`` placeholder
+        """
+        if "{tenant}" not in url_template:
+            raise ValueError("Tenant database URL must contain '{tenant}'")
+        self.url_template = url_template
+        self.max_engines = max_engines
+        self.idle_timeout = idle_timeout
+        self._engine_kwargs = engine_kwargs or {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        # Serializes first-time setup per tenant without blocking other tenants
+        self._opening: Dict[str, threading.Lock] = {}
+
+    def url_for(self, tenant: str) -> str:
+        """Get the database URL of a tenant.
+
+        Args:
+            tenant: Tenant name
+
+        Returns:
+            The tenant's database URL.
+
+        Raises:
+            ValueError: If the tenant name contains unsupported characters
+        """
+        if not TENANT_NAME.match(tenant):
+            raise ValueError(f"Invalid tenant name: '{tenant}'")
+        return self.url_template.format(tenant=tenant)
+
+    def acquire(self, tenant: str) -> DatabaseManager:
+        """Get a tenant's database manager and mark it in use.
+
+        Opens the database on first use, creating its tables and default
+        data. Every call must be paired with ``release``.
+
+        Args:
+            tenant: Tenant name
+
+        Returns:
+            The tenant's DatabaseManager.
+        """
+        with self._lock:
+            entry = self._tenants.get(tenant)
+            if entry is not None:
+                self._lease(tenant, entry)
+                return entry.manager
+            opening = self._opening.setdefault(tenant, threading.Lock())
+
+        with opening:
+            with self._lock:
+                entry = self._tenants.get(tenant)
+                if entry is not None:
+                    self._lease(tenant, entry)
+                    return entry.manager
+            manager = self._open(tenant)
+            with self._lock:
+                entry = _Tenant(manager)
+                self._tenants[tenant] = entry
+                self._opening.pop(tenant, None)
+                self._lease(tenant, entry)
+                evicted = self._collect_evictions()
+        self._dispose(evicted)
+        return manager
+
+    def release(self, tenant: str) -> None:
+        """Mark a tenant's database as no longer in use by the caller.
+
+        Args:
+            tenant: Tenant name passed to ``acquire``
+        """
+        with self._lock:
+            entry = self._tenants.get(tenant)
+            if entry is not None:
+                entry.leases -= 1
+                entry.last_used = self._clock()
+            evicted = self._collect_evictions()
+        self._dispose(evicted)
+
+    def evict_idle(self) -> List[str]:
+        """Dispose of engines that have been idle longer than the timeout.
+
+        Eviction also happens on every acquire and release; long-running
+        services with bursty traffic can call this periodically as well.
+
+        Returns:
+            Names of the evicted tenants.
+        """
+        with self._lock:
+            evicted = self._collect_evictions()
+        self._dispose(evicted)
+        return [tenant for tenant, _ in evicted]
+
+    def open_tenants(self) -> List[str]:
+        """Get the tenants with an open engine, least recently used first."""
+        with self._lock:
+            return list(self._tenants)
+
+    def close(self) -> None:
+        """Dispose of every cached engine."""
+        with self._lock:
+            evicted = list(self._tenants.items())
+            self._tenants.clear()
+        self._dispose(evicted)
+
+    def _lease(self, tenant: str, entry: _Tenant) -> None:
+        entry.leases += 1
+        entry.last_used = self._clock()
+        self._tenants.move_to_end(tenant)
+
+    def _collect_evictions(self) -> List[Tuple[str, _Tenant]]:
+        """Remove idle and least recently used entries; caller holds the lock."""
+        now = self._clock()
+        evicted = []
+        for tenant, entry in list(self._tenants.items()):
+            if entry.leases > 0:
+                continue
+            over_capacity = len(self._tenants) > self.max_engines
+            if over_capacity or now - entry.last_used >= self.idle_timeout:
+                evicted.append((tenant, self._tenants.pop(tenant)))
+        return evicted
+
+    def _dispose(self, evicted: List[Tuple[str, _Tenant]]) -> None:
+        for tenant, entry in evicted:
+            logger.debug("Closing database for tenant '%s'", tenant)
+            entry.manager.dispose()
+
+    def _open(self, tenant: str) -> DatabaseManager:
+        url = self.url_for(tenant)
+        parsed = make_url(url)
+        if parsed.get_backend_name() == "sqlite" and parsed.database:
+            Path(parsed.database).parent.mkdir(parents=True, exist_ok=True)
+        logger.info("Opening database for tenant '%s'", tenant)
+        manager = DatabaseManager(db_url=url, **self._engine_kwargs)
+        manager.create_tables()
+        _seed_default_event_sources(manager)
+        return manager
+
+
+class TenantSessionContext(SessionContext):
+    """SessionContext bound to a tenant's database.
+
+    Holds the tenant's engine open for the lifetime of the session.
+    """
+
+    def __init__(self, registry: TenantRegistry, tenant: str) -> None:
+        """Initialize for a tenant.
+
+        Args:
+            registry: Registry that owns the tenant's engine
+            tenant: Tenant name
+        """
+        self._registry = registry
+        self._tenant = tenant
+        self.session = None
+
+    def __enter__(self) -> Any:
+        self._db = self._registry.acquire(self._tenant)
+        try:
+            return super().__enter__()
+        except BaseException:
+            self._registry.release(self._tenant)
+            raise
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[Any],
+    ) -> None:
+        try:
+            super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._registry.release(self._tenant)
+
+
+_registry: Optional[TenantRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_tenant_registry() -> TenantRegistry:
+    """Get the process-wide tenant registry, creating it from the config.
+
+    Uses ``tenant_database_url``, ``tenant_cache_size`` and
+    ``tenant_idle_timeout``, plus the ``db_pool_*`` settings for each engine.
+
+    Returns:
+        The shared TenantRegistry.
+
+    Raises:
+        ConfigError: If ``tenant_database_url`` is not set
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                from sologm.database import pool_options
+                from sologm.utils.config import get_config
+
+                config = get_config()
+                url_template = config.get_str("tenant_database_url")
+                if not url_template:
+                    raise ConfigError(
+                        "tenant_database_url must be set to serve tenant databases"
+                    )
+                _registry = TenantRegistry(
+                    url_template=url_template,
+                    max_engines=config.get_int("tenant_cache_size", 64),
+                    idle_timeout=config.get_int("tenant_idle_timeout", 600),
+                    engine_kwargs=pool_options(config),
+                )
+    return _registry
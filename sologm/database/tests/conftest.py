@@ -0,0 +1,4 @@
+"""Shared test fixtures for database tests."""
+
+# Import all fixtures from central conftest
+from sologm.tests.conftest import *  # noqa: F401, F403
@@ -0,0 +1,160 @@
+"""Tests for database manager initialization and connection pooling."""
+
+import threading
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from sologm.database import pool_options
+from sologm.database.session import (
+    DatabaseManager,
+    SessionContext,
+    _seed_default_event_sources,
+    get_db_context,
+)
+from sologm.models.event import Event
+from sologm.models.event_source import EventSource, event_source_cache
+from sologm.utils.config import Config
+
+
+@pytest.fixture
+def named_databases() -> Generator[None, None, None]:
+    """Unregister named databases created by a test."""
+    yield
+    DatabaseManager.dispose_named()
+
+
+def test_get_instance_initializes_once_across_threads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test threads racing to initialize share one manager."""
+    monkeypatch.setattr(DatabaseManager, "_instance", None)
+    db_url = f"sqlite:///{tmp_path / 'race.db'}"
+    barrier = threading.Barrier(8)
+    managers: List[DatabaseManager] = []
+
+    def initialize() -> None:
+        barrier.wait()
+        managers.append(DatabaseManager.get_instance(db_url=db_url))
+
+    threads = [threading.Thread(target=initialize) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(manager) for manager in managers}) == 1
+    managers[0].dispose()
+
+
+def test_named_databases(tmp_path: Path, named_databases: None) -> None:
+    """Test named managers are cached per name and bound to one URL."""
+    first_url = f"sqlite:///{tmp_path / 'first.db'}"
+    first = DatabaseManager.get_named("first", db_url=first_url)
+    first.create_tables()
+
+    assert DatabaseManager.get_named("first") is first
+    assert DatabaseManager.get_named("first", db_url=first_url) is first
+    assert (
+        DatabaseManager.get_named("second", f"sqlite:///{tmp_path / 'b.db'}")
+        is not first
+    )
+    with pytest.raises(ValueError):
+        DatabaseManager.get_named("first", db_url=f"sqlite:///{tmp_path / 'b.db'}")
+    with pytest.raises(KeyError):
+        DatabaseManager.get_named("missing")
+
+    with get_db_context("first") as session:
+        assert session.get_bind() is first.engine
+
+
+def test_seeding_warms_event_source_cache(tmp_path: Path) -> None:
+    """Test seeded source IDs are cached once the seeding commits."""
+    manager = DatabaseManager(db_url=f"sqlite:///{tmp_path / 'seed.db'}")
+    manager.create_tables()
+
+    _seed_default_event_sources(manager)
+
+    assert {
+        name: event_source_cache.peek_id(name, manager.engine)
+        for name in ("manual", "oracle", "dice")
+    } == {"manual": 1, "oracle": 2, "dice": 3}
+    manager.dispose()
+
+
+def test_source_ids_only_inlined_for_a_single_engine(
+    tmp_path: Path, database_manager: DatabaseManager
+) -> None:
+    """Test class-level source checks join while several databases are open."""
+    _seed_default_event_sources(database_manager)
+    other = DatabaseManager(db_url=f"sqlite:///{tmp_path / 'other.db'}")
+    other.create_tables()
+    with SessionContext(other) as session:
+        # Same names, different IDs than the default database
+        session.add_all(EventSource.create(name=n) for n in ("dice", "manual"))
+    for manager in (database_manager, other):
+        with SessionContext(manager) as session:
+            event_source_cache.get_ids(session)
+
+    assert event_source_cache.peek_id("manual") is None
+    assert "event_sources" in str(select(Event.id).where(Event.is_manual))
+    assert event_source_cache.peek_id("manual", other.engine) == 2
+
+    other.dispose()
+
+    assert event_source_cache.peek_id("manual") == 1
+    assert "event_sources" not in str(select(Event.id).where(Event.is_manual))
+
+
+def test_pool_stats_track_checkouts_and_timeouts(tmp_path: Path) -> None:
+    """Test pool statistics report usage, waits and timeouts."""
+    manager = DatabaseManager(
+        db_url=f"sqlite:///{tmp_path / 'pool.db'}",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        with manager.engine.connect() as held:
+            held.execute(text("SELECT 1"))
+            with pytest.raises(PoolTimeoutError):
+                manager.engine.connect()
+            stats = manager.pool_stats()
+
+        assert stats.size == 1
+        assert stats.checked_out == 1
+        assert stats.overflow == 0
+        assert stats.checkouts == 1
+        assert stats.timeouts == 1
+        assert stats.max_wait >= 0.05
+        assert manager.pool_stats().checked_out == 0
+    finally:
+        manager.dispose()
+
+
+def test_pool_stats_without_queue_pool(database_manager: DatabaseManager) -> None:
+    """Test pools without sizes report None instead of failing."""
+    stats = database_manager.pool_stats()
+
+    assert stats.size is None
+    assert stats.checkouts == 0
+    assert stats.average_wait == 0.0
+
+
+def test_pool_options_from_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test pool sizes are read from the config with env overrides."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SOLOGM_DB_POOL_SIZE", "20")
+    config = Config(tmp_path / "config.yaml")
+
+    assert pool_options(config) == {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+    }
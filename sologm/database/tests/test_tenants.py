@@ -0,0 +1,115 @@
+"""Tests for the per-tenant database registry."""
+
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from sologm.core.game import GameManager
+from sologm.database import tenants
+from sologm.database.session import get_db_context
+from sologm.database.tenants import TenantRegistry, get_tenant_registry
+from sologm.utils import config as config_module
+from sologm.utils.config import Config
+from sologm.utils.errors import ConfigError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(
+    tmp_path: Path, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> Generator[TenantRegistry, None, None]:
+    """Provide a registry over temporary SQLite files, used by get_db_context."""
+    registry = TenantRegistry(
+        f"sqlite:///{tmp_path}/tenants/{{tenant}}.db",
+        max_engines=2,
+        idle_timeout=60,
+        clock=clock,
+    )
+    monkeypatch.setattr(tenants, "_registry", registry)
+    yield registry
+    registry.close()
+
+
+def _game_names(tenant: str) -> List[str]:
+    with get_db_context(tenant=tenant) as session:
+        return [game.name for game in GameManager(session=session).list_games()]
+
+
+def test_tenants_are_isolated(tmp_path: Path, registry: TenantRegistry) -> None:
+    """Test each tenant gets its own initialized database."""
+    with get_db_context(tenant="alice") as session:
+        GameManager(session=session).create_game("Alice's Game", "Hers")
+
+    assert _game_names("alice") == ["Alice's Game"]
+    assert _game_names("bob") == []
+    assert (tmp_path / "tenants" / "alice.db").exists()
+
+
+def test_least_recently_used_engine_is_evicted(registry: TenantRegistry) -> None:
+    """Test the cache closes the least recently used engine when full."""
+    for tenant in ("alice", "bob", "alice", "carol"):
+        _game_names(tenant)
+
+    assert registry.open_tenants() == ["alice", "carol"]
+
+
+def test_idle_engines_are_evicted(registry: TenantRegistry, clock: FakeClock) -> None:
+    """Test engines unused for longer than the timeout are closed."""
+    _game_names("alice")
+    clock.now = 30
+    _game_names("bob")
+    clock.now = 70
+
+    assert registry.evict_idle() == ["alice"]
+    assert registry.open_tenants() == ["bob"]
+
+
+def test_engines_in_use_are_not_evicted(
+    registry: TenantRegistry, clock: FakeClock
+) -> None:
+    """Test an engine isn't closed while one of its sessions is open."""
+    with get_db_context(tenant="alice") as session:
+        clock.now = 1000
+        _game_names("bob")
+        _game_names("carol")
+        GameManager(session=session).list_games()
+        # Alice is idle and least recently used, but her session is open
+        assert registry.open_tenants() == ["alice", "carol"]
+
+    clock.now = 2000
+    assert registry.evict_idle() == ["alice", "carol"]
+
+
+def test_invalid_tenant_name_is_rejected(registry: TenantRegistry) -> None:
+    """Test tenant names can't escape the database directory."""
+    with pytest.raises(ValueError):
+        registry.acquire("../alice")
+    assert registry.open_tenants() == []
+
+
+def test_registry_requires_url_template(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an unset tenant_database_url is reported as a config error."""
+    config = Config(tmp_path / "config.yaml")
+    config.set("tenant_database_url", "")
+    monkeypatch.setattr(config_module, "get_config", lambda: config)
+    monkeypatch.setattr(tenants, "_registry", None)
+
+    with pytest.raises(ConfigError, match="tenant_database_url"):
+        get_tenant_registry()
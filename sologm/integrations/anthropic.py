@@ -1,35 +1,170 @@
 """Anthropic API client for Solo RPG Helper."""
 
+import asyncio
 import logging
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
 from anthropic import Anthropic
 from anthropic._types import NOT_GIVEN
 
+from sologm.integrations import metrics
+from sologm.integrations.cassette import (
+    Cassette,
+    RecordingTransport,
+    configured_cassette,
+    replay_transport_from_config,
+)
+from sologm.integrations.metrics import CallMetrics, usage_tokens
+from sologm.integrations.throttle import (
+    CallGuard,
+    estimate_request_tokens,
+    get_call_guard,
+)
 from sologm.utils.config import get_config
-from sologm.utils.errors import APIError
+from sologm.utils.errors import APIError, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
 # Default max tokens for narrative generation (can be overridden)
 NARRATIVE_MAX_TOKENS = 2048
 
+# Model used for all requests
+DEFAULT_MODEL = "claude-3-5-sonnet-latest"
+
+# Seconds between checks on a message batch
+BATCH_POLL_INTERVAL = 10.0
+
+# Library clients reused across AnthropicClient instances, keyed by API key.
+# Only populated once share_connections() has been called.
+_shared_clients: Optional[Dict[str, Anthropic]] = None
+_shared_clients_lock = threading.Lock()
+
+
+def share_connections() -> None:
+    """Reuse one HTTP connection pool per API key for all clients.
+
+    Long-running processes such as ``sologm serve`` call this so each command
+    doesn't open fresh TLS connections. The underlying library client is
+    thread-safe. Short-lived CLI processes don't need it.
+    """
+    global _shared_clients
+    with _shared_clients_lock:
+        if _shared_clients is None:
+            _shared_clients = {}
+
+
+def _library_client(api_key: str) -> Anthropic:
+    """Get a library client, shared if share_connections() was called.
+
+    The library's own retries are disabled; the call guard retries instead.
+    """
+    if _shared_clients is None:
+        return Anthropic(api_key=api_key, max_retries=0)
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = _shared_clients[api_key] = Anthropic(
+                api_key=api_key, max_retries=0
+            )
+        return client
+
+
+def _record_metrics(
+    call_site: str,
+    started: float,
+    response: Any = None,
+    retries: int = 0,
+    error: Optional[Exception] = None,
+    batch: bool = False,
+) -> None:
+    """Record the metrics of a request started at ``started`` (perf_counter)."""
+    first_token = getattr(response, "time_to_first_token", None)
+    tokens = usage_tokens(response)
+    metrics.record(
+        CallMetrics(
+            call_site=call_site,
+            model=DEFAULT_MODEL,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            time_to_first_token_ms=(
+                first_token * 1000 if isinstance(first_token, (int, float)) else None
+            ),
+            retries=retries,
+            batch=batch,
+            error=str(error) if error is not None else None,
+            input_tokens=tokens["input_tokens"],
+            output_tokens=tokens["output_tokens"],
+            cache_creation_tokens=tokens["cache_creation_tokens"],
+            cache_read_tokens=tokens["cache_read_tokens"],
+        )
+    )
+
+
+def _tokens_used(response: Any) -> Optional[int]:
+    """Get the input plus output tokens of a response, if reported."""
+    usage = getattr(response, "usage", None)
+    input_tokens = getattr(usage, "input_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None)
+    if isinstance(input_tokens, int) and isinstance(output_tokens, int):
+        return input_tokens + output_tokens
+    return None
+
+
+@dataclass
+class BatchResults:
+    """Outcome of a message batch.
+
+    Attributes:
+        batch_id: ID of the batch
+        texts: Response text by request ID, for requests that succeeded
+        errors: Error description by request ID, for the others
+    """
+
+    batch_id: str
+    texts: Dict[str, str] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
 
 class AnthropicClient:
     """Client for interacting with Anthropic's Claude API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[Any] = None,
+        call_guard: Optional[CallGuard] = None,
+    ):
         """Initialize the Anthropic client.
 
         Args:
             api_key: Optional API key. If not provided, will try to get from
                     config (which checks environment variables and config file).
+            transport: Optional object to send requests through instead of the
+                    Anthropic library client, such as a cassette replay (see
+                    sologm.integrations.cassette). Replaying a cassette set
+                    with the ``ai_cassette`` config key needs no API key.
+            call_guard: Rate limiter, retry policy and circuit breaker for
+                    requests. Defaults to the one shared by the whole process.
 
         Raises:
             APIError: If no API key is found or if client initialization fails.
         """
         logger.debug("[AnthropicClient.__init__] Initializing...")
+        self.call_guard = call_guard
         try:
+            cassette = configured_cassette() if transport is None else None
+            if cassette is not None and cassette["mode"] == "replay":
+                transport = replay_transport_from_config(cassette["path"])
+            if transport is not None:
+                logger.debug(
+                    "[AnthropicClient.__init__] Using %s", type(transport).__name__
+                )
+                self.api_key = api_key
+                self.client = transport
+                return
+
             if api_key is None:
                 logger.debug(
                     "[AnthropicClient.__init__] API key not provided, "
@@ -40,8 +175,10 @@ class AnthropicClient:
                 config = get_config()
                 # Log details about the config object received
                 logger.debug(
-                    "[AnthropicClient.__init__] get_config() returned "
-                    f"object: {config} (type: {type(config)})"
+                    "[AnthropicClient.__init__] get_config() returned object: %s "
+                    "(type: %s)",
+                    config,
+                    type(config),
                 )
                 # Check if it's the mock object we expect in tests
 
@@ -51,8 +188,9 @@ class AnthropicClient:
                 api_key = config.get("anthropic_api_key")
                 # Log the exact value returned by config.get
                 logger.debug(
-                    f"[AnthropicClient.__init__] "
-                    f"config.get('anthropic_api_key') returned: {api_key!r}"
+                    "[AnthropicClient.__init__] config.get('anthropic_api_key') "
+                    "returned: %r",
+                    api_key,
                 )
 
                 if not api_key:
@@ -78,14 +216,20 @@ class AnthropicClient:
                 "[AnthropicClient.__init__] Initializing actual Anthropic "
                 "library client"
             )
-            self.client = Anthropic(api_key=self.api_key)
+            self.client = _library_client(self.api_key)
+            if cassette is not None:
+                logger.info("Recording AI responses to %s", cassette["path"])
+                self.client = RecordingTransport(
+                    self.client, Cassette(cassette["path"])
+                )
             logger.debug(
                 "[AnthropicClient.__init__] Anthropic library client "
                 "initialized successfully."
             )
         except Exception as e:
             logger.error(
-                f"[AnthropicClient.__init__] Failed during initialization: {e}",
+                "[AnthropicClient.__init__] Failed during initialization: %s",
+                e,
                 exc_info=True,
             )  # Add exc_info for traceback
             # Avoid shadowing the original error type if it's already APIError
@@ -93,12 +237,18 @@ class AnthropicClient:
                 raise
             raise APIError(f"Failed to initialize Anthropic client: {str(e)}") from e
 
+    @property
+    def _guard(self) -> CallGuard:
+        """The call guard for this client's requests."""
+        return self.call_guard or get_call_guard()
+
     def send_message(
         self,
         prompt: str,
         max_tokens: int = 1000,
         temperature: float = 0.7,
         system: Optional[str] = None,
+        call_site: str = "other",
     ) -> str:
         """Send a message to Claude and get the response.
 
@@ -107,6 +257,8 @@ class AnthropicClient:
             max_tokens: Maximum number of tokens in the response.
             temperature: Controls randomness in the response (0.0 to 1.0).
             system: Optional system message to set context.
+            call_site: What the request is for, recorded with its metrics
+                (see sologm.integrations.metrics).
 
         Returns:
             str: Claude's response text.
@@ -114,33 +266,271 @@ class AnthropicClient:
         Raises:
             APIError: If the API call fails.
         """
+        started = time.perf_counter()
+        retries: List[Exception] = []
+        response = None
+        error: Optional[Exception] = None
         try:
-            logger.debug(f"Sending message to Claude with {max_tokens} max tokens")
-
-            logger.debug(f"Sending message to Claude with prompt length: {len(prompt)}")
-            logger.debug(f"Prompt: {prompt}")
-            # Handle system message
-            system_param = system if system is not None else NOT_GIVEN
-
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-latest",
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_param,
-                messages=[{"role": "user", "content": prompt}],
+            params = self._message_params(prompt, max_tokens, temperature, system)
+            response = self._guard.call(
+                lambda: self.client.messages.create(**params),
+                tokens=estimate_request_tokens(prompt, max_tokens),
+                used_tokens=_tokens_used,
+                on_retry=retries.append,
             )
+            return self._response_text(response)
 
-            # Extract text from the first content block
-            if not response.content or not hasattr(response.content[0], "text"):
-                raise APIError("Unexpected response format from Claude")
-            response_text = response.content[0].text
-            logger.debug(
-                f"Successfully received response from Claude "
-                f"(length: {len(response_text)})"
+        except CircuitOpenError as e:
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            logger.error("Failed to get response from Claude: %s", e)
+            raise APIError(f"Failed to get response from Claude: {str(e)}") from e
+        finally:
+            _record_metrics(call_site, started, response, len(retries), error)
+
+    async def send_message_async(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system: Optional[str] = None,
+        call_site: str = "other",
+    ) -> str:
+        """Send a message to Claude without blocking the event loop.
+
+        The request runs in a worker thread, and rate limit and retry waits
+        use ``CallGuard.call_async``. See send_message for the arguments.
+
+        Returns:
+            str: Claude's response text.
+
+        Raises:
+            APIError: If the API call fails.
+        """
+        started = time.perf_counter()
+        retries: List[Exception] = []
+        response = None
+        error: Optional[Exception] = None
+        try:
+            params = self._message_params(prompt, max_tokens, temperature, system)
+            response = await self._guard.call_async(
+                lambda: asyncio.to_thread(self.client.messages.create, **params),
+                tokens=estimate_request_tokens(prompt, max_tokens),
+                used_tokens=_tokens_used,
+                on_retry=retries.append,
             )
-            logger.debug(f"Response Text: {response_text}")
-            return response_text
+            return self._response_text(response)
 
+        except CircuitOpenError as e:
+            error = e
+            raise
         except Exception as e:
-            logger.error(f"Failed to get response from Claude: {e}")
+            error = e
+            logger.error("Failed to get response from Claude: %s", e)
             raise APIError(f"Failed to get response from Claude: {str(e)}") from e
+        finally:
+            _record_metrics(call_site, started, response, len(retries), error)
+
+    @staticmethod
+    def _message_params(
+        prompt: str, max_tokens: int, temperature: float, system: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the arguments of a messages.create request."""
+        logger.debug("Sending message to Claude with %s max tokens", max_tokens)
+        logger.debug("Sending message to Claude with prompt length: %s", len(prompt))
+        logger.debug("Prompt: %s", prompt)
+        return {
+            "model": DEFAULT_MODEL,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system if system is not None else NOT_GIVEN,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Extract the text from the first content block of a response."""
+        if not response.content or not hasattr(response.content[0], "text"):
+            raise APIError("Unexpected response format from Claude")
+        response_text = response.content[0].text
+        logger.debug(
+            "Successfully received response from Claude (length: %s)",
+            len(response_text),
+        )
+        logger.debug("Response Text: %s", response_text)
+        return response_text
+
+    def send_batch(
+        self,
+        prompts: Dict[str, str],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        timeout: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        call_site: str = "other",
+    ) -> BatchResults:
+        """Send several messages as one batch job and wait for the results.
+
+        Uses the Message Batches API, which processes requests
+        asynchronously at a lower price than individual messages.
+
+        Args:
+            prompts: Prompt by request ID. IDs may only contain letters,
+                digits, "-" and "_", up to 64 characters.
+            max_tokens: Maximum number of tokens in each response.
+            temperature: Controls randomness in the responses (0.0 to 1.0).
+            poll_interval: Seconds between checks on the batch.
+            timeout: Seconds to wait before giving up (None waits until the
+                batch ends).
+            sleep: Function used to wait between checks.
+            call_site: What the batch is for, recorded with the metrics of
+                each request.
+
+        Returns:
+            BatchResults with the text or error of each request.
+
+        Raises:
+            APIError: If the batch can't be created or checked, or the
+                timeout passes.
+        """
+        requests = [
+            {
+                "custom_id": request_id,
+                "params": {
+                    "model": DEFAULT_MODEL,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for request_id, prompt in prompts.items()
+        ]
+        started = time.perf_counter()
+        try:
+            batch = self._guard.call(
+                lambda: self.client.messages.batches.create(requests=requests)
+            )
+            logger.info(
+                "Submitted message batch %s with %s requests", batch.id, len(requests)
+            )
+            submitted = time.monotonic()
+            while batch.processing_status != "ended":
+                if timeout is not None and time.monotonic() - submitted > timeout:
+                    raise APIError(
+                        f"Message batch {batch.id} did not finish within "
+                        f"{timeout:.0f}s"
+                    )
+                sleep(poll_interval)
+                batch = self._guard.call(
+                    lambda: self.client.messages.batches.retrieve(batch.id)
+                )
+                logger.debug(
+                    "Message batch %s is %s", batch.id, batch.processing_status
+                )
+
+            results = BatchResults(batch_id=batch.id)
+            for entry in self._guard.call(
+                lambda: self.client.messages.batches.results(batch.id)
+            ):
+                result = entry.result
+                if result.type == "succeeded" and result.message.content:
+                    results.texts[entry.custom_id] = result.message.content[0].text
+                    _record_metrics(call_site, started, result.message, batch=True)
+                    continue
+                if result.type == "errored":
+                    # An error response wrapping the error itself
+                    error = getattr(result.error, "error", result.error)
+                    results.errors[entry.custom_id] = str(
+                        getattr(error, "message", error)
+                    )
+                else:
+                    results.errors[entry.custom_id] = f"Request {result.type}"
+                _record_metrics(
+                    call_site,
+                    started,
+                    error=APIError(results.errors[entry.custom_id]),
+                    batch=True,
+                )
+            for request_id in prompts.keys() - results.texts.keys():
+                results.errors.setdefault(request_id, "No result returned")
+            logger.info(
+                "Message batch %s ended: %s succeeded, %s failed",
+                batch.id,
+                len(results.texts),
+                len(results.errors),
+            )
+            return results
+        except APIError:
+            raise
+        except Exception as e:
+            logger.error("Failed to process message batch: %s", e)
+            raise APIError(f"Failed to process message batch: {str(e)}") from e
+
+    def count_tokens(self, prompt: str, system: Optional[str] = None) -> int:
+        """Count the input tokens of a message exactly, without sending it.
+
+        Uses the API's token counting endpoint, which is free but still a
+        network round trip; prefer a local estimate where precision doesn't
+        matter.
+
+        Args:
+            prompt: The message to measure.
+            system: Optional system message sent with it.
+
+        Returns:
+            int: Number of input tokens.
+
+        Raises:
+            APIError: If the API call fails.
+        """
+        try:
+            response = self._guard.call(
+                lambda: self.client.messages.count_tokens(
+                    **self._count_params(prompt, system)
+                )
+            )
+            logger.debug(
+                "Prompt of length %s is %s tokens", len(prompt), response.input_tokens
+            )
+            return response.input_tokens
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logger.error("Failed to count tokens: %s", e)
+            raise APIError(f"Failed to count tokens: {str(e)}") from e
+
+    async def count_tokens_async(
+        self, prompt: str, system: Optional[str] = None
+    ) -> int:
+        """Count the input tokens of a message without blocking the event loop.
+
+        See count_tokens.
+
+        Raises:
+            APIError: If the API call fails.
+        """
+        try:
+            response = await self._guard.call_async(
+                lambda: asyncio.to_thread(
+                    self.client.messages.count_tokens,
+                    **self._count_params(prompt, system),
+                )
+            )
+            return response.input_tokens
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logger.error("Failed to count tokens: %s", e)
+            raise APIError(f"Failed to count tokens: {str(e)}") from e
+
+    @staticmethod
+    def _count_params(prompt: str, system: Optional[str]) -> Dict[str, Any]:
+        """Build the arguments of a messages.count_tokens request."""
+        return {
+            "model": DEFAULT_MODEL,
+            "system": system if system is not None else NOT_GIVEN,
+            "messages": [{"role": "user", "content": prompt}],
+        }
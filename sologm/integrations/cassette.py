@@ -0,0 +1,599 @@
+"""Record and replay Anthropic API exchanges.
+
+``AnthropicClient`` sends requests through a transport: an object with a
+``messages`` attribute offering ``create`` and ``count_tokens``, like the
+Anthropic library client. This module provides two more:
+
+- ``RecordingTransport`` passes requests on to a real client and saves each
+  exchange, with how long it took, to a cassette file.
+- ``ReplayTransport`` answers from a cassette without network access. It can
+  simulate the time to the first token, streaming of the output at a given
+  token rate, and inject failures (rate limits, timeouts and malformed
+  Markdown), so the AI code paths can be tested and benchmarked offline and
+  reproducibly.
+
+Both also offer ``messages.batches``; the replay version serves as a local
+fake of the Message Batches API.
+
+Cassettes are configured with ``ai_cassette`` and ``ai_cassette_mode``
+(``replay`` or ``record``), or passed to ``AnthropicClient(transport=...)``.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from sologm.utils.config import get_config
+from sologm.utils.errors import ConfigError
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+CASSETTE_MODES = ("replay", "record")
+
+# Request parameters that identify an exchange
+_MATCH_PARAMS = ("model", "system", "messages", "max_tokens", "temperature")
+
+# Rough output token estimate for exchanges recorded without usage
+CHARS_PER_TOKEN = 4
+
+
+class CassetteMissError(Exception):
+    """Raised when a replayed request has no recorded response."""
+
+
+class ReplayRateLimitError(Exception):
+    """Simulated HTTP 429 response.
+
+    Attributes:
+        status_code: Always 429
+        retry_after: Seconds the server asked the client to wait
+    """
+
+    status_code = 429
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Simulated rate limit (retry after {retry_after}s)")
+        self.retry_after = retry_after
+
+
+class ReplayTimeoutError(TimeoutError):
+    """Simulated request timeout."""
+
+
+def _jsonable(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the parameters that identify a request, dropping unset ones."""
+    return {
+        key: params[key]
+        for key in _MATCH_PARAMS
+        if key in params and isinstance(params[key], (str, int, float, list, dict))
+    }
+
+
+def request_key(kind: str, params: Dict[str, Any]) -> str:
+    """Get the key a request is matched by.
+
+    Args:
+        kind: "create" or "count_tokens"
+        params: Request parameters as passed to the library client
+
+    Returns:
+        A hash of the kind and the identifying parameters.
+    """
+    payload = json.dumps(
+        {"kind": kind, **_jsonable(params)}, sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """A file of recorded API exchanges.
+
+    Each exchange holds the request, the response text and token usage (or
+    the token count, for ``count_tokens``) and the recorded duration.
+    Identical requests can be recorded more than once and are replayed in
+    the order they were recorded; after the last one, it is repeated.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Load a cassette, or start an empty one if the file doesn't exist.
+
+        Args:
+            path: Path of the cassette file (JSON)
+        """
+        self.path = Path(path)
+        self.interactions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Unsupported cassette version {data.get('version')!r} "
+                    f"in {self.path}"
+                )
+            self.interactions = data.get("interactions", [])
+        self._by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for interaction in self.interactions:
+            self._by_key[interaction["key"]].append(interaction)
+        self._used: Dict[str, int] = defaultdict(int)
+        self._position = 0
+
+    def record(
+        self,
+        kind: str,
+        params: Dict[str, Any],
+        response: Dict[str, Any],
+        duration: float,
+    ) -> None:
+        """Add an exchange and save the cassette.
+
+        Args:
+            kind: "create" or "count_tokens"
+            params: Request parameters
+            response: What to replay: "text", "usage" and "stop_reason", or
+                "input_tokens" for token counts
+            duration: Seconds the request took
+        """
+        key = request_key(kind, params)
+        interaction: Dict[str, Any] = {
+            "key": key,
+            "kind": kind,
+            "request": _jsonable(params),
+            "response": response,
+            "duration": round(duration, 4),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+            self._by_key[key].append(interaction)
+            self.save()
+
+    def save(self) -> None:
+        """Write the cassette file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {"version": CASSETTE_VERSION, "interactions": self.interactions},
+                indent=2,
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+
+    def find(
+        self, kind: str, params: Dict[str, Any], match: str = "request"
+    ) -> Dict[str, Any]:
+        """Get the recorded exchange for a request.
+
+        Args:
+            kind: "create" or "count_tokens"
+            params: Request parameters
+            match: "request" to match on the request parameters, or
+                "sequence" to replay exchanges of the same kind in recorded
+                order whatever was asked
+
+        Returns:
+            The recorded exchange.
+
+        Raises:
+            CassetteMissError: If nothing was recorded for the request
+        """
+        with self._lock:
+            if match == "sequence":
+                candidates = [i for i in self.interactions if i["kind"] == kind]
+                if not candidates:
+                    raise CassetteMissError(f"No {kind} exchanges in {self.path}")
+                interaction = candidates[self._position % len(candidates)]
+                self._position += 1
+                return interaction
+
+            key = request_key(kind, params)
+            recorded = self._by_key.get(key)
+            if not recorded:
+                raise CassetteMissError(
+                    f"No recorded {kind} response for this request in {self.path}"
+                )
+            index = min(self._used[key], len(recorded) - 1)
+            self._used[key] += 1
+            return recorded[index]
+
+
+@dataclass
+class FailureInjection:
+    """Probabilities of simulated failures per replayed request.
+
+    Attributes:
+        rate_limit: Chance of an HTTP 429 (ReplayRateLimitError)
+        timeout: Chance of a timeout (ReplayTimeoutError)
+        malformed: Chance of a response with its Markdown headings removed
+        retry_after: Seconds sent with simulated rate limits
+        seed: Random seed, so a run can be reproduced
+    """
+
+    rate_limit: float = 0.0
+    timeout: float = 0.0
+    malformed: float = 0.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> "FailureInjection":
+        """Parse a spec such as ``"rate_limit=0.1,timeout=0.05,malformed=0.2"``.
+
+        Args:
+            spec: Comma-separated name=value pairs (empty for no failures)
+            seed: Random seed
+
+        Returns:
+            The failure injection settings.
+
+        Raises:
+            ValueError: If the spec names an unknown setting or a bad value
+        """
+        values: Dict[str, float] = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            name, _, value = item.partition("=")
+            name = name.strip()
+            if name not in ("rate_limit", "timeout", "malformed", "retry_after"):
+                raise ValueError(f"Unknown failure type '{name}'")
+            try:
+                values[name] = float(value)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for '{name}': {value!r}") from e
+        return cls(seed=seed, **values)
+
+
+def _malform(text: str) -> str:
+    """Strip Markdown headings, which response parsers rely on."""
+    return re.sub(r"(?m)^#+ ?", "", text)
+
+
+class RecordingTransport:
+    """Transport that calls a real client and records each exchange."""
+
+    def __init__(self, client: Any, cassette: Cassette) -> None:
+        """Initialize the recorder.
+
+        Args:
+            client: Anthropic library client (or another transport)
+            cassette: Cassette to record to
+        """
+        self.client = client
+        self.cassette = cassette
+        self._batches = _RecordingBatches(self)
+
+    @property
+    def messages(self) -> "RecordingTransport":
+        """Mirror the library client's ``client.messages`` namespace."""
+        return self
+
+    def create(self, **params: Any) -> Any:
+        """Send a message and record the exchange."""
+        started = time.perf_counter()
+        response = self.client.messages.create(**params)
+        duration = time.perf_counter() - started
+        usage = getattr(response, "usage", None)
+        self.cassette.record(
+            "create",
+            params,
+            {
+                "text": "".join(
+                    getattr(block, "text", "") for block in response.content
+                ),
+                "stop_reason": getattr(response, "stop_reason", None),
+                "usage": {
+                    "input_tokens": getattr(usage, "input_tokens", None),
+                    "output_tokens": getattr(usage, "output_tokens", None),
+                },
+            },
+            duration,
+        )
+        return response
+
+    @property
+    def batches(self) -> "_RecordingBatches":
+        """Mirror ``client.messages.batches``, recording each succeeded request."""
+        return self._batches
+
+    def count_tokens(self, **params: Any) -> Any:
+        """Count tokens and record the result."""
+        started = time.perf_counter()
+        response = self.client.messages.count_tokens(**params)
+        self.cassette.record(
+            "count_tokens",
+            params,
+            {"input_tokens": response.input_tokens},
+            time.perf_counter() - started,
+        )
+        return response
+
+
+class ReplayTransport:
+    """Transport that answers from a cassette, with simulated timing and faults.
+
+    Replies take ``latency`` seconds to the first token plus the output
+    tokens at ``tokens_per_second``, as a streamed response would. With
+    ``latency=None`` the recorded durations are replayed instead.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: Optional[float] = 0.0,
+        tokens_per_second: float = 0.0,
+        failures: Optional[FailureInjection] = None,
+        match: str = "request",
+        sleep: Callable[[float], None] = time.sleep,
+        batch_polls: int = 1,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            cassette: Cassette to replay
+            latency: Seconds before the first token, or None to replay the
+                recorded duration of each exchange
+            tokens_per_second: Simulated output rate (0 for instant output)
+            failures: Failures to inject, if any
+            match: How requests are matched to exchanges (see Cassette.find)
+            sleep: Function used to wait, replaceable in tests
+            batch_polls: Status checks a message batch stays in progress for
+        """
+        self.cassette = cassette
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.failures = failures or FailureInjection()
+        self.match = match
+        self._sleep = sleep
+        self._random = random.Random(self.failures.seed)
+        self._lock = threading.Lock()
+        self._batches = _ReplayBatches(self, batch_polls)
+
+    @property
+    def messages(self) -> "ReplayTransport":
+        """Mirror the library client's ``client.messages`` namespace."""
+        return self
+
+    @property
+    def batches(self) -> "_ReplayBatches":
+        """Mirror ``client.messages.batches``, answering from the cassette."""
+        return self._batches
+
+    def create(self, **params: Any) -> SimpleNamespace:
+        """Replay a message response.
+
+        Raises:
+            CassetteMissError: If the request wasn't recorded
+            ReplayRateLimitError: When a rate limit is injected
+            ReplayTimeoutError: When a timeout is injected
+        """
+        return self._reply(params, wait=True)
+
+    def _reply(self, params: Dict[str, Any], wait: bool) -> SimpleNamespace:
+        """Build the replayed response, simulating timing only if ``wait``."""
+        interaction = self.cassette.find("create", params, self.match)
+        recorded = interaction["response"]
+        text = recorded["text"]
+        usage = recorded.get("usage") or {}
+        output_tokens = usage.get("output_tokens") or max(
+            1, len(text) // CHARS_PER_TOKEN
+        )
+
+        failure = self._draw_failure()
+        if failure == "rate_limit":
+            raise ReplayRateLimitError(self.failures.retry_after)
+
+        if self.latency is None:
+            # The recorded duration already includes the streamed output
+            first_token, streaming = interaction.get("duration", 0.0), 0.0
+        else:
+            first_token = self.latency
+            streaming = (
+                output_tokens / self.tokens_per_second if self.tokens_per_second else 0
+            )
+        if failure == "timeout":
+            if wait:
+                self._wait(first_token)
+            raise ReplayTimeoutError("Simulated request timeout")
+        if wait:
+            self._wait(first_token + streaming)
+
+        if failure == "malformed":
+            text = _malform(text)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=text)],
+            stop_reason=recorded.get("stop_reason"),
+            usage=SimpleNamespace(
+                input_tokens=usage.get("input_tokens"), output_tokens=output_tokens
+            ),
+            # Simulated streaming, reported for the AI metrics
+            time_to_first_token=first_token if wait else None,
+        )
+
+    def count_tokens(self, **params: Any) -> SimpleNamespace:
+        """Replay a token count.
+
+        Raises:
+            CassetteMissError: If the request wasn't recorded
+        """
+        interaction = self.cassette.find("count_tokens", params, self.match)
+        return SimpleNamespace(input_tokens=interaction["response"]["input_tokens"])
+
+    def _draw_failure(self) -> Optional[str]:
+        """Pick the failure to inject into the next reply, if any."""
+        with self._lock:
+            roll = self._random.random()
+        for name in ("rate_limit", "timeout", "malformed"):
+            chance = getattr(self.failures, name)
+            if roll < chance:
+                return name
+            roll -= chance
+        return None
+
+    def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(seconds)
+
+
+class _RecordingBatches:
+    """Message batch calls passed on to the real client and recorded.
+
+    Each succeeded request is recorded as a single message exchange, so a
+    cassette recorded through a batch can be replayed either way.
+    """
+
+    def __init__(self, transport: RecordingTransport) -> None:
+        self._transport = transport
+        self._params: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def create(self, requests: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        batch = self._transport.client.messages.batches.create(
+            requests=requests, **kwargs
+        )
+        self._params[batch.id] = {
+            request["custom_id"]: request["params"] for request in requests
+        }
+        return batch
+
+    def retrieve(self, batch_id: str, **kwargs: Any) -> Any:
+        return self._transport.client.messages.batches.retrieve(batch_id, **kwargs)
+
+    def results(self, batch_id: str, **kwargs: Any) -> Iterator[Any]:
+        params = self._params.get(batch_id, {})
+        for entry in self._transport.client.messages.batches.results(
+            batch_id, **kwargs
+        ):
+            result = entry.result
+            if result.type == "succeeded" and entry.custom_id in params:
+                usage = getattr(result.message, "usage", None)
+                self._transport.cassette.record(
+                    "create",
+                    params[entry.custom_id],
+                    {
+                        "text": "".join(
+                            getattr(block, "text", "")
+                            for block in result.message.content
+                        ),
+                        "stop_reason": getattr(result.message, "stop_reason", None),
+                        "usage": {
+                            "input_tokens": getattr(usage, "input_tokens", None),
+                            "output_tokens": getattr(usage, "output_tokens", None),
+                        },
+                    },
+                    0.0,
+                )
+            yield entry
+
+
+class _ReplayBatches:
+    """A local stand-in for the Message Batches API.
+
+    Requests are answered from the cassette when the batch is created
+    (failed lookups and injected failures become errored results). The
+    batch reports ``in_progress`` for the configured number of status
+    checks before it ends.
+    """
+
+    def __init__(self, transport: ReplayTransport, polls: int) -> None:
+        self._transport = transport
+        self._polls = polls
+        self._batches: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, requests: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        entries = []
+        for request in requests:
+            try:
+                message = self._transport._reply(request["params"], wait=False)
+                result = SimpleNamespace(type="succeeded", message=message)
+            except Exception as e:
+                result = SimpleNamespace(
+                    type="errored",
+                    error=SimpleNamespace(
+                        type="error",
+                        error=SimpleNamespace(type="api_error", message=str(e)),
+                    ),
+                )
+            entries.append(
+                SimpleNamespace(custom_id=request["custom_id"], result=result)
+            )
+        with self._lock:
+            batch_id = f"msgbatch_replay_{len(self._batches) + 1}"
+            self._batches[batch_id] = {"entries": entries, "polls": 0}
+        return self._status(batch_id)
+
+    def retrieve(self, batch_id: str, **kwargs: Any) -> Any:
+        with self._lock:
+            self._batches[batch_id]["polls"] += 1
+        return self._status(batch_id)
+
+    def results(self, batch_id: str, **kwargs: Any) -> Iterator[Any]:
+        return iter(self._batches[batch_id]["entries"])
+
+    def _status(self, batch_id: str) -> SimpleNamespace:
+        batch = self._batches[batch_id]
+        ended = batch["polls"] >= self._polls
+        return SimpleNamespace(
+            id=batch_id, processing_status="ended" if ended else "in_progress"
+        )
+
+
+def configured_cassette() -> Optional[Dict[str, Any]]:
+    """Get the cassette settings from the configuration, if one is set.
+
+    Returns:
+        Dict with "path" and "mode", or None if no cassette is configured.
+
+    Raises:
+        ConfigError: If ``ai_cassette_mode`` is not "replay" or "record"
+    """
+    config = get_config()
+    path = config.get_str("ai_cassette", "")
+    if not path:
+        return None
+    mode = (config.get_str("ai_cassette_mode", "replay") or "").lower()
+    if mode not in CASSETTE_MODES:
+        raise ConfigError(
+            f"ai_cassette_mode must be 'replay' or 'record', not {mode!r}"
+        )
+    return {"path": Path(path).expanduser(), "mode": mode}
+
+
+def replay_transport_from_config(path: Path) -> ReplayTransport:
+    """Create a replay transport using the ``ai_replay_*`` settings.
+
+    Args:
+        path: Cassette file to replay
+
+    Returns:
+        The configured replay transport.
+
+    Raises:
+        ConfigError: If ``ai_replay_failures`` is invalid
+    """
+    config = get_config()
+    latency_ms = config.get_int("ai_replay_latency_ms", 0)
+    try:
+        failures = FailureInjection.parse(
+            config.get_str("ai_replay_failures", "") or "",
+            seed=config.get_int("ai_replay_seed", 0),
+        )
+    except ValueError as e:
+        raise ConfigError(f"Invalid ai_replay_failures: {e}") from e
+    transport = ReplayTransport(
+        Cassette(path),
+        latency=None if latency_ms < 0 else latency_ms / 1000,
+        tokens_per_second=config.get_int("ai_replay_tokens_per_second", 0),
+        failures=failures,
+        match=config.get_str("ai_replay_match", "request") or "request",
+    )
+    logger.info("Replaying AI responses from %s", path)
+    return transport
@@ -0,0 +1,278 @@
+"""Token usage and latency metrics for AI requests.
+
+Every request sent through AnthropicClient appends one JSON line to the
+``ai_metrics_file`` (unless ``ai_metrics`` is off), tagged with the call
+site that made it, such as ``oracle.interpret`` or ``act.summary``. Lines
+record the tokens used (including prompt cache reads and writes), the
+latency, the retries needed and any error. Callers that can't parse a
+response add a ``parse_failure`` line for their call site.
+
+``sologm stats ai`` reads the file back and summarizes it per call site with
+latency percentiles and cost estimates, using summarize().
+
+Responses aren't streamed yet, so time to first token is only recorded when
+a transport reports it.
+"""
+
+import json
+import logging
+import math
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sologm.utils.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Dollars per million tokens: input, output, cache write, cache read.
+# Matched by model name prefix, longest first.
+MODEL_PRICES: Dict[str, Tuple[float, float, float, float]] = {
+    "claude-3-5-haiku": (0.80, 4.00, 1.00, 0.08),
+    "claude-3-5-sonnet": (3.00, 15.00, 3.75, 0.30),
+    "claude-3-7-sonnet": (3.00, 15.00, 3.75, 0.30),
+    "claude-sonnet-4": (3.00, 15.00, 3.75, 0.30),
+    "claude-opus-4": (15.00, 75.00, 18.75, 1.50),
+}
+
+# Message batches are billed at half price
+BATCH_DISCOUNT = 0.5
+
+_write_lock = threading.Lock()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class CallMetrics:
+    """One line of the metrics file.
+
+    Attributes:
+        call_site: What made the request, e.g. "oracle.interpret"
+        model: Model the request was sent to
+        kind: "request", or "parse_failure" when the response was unusable
+        input_tokens: Uncached input tokens
+        output_tokens: Output tokens
+        cache_creation_tokens: Input tokens written to the prompt cache
+        cache_read_tokens: Input tokens read from the prompt cache
+        latency_ms: Time from the first attempt to the response, including
+            retries and rate limit waits
+        time_to_first_token_ms: Time to the first streamed token, if known
+        retries: Attempts retried before the final one
+        batch: Whether the request was part of a message batch
+        error: Error message if the request failed
+        timestamp: When the line was written (UTC, ISO 8601)
+    """
+
+    call_site: str
+    model: str = ""
+    kind: str = "request"
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+    latency_ms: float = 0.0
+    time_to_first_token_ms: Optional[float] = None
+    retries: int = 0
+    batch: bool = False
+    error: Optional[str] = None
+    timestamp: str = field(default_factory=_now)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CallMetrics":
+        """Build metrics from a parsed line, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def cost(self) -> float:
+        """Estimate the cost of the request in dollars (0 for unknown models)."""
+        prices = model_prices(self.model)
+        if prices is None:
+            return 0.0
+        input_price, output_price, write_price, read_price = prices
+        cost = (
+            self.input_tokens * input_price
+            + self.output_tokens * output_price
+            + self.cache_creation_tokens * write_price
+            + self.cache_read_tokens * read_price
+        ) / 1_000_000
+        return cost * BATCH_DISCOUNT if self.batch else cost
+
+
+def model_prices(model: str) -> Optional[Tuple[float, float, float, float]]:
+    """Get the per-million-token prices of a model, if known."""
+    for prefix in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_PRICES[prefix]
+    return None
+
+
+def usage_tokens(response: Any) -> Dict[str, int]:
+    """Read the token counts from a response's ``usage``, if reported."""
+    usage = getattr(response, "usage", None)
+
+    def _count(name: str) -> int:
+        value = getattr(usage, name, None)
+        return value if isinstance(value, int) else 0
+
+    return {
+        "input_tokens": _count("input_tokens"),
+        "output_tokens": _count("output_tokens"),
+        "cache_creation_tokens": _count("cache_creation_input_tokens"),
+        "cache_read_tokens": _count("cache_read_input_tokens"),
+    }
+
+
+class MetricsLog:
+    """An append-only JSON lines file of request metrics."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the log.
+
+        Args:
+            path: File to append to and read from
+        """
+        self.path = Path(path)
+
+    def append(self, metrics: CallMetrics) -> None:
+        """Add a line for one request."""
+        line = json.dumps(asdict(metrics), separators=(",", ":"))
+        with _write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def read(self) -> Iterator[CallMetrics]:
+        """Read every line back, skipping any that can't be parsed."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield CallMetrics.from_dict(json.loads(line))
+                except (ValueError, TypeError) as e:
+                    logger.warning(
+                        "Skipping bad line %s of %s: %s", number, self.path, e
+                    )
+
+
+def configured_log() -> Optional[MetricsLog]:
+    """Get the configured metrics log, or None if metrics are off."""
+    config = get_config()
+    path = config.get_str("ai_metrics_file", "")
+    if not config.get_bool("ai_metrics", True) or not path:
+        return None
+    return MetricsLog(Path(path).expanduser())
+
+
+def record(metrics: CallMetrics) -> None:
+    """Append metrics to the configured log.
+
+    Metrics must never break a request, so write errors are only logged.
+    """
+    log = configured_log()
+    if log is None:
+        return
+    try:
+        log.append(metrics)
+    except OSError as e:
+        logger.warning("Could not write AI metrics to %s: %s", log.path, e)
+
+
+def record_parse_failure(call_site: str, model: str = "") -> None:
+    """Note that a response from ``call_site`` couldn't be parsed."""
+    record(CallMetrics(call_site=call_site, model=model, kind="parse_failure"))
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Get a percentile of some values by linear interpolation.
+
+    Args:
+        values: Values in any order
+        pct: Percentile from 0 to 100
+
+    Returns:
+        The percentile, or None if there are no values.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class CallSiteStats:
+    """Totals and latency percentiles for one call site."""
+
+    call_site: str
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    parse_failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    cost: float = 0.0
+    latency_p50_ms: Optional[float] = None
+    latency_p90_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    ttft_p50_ms: Optional[float] = None
+
+
+def summarize(
+    records: Iterable[CallMetrics], since: Optional[datetime] = None
+) -> List[CallSiteStats]:
+    """Summarize metrics per call site.
+
+    Args:
+        records: Metrics lines
+        since: Only include lines written at or after this time
+
+    Returns:
+        Stats per call site, most expensive first.
+    """
+    stats: Dict[str, CallSiteStats] = {}
+    latencies: Dict[str, List[float]] = {}
+    first_tokens: Dict[str, List[float]] = {}
+    for metrics in records:
+        if since is not None:
+            try:
+                if datetime.fromisoformat(metrics.timestamp) < since:
+                    continue
+            except ValueError:
+                continue
+        site = stats.setdefault(metrics.call_site, CallSiteStats(metrics.call_site))
+        if metrics.kind == "parse_failure":
+            site.parse_failures += 1
+            continue
+        site.requests += 1
+        site.retries += metrics.retries
+        if metrics.error:
+            site.errors += 1
+        site.input_tokens += metrics.input_tokens
+        site.output_tokens += metrics.output_tokens
+        site.cached_tokens += metrics.cache_read_tokens
+        site.cost += metrics.cost()
+        if not metrics.error:
+            latencies.setdefault(metrics.call_site, []).append(metrics.latency_ms)
+        if metrics.time_to_first_token_ms is not None:
+            first_tokens.setdefault(metrics.call_site, []).append(
+                metrics.time_to_first_token_ms
+            )
+
+    for name, site in stats.items():
+        values = latencies.get(name, [])
+        site.latency_p50_ms = percentile(values, 50)
+        site.latency_p90_ms = percentile(values, 90)
+        site.latency_p99_ms = percentile(values, 99)
+        site.ttft_p50_ms = percentile(first_tokens.get(name, []), 50)
+    return sorted(stats.values(), key=lambda s: (-s.cost, s.call_site))
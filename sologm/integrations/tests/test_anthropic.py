@@ -1,5 +1,6 @@
 """Tests for Anthropic API client."""
 
+import asyncio
 import logging  # Make sure logger is available if not already imported/configured
 from unittest.mock import MagicMock, patch
 
@@ -36,7 +37,7 @@ def test_init_with_api_key(mock_anthropic):
     """Test initializing client with explicit API key."""
     mock_class, mock_instance = mock_anthropic
     AnthropicClient(api_key="test_key")
-    mock_class.assert_called_once_with(api_key="test_key")
+    mock_class.assert_called_once_with(api_key="test_key", max_retries=0)
 
 
 def test_init_with_env_var(mock_anthropic, monkeypatch):
@@ -44,7 +45,7 @@ def test_init_with_env_var(mock_anthropic, monkeypatch):
     mock_class, mock_instance = mock_anthropic
     monkeypatch.setenv("ANTHROPIC_API_KEY", "env_test_key")
     AnthropicClient()
-    mock_class.assert_called_once_with(api_key="env_test_key")
+    mock_class.assert_called_once_with(api_key="env_test_key", max_retries=0)
 
 
 # Use the new fixture name and apply patch within the test
@@ -147,6 +148,34 @@ def test_send_message_with_options(mock_anthropic, mock_response):
     )
 
 
+def test_send_message_async(mock_anthropic, mock_response):
+    """Test the async variant sends the same request off the event loop."""
+    mock_class, mock_instance = mock_anthropic
+    mock_instance.messages.create.return_value = mock_response
+    mock_instance.messages.count_tokens.return_value = MagicMock(input_tokens=42)
+
+    client = AnthropicClient(api_key="test_key")
+
+    async def main() -> tuple:
+        return (
+            await client.send_message_async("Test prompt", system="System"),
+            await client.count_tokens_async("Test prompt"),
+        )
+
+    assert asyncio.run(main()) == ("Test response from Claude", 42)
+    mock_instance.messages.create.assert_called_once_with(
+        model="claude-3-5-sonnet-latest",
+        max_tokens=1000,
+        temperature=0.7,
+        system="System",
+        messages=[{"role": "user", "content": "Test prompt"}],
+    )
+
+    mock_instance.messages.create.side_effect = Exception("API Error")
+    with pytest.raises(APIError, match="Failed to get response from Claude"):
+        asyncio.run(client.send_message_async("Test prompt"))
+
+
 def test_send_message_api_error(mock_anthropic):
     """Test handling API errors when sending messages."""
     mock_class, mock_instance = mock_anthropic
@@ -192,3 +221,29 @@ def test_send_message_invalid_response_format_no_text(mock_anthropic):
     with pytest.raises(APIError) as exc:
         client.send_message("Test prompt")
     assert "Unexpected response format from Claude" in str(exc.value)
+
+
+def test_count_tokens(mock_anthropic):
+    """Test counting a prompt's tokens through the API."""
+    mock_class, mock_instance = mock_anthropic
+    mock_instance.messages.count_tokens.return_value = MagicMock(input_tokens=42)
+
+    client = AnthropicClient(api_key="test_key")
+
+    assert client.count_tokens("Test prompt") == 42
+    mock_instance.messages.count_tokens.assert_called_once_with(
+        model="claude-3-5-sonnet-latest",
+        system=NOT_GIVEN,
+        messages=[{"role": "user", "content": "Test prompt"}],
+    )
+
+
+def test_count_tokens_api_error(mock_anthropic):
+    """Test token counting failures are raised as APIError."""
+    mock_class, mock_instance = mock_anthropic
+    mock_instance.messages.count_tokens.side_effect = Exception("API Error")
+
+    client = AnthropicClient(api_key="test_key")
+    with pytest.raises(APIError) as exc:
+        client.count_tokens("Test prompt")
+    assert "Failed to count tokens" in str(exc.value)
@@ -0,0 +1,246 @@
+"""Tests for recording and replaying Anthropic API exchanges."""
+
+import json
+from pathlib import Path
+from typing import Callable, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from sologm.core.factory import create_all_managers
+from sologm.database.session import SessionContext
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.cassette import (
+    Cassette,
+    CassetteMissError,
+    FailureInjection,
+    RecordingTransport,
+    ReplayRateLimitError,
+    ReplayTimeoutError,
+    ReplayTransport,
+)
+from sologm.integrations.throttle import CallGuard, RetryPolicy
+from sologm.utils.errors import APIError, OracleError
+
+INTERPRETATIONS = """## The Hidden Stair
+A draft from under the altar reveals a stair going down.
+
+## The Watcher
+Someone has been following the party since the village."""
+
+
+def _library_client(text: str = INTERPRETATIONS) -> MagicMock:
+    """Fake Anthropic library client returning a fixed response."""
+    client = MagicMock()
+    client.messages.create.return_value = MagicMock(
+        content=[MagicMock(text=text)],
+        stop_reason="end_turn",
+        usage=MagicMock(input_tokens=120, output_tokens=40),
+    )
+    client.messages.count_tokens.return_value = MagicMock(input_tokens=120)
+    return client
+
+
+def _record(path: Path, prompts: List[str]) -> None:
+    """Record one exchange per prompt to a cassette."""
+    client = AnthropicClient(
+        transport=RecordingTransport(_library_client(), Cassette(path))
+    )
+    for prompt in prompts:
+        client.send_message(prompt)
+        client.count_tokens(prompt)
+
+
+def test_record_then_replay(tmp_path: Path) -> None:
+    """Test recorded exchanges are replayed without the real client."""
+    path = tmp_path / "cassette.json"
+    _record(path, ["First prompt", "Second prompt"])
+
+    data = json.loads(path.read_text())
+    assert [i["kind"] for i in data["interactions"]] == [
+        "create",
+        "count_tokens",
+        "create",
+        "count_tokens",
+    ]
+    assert data["interactions"][0]["response"]["usage"]["output_tokens"] == 40
+
+    client = AnthropicClient(transport=ReplayTransport(Cassette(path)))
+    assert client.send_message("Second prompt") == INTERPRETATIONS
+    assert client.count_tokens("First prompt") == 120
+    with pytest.raises(APIError) as exc:
+        client.send_message("Never recorded")
+    assert isinstance(exc.value.__cause__, CassetteMissError)
+
+
+def test_replay_simulates_latency_and_streaming(tmp_path: Path) -> None:
+    """Test replies wait for the first token plus the output at the token rate."""
+    path = tmp_path / "cassette.json"
+    _record(path, ["Prompt"])
+    waits: List[float] = []
+
+    client = AnthropicClient(
+        transport=ReplayTransport(
+            Cassette(path), latency=0.5, tokens_per_second=20, sleep=waits.append
+        )
+    )
+    client.send_message("Prompt")
+
+    # 40 output tokens at 20 tokens per second after 0.5s to the first token
+    assert waits == [pytest.approx(2.5)]
+
+
+def test_replay_injects_failures(tmp_path: Path) -> None:
+    """Test rate limits, timeouts and malformed responses can be injected."""
+    path = tmp_path / "cassette.json"
+    _record(path, ["Prompt"])
+
+    def replay(**failures: float) -> AnthropicClient:
+        transport = ReplayTransport(
+            Cassette(path), failures=FailureInjection(retry_after=3, **failures)
+        )
+        no_retries = CallGuard(retry=RetryPolicy(max_retries=0))
+        return AnthropicClient(transport=transport, call_guard=no_retries)
+
+    with pytest.raises(APIError) as exc:
+        replay(rate_limit=1).send_message("Prompt")
+    assert isinstance(exc.value.__cause__, ReplayRateLimitError)
+    assert exc.value.__cause__.status_code == 429
+    assert exc.value.__cause__.retry_after == 3
+
+    with pytest.raises(APIError) as exc:
+        replay(timeout=1).send_message("Prompt")
+    assert isinstance(exc.value.__cause__, ReplayTimeoutError)
+
+    malformed = replay(malformed=1).send_message("Prompt")
+    assert "##" not in malformed
+    assert "The Hidden Stair" in malformed
+
+
+def test_batch_record_then_replay(tmp_path: Path) -> None:
+    """Test batch results are recorded and served by the local batch fake."""
+    path = tmp_path / "cassette.json"
+    library_client = _library_client()
+    library_client.messages.batches.create.return_value = MagicMock(
+        id="msgbatch_1", processing_status="in_progress"
+    )
+    library_client.messages.batches.retrieve.return_value = MagicMock(
+        id="msgbatch_1", processing_status="ended"
+    )
+    library_client.messages.batches.results.return_value = iter(
+        [
+            MagicMock(
+                custom_id="first",
+                result=library_client.messages.create.return_value,
+                **{"result.type": "succeeded"},
+            ),
+            MagicMock(
+                custom_id="second",
+                **{
+                    "result.type": "errored",
+                    "result.error.error.message": "Overloaded",
+                },
+            ),
+        ]
+    )
+    library_client.messages.create.return_value.message = (
+        library_client.messages.create.return_value
+    )
+    prompts = {"first": "First prompt", "second": "Second prompt"}
+    waits: List[float] = []
+
+    recorder = AnthropicClient(
+        transport=RecordingTransport(library_client, Cassette(path))
+    )
+    results = recorder.send_batch(prompts, poll_interval=5, sleep=waits.append)
+    assert results.texts == {"first": INTERPRETATIONS}
+    assert results.errors == {"second": "Overloaded"}
+    assert waits == [5]
+
+    replayer = AnthropicClient(transport=ReplayTransport(Cassette(path), batch_polls=3))
+    results = replayer.send_batch(prompts, poll_interval=5, sleep=waits.append)
+    assert results.batch_id == "msgbatch_replay_1"
+    assert results.texts == {"first": INTERPRETATIONS}
+    assert list(results.errors) == ["second"]
+    assert waits == [5] * 4
+
+    with pytest.raises(APIError):
+        replayer.send_batch(prompts, poll_interval=5, timeout=0, sleep=waits.append)
+
+
+def test_failure_injection_is_reproducible() -> None:
+    """Test a seeded failure spec gives the same failures on every run."""
+    failures = FailureInjection.parse("rate_limit=0.3, malformed=0.3", seed=7)
+    assert failures.rate_limit == 0.3
+    assert failures.timeout == 0.0
+
+    def draws() -> List[str]:
+        transport = ReplayTransport(MagicMock(), failures=failures)
+        return [transport._draw_failure() for _ in range(20)]
+
+    assert draws() == draws()
+    assert {"rate_limit", "malformed", None} == set(draws())
+
+    with pytest.raises(ValueError):
+        FailureInjection.parse("explode=1")
+
+
+def test_cassette_from_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a configured cassette is replayed without an API key."""
+    path = tmp_path / "cassette.json"
+    _record(path, ["Prompt"])
+    monkeypatch.setenv("SOLOGM_AI_CASSETTE", str(path))
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.delenv("SOLOGM_ANTHROPIC_API_KEY", raising=False)
+
+    client = AnthropicClient()
+
+    assert isinstance(client.client, ReplayTransport)
+    assert client.send_message("Prompt") == INTERPRETATIONS
+
+
+def test_oracle_pipeline_offline(
+    tmp_path: Path,
+    session_context: SessionContext,
+    create_test_game: Callable,
+    create_test_act: Callable,
+    create_test_scene: Callable,
+) -> None:
+    """Test interpretations run end to end from a recorded exchange."""
+    path = tmp_path / "oracle.json"
+    library_client = _library_client()
+
+    with session_context as session:
+        game = create_test_game(session)
+        act = create_test_act(session, game_id=game.id)
+        scene = create_test_scene(session, act_id=act.id)
+
+        recorder = AnthropicClient(
+            transport=RecordingTransport(library_client, Cassette(path))
+        )
+        managers = create_all_managers(session, recorder)
+        managers.oracle.get_interpretations(scene.id, "What is below?", "Stair", 2)
+        library_client.messages.create.assert_called_once()
+
+        replayer = AnthropicClient(transport=ReplayTransport(Cassette(path)))
+        managers = create_all_managers(session, replayer)
+        interpretation_set = managers.oracle.get_interpretations(
+            scene.id, "What is below?", "Stair", 2
+        )
+        assert [i.title for i in interpretation_set.interpretations] == [
+            "The Hidden Stair",
+            "The Watcher",
+        ]
+
+        broken = AnthropicClient(
+            transport=ReplayTransport(
+                Cassette(path),
+                failures=FailureInjection(malformed=1),
+                match="sequence",
+            )
+        )
+        managers = create_all_managers(session, broken)
+        with pytest.raises(OracleError):
+            managers.oracle.get_interpretations(
+                scene.id, "What is below?", "Stair", 2, max_retries=1
+            )
@@ -0,0 +1,136 @@
+"""Tests for AI request metrics."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.metrics import (
+    CallMetrics,
+    MetricsLog,
+    configured_log,
+    percentile,
+    record_parse_failure,
+    summarize,
+)
+from sologm.integrations.throttle import CallGuard, RetryPolicy
+from sologm.utils.errors import APIError
+
+
+class Overloaded(Exception):
+    """A transient API error."""
+
+    status_code = 529
+
+
+def _response(text: str = "Reply") -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(
+            input_tokens=100,
+            output_tokens=20,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=400,
+        ),
+    )
+
+
+def _client(transport: MagicMock) -> AnthropicClient:
+    guard = CallGuard(retry=RetryPolicy(max_retries=2), sleep=lambda _: None)
+    return AnthropicClient(transport=transport, call_guard=guard)
+
+
+def test_send_message_records_metrics(ai_metrics_file: Path) -> None:
+    """Test each request is logged with its call site, tokens and retries."""
+    transport = MagicMock()
+    transport.messages.create.side_effect = [Overloaded(), _response()]
+    client = _client(transport)
+
+    assert client.send_message("Prompt", call_site="oracle.interpret") == "Reply"
+    transport.messages.create.side_effect = ValueError("bad request")
+    with pytest.raises(APIError):
+        client.send_message("Prompt", call_site="act.summary")
+    record_parse_failure("oracle.interpret")
+
+    lines = [json.loads(line) for line in ai_metrics_file.read_text().splitlines()]
+    assert [(line["call_site"], line["kind"]) for line in lines] == [
+        ("oracle.interpret", "request"),
+        ("act.summary", "request"),
+        ("oracle.interpret", "parse_failure"),
+    ]
+    assert lines[0]["retries"] == 1
+    assert lines[0]["input_tokens"] == 100
+    assert lines[0]["cache_read_tokens"] == 400
+    assert lines[0]["error"] is None
+    assert lines[0]["latency_ms"] >= 0
+    assert lines[1]["error"] == "bad request"
+
+
+def test_metrics_can_be_turned_off(
+    ai_metrics_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test nothing is written when metrics are off."""
+    monkeypatch.setenv("SOLOGM_AI_METRICS", "false")
+    transport = MagicMock()
+    transport.messages.create.return_value = _response()
+
+    _client(transport).send_message("Prompt")
+
+    assert configured_log() is None
+    assert not ai_metrics_file.exists()
+
+
+def test_percentile() -> None:
+    """Test percentiles interpolate between the nearest values."""
+    assert percentile([], 50) is None
+    assert percentile([5.0], 99) == 5.0
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.5
+    assert percentile(list(range(1, 101)), 90) == pytest.approx(90.1)
+
+
+def test_summarize_per_call_site(tmp_path: Path) -> None:
+    """Test totals, percentiles and costs are computed per call site."""
+    log = MetricsLog(tmp_path / "metrics.jsonl")
+    old = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+    for latency in (100, 200, 300):
+        log.append(
+            CallMetrics(
+                call_site="oracle.interpret",
+                model="claude-3-5-sonnet-latest",
+                input_tokens=1_000_000,
+                output_tokens=100_000,
+                latency_ms=latency,
+            )
+        )
+    log.append(
+        CallMetrics(
+            call_site="act.summary",
+            model="claude-3-5-sonnet-latest",
+            input_tokens=1_000_000,
+            batch=True,
+        )
+    )
+    log.append(CallMetrics(call_site="oracle.interpret", error="timeout", retries=3))
+    log.append(CallMetrics(call_site="oracle.interpret", kind="parse_failure"))
+    log.append(CallMetrics(call_site="act.narrative", timestamp=old))
+    with log.path.open("a") as f:
+        f.write("not json\n")
+
+    stats = summarize(log.read(), since=datetime.now(timezone.utc) - timedelta(1))
+
+    assert [s.call_site for s in stats] == ["oracle.interpret", "act.summary"]
+    oracle, summary = stats
+    assert oracle.requests == 4
+    assert oracle.errors == 1
+    assert oracle.retries == 3
+    assert oracle.parse_failures == 1
+    assert oracle.latency_p50_ms == 200
+    assert oracle.latency_p90_ms == pytest.approx(280)
+    # 3 x ($3 input + $1.50 output)
+    assert oracle.cost == pytest.approx(13.5)
+    # Half price for batches
+    assert summary.cost == pytest.approx(1.5)
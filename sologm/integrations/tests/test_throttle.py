@@ -0,0 +1,276 @@
+"""Tests for AI call rate limiting, retries and circuit breaking."""
+
+import asyncio
+import random
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.cassette import Cassette, FailureInjection, ReplayTransport
+from sologm.integrations.throttle import (
+    CallGuard,
+    CircuitBreaker,
+    RateLimiter,
+    RetryPolicy,
+    get_call_guard,
+    is_outage,
+    is_retryable,
+    retry_after,
+)
+from sologm.utils.errors import APIError, CircuitOpenError
+
+
+class FakeClock:
+    """Manual clock; sleeping advances it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StatusError(Exception):
+    """API error with an HTTP status and optional headers."""
+
+    def __init__(self, status: int, headers: dict = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _guard(clock: FakeClock, **kwargs) -> CallGuard:
+    return CallGuard(
+        limiter=kwargs.pop("limiter", RateLimiter(clock=clock, sleep=clock.sleep)),
+        retry=kwargs.pop("retry", RetryPolicy(max_retries=3, rng=random.Random(1))),
+        breaker=kwargs.pop("breaker", CircuitBreaker(clock=clock)),
+        sleep=clock.sleep,
+    )
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    """Test requests beyond the per-minute burst wait for the bucket to refill."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep)
+
+    waits = [limiter.acquire() for _ in range(62)]
+
+    assert waits[:60] == [0.0] * 60
+    assert waits[60:] == [pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_rate_limiter_tokens_and_refund() -> None:
+    """Test the token bucket limits by size and takes back unused tokens."""
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=6000, clock=clock, sleep=clock.sleep)
+
+    assert limiter.reserve(6000) == 0
+    assert limiter.reserve(600) == pytest.approx(6.0)
+    limiter.refund(600)
+    assert limiter.reserve(100) == pytest.approx(1.0)
+
+
+def test_rate_limiter_async() -> None:
+    """Test asyncio callers share the same buckets."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=600, clock=clock)
+
+    async def burst() -> List[float]:
+        return [await limiter.acquire_async() for _ in range(601)]
+
+    waits = asyncio.run(burst())
+    assert waits[-1] == pytest.approx(0.1)
+
+
+def test_retries_transient_errors_with_backoff() -> None:
+    """Test overload errors are retried with growing jittered delays."""
+    clock = FakeClock()
+    calls = iter([StatusError(529), StatusError(500), "ok"])
+
+    def call() -> str:
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert _guard(clock).call(call) == "ok"
+    assert len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= 0.5
+    assert 0 <= clock.sleeps[1] <= 1.0
+
+
+def test_retry_after_pauses_every_caller() -> None:
+    """Test a rate limit waits as asked and holds back other requests."""
+    clock = FakeClock()
+    guard = _guard(clock)
+    calls = iter([StatusError(429, {"retry-after": "7"}), "ok"])
+
+    def call() -> str:
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert guard.call(call) == "ok"
+    assert clock.sleeps == [7.0]
+
+    clock.now -= 3
+    assert guard.limiter.reserve() == pytest.approx(3.0)
+
+
+def test_retry_after_is_capped() -> None:
+    """Test a server-requested delay never exceeds the maximum delay."""
+    policy = RetryPolicy(max_delay=10.0)
+    assert policy.delay(1, retry_after=3600) == 10.0
+    assert policy.delay(1, retry_after=2) == 2.0
+
+
+def test_rate_limits_do_not_trip_the_breaker() -> None:
+    """Test exhausted rate limit retries leave the circuit closed."""
+    clock = FakeClock()
+    guard = _guard(clock, breaker=CircuitBreaker(failure_threshold=2, clock=clock))
+
+    def call() -> None:
+        raise StatusError(429, {"retry-after": "1"})
+
+    for _ in range(2):
+        with pytest.raises(StatusError):
+            guard.call(call)
+    assert guard.breaker.state == "closed"
+    assert len(clock.sleeps) == 6
+
+
+def test_call_async_does_not_block_the_loop() -> None:
+    """Test async calls wait out retries while other tasks keep running."""
+    guard = CallGuard(retry=RetryPolicy(max_retries=2, base_delay=0.05))
+    calls = iter([StatusError(529), StatusError(503), "ok"])
+    ticks: List[int] = []
+
+    async def call() -> str:
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.005)
+
+    async def main() -> str:
+        task = asyncio.create_task(ticker())
+        try:
+            return await guard.call_async(call)
+        finally:
+            task.cancel()
+
+    # A rate limit pause is waited out on the loop too
+    guard.limiter.pause(0.02)
+    assert asyncio.run(main()) == "ok"
+    assert len(ticks) > 2
+
+
+def test_client_errors_are_not_retried() -> None:
+    """Test a bad request fails at once and doesn't trip the breaker."""
+    clock = FakeClock()
+    guard = _guard(clock, breaker=CircuitBreaker(failure_threshold=1, clock=clock))
+
+    def call() -> None:
+        raise StatusError(400)
+
+    with pytest.raises(StatusError):
+        guard.call(call)
+    assert clock.sleeps == []
+    assert guard.breaker.state == "closed"
+
+
+def test_circuit_breaker_fails_fast_then_recovers() -> None:
+    """Test the breaker opens after repeated failures and closes after a trial."""
+    clock = FakeClock()
+    guard = _guard(
+        clock,
+        retry=RetryPolicy(max_retries=0),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock),
+    )
+    attempts: List[int] = []
+
+    def failing() -> None:
+        attempts.append(1)
+        raise TimeoutError("timed out")
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            guard.call(failing)
+    with pytest.raises(CircuitOpenError) as exc:
+        guard.call(failing)
+    assert len(attempts) == 2
+    assert exc.value.retry_in == pytest.approx(30)
+
+    clock.now += 30
+    assert guard.breaker.state == "half-open"
+    assert guard.call(lambda: "back") == "back"
+    assert guard.breaker.state == "closed"
+
+
+def test_error_classification() -> None:
+    """Test which errors are retried and how retry-after is read."""
+    assert is_retryable(StatusError(429))
+    assert is_retryable(StatusError(529))
+    assert not is_retryable(StatusError(401))
+    assert is_retryable(ConnectionError())
+    assert not is_retryable(ValueError())
+    assert is_outage(StatusError(529))
+    assert is_outage(StatusError(500))
+    assert is_outage(TimeoutError())
+    assert not is_outage(StatusError(429))
+    assert not is_outage(StatusError(400))
+
+    assert retry_after(StatusError(429, {"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(StatusError(429, {"retry-after": "2"})) == 2.0
+    assert retry_after(StatusError(429, {"retry-after": "Wed, 21 Oct"})) is None
+    assert retry_after(ValueError()) is None
+
+
+def test_client_retries_replayed_rate_limits(tmp_path: Path) -> None:
+    """Test AnthropicClient rides out rate limits through its call guard."""
+    cassette = Cassette(tmp_path / "cassette.json")
+    cassette.record("create", {}, {"text": "The door opens"}, 0.1)
+
+    clock = FakeClock()
+    transport = ReplayTransport(
+        cassette,
+        failures=FailureInjection(rate_limit=0.5, retry_after=2, seed=3),
+        match="sequence",
+    )
+    client = AnthropicClient(transport=transport, call_guard=_guard(clock))
+
+    replies = [client.send_message("Prompt") for _ in range(5)]
+
+    assert replies == ["The door opens"] * 5
+    assert clock.sleeps and set(clock.sleeps) == {2.0}
+
+    breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+    breaker.record_failure()
+    client.call_guard = _guard(clock, breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        client.send_message("Prompt")
+
+
+def test_call_guard_is_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test every client uses one guard built from the configuration."""
+    monkeypatch.setenv("SOLOGM_AI_MAX_RETRIES", "7")
+    cassette = Cassette(tmp_path / "empty.json")
+    client = AnthropicClient(transport=ReplayTransport(cassette))
+
+    assert client._guard is get_call_guard()
+    assert get_call_guard().retry.max_retries == 7
+    with pytest.raises(APIError):
+        client.send_message("Not recorded")
@@ -0,0 +1,546 @@
+"""Rate limiting, retries and circuit breaking for AI calls.
+
+Every ``AnthropicClient`` in a process sends its requests through one
+shared ``CallGuard`` (see ``get_call_guard``), which:
+
+- waits for capacity in token buckets for requests per minute and tokens per
+  minute, so bursts (oracle retries, batch summaries) stay under the
+  account's limits instead of failing;
+- retries rate limits (429), overload (529), server errors and timeouts with
+  exponential backoff and full jitter, honoring ``retry-after`` up to the
+  maximum delay. A rate limit also pauses every other caller until the
+  ``retry-after`` time;
+- stops calling for a while after repeated outage errors (a circuit breaker),
+  so commands fail fast during an outage instead of each waiting out its
+  retries. Rate limits don't count: the limiter's pause handles them.
+
+State is protected by a lock, so the guard can be shared by threads. Asyncio
+code uses ``CallGuard.call_async``, which waits without blocking the event
+loop.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from sologm.utils.config import get_config
+from sologm.utils.errors import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeout, conflict, rate limit, server errors
+# and Anthropic's "overloaded"
+RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+# Rough prompt size estimate used for the tokens-per-minute bucket
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at a per-minute rate.
+
+    Reservations may overdraw the bucket; the caller then waits until the
+    debt is repaid, which serves concurrent callers in arrival order. Not
+    thread-safe on its own; RateLimiter holds the lock.
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Refill rate
+            capacity: Largest burst, one minute's worth by default
+            clock: Monotonic clock in seconds
+        """
+        self.rate = per_minute / 60
+        self.capacity = capacity if capacity is not None else per_minute
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket.
+
+        Args:
+            amount: Units to take; capped at the capacity so a single large
+                request can't wait forever
+
+        Returns:
+            Seconds to wait before the reservation is covered.
+        """
+        now = self._clock()
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._level -= min(amount, self.capacity)
+        return max(0.0, -self._level / self.rate)
+
+    def refund(self, amount: float) -> None:
+        """Return units that were reserved but not used."""
+        self._level = min(self.capacity, self._level + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits shared by all callers."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request limit (0 for no limit)
+            tokens_per_minute: Token limit (0 for no limit)
+            clock: Monotonic clock in seconds
+            sleep: Function used to wait, replaceable in tests
+        """
+        self._requests = (
+            TokenBucket(requests_per_minute, clock=clock)
+            if requests_per_minute > 0
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, clock=clock)
+            if tokens_per_minute > 0
+            else None
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request without waiting.
+
+        Args:
+            tokens: Tokens the request is expected to use
+
+        Returns:
+            Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            wait = max(0.0, self._paused_until - self._clock())
+            if self._requests is not None:
+                wait = max(wait, self._requests.reserve(1))
+            if self._tokens is not None and tokens > 0:
+                wait = max(wait, self._tokens.reserve(tokens))
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Wait until a request may be sent.
+
+        Args:
+            tokens: Tokens the request is expected to use
+
+        Returns:
+            Seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.debug("Rate limiter delaying AI request by %.2fs", wait)
+            self._sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Wait until a request may be sent, without blocking the event loop.
+
+        Args:
+            tokens: Tokens the request is expected to use
+
+        Returns:
+            Seconds waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def refund(self, tokens: int) -> None:
+        """Return reserved tokens a request didn't use."""
+        if self._tokens is not None and tokens > 0:
+            with self._lock:
+                self._tokens.refund(tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for ``seconds``, e.g. after a rate limit."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff ceiling before the first retry, in seconds
+            max_delay: Largest delay, in seconds
+            rng: Random source for the jitter
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._random = rng or random.Random()
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Get the delay before a retry.
+
+        Args:
+            attempt: Number of attempts made so far (1 for the first retry)
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Seconds to wait. A server-requested delay is honored up to
+            ``max_delay``.
+        """
+        if retry_after is not None:
+            return min(self.max_delay, max(0.0, retry_after))
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return self._random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Fails fast after consecutive failures until the service recovers.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are refused for ``reset_timeout`` seconds. Then one trial call is
+    let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+                (0 to never open it)
+            reset_timeout: Seconds to stay open before a trial call
+            clock: Monotonic clock in seconds
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """ "closed", "open" or "half-open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
+
+    def before_call(self) -> None:
+        """Check that a call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a trial call is
+                already running
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            retry_in = self.reset_timeout - (self._clock() - self._opened_at)
+            if retry_in <= 0 and not self._trial_running:
+                self._trial_running = True
+                return
+            raise CircuitOpenError(
+                f"AI service unavailable after {self._failures} consecutive "
+                f"failures; not retrying for {max(retry_in, 0):.0f}s",
+                retry_in=max(retry_in, 0.0),
+            )
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            trial_failed = self._trial_running
+            self._trial_running = False
+            if trial_failed or (
+                self.failure_threshold > 0 and self._failures >= self.failure_threshold
+            ):
+                if self._opened_at is None or trial_failed:
+                    logger.warning(
+                        "Opening AI circuit breaker after %s failures", self._failures
+                    )
+                self._opened_at = self._clock()
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """Get the HTTP status of an API error, if it has one."""
+    code = getattr(error, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is transient: rate limits, overload, server errors
+    and timeouts or dropped connections."""
+    code = status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUSES
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # The Anthropic library's timeout and connection errors carry no status
+    return type(error).__name__ in ("APITimeoutError", "APIConnectionError")
+
+
+def is_outage(error: BaseException) -> bool:
+    """Whether an error suggests the service is down: server errors,
+    overload and timeouts or dropped connections. Rate limits and conflicts
+    mean the service is answering, so they don't count."""
+    code = status_code(error)
+    if code is not None:
+        return code == 408 or code >= 500
+    return is_retryable(error)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Get the delay an error's response asked for, in seconds.
+
+    Reads a ``retry_after`` attribute or the ``retry-after-ms`` and
+    ``retry-after`` response headers. HTTP dates are ignored.
+    """
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, (int, float)):
+        return float(value)
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return float(milliseconds) / 1000
+        seconds = headers.get("retry-after")
+        return float(seconds) if seconds is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class CallGuard:
+    """Rate limiter, retry policy and circuit breaker applied to each call."""
+
+    def __init__(
+        self,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the guard.
+
+        Args:
+            limiter: Rate limiter (no limits by default)
+            retry: Retry policy (default policy if None)
+            breaker: Circuit breaker (default breaker if None)
+            sleep: Function used to wait between retries
+        """
+        self.limiter = limiter or RateLimiter(sleep=sleep)
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+
+    def call(
+        self,
+        function: Callable[[], T],
+        tokens: int = 0,
+        used_tokens: Optional[Callable[[T], Optional[int]]] = None,
+        on_retry: Optional[Callable[[Exception], None]] = None,
+    ) -> T:
+        """Call ``function`` within the rate limits, retrying transient errors.
+
+        Args:
+            function: The API call
+            tokens: Tokens the call may use (prompt estimate plus max_tokens)
+            used_tokens: Gets the tokens actually used from the result, so the
+                unused part of the reservation can be returned
+            on_retry: Called with the error before each retry
+
+        Returns:
+            The result of ``function``.
+
+        Raises:
+            CircuitOpenError: If calls are being refused after repeated failures
+            Exception: The last error, if it wasn't transient or retries ran out
+        """
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            self.limiter.acquire(tokens)
+            try:
+                result = function()
+            except Exception as e:
+                attempt += 1
+                delay = self._retry_delay(e, attempt, tokens, on_retry)
+                self._sleep(delay)
+                continue
+            return self._succeeded(result, tokens, used_tokens)
+
+    async def call_async(
+        self,
+        function: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        used_tokens: Optional[Callable[[T], Optional[int]]] = None,
+        on_retry: Optional[Callable[[Exception], None]] = None,
+    ) -> T:
+        """Await ``function`` within the rate limits, retrying transient errors.
+
+        The asyncio counterpart of ``call``: waits for capacity and between
+        retries without blocking the event loop. Shares the limiter and
+        breaker with synchronous callers.
+
+        Args:
+            function: Returns the awaitable API call
+            tokens: Tokens the call may use (prompt estimate plus max_tokens)
+            used_tokens: Gets the tokens actually used from the result
+            on_retry: Called with the error before each retry
+
+        Returns:
+            The result of ``function``.
+
+        Raises:
+            CircuitOpenError: If calls are being refused after repeated failures
+            Exception: The last error, if it wasn't transient or retries ran out
+        """
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            await self.limiter.acquire_async(tokens)
+            try:
+                result = await function()
+            except Exception as e:
+                attempt += 1
+                delay = self._retry_delay(e, attempt, tokens, on_retry)
+                await asyncio.sleep(delay)
+                continue
+            return self._succeeded(result, tokens, used_tokens)
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        tokens: int,
+        on_retry: Optional[Callable[[Exception], None]],
+    ) -> float:
+        """Account for a failed attempt and get the delay before the next one.
+
+        Raises:
+            Exception: ``error`` itself, if it isn't transient or retries ran out
+        """
+        if is_outage(error):
+            self.breaker.record_failure()
+        else:
+            # The service answered; only an outage should open the circuit
+            self.breaker.record_success()
+        if not is_retryable(error):
+            raise error
+        # A refused request doesn't count against the token limit
+        self.limiter.refund(tokens)
+        if attempt > self.retry.max_retries:
+            raise error
+        requested = retry_after(error)
+        delay = self.retry.delay(attempt, requested)
+        if requested is not None:
+            self.limiter.pause(delay)
+        logger.warning(
+            "AI request failed (%s), retry %s/%s in %.1fs",
+            error,
+            attempt,
+            self.retry.max_retries,
+            delay,
+        )
+        if on_retry is not None:
+            on_retry(error)
+        return delay
+
+    def _succeeded(
+        self,
+        result: T,
+        tokens: int,
+        used_tokens: Optional[Callable[[T], Optional[int]]],
+    ) -> T:
+        """Close the circuit and return unused tokens after a successful call."""
+        self.breaker.record_success()
+        if used_tokens is not None:
+            used = used_tokens(result)
+            if isinstance(used, int):
+                self.limiter.refund(tokens - used)
+        return result
+
+
+def estimate_request_tokens(prompt: str, max_tokens: int) -> int:
+    """Estimate the tokens a request counts against a tokens-per-minute limit."""
+    return len(prompt) // CHARS_PER_TOKEN + max_tokens
+
+
+_call_guard: Optional[CallGuard] = None
+_call_guard_lock = threading.Lock()
+
+
+def get_call_guard() -> CallGuard:
+    """Get the process-wide call guard, built from the configuration."""
+    global _call_guard
+    with _call_guard_lock:
+        if _call_guard is None:
+            config = get_config()
+            _call_guard = CallGuard(
+                limiter=RateLimiter(
+                    requests_per_minute=config.get_int("ai_requests_per_minute", 0),
+                    tokens_per_minute=config.get_int("ai_tokens_per_minute", 0),
+                ),
+                retry=RetryPolicy(
+                    max_retries=config.get_int("ai_max_retries", 3),
+                    base_delay=config.get_int("ai_retry_base_delay_ms", 500) / 1000,
+                    max_delay=config.get_int("ai_retry_max_delay_ms", 30000) / 1000,
+                ),
+                breaker=CircuitBreaker(
+                    failure_threshold=config.get_int("ai_circuit_failures", 5),
+                    reset_timeout=config.get_int("ai_circuit_reset_seconds", 30),
+                ),
+            )
+        return _call_guard
+
+
+def reset_call_guard() -> None:
+    """Drop the process-wide guard so the next call rebuilds it from config."""
+    global _call_guard
+    with _call_guard_lock:
+        _call_guard = None
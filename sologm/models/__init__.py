@@ -3,8 +3,15 @@
 # Import relationships to ensure they're properly set up
 import sologm.models.relationships  # noqa
 
+# Import listeners that maintain denormalized act_id/game_id columns
+import sologm.models.hierarchy  # noqa
+
+# Import listeners that maintain materialized *_count columns
+import sologm.models.counters  # noqa
+
 from sologm.models.act import Act
 from sologm.models.base import Base, TimestampMixin
+from sologm.models.context_digest import ContextDigest
 from sologm.models.dice import DiceRoll
 from sologm.models.event import Event
 from sologm.models.event_source import EventSource
@@ -12,6 +19,7 @@ from sologm.models.game import Game
 from sologm.models.mixins import ExistenceCheckMixin, ExistenceConfig
 from sologm.models.oracle import Interpretation, InterpretationSet
 from sologm.models.scene import Scene
+from sologm.models.scene_summary import SceneSummary
 
 __all__ = [
     "Base",
@@ -26,6 +34,8 @@ __all__ = [
     "InterpretationSet",
     "Interpretation",
     "DiceRoll",
+    "SceneSummary",
+    "ContextDigest",
     "generate_unique_id",
     "slugify",
 ]
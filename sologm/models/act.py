@@ -3,11 +3,19 @@
 import uuid
 from typing import TYPE_CHECKING, Dict, List, Optional
 
-from sqlalchemy import ForeignKey, Integer, Text, UniqueConstraint, select
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    UniqueConstraint,
+    select,
+    text,
+)
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from sologm.models.base import Base, TimestampMixin
+from sologm.models.base import Base, TimestampMixin, VersionedMixin
 from sologm.models.mixins import (
     CountingMixin,
     CrossTableCountConfig,
@@ -27,6 +35,7 @@ from sologm.models.utils import (
 )
 
 if TYPE_CHECKING:
+    from sologm.models.context_digest import ContextDigest
     from sologm.models.dice import DiceRoll
     from sologm.models.event import Event
     from sologm.models.oracle import Interpretation
@@ -45,11 +54,29 @@ if TYPE_CHECKING:
     has_active_scene: bool
 
 
-class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampMixin):
+class Act(
+    ExistenceCheckMixin,
+    CountingMixin,
+    StatusCheckMixin,
+    Base,
+    TimestampMixin,
+    VersionedMixin,
+):
     """SQLAlchemy model representing an act in a game."""
 
     __tablename__ = "acts"
-    __table_args__ = (UniqueConstraint("game_id", "slug", name="uix_game_act_slug"),)
+    __table_args__ = (
+        UniqueConstraint("game_id", "slug", name="uix_game_act_slug"),
+        UniqueConstraint("game_id", "sequence", name="uix_game_act_sequence"),
+        # At most one active act per game (partial index, where supported)
+        Index(
+            "uix_game_active_act",
+            "game_id",
+            unique=True,
+            sqlite_where=text("is_active"),
+            postgresql_where=text("is_active"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True, default=lambda: str(uuid.uuid4()))
     slug: Mapped[str] = mapped_column(nullable=False, index=True)
@@ -63,10 +90,36 @@ class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampM
     sequence: Mapped[int] = mapped_column(Integer, nullable=False)
     is_active: Mapped[bool] = mapped_column(default=False)
 
+    # Highest scene sequence handed out so far; see sologm.core.sequence.
+    last_scene_sequence: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Materialized counters, maintained by sologm.models.counters and read
+    # by the generated *_count properties.
+    scene_count_stored: Mapped[int] = mapped_column(
+        "scene_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    event_count_stored: Mapped[int] = mapped_column(
+        "event_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    dice_roll_count_stored: Mapped[int] = mapped_column(
+        "dice_roll_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    interpretation_count_stored: Mapped[int] = mapped_column(
+        "interpretation_count", Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships this model owns
     scenes: Mapped[List["Scene"]] = relationship(
         "Scene", back_populates="act", cascade="all, delete-orphan"
     )
+    # Digests of the act and its scenes; loaded on demand
+    context_digests: Mapped[List["ContextDigest"]] = relationship(
+        "ContextDigest",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     # Configuration for ExistenceCheckMixin to generate has_X properties
     # Import locally to avoid circular import issues
@@ -113,6 +166,8 @@ class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampM
         }
 
     _counting_configs = _get_counting_configs()
+    _stored_counts = ("scene", "event", "dice_roll", "interpretation")
+    _read_stored_counts = True
 
     # Configuration for StatusCheckMixin to generate status properties
     # Import locally to avoid circular import issues
@@ -187,14 +242,8 @@ class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampM
     def has_events(cls):  # noqa: N805
         """SQL expression for has_events."""
         from sologm.models.event import Event
-        from sologm.models.scene import Scene
 
-        return (
-            select(1)
-            .where((Scene.act_id == cls.id) & (Event.scene_id == Scene.id))
-            .exists()
-            .label("has_events")
-        )
+        return select(1).where(Event.act_id == cls.id).exists().label("has_events")
 
     @property
     def first_scene(self) -> Optional["Scene"]:
@@ -237,13 +286,9 @@ class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampM
     def has_dice_rolls(cls):  # noqa: N805
         """SQL expression for has_dice_rolls."""
         from sologm.models.dice import DiceRoll
-        from sologm.models.scene import Scene
 
         return (
-            select(1)
-            .where((Scene.act_id == cls.id) & (DiceRoll.scene_id == Scene.id))
-            .exists()
-            .label("has_dice_rolls")
+            select(1).where(DiceRoll.act_id == cls.id).exists().label("has_dice_rolls")
         )
 
     @property
@@ -274,16 +319,11 @@ class Act(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampM
     @has_interpretations.expression
     def has_interpretations(cls):  # noqa: N805
         """SQL expression for has_interpretations."""
-        from sologm.models.oracle import Interpretation, InterpretationSet
-        from sologm.models.scene import Scene
+        from sologm.models.oracle import Interpretation
 
         return (
             select(1)
-            .where(
-                (Scene.act_id == cls.id)
-                & (InterpretationSet.scene_id == Scene.id)
-                & (Interpretation.set_id == InterpretationSet.id)
-            )
+            .where(Interpretation.act_id == cls.id)
             .exists()
             .label("has_interpretations")
         )
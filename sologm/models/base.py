@@ -1,7 +1,9 @@
 """Base SQLAlchemy models and utilities for SoloGM."""
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import DeclarativeBase, mapped_column
+from typing import Any, Dict
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
 from sologm.utils.datetime_utils import get_current_time
 
@@ -19,3 +21,21 @@ class TimestampMixin:
     modified_at = mapped_column(
         DateTime, default=get_current_time, onupdate=get_current_time, nullable=False
     )
+
+
+class VersionedMixin:
+    """Mixin that adds a version_id column used for optimistic concurrency.
+
+    Every ORM flush that updates the row bumps the version and only matches
+    the row if its version is unchanged since it was loaded. A stale write
+    raises StaleDataError instead of silently overwriting another process's
+    edit. Bulk UPDATE statements (counters, activation) don't bump it.
+    """
+
+    version_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> Dict[str, Any]:
+        return {"version_id_col": cls.__table__.c.version_id}
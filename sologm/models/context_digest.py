@@ -0,0 +1,40 @@
+"""Rolling AI summaries of scenes and acts, used as oracle context."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sologm.models.base import Base, TimestampMixin
+
+SCENE_SCOPE = "scene"
+ACT_SCOPE = "act"
+
+
+class ContextDigest(Base, TimestampMixin):
+    """SQLAlchemy model for the running digest of a scene or an act.
+
+    A digest is a compact summary of everything that has happened so far.
+    New events are folded into it incrementally; ``through_created_at`` and
+    ``through_event_id`` mark the last event it covers, in (created_at, id)
+    order.
+    """
+
+    __tablename__ = "context_digests"
+
+    # ID of the scene or act the digest describes
+    owner_id: Mapped[str] = mapped_column(String, primary_key=True)
+    scope: Mapped[str] = mapped_column(String(10), nullable=False)
+    act_id: Mapped[str] = mapped_column(
+        ForeignKey("acts.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    scene_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("scenes.id", ondelete="CASCADE"), nullable=True
+    )
+    digest: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    through_created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
+    through_event_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
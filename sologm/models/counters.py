@@ -0,0 +1,244 @@
+"""Maintenance of materialized relationship counters.
+
+Parents keep ``*_count`` columns (mapped as ``*_count_stored``) so listings
+can show how many scenes, events, rolls and interpretations they hold
+without a correlated COUNT per row. Inserts, deletes and re-parenting of
+children are collected while a flush runs and applied as one
+``col = col + delta`` UPDATE per parent when it finishes. Moving a scene to
+another act recounts the affected acts outright, since the denormalized
+act_id columns of its children are rewritten in bulk by
+``sologm.models.hierarchy``.
+
+Rows changed behind the ORM's back (bulk statements, manual SQL) are not
+tracked; ``recount`` rebuilds every counter from scratch.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, DefaultDict, Dict, Optional, Set, Tuple, Type
+
+from sqlalchemy import ScalarSelect, event, func, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, Session, attributes, object_session
+from sqlalchemy.orm.util import identity_key
+
+from sologm.models.act import Act
+from sologm.models.dice import DiceRoll
+from sologm.models.event import Event
+from sologm.models.game import Game
+from sologm.models.oracle import Interpretation, InterpretationSet
+from sologm.models.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CounterSpec:
+    """A counter column on a parent, fed by a foreign key on a child."""
+
+    parent: Type[Any]
+    name: str
+    child: Type[Any]
+    foreign_key: str
+
+    @property
+    def attribute(self) -> str:
+        """Mapped attribute holding the counter on the parent."""
+        return f"{self.name}_count_stored"
+
+    @property
+    def label(self) -> str:
+        """Human-readable identifier, e.g. ``acts.event_count``."""
+        return f"{self.parent.__tablename__}.{self.name}_count"
+
+
+COUNTERS: Tuple[CounterSpec, ...] = (
+    CounterSpec(Game, "act", Act, "game_id"),
+    CounterSpec(Act, "scene", Scene, "act_id"),
+    CounterSpec(Act, "event", Event, "act_id"),
+    CounterSpec(Act, "dice_roll", DiceRoll, "act_id"),
+    CounterSpec(Act, "interpretation", Interpretation, "act_id"),
+    CounterSpec(Scene, "event", Event, "scene_id"),
+    CounterSpec(Scene, "dice_roll", DiceRoll, "scene_id"),
+    CounterSpec(Scene, "interpretation_set", InterpretationSet, "scene_id"),
+    CounterSpec(InterpretationSet, "interpretation", Interpretation, "set_id"),
+    CounterSpec(Interpretation, "event", Event, "interpretation_id"),
+)
+
+# Counters fed by the denormalized act_id column, which a scene move rewrites
+_ACT_COUNTERS = tuple(
+    spec for spec in COUNTERS if spec.parent is Act and spec.child is not Scene
+)
+
+_PENDING_KEY = "sologm_counter_deltas"
+_RECOUNT_KEY = "sologm_counter_recount_acts"
+
+
+def _specs_for(target: Any) -> Tuple[CounterSpec, ...]:
+    return tuple(spec for spec in COUNTERS if isinstance(target, spec.child))
+
+
+def _pending(session: Session) -> DefaultDict[Tuple[CounterSpec, str], int]:
+    return session.info.setdefault(_PENDING_KEY, defaultdict(int))
+
+
+def _record(
+    target: Any, spec: CounterSpec, parent_id: Optional[str], delta: int
+) -> None:
+    session = object_session(target)
+    if session is None or parent_id is None:
+        return
+    _pending(session)[(spec, parent_id)] += delta
+
+
+def _committed_value(target: Any, key: str) -> Optional[str]:
+    """Get the value a column had before the current flush changed it."""
+    history = attributes.get_history(target, key)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, key)
+
+
+def _child_inserted(_: Mapper, __: Connection, target: Any) -> None:
+    for spec in _specs_for(target):
+        _record(target, spec, getattr(target, spec.foreign_key), 1)
+
+
+def _child_deleted(_: Mapper, __: Connection, target: Any) -> None:
+    for spec in _specs_for(target):
+        _record(target, spec, _committed_value(target, spec.foreign_key), -1)
+
+
+def _child_updated(_: Mapper, __: Connection, target: Any) -> None:
+    for spec in _specs_for(target):
+        history = attributes.get_history(target, spec.foreign_key)
+        if not history.has_changes():
+            continue
+        if history.deleted:
+            _record(target, spec, history.deleted[0], -1)
+        if history.added:
+            _record(target, spec, history.added[0], 1)
+
+
+for _child in dict.fromkeys(spec.child for spec in COUNTERS):
+    event.listen(_child, "after_insert", _child_inserted)
+    event.listen(_child, "after_delete", _child_deleted)
+    event.listen(_child, "after_update", _child_updated)
+
+
+@event.listens_for(Scene, "after_update")
+def _scene_moved(_: Mapper, __: Connection, target: Scene) -> None:
+    history = attributes.get_history(target, "act_id")
+    if not history.has_changes():
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    moved: Set[str] = session.info.setdefault(_RECOUNT_KEY, set())
+    moved.update(act_id for act_id in (*history.deleted, *history.added) if act_id)
+
+
+def _sync_loaded(
+    session: Session, spec: CounterSpec, values: Dict[str, int], relative: bool
+) -> None:
+    """Update counters on already-loaded parents without marking them dirty."""
+    for parent_id, value in values.items():
+        parent = session.identity_map.get(identity_key(spec.parent, parent_id))
+        if parent is None or spec.attribute not in parent.__dict__:
+            continue
+        if relative:
+            value += parent.__dict__[spec.attribute] or 0
+        attributes.set_committed_value(parent, spec.attribute, value)
+
+
+def _count_expression(spec: CounterSpec) -> ScalarSelect[int]:
+    return (
+        select(func.count())
+        .select_from(spec.child)
+        .where(getattr(spec.child, spec.foreign_key) == spec.parent.id)
+        .scalar_subquery()
+    )
+
+
+def _recount_parents(
+    session: Session, spec: CounterSpec, parent_ids: Optional[Set[str]] = None
+) -> int:
+    """Rewrite a counter from a COUNT of its children.
+
+    Args:
+        session: Session to execute in.
+        spec: Counter to rebuild.
+        parent_ids: Restrict to these parents. All parents when None.
+
+    Returns:
+        Number of parents whose stored value was wrong.
+    """
+    column = getattr(spec.parent, spec.attribute)
+    expected = _count_expression(spec)
+    stale = select(spec.parent.id, expected).where(column != expected)
+    if parent_ids is not None:
+        stale = stale.where(spec.parent.id.in_(parent_ids))
+
+    connection = session.connection()
+    fixes: Dict[str, int] = dict(connection.execute(stale).tuples().all())
+    for parent_id, value in fixes.items():
+        connection.execute(
+            update(spec.parent)
+            .where(spec.parent.id == parent_id)
+            .values({column: value})
+        )
+    _sync_loaded(session, spec, fixes, relative=False)
+    return len(fixes)
+
+
+@event.listens_for(Session, "before_flush")
+def _reset_pending(session: Session, *_: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_RECOUNT_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_pending(session: Session, _: Any) -> None:
+    deltas = session.info.pop(_PENDING_KEY, None)
+    moved_acts = session.info.pop(_RECOUNT_KEY, None)
+
+    if deltas:
+        connection = session.connection()
+        grouped: DefaultDict[CounterSpec, Dict[str, int]] = defaultdict(dict)
+        for (spec, parent_id), delta in deltas.items():
+            if delta:
+                grouped[spec][parent_id] = delta
+        for spec, changes in grouped.items():
+            column = getattr(spec.parent, spec.attribute)
+            for parent_id, delta in changes.items():
+                connection.execute(
+                    update(spec.parent)
+                    .where(spec.parent.id == parent_id)
+                    .values({column: column + delta})
+                )
+            _sync_loaded(session, spec, changes, relative=True)
+
+    if moved_acts:
+        logger.debug("Recounting acts %s after scene move", sorted(moved_acts))
+        for spec in _ACT_COUNTERS:
+            _recount_parents(session, spec, moved_acts)
+
+
+def recount(session: Session) -> Dict[str, int]:
+    """Rebuild every materialized counter from the child tables.
+
+    Args:
+        session: Session to execute in. The caller owns the transaction.
+
+    Returns:
+        Mapping of counter label (e.g. ``acts.event_count``) to the number of
+        rows that held a wrong value and were corrected.
+    """
+    session.flush()
+    results = {}
+    for spec in COUNTERS:
+        results[spec.label] = _recount_parents(session, spec)
+        if results[spec.label]:
+            logger.info("Corrected %s on %d row(s)", spec.label, results[spec.label])
+    return results
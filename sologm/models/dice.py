@@ -4,7 +4,7 @@ import json
 import uuid
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import BigInteger, ForeignKey, Integer, String, Text
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import TypeDecorator
@@ -45,12 +45,29 @@ class DiceRoll(Base, TimestampMixin):
     individual_results: Mapped[List[int]] = mapped_column(JSONType, nullable=False)
     modifier: Mapped[int] = mapped_column(Integer, nullable=False)
     total: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Per-term breakdown for compound notations (e.g. "2d6+1d4-1"); older
+    # rolls predate this column and leave it empty.
+    term_results: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
+        JSONType, nullable=True
+    )
     reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Position in the random stream the roll was drawn from; replaying the
+    # notation against (rng_seed, rng_counter) reproduces the roll exactly.
+    rng_seed: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    rng_counter: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Optional link to game and scene
     scene_id: Mapped[Optional[str]] = mapped_column(
         ForeignKey("scenes.id", ondelete="CASCADE"), nullable=True
     )
+    # Denormalized from the scene hierarchy so act- and game-wide queries can
+    # filter directly; maintained by sologm.models.hierarchy.
+    act_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("acts.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    game_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("games.id", ondelete="CASCADE"), nullable=True, index=True
+    )
 
     # Relationships will be defined in relationships.py
 
@@ -59,21 +76,11 @@ class DiceRoll(Base, TimestampMixin):
         """Get the act this dice roll belongs to, if any."""
         return self.scene.act if self.scene else None
 
-    @property
-    def act_id(self) -> Optional[str]:
-        """Get the act ID this dice roll belongs to, if any."""
-        return self.scene.act_id if self.scene else None
-
     @property
     def game(self) -> Optional["Game"]:
         """Get the game this dice roll belongs to, if any."""
         return self.scene.act.game if self.scene else None
 
-    @property
-    def game_id(self) -> Optional[str]:
-        """Get the game ID this dice roll belongs to, if any."""
-        return self.scene.act.game_id if self.scene else None
-
     @property
     def formatted_results(self) -> str:
         """Get a formatted string representation of the dice roll results.
@@ -162,6 +169,9 @@ class DiceRoll(Base, TimestampMixin):
         total: int,
         reason: Optional[str] = None,
         scene_id: Optional[str] = None,
+        term_results: Optional[List[Dict[str, Any]]] = None,
+        rng_seed: Optional[int] = None,
+        rng_counter: Optional[int] = None,
     ) -> "DiceRoll":
         """Create a new dice roll record.
 
@@ -172,6 +182,9 @@ class DiceRoll(Base, TimestampMixin):
             total: The total result of the roll.
             reason: Optional reason for the roll.
             scene_id: Optional ID of the scene this roll belongs to.
+            term_results: Optional per-term breakdown of the roll.
+            rng_seed: Optional seed of the stream the roll was drawn from.
+            rng_counter: Optional position of the roll within that stream.
         Returns:
             A new DiceRoll instance.
         """
@@ -183,4 +196,7 @@ class DiceRoll(Base, TimestampMixin):
             total=total,
             reason=reason,
             scene_id=scene_id,
+            term_results=term_results,
+            rng_seed=rng_seed,
+            rng_counter=rng_counter,
         )
@@ -4,11 +4,10 @@ import uuid
 from typing import TYPE_CHECKING, Optional
 
 # Add ondelete="CASCADE" to the ForeignKey import if needed, but it's a string argument
-from sqlalchemy import ForeignKey, Text, select
-from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy import ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from sologm.models.base import Base, TimestampMixin
+from sologm.models.base import Base, TimestampMixin, VersionedMixin
 from sologm.models.mixins import (
     RelationshipStatusConfig,
     SourceStatusConfig,
@@ -23,10 +22,10 @@ if TYPE_CHECKING:
     from sologm.models.scene import Scene  # Import Scene
 
 # Import EventSource outside TYPE_CHECKING for the status configs
-from sologm.models.event_source import EventSource
+from sologm.models.event_source import EventSource, event_source_cache
 
 
-class Event(StatusCheckMixin, Base, TimestampMixin):
+class Event(StatusCheckMixin, Base, TimestampMixin, VersionedMixin):
     """SQLAlchemy model representing a game event."""
 
     __tablename__ = "events"
@@ -36,6 +35,14 @@ class Event(StatusCheckMixin, Base, TimestampMixin):
     scene_id: Mapped[str] = mapped_column(
         ForeignKey("scenes.id", ondelete="CASCADE"), nullable=False
     )
+    # Denormalized from the scene hierarchy so act- and game-wide queries can
+    # filter directly; maintained by sologm.models.hierarchy.
+    act_id: Mapped[str] = mapped_column(
+        ForeignKey("acts.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    game_id: Mapped[str] = mapped_column(
+        ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     description: Mapped[str] = mapped_column(Text, nullable=False)
     source_id: Mapped[int] = mapped_column(
         ForeignKey("event_sources.id"), nullable=False
@@ -60,18 +67,21 @@ class Event(StatusCheckMixin, Base, TimestampMixin):
             source_field="source_id",
             source_name_field="name",
             expected_value="manual",
+            id_cache=event_source_cache,
         ),
         "oracle_generated": SourceStatusConfig(
             source_model=EventSource,
             source_field="source_id",
             source_name_field="name",
             expected_value="oracle",
+            id_cache=event_source_cache,
         ),
         "dice_generated": SourceStatusConfig(
             source_model=EventSource,
             source_field="source_id",
             source_name_field="name",
             expected_value="dice",
+            id_cache=event_source_cache,
         ),
     }
 
@@ -93,43 +103,6 @@ class Event(StatusCheckMixin, Base, TimestampMixin):
             raise AttributeError("Scene relationship not loaded on Event object.")
         return self.scene.act.game
 
-    @hybrid_property
-    def game_id(self) -> str:
-        """Get the game ID this event belongs to.
-
-        Works in both Python and SQL contexts:
-        - Python: Returns the game ID through relationships
-        - SQL: Performs a subquery to get the game ID
-        """
-        # Add check for scene relationship being loaded in Python mode
-        if hasattr(self, "scene") and self.scene is not None:
-            if hasattr(self.scene, "act") and self.scene.act is not None:
-                return self.scene.act.game_id
-            else:
-                # This path might indicate an issue if accessed when act isn't loaded
-                # Consider raising or returning None/default based on expected usage
-                raise AttributeError(
-                    "Act relationship not loaded on Scene object within Event."
-                )
-        # If accessed in a way where relationships aren't loaded (e.g., direct query)
-        # this part might not be hit directly, relying on the expression below.
-        # However, direct attribute access implies loaded state.
-        # Let's raise for clarity if relationships aren't ready.
-        raise AttributeError("Scene or Act relationship not loaded on Event object.")
-
-    @game_id.expression
-    def game_id(cls):  # noqa: N805
-        """SQL expression for game_id."""
-        from sologm.models.act import Act
-        from sologm.models.scene import Scene
-
-        return (
-            select(Act.game_id)
-            .join(Scene, Scene.act_id == Act.id)
-            .where(Scene.id == cls.scene_id)
-            .scalar_subquery()
-        ).label("game_id")
-
     @property
     def act(self) -> "Act":
         """Get the act this event belongs to through the scene relationship."""
@@ -138,28 +111,6 @@ class Event(StatusCheckMixin, Base, TimestampMixin):
             raise AttributeError("Scene relationship not loaded on Event object.")
         return self.scene.act
 
-    @hybrid_property
-    def act_id(self) -> str:
-        """Get the act ID this event belongs to.
-
-        Works in both Python and SQL contexts:
-        - Python: Returns the act ID through relationships
-        - SQL: Performs a subquery to get the act ID
-        """
-        # Add check for scene relationship being loaded in Python mode
-        if hasattr(self, "scene") and self.scene is not None:
-            return self.scene.act_id
-        raise AttributeError("Scene relationship not loaded on Event object.")
-
-    @act_id.expression
-    def act_id(cls):  # noqa: N805
-        """SQL expression for act_id."""
-        from sologm.models.scene import Scene
-
-        return (
-            select(Scene.act_id).where(Scene.id == cls.scene_id).scalar_subquery()
-        ).label("act_id")
-
     @property
     def source_name(self) -> str:
         """Get the name of the event source.
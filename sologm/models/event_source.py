@@ -1,10 +1,23 @@
 """Event source model for SoloGM."""
 
-from sqlalchemy import Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Integer, String, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import (
+    Mapped,
+    Session,
+    make_transient_to_detached,
+    mapped_column,
+)
 
 from sologm.models.base import Base
 
+logger = logging.getLogger(__name__)
+
 
 class EventSource(Base):
     """SQLAlchemy model representing an event source type."""
@@ -27,3 +40,131 @@ class EventSource(Base):
             A new EventSource instance
         """
         return cls(name=name)
+
+
+class EventSourceCache:
+    """Process-wide cache of event source names to IDs.
+
+    Event sources are a tiny, almost static lookup table, so the name→id map
+    is loaded once per database engine and reused by every session. The cache
+    is dropped whenever a source is inserted, changed or deleted, and after
+    any rollback (which may discard a freshly inserted source).
+
+    Lookups that don't know their database (class-level SQL expressions and
+    detached instances) only use the cache while a single engine is in use;
+    database managers register their engines with ``track_engine``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ids: "weakref.WeakKeyDictionary[Engine, Dict[str, int]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Engines in use, keyed by the database manager that owns each
+        self._engines: "weakref.WeakKeyDictionary[Any, Engine]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def track_engine(self, owner: Any, engine: Engine) -> None:
+        """Register an engine as in use until its owner is released.
+
+        Args:
+            owner: Object holding the engine, such as a DatabaseManager.
+            engine: The (synchronous) engine sessions will be bound to.
+        """
+        with self._lock:
+            self._engines[owner] = engine
+
+    def untrack_engine(self, owner: Any) -> None:
+        """Stop counting an owner's engine as in use."""
+        with self._lock:
+            self._engines.pop(owner, None)
+
+    def get_ids(self, session: Session) -> Dict[str, int]:
+        """Get the name→id map for the session's database, loading it if needed.
+
+        Args:
+            session: Session whose database should be consulted on a miss.
+
+        Returns:
+            A copy of the name→id map.
+        """
+        engine = session.get_bind().engine
+        with self._lock:
+            ids = self._ids.get(engine)
+        if ids is None:
+            logger.debug("Loading event source cache for %s", engine.url)
+            rows = session.execute(select(EventSource.name, EventSource.id)).all()
+            ids = {name: source_id for name, source_id in rows}
+            with self._lock:
+                self._ids[engine] = ids
+        return dict(ids)
+
+    def get_id(self, session: Session, name: str) -> Optional[int]:
+        """Get the ID of the named source, or None if it doesn't exist."""
+        return self.get_ids(session).get(name)
+
+    def peek_id(self, name: str, engine: Optional[Engine] = None) -> Optional[int]:
+        """Get a cached source ID without touching the database.
+
+        Args:
+            name: Name of the source.
+            engine: Engine to look up. Defaults to the only engine in use.
+
+        Returns:
+            The cached ID, or None if the cache is cold, the name is unknown,
+            or no engine was given while several are in use.
+        """
+        with self._lock:
+            if engine is None:
+                engines = set(self._engines.values())
+                if len(engines) != 1:
+                    return None
+                engine = engines.pop()
+            ids = self._ids.get(engine)
+        return ids.get(name) if ids is not None else None
+
+    def get_source(self, session: Session, name: str) -> Optional[EventSource]:
+        """Get the named source as a session-bound instance without querying.
+
+        The instance is merged into the session's identity map, so relationship
+        access such as ``event.source`` resolves without another SELECT.
+        """
+        source_id = self.get_id(session, name)
+        if source_id is None:
+            return None
+        return self._attach(session, source_id, name)
+
+    def get_sources(self, session: Session) -> List[EventSource]:
+        """Get all sources as session-bound instances, ordered by name."""
+        return [
+            self._attach(session, source_id, name)
+            for name, source_id in sorted(self.get_ids(session).items())
+        ]
+
+    @staticmethod
+    def _attach(session: Session, source_id: int, name: str) -> EventSource:
+        """Bind a cached source to the session without emitting a SELECT."""
+        source = EventSource(id=source_id, name=name)
+        make_transient_to_detached(source)
+        return session.merge(source, load=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached mappings."""
+        with self._lock:
+            self._ids.clear()
+
+
+event_source_cache = EventSourceCache()
+
+
+@event.listens_for(EventSource, "after_insert")
+@event.listens_for(EventSource, "after_update")
+@event.listens_for(EventSource, "after_delete")
+def _invalidate_on_change(*_) -> None:
+    event_source_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_rollback(_: Session) -> None:
+    event_source_cache.invalidate()
@@ -3,11 +3,11 @@
 import uuid
 from typing import TYPE_CHECKING, Dict, List, Optional
 
-from sqlalchemy import Text, select
+from sqlalchemy import BigInteger, Index, Integer, Text, select, text
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from sologm.models.base import Base, TimestampMixin
+from sologm.models.base import Base, TimestampMixin, VersionedMixin
 from sologm.models.mixins import (
     CountingMixin,
     DirectCountConfig,
@@ -23,6 +23,7 @@ from sologm.models.utils import (
     get_latest_entity,
     slugify,
 )
+from sologm.utils.dice_rng import new_seed
 
 if TYPE_CHECKING:
     from sologm.models.act import Act
@@ -38,10 +39,27 @@ if TYPE_CHECKING:
     has_active_act: bool
 
 
-class Game(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, TimestampMixin):
+class Game(
+    ExistenceCheckMixin,
+    CountingMixin,
+    StatusCheckMixin,
+    Base,
+    TimestampMixin,
+    VersionedMixin,
+):
     """SQLAlchemy model representing a game in the system."""
 
     __tablename__ = "games"
+    __table_args__ = (
+        # At most one active game. Partial indexes exist only on some backends.
+        Index(
+            "uix_single_active_game",
+            "is_active",
+            unique=True,
+            sqlite_where=text("is_active"),
+            postgresql_where=text("is_active"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
@@ -49,6 +67,22 @@ class Game(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, Timestamp
     description: Mapped[Optional[str]] = mapped_column(Text)
     is_active: Mapped[bool] = mapped_column(default=False)
 
+    # Dice rolls in this game draw from a reproducible (seed, counter) stream;
+    # rng_counter is the next unused position.
+    rng_seed: Mapped[int] = mapped_column(BigInteger, nullable=False, default=new_seed)
+    rng_counter: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Highest act sequence handed out so far; see sologm.core.sequence.
+    last_act_sequence: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Materialized counters, maintained by sologm.models.counters and read
+    # by the generated *_count properties.
+    act_count_stored: Mapped[int] = mapped_column(
+        "act_count", Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships this model owns
     acts: Mapped[List["Act"]] = relationship(
         "Act", back_populates="game", cascade="all, delete-orphan"
@@ -79,6 +113,8 @@ class Game(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, Timestamp
         }
 
     _counting_configs = _get_counting_configs()
+    _stored_counts = ("act",)
+    _read_stored_counts = True
 
     # Configuration for StatusCheckMixin to generate status properties
     # Import locally to avoid circular import issues
@@ -216,12 +252,16 @@ class Game(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, Timestamp
         return get_latest_entity(all_scenes)
 
     @classmethod
-    def create(cls, name: str, description: str) -> "Game":
+    def create(
+        cls, name: str, description: str, rng_seed: Optional[int] = None
+    ) -> "Game":
         """Create a new game with a unique ID and slug based on the name.
 
         Args:
             name: Name of the game.
             description: Description of the game.
+            rng_seed: Optional seed for the game's dice stream. A random seed
+                is generated when omitted.
         Returns:
             A new Game instance.
         """
@@ -231,4 +271,11 @@ class Game(ExistenceCheckMixin, CountingMixin, StatusCheckMixin, Base, Timestamp
         # Create a unique ID
         unique_id = str(uuid.uuid4())
 
-        return cls(id=unique_id, slug=base_slug, name=name, description=description)
+        return cls(
+            id=unique_id,
+            slug=base_slug,
+            name=name,
+            description=description,
+            rng_seed=rng_seed if rng_seed is not None else new_seed(),
+            rng_counter=0,
+        )
@@ -0,0 +1,181 @@
+"""Maintenance of denormalized act_id/game_id columns.
+
+Events, dice rolls, interpretation sets and interpretations store the act and
+game they belong to so that act- and game-wide queries can filter on an
+indexed column instead of joining through scenes. The listeners here fill the
+columns on insert, refresh them when a row is attached to a different parent,
+and propagate changes when a scene moves to another act (or an act to another
+game).
+"""
+
+import logging
+from typing import Any, Collection, Optional, Tuple
+
+from sqlalchemy import event, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, attributes, object_session
+from sqlalchemy.orm.util import identity_key
+
+from sologm.models.act import Act
+from sologm.models.dice import DiceRoll
+from sologm.models.event import Event
+from sologm.models.oracle import Interpretation, InterpretationSet
+from sologm.models.scene import Scene
+
+logger = logging.getLogger(__name__)
+
+# Models that hang directly off a scene
+_SCENE_CHILDREN = (Event, DiceRoll, InterpretationSet)
+
+
+def _lookup_loaded(target: Any, model: type, pk: Optional[str]) -> Optional[Any]:
+    """Get an instance from the target's session identity map without SQL."""
+    session = object_session(target)
+    if session is None or pk is None:
+        return None
+    return session.identity_map.get(identity_key(model, pk))
+
+
+def _scene_ancestry(
+    connection: Connection, target: Any, scene_id: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve (act_id, game_id) for a scene, preferring already-loaded rows."""
+    if scene_id is None:
+        return None, None
+
+    scene = _lookup_loaded(target, Scene, scene_id)
+    if scene is not None and scene.act_id is not None:
+        act = _lookup_loaded(target, Act, scene.act_id)
+        if act is not None and act.game_id is not None:
+            return scene.act_id, act.game_id
+
+    row = connection.execute(
+        select(Scene.act_id, Act.game_id)
+        .join(Act, Act.id == Scene.act_id)
+        .where(Scene.id == scene_id)
+    ).first()
+    return (row[0], row[1]) if row else (None, None)
+
+
+def _set_ancestry(connection: Connection, target: Any, scene_id: Optional[str]) -> None:
+    target.act_id, target.game_id = _scene_ancestry(connection, target, scene_id)
+
+
+def _parent_changed(target: Any, key: str) -> bool:
+    return attributes.get_history(target, key).has_changes()
+
+
+@event.listens_for(Event, "before_insert")
+@event.listens_for(DiceRoll, "before_insert")
+@event.listens_for(InterpretationSet, "before_insert")
+def _fill_from_scene(_: Mapper, connection: Connection, target: Any) -> None:
+    _set_ancestry(connection, target, target.scene_id)
+
+
+@event.listens_for(Event, "before_update")
+@event.listens_for(DiceRoll, "before_update")
+@event.listens_for(InterpretationSet, "before_update")
+def _refresh_from_scene(_: Mapper, connection: Connection, target: Any) -> None:
+    if _parent_changed(target, "scene_id"):
+        _set_ancestry(connection, target, target.scene_id)
+
+
+def _fill_from_set(connection: Connection, target: Interpretation) -> None:
+    interp_set = _lookup_loaded(target, InterpretationSet, target.set_id)
+    if interp_set is not None and interp_set.act_id is not None:
+        target.act_id, target.game_id = interp_set.act_id, interp_set.game_id
+        return
+
+    row = connection.execute(
+        select(InterpretationSet.act_id, InterpretationSet.game_id).where(
+            InterpretationSet.id == target.set_id
+        )
+    ).first()
+    target.act_id, target.game_id = (row[0], row[1]) if row else (None, None)
+
+
+@event.listens_for(Interpretation, "before_insert")
+def _fill_interpretation(_: Mapper, connection: Connection, target: Any) -> None:
+    _fill_from_set(connection, target)
+
+
+@event.listens_for(Interpretation, "before_update")
+def _refresh_interpretation(_: Mapper, connection: Connection, target: Any) -> None:
+    if _parent_changed(target, "set_id"):
+        _fill_from_set(connection, target)
+
+
+def _sync_loaded(
+    target: Any, model: type, key: str, matches: Collection[Any], **values: Any
+) -> None:
+    """Update already-loaded instances so they don't show stale ancestry.
+
+    Only attributes present in each instance's state are inspected, so this
+    never triggers a load in the middle of a flush.
+    """
+    session = object_session(target)
+    if session is None:
+        return
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, model) and obj.__dict__.get(key) in matches:
+            for name, value in values.items():
+                attributes.set_committed_value(obj, name, value)
+
+
+@event.listens_for(Scene, "after_update")
+def _propagate_scene_move(_: Mapper, connection: Connection, target: Scene) -> None:
+    if not _parent_changed(target, "act_id"):
+        return
+
+    act = _lookup_loaded(target, Act, target.act_id)
+    game_id = (
+        act.game_id
+        if act is not None
+        else connection.execute(
+            select(Act.game_id).where(Act.id == target.act_id)
+        ).scalar()
+    )
+    logger.debug(
+        "Scene %s moved to act %s; updating denormalized ancestry",
+        target.id,
+        target.act_id,
+    )
+
+    values = {"act_id": target.act_id, "game_id": game_id}
+    for model in _SCENE_CHILDREN:
+        connection.execute(
+            update(model).where(model.scene_id == target.id).values(**values)
+        )
+        _sync_loaded(target, model, "scene_id", {target.id}, **values)
+
+    set_ids = set(
+        connection.execute(
+            select(InterpretationSet.id).where(InterpretationSet.scene_id == target.id)
+        ).scalars()
+    )
+    if set_ids:
+        connection.execute(
+            update(Interpretation)
+            .where(Interpretation.set_id.in_(set_ids))
+            .values(**values)
+        )
+        _sync_loaded(target, Interpretation, "set_id", set_ids, **values)
+
+
+@event.listens_for(Act, "after_update")
+def _propagate_act_move(_: Mapper, connection: Connection, target: Act) -> None:
+    if not _parent_changed(target, "game_id"):
+        return
+
+    logger.debug(
+        "Act %s moved to game %s; updating denormalized ancestry",
+        target.id,
+        target.game_id,
+    )
+    for model in (*_SCENE_CHILDREN, Interpretation):
+        connection.execute(
+            update(model)
+            .where(model.act_id == target.id)
+            .values(game_id=target.game_id)
+        )
+        _sync_loaded(target, model, "act_id", {target.id}, game_id=target.game_id)
@@ -6,13 +6,25 @@ while maintaining identical behavior to manually implemented properties.
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import object_session
 
 if TYPE_CHECKING:
     from sologm.models.base import Base
+    from sologm.models.event_source import EventSourceCache
 
 
 @dataclass
@@ -274,6 +286,18 @@ class FilteredCrossTableCountConfig:
     relationship_name: Optional[str] = None
 
 
+def _has_pending(instance: Any, model: Type["Base"]) -> bool:
+    """Check whether the instance's session has unflushed changes to ``model``."""
+    session = object_session(instance)
+    if session is None:
+        return False
+    return any(
+        isinstance(obj, model)
+        for changed in (session.new, session.deleted, session.dirty)
+        for obj in changed
+    )
+
+
 class CountingMixin:
     """Mixin providing X_count hybrid properties for relationship counting.
 
@@ -304,6 +328,15 @@ class CountingMixin:
                 ),
             }
             # This automatically generates event_count and selected_interpretation_count
+
+    Stored counts:
+        A model may also keep materialized counter columns, mapped as
+        ``{name}_count_stored`` and listed in ``_stored_counts``. While
+        ``_read_stored_counts`` is True, the generated properties read those
+        columns in both contexts instead of counting. In Python they fall
+        back to counting while the session holds unflushed changes to the
+        counted model, and for pending objects whose counter has not been
+        set yet.
     """
 
     # Configuration attribute (defined by implementing classes)
@@ -317,6 +350,12 @@ class CountingMixin:
         ],
     ]
 
+    # Config keys backed by a materialized {name}_count_stored column
+    _stored_counts: Tuple[str, ...] = ()
+
+    # Switch: read materialized columns for keys listed in _stored_counts
+    _read_stored_counts: bool = False
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """Generate hybrid properties when class is created.
 
@@ -521,6 +560,11 @@ class CountingMixin:
         # Create SQL expression method
         sql_expression = cls._build_sql_count(property_name, config)
 
+        if name in cls._stored_counts:
+            python_method, sql_expression = cls._wrap_stored_count(
+                name, config.model, python_method, sql_expression
+            )
+
         # Set proper docstrings with model-specific information
         python_method.__doc__ = (
             f"Get the number of {name} for this {cls.__name__.lower()}.\n\n"
@@ -538,6 +582,48 @@ class CountingMixin:
         # Add the property to the class
         setattr(cls, property_name, hybrid_prop)
 
+    @classmethod
+    def _wrap_stored_count(
+        cls,
+        name: str,
+        child_model: Type["Base"],
+        python_method: Callable[[Any], int],
+        sql_expression: Callable[[Any], Any],
+    ) -> Tuple[Callable[[Any], int], Callable[[Any], Any]]:
+        """Make count methods prefer the materialized column when switched on.
+
+        The switch is checked on every access, so toggling
+        ``_read_stored_counts`` takes effect immediately. The stored column
+        only changes when a flush runs, so while the instance's session
+        holds unflushed ``child_model`` objects the count is computed
+        instead.
+
+        Args:
+            name: The configuration key name
+            child_model: Model of the rows being counted
+            python_method: The computed Python count method
+            sql_expression: The computed SQL count expression
+
+        Returns:
+            Tuple of (python_method, sql_expression) wrappers
+        """
+        stored_attr = f"{name}_count_stored"
+        property_name = f"{name}_count"
+
+        def stored_python_method(self: Any) -> int:
+            if type(self)._read_stored_counts and not _has_pending(self, child_model):
+                stored = getattr(self, stored_attr)
+                if stored is not None:
+                    return stored
+            return python_method(self)
+
+        def stored_sql_expression(cls_inner: Any) -> Any:
+            if cls_inner._read_stored_counts:
+                return getattr(cls_inner, stored_attr).label(property_name)
+            return sql_expression(cls_inner)
+
+        return stored_python_method, stored_sql_expression
+
     @classmethod
     def _build_python_count(
         cls,
@@ -1045,6 +1131,9 @@ class SourceStatusConfig:
         expected_value: The expected value in the source name field
         relationship_name: Name of the relationship attribute. Defaults to config key.
         property_name: Custom property name. Defaults to is_{config_key}.
+        id_cache: Optional name→id cache for the source table. When the expected
+            source's ID is cached, both contexts compare source_field against it
+            directly instead of going through the source table.
 
     Example: Event.is_manual - checks if event_sources.name = 'manual'
     """
@@ -1055,6 +1144,7 @@ class SourceStatusConfig:
     expected_value: str
     relationship_name: Optional[str] = None
     property_name: Optional[str] = None
+    id_cache: Optional["EventSourceCache"] = None
 
 
 @dataclass
@@ -1373,8 +1463,27 @@ class StatusCheckMixin:
                 if not source_id:
                     return False
 
-                # Try to get the source via loaded relationship first
+                # An already-loaded source is authoritative (it may have been
+                # reassigned without a flush), and checking it costs nothing.
                 source_relationship_name = config.source_field.replace("_id", "")
+                loaded_source = self.__dict__.get(source_relationship_name)
+                if loaded_source is not None:
+                    source_name = getattr(loaded_source, config.source_name_field)
+                    return source_name == config.expected_value
+
+                # Otherwise compare IDs against the cached name→id map
+                if config.id_cache is not None:
+                    session = object_session(self)
+                    if session is not None:
+                        expected_id = config.id_cache.get_id(
+                            session, config.expected_value
+                        )
+                    else:
+                        expected_id = config.id_cache.peek_id(config.expected_value)
+                    if expected_id is not None:
+                        return source_id == expected_id
+
+                # Try to get the source via the relationship (may lazy-load)
                 if hasattr(self, source_relationship_name):
                     source = getattr(self, source_relationship_name)
                     if source:
@@ -1486,6 +1595,16 @@ class StatusCheckMixin:
                 )
 
             elif isinstance(config, SourceStatusConfig):
+                # Compare IDs directly when the expected source is cached. The
+                # expression isn't tied to a database, so peek_id only answers
+                # while a single engine is in use.
+                if config.id_cache is not None:
+                    expected_id = config.id_cache.peek_id(config.expected_value)
+                    if expected_id is not None:
+                        return (
+                            getattr(cls_inner, config.source_field) == expected_id
+                        ).label(property_name)
+
                 # Source-based status with JOIN
                 source_field = getattr(config.source_model, config.source_name_field)
                 return (
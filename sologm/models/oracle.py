@@ -39,6 +39,14 @@ class InterpretationSet(CountingMixin, Base, TimestampMixin):
     scene_id: Mapped[str] = mapped_column(
         ForeignKey("scenes.id", ondelete="CASCADE"), nullable=False
     )
+    # Denormalized from the scene hierarchy so act- and game-wide queries can
+    # filter directly; maintained by sologm.models.hierarchy.
+    act_id: Mapped[str] = mapped_column(
+        ForeignKey("acts.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    game_id: Mapped[str] = mapped_column(
+        ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     context: Mapped[str] = mapped_column(Text, nullable=False)
     oracle_results: Mapped[str] = mapped_column(Text, nullable=False)
     retry_attempt: Mapped[int] = mapped_column(Integer, default=0)
@@ -46,6 +54,12 @@ class InterpretationSet(CountingMixin, Base, TimestampMixin):
     # Flag for current interpretation set in a game
     is_current: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Materialized counters, maintained by sologm.models.counters and read
+    # by the generated *_count properties.
+    interpretation_count_stored: Mapped[int] = mapped_column(
+        "interpretation_count", Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships this model owns
     interpretations: Mapped[List["Interpretation"]] = relationship(
         "Interpretation",
@@ -55,6 +69,8 @@ class InterpretationSet(CountingMixin, Base, TimestampMixin):
 
     # Configuration for CountingMixin will be set after Interpretation class is defined
     _counting_configs = {}
+    _stored_counts = ("interpretation",)
+    _read_stored_counts = True
 
     @property
     def act(self) -> "Act":
@@ -62,22 +78,12 @@ class InterpretationSet(CountingMixin, Base, TimestampMixin):
         relationship."""
         return self.scene.act
 
-    @property
-    def act_id(self) -> str:
-        """Get the act ID this interpretation set belongs to."""
-        return self.scene.act_id
-
     @property
     def game(self) -> "Game":
         """Get the game this interpretation set belongs to through the scene
         and act relationships."""
         return self.scene.act.game
 
-    @property
-    def game_id(self) -> str:
-        """Get the game ID this interpretation set belongs to."""
-        return self.scene.act.game_id
-
     @property
     def selected_interpretation(self) -> Optional["Interpretation"]:
         """Get the selected interpretation from this set, if any.
@@ -153,11 +159,25 @@ class Interpretation(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
     set_id: Mapped[str] = mapped_column(
         ForeignKey("interpretation_sets.id", ondelete="CASCADE"), nullable=False
     )
+    # Denormalized from the interpretation set so act- and game-wide queries can
+    # filter directly; maintained by sologm.models.hierarchy.
+    act_id: Mapped[str] = mapped_column(
+        ForeignKey("acts.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    game_id: Mapped[str] = mapped_column(
+        ForeignKey("games.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     title: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     slug: Mapped[str] = mapped_column(nullable=False)
     is_selected: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Materialized counters, maintained by sologm.models.counters and read
+    # by the generated *_count properties.
+    event_count_stored: Mapped[int] = mapped_column(
+        "event_count", Integer, nullable=False, default=0, server_default="0"
+    )
+
     # Relationships this model owns
     events: Mapped[List["Event"]] = relationship(
         "Event", back_populates="interpretation"
@@ -188,6 +208,8 @@ class Interpretation(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
         }
 
     _counting_configs = _get_counting_configs()
+    _stored_counts = ("event",)
+    _read_stored_counts = True
 
     # Removed the recursive property
 
@@ -207,21 +229,11 @@ class Interpretation(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
         """Get the act this interpretation belongs to through the scene relationship."""
         return self.scene.act
 
-    @property
-    def act_id(self) -> str:
-        """Get the act ID this interpretation belongs to."""
-        return self.scene.act_id
-
     @property
     def game(self) -> "Game":
         """Get the game this interpretation belongs to through the act relationship."""
         return self.act.game
 
-    @property
-    def game_id(self) -> str:
-        """Get the game ID this interpretation belongs to."""
-        return self.act.game_id
-
     @property
     def short_description(self) -> str:
         """Get a shortened version of the description.
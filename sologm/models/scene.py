@@ -5,15 +5,17 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 
 from sqlalchemy import (
     ForeignKey,
+    Index,
     Integer,
     Text,
     UniqueConstraint,
     select,
+    text,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from sologm.models.base import Base, TimestampMixin
+from sologm.models.base import Base, TimestampMixin, VersionedMixin
 from sologm.models.mixins import (
     CountingMixin,
     CrossTableCountConfig,
@@ -35,17 +37,30 @@ if TYPE_CHECKING:
     from sologm.models.act import (
         Act,
     )  # Added Act for relationship back_populates type hint
+    from sologm.models.context_digest import ContextDigest
     from sologm.models.dice import DiceRoll
     from sologm.models.event import Event
     from sologm.models.game import Game
     from sologm.models.oracle import Interpretation, InterpretationSet
+    from sologm.models.scene_summary import SceneSummary
 
 
-class Scene(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
+class Scene(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin, VersionedMixin):
     """SQLAlchemy model representing a scene in a game."""
 
     __tablename__ = "scenes"
-    __table_args__ = (UniqueConstraint("act_id", "slug", name="uix_act_scene_slug"),)
+    __table_args__ = (
+        UniqueConstraint("act_id", "slug", name="uix_act_scene_slug"),
+        UniqueConstraint("act_id", "sequence", name="uix_act_scene_sequence"),
+        # At most one active scene per act (partial index, where supported)
+        Index(
+            "uix_act_active_scene",
+            "act_id",
+            unique=True,
+            sqlite_where=text("is_active"),
+            postgresql_where=text("is_active"),
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
 
     id: Mapped[str] = mapped_column(primary_key=True, default=lambda: str(uuid.uuid4()))
     slug: Mapped[str] = mapped_column(nullable=False, index=True)
@@ -60,6 +75,22 @@ class Scene(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
         default=False, index=True
     )  # True if this is the current scene being played in its act.
 
+    # Materialized counters, maintained by sologm.models.counters and read
+    # by the generated *_count properties.
+    event_count_stored: Mapped[int] = mapped_column(
+        "event_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    dice_roll_count_stored: Mapped[int] = mapped_column(
+        "dice_roll_count", Integer, nullable=False, default=0, server_default="0"
+    )
+    interpretation_set_count_stored: Mapped[int] = mapped_column(
+        "interpretation_set_count",
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
     # Relationships
     events: Mapped[List["Event"]] = relationship(
         "Event",
@@ -79,6 +110,19 @@ class Scene(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
         cascade="all, delete-orphan",  # Added cascade to match ondelete
         lazy="selectin",  # Use selectin loading for potential performance gain.
     )
+    # Cache only, so loaded on demand rather than with the scene
+    summary_cache: Mapped[Optional["SceneSummary"]] = relationship(
+        "SceneSummary",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+    )
+    context_digest: Mapped[Optional["ContextDigest"]] = relationship(
+        "ContextDigest",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        uselist=False,
+    )
 
     # Define the relationship back to Act within TYPE_CHECKING to avoid
     # circular imports.
@@ -150,6 +194,8 @@ class Scene(ExistenceCheckMixin, CountingMixin, Base, TimestampMixin):
         }
 
     _counting_configs = _get_counting_configs()
+    _stored_counts = ("event", "dice_roll", "interpretation_set")
+    _read_stored_counts = True
 
     # --- Accessor Properties ---
 
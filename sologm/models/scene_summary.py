@@ -0,0 +1,23 @@
+"""Cached AI summaries of individual scenes."""
+
+from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sologm.models.base import Base, TimestampMixin
+
+
+class SceneSummary(Base, TimestampMixin):
+    """SQLAlchemy model caching the AI summary of a scene's events.
+
+    Long acts are summarized scene by scene before the act summary or
+    narrative is generated. A scene's summary is reused until the hash of
+    the content it was generated from changes.
+    """
+
+    __tablename__ = "scene_summaries"
+
+    scene_id: Mapped[str] = mapped_column(
+        ForeignKey("scenes.id", ondelete="CASCADE"), primary_key=True
+    )
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
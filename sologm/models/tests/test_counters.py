@@ -0,0 +1,163 @@
+"""Tests for the materialized relationship counters."""
+
+from typing import Callable
+
+from sqlalchemy import select, update
+
+from sologm.database.session import SessionContext
+from sologm.models.act import Act
+from sologm.models.counters import recount
+from sologm.models.scene import Scene
+
+
+class TestMaterializedCounters:
+    """Test counters follow inserts, deletes and moves, and can be rebuilt."""
+
+    def test_insert_and_delete(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        create_test_interpretation_set: Callable,
+        create_test_interpretation: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test stored counts track children as they come and go."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+            events = [create_test_event(session, scene_id=scene.id) for _ in range(3)]
+            interp_set = create_test_interpretation_set(session, scene_id=scene.id)
+            create_test_interpretation(session, set_id=interp_set.id)
+            create_test_interpretation(session, set_id=interp_set.id)
+
+            assert game.act_count_stored == 1
+            assert act.scene_count_stored == 1
+            assert act.event_count_stored == 3
+            assert act.interpretation_count_stored == 2
+            assert scene.event_count_stored == 3
+            assert scene.interpretation_set_count_stored == 1
+            assert interp_set.interpretation_count_stored == 2
+
+            session.delete(events[0])
+            session.flush()
+
+            assert scene.event_count_stored == 2
+            assert act.event_count_stored == 2
+
+            session.expire_all()
+            assert scene.event_count_stored == 2
+            assert act.event_count_stored == 2
+
+    def test_scene_move_recounts_acts(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test moving a scene shifts its counts between acts."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            first_act = create_test_act(session, game_id=game.id, sequence=1)
+            second_act = create_test_act(
+                session, game_id=game.id, sequence=2, is_active=False
+            )
+            scene = create_test_scene(session, act_id=first_act.id)
+            create_test_event(session, scene_id=scene.id)
+            create_test_event(session, scene_id=scene.id)
+
+            scene.act_id = second_act.id
+            session.flush()
+
+            assert first_act.scene_count_stored == 0
+            assert first_act.event_count_stored == 0
+            assert second_act.scene_count_stored == 1
+            assert second_act.event_count_stored == 2
+
+    def test_hybrids_read_stored_columns(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        initialize_event_sources: Callable,
+        monkeypatch,
+    ) -> None:
+        """Test the *_count properties use the stored column when switched on."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+            create_test_event(session, scene_id=scene.id)
+
+            session.execute(
+                update(Scene).where(Scene.id == scene.id).values(event_count=7)
+            )
+            session.expire(scene)
+
+            assert scene.event_count == 7
+            assert session.execute(select(Scene.event_count)).scalar_one() == 7
+
+            monkeypatch.setattr(Scene, "_read_stored_counts", False)
+            assert scene.event_count == 1
+            assert session.execute(select(Scene.event_count)).scalar_one() == 1
+
+    def test_unflushed_children_are_counted(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+    ) -> None:
+        """Test counts include children added since the last flush."""
+        with session_context as session:
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            create_test_scene(session, act_id=act.id)
+            assert act.scene_count == 1
+
+            session.add(Scene.create(act.id, "Unflushed", None, sequence=2))
+
+            assert act.scene_count_stored == 1
+            assert act.scene_count == 2
+            session.flush()
+            assert act.scene_count_stored == 2
+            assert act.scene_count == 2
+
+    def test_recount_repairs_drift(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test recount fixes counters changed behind the ORM's back."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+            create_test_event(session, scene_id=scene.id)
+
+            session.execute(update(Act).values(event_count=0, scene_count=5))
+
+            results = recount(session)
+
+            assert results["acts.event_count"] == 1
+            assert results["acts.scene_count"] == 1
+            assert results["scenes.event_count"] == 0
+            assert act.event_count_stored == 1
+            assert act.scene_count_stored == 1
+            assert recount(session) == dict.fromkeys(results, 0)
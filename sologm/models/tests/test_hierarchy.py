@@ -0,0 +1,130 @@
+"""Tests for the denormalized act_id/game_id columns."""
+
+from typing import Callable
+
+from sologm.core.factory import create_all_managers
+from sologm.database.session import SessionContext
+from sologm.models.dice import DiceRoll
+from sologm.models.event import Event
+from sologm.models.oracle import Interpretation, InterpretationSet
+
+
+class TestDenormalizedAncestry:
+    """Test that act_id/game_id are filled on insert and follow scene moves."""
+
+    def test_filled_on_insert(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        create_test_interpretation_set: Callable,
+        create_test_interpretation: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test every scene-owned row records its act and game."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scene = create_test_scene(session, act_id=act.id)
+
+            event = create_test_event(session, scene_id=scene.id)
+            interp_set = create_test_interpretation_set(session, scene_id=scene.id)
+            interpretation = create_test_interpretation(session, set_id=interp_set.id)
+            roll = DiceRoll.create(
+                notation="1d6",
+                individual_results=[3],
+                modifier=0,
+                total=3,
+                scene_id=scene.id,
+            )
+            session.add(roll)
+            session.flush()
+
+            for row in (event, interp_set, interpretation, roll):
+                assert (row.act_id, row.game_id) == (act.id, game.id)
+
+    def test_sceneless_dice_roll(self, session_context: SessionContext) -> None:
+        """Test dice rolls without a scene have no ancestry."""
+        with session_context as session:
+            roll = DiceRoll.create(
+                notation="1d6", individual_results=[3], modifier=0, total=3
+            )
+            session.add(roll)
+            session.flush()
+
+            assert roll.act_id is None
+            assert roll.game_id is None
+
+    def test_scene_move_propagates(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        create_test_interpretation_set: Callable,
+        create_test_interpretation: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test moving a scene to another act updates its rows."""
+        with session_context as session:
+            initialize_event_sources(session)
+            game = create_test_game(session)
+            first_act = create_test_act(session, game_id=game.id, sequence=1)
+            second_act = create_test_act(
+                session, game_id=game.id, sequence=2, is_active=False
+            )
+            scene = create_test_scene(session, act_id=first_act.id)
+            event = create_test_event(session, scene_id=scene.id)
+            interp_set = create_test_interpretation_set(session, scene_id=scene.id)
+            create_test_interpretation(session, set_id=interp_set.id)
+
+            scene.act_id = second_act.id
+            session.flush()
+
+            assert event.act_id == second_act.id
+            assert (
+                session.query(Event).filter(Event.act_id == second_act.id).count() == 1
+            )
+            assert (
+                session.query(Interpretation)
+                .filter(Interpretation.act_id == second_act.id)
+                .count()
+                == 1
+            )
+            moved_out = session.query(Event).filter(Event.act_id == first_act.id)
+            assert moved_out.count() == 0
+
+    def test_act_wide_queries(
+        self,
+        session_context: SessionContext,
+        create_test_game: Callable,
+        create_test_act: Callable,
+        create_test_scene: Callable,
+        create_test_event: Callable,
+        create_test_interpretation_set: Callable,
+        initialize_event_sources: Callable,
+    ) -> None:
+        """Test act-level listings span all scenes without joins."""
+        with session_context as session:
+            initialize_event_sources(session)
+            managers = create_all_managers(session)
+            game = create_test_game(session)
+            act = create_test_act(session, game_id=game.id)
+            scenes = [
+                create_test_scene(session, act_id=act.id, title=f"Scene {i}")
+                for i in range(3)
+            ]
+            for scene in scenes:
+                create_test_event(session, scene_id=scene.id)
+                create_test_interpretation_set(session, scene_id=scene.id)
+
+            events = managers.event.list_events_for_act(act.id)
+            assert {event.scene_id for event in events} == {s.id for s in scenes}
+
+            sets = managers.oracle.list_interpretation_sets(act_id=act.id)
+            assert len(sets) == 3
+            assert all(isinstance(s, InterpretationSet) for s in sets)
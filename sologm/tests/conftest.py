@@ -4,6 +4,7 @@
 import logging
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 from unittest.mock import MagicMock
 
@@ -13,9 +14,11 @@ from sqlalchemy import Engine, create_engine, event  # Import event
 from sqlalchemy.orm import Session
 
 # Local application/library imports
+from sologm.core.digest import digest_worker
 from sologm.core.factory import create_all_managers
 from sologm.database.session import DatabaseManager, SessionContext
 from sologm.integrations.anthropic import AnthropicClient
+from sologm.integrations.throttle import reset_call_guard
 from sologm.models.base import Base
 from sologm.models.event import Event
 from sologm.models.event_source import EventSource
@@ -99,6 +102,10 @@ def database_manager(
     # Restore the original singleton instance to prevent test pollution.
     logger.debug("Restoring original DatabaseManager instance")
     DatabaseManager._instance = old_instance
+    # Let digest updates queued by the test finish before the tables go away
+    digest_worker.join()
+    # Stop counting the test engine as in use (see EventSourceCache)
+    db_manager.dispose()
 
 
 # --- Mock Fixtures ---
@@ -151,6 +158,22 @@ def mock_anthropic_client() -> MagicMock:
     return MagicMock(spec=AnthropicClient)
 
 
+@pytest.fixture(autouse=True)
+def fresh_call_guard() -> Generator[None, None, None]:
+    """Give each test its own rate limiter and circuit breaker state."""
+    reset_call_guard()
+    yield
+    reset_call_guard()
+
+
+@pytest.fixture(autouse=True)
+def ai_metrics_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write AI metrics to a temporary file instead of the user's."""
+    path = tmp_path / "ai_metrics.jsonl"
+    monkeypatch.setenv("SOLOGM_AI_METRICS_FILE", str(path))
+    return path
+
+
 @pytest.fixture(autouse=True)
 def auto_mock_anthropic_client(
     monkeypatch: pytest.MonkeyPatch, mock_anthropic_client: MagicMock
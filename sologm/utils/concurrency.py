@@ -0,0 +1,64 @@
+"""Blocking waits that yield to the event loop when run from async code.
+
+The async managers run the sync managers inside ``AsyncSession.run_sync``,
+which executes them in a greenlet on the event loop thread. A plain blocking
+call there (an HTTP request, waiting on a thread pool) stalls every other
+task on the loop. The helpers here detect that case and hand the wait to the
+loop instead, and behave exactly like the plain call everywhere else.
+"""
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import wait as wait_futures
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+T = TypeVar("T")
+
+
+def on_event_loop() -> bool:
+    """Check whether the caller runs inside ``AsyncSession.run_sync``."""
+    return bool(in_greenlet())
+
+
+def call_blocking(
+    function: Callable[..., T],
+    *args: Any,
+    async_function: Optional[Callable[..., Awaitable[T]]] = None,
+    **kwargs: Any,
+) -> T:
+    """Call a blocking function without holding the event loop.
+
+    Args:
+        function: The blocking callable.
+        *args: Positional arguments for the call.
+        async_function: Coroutine function with the same arguments, awaited
+            instead of running ``function`` in a worker thread when given.
+        **kwargs: Keyword arguments for the call.
+
+    Returns:
+        The result of the call.
+    """
+    if not on_event_loop():
+        return function(*args, **kwargs)
+    if async_function is not None:
+        return await_only(async_function(*args, **kwargs))
+    return await_only(asyncio.to_thread(function, *args, **kwargs))
+
+
+def wait_all(futures: Iterable[Future]) -> None:
+    """Wait for thread pool futures to finish, yielding to the event loop.
+
+    Args:
+        futures: Futures to wait for. Their outcome is left for the caller
+            to collect.
+    """
+    futures = list(futures)
+    if not futures:
+        return
+    if on_event_loop():
+        await_only(asyncio.wait([asyncio.wrap_future(f) for f in futures]))
+    else:
+        wait_futures(futures)
@@ -2,8 +2,10 @@
 
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import yaml
 
@@ -12,11 +14,27 @@ from sologm.utils.errors import ConfigError
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "no default given" from an explicit None
+_MISSING = object()
+
 
 class Config:
-    """Configuration manager for Solo RPG Helper."""
+    """Configuration manager for Solo RPG Helper.
+
+    Values resolve in order: environment variables, the config file, then
+    built-in defaults. File and default values are merged once into an
+    immutable snapshot, so lookups are plain dictionary reads. The snapshot
+    is rebuilt after ``set`` and, via ``refresh_if_changed``, when the config
+    file's modification time changes (e.g. edited while a long-running
+    process is up). Environment variables are still read on each lookup,
+    but the candidate variable names per key are computed only once.
+
+    Creating the singleton and reloading or writing the file are guarded by
+    locks, so the instance can be shared by worker threads.
+    """
 
     _instance = None
+    _instance_lock = threading.Lock()
 
     @classmethod
     def get_instance(cls, config_path: Optional[Path] = None) -> "Config":
@@ -29,14 +47,18 @@ class Config:
         Returns:
             The singleton Config instance
         """
-        if cls._instance is None:
-            logger.debug("Creating new Config instance")
-            cls._instance = cls(config_path)
-        elif config_path is not None:
-            # Reinitialize with new path if specified
-            logger.debug(f"Reinitializing Config with new path: {config_path}")
-            cls._instance = cls(config_path)
-        return cls._instance
+        instance = cls._instance
+        if instance is not None and config_path is None:
+            return instance
+        with cls._instance_lock:
+            if cls._instance is None:
+                logger.debug("Creating new Config instance")
+                cls._instance = cls(config_path)
+            elif config_path is not None:
+                # Reinitialize with new path if specified
+                logger.debug("Reinitializing Config with new path: %s", config_path)
+                cls._instance = cls(config_path)
+            return cls._instance
 
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize configuration manager.
@@ -49,71 +71,162 @@ class Config:
         self.config_path = config_path or self.base_dir / "config.yaml"
         # Store config_file path for potential use elsewhere (like logger)
         self.config_file = self.config_path
-        logger.debug(f"Initializing Config with path: {self.config_path}")
+        logger.debug("Initializing Config with path: %s", self.config_path)
         self._config: Dict[str, Any] = {}
+        self._snapshot: Mapping[str, Any] = MappingProxyType({})
+        self._mtime: Optional[float] = None
+        self._env_names: Dict[str, Tuple[str, ...]] = {}
+        self._lock = threading.RLock()
         self._load_config()
 
+    def _default_values(self) -> Dict[str, Any]:
+        """Get the built-in default configuration."""
+        return {
+            "anthropic_api_key": "",
+            "default_interpretations": 5,
+            "oracle_retries": 2,
+            "debug": False,
+            "database_url": f"sqlite:///{self.base_dir / 'sologm.db'}",
+            # --- Connection pool defaults ---
+            "db_pool_size": 5,
+            "db_max_overflow": 10,
+            "db_pool_timeout": 30,
+            "db_pool_recycle": 1800,
+            # --- Multi-tenant defaults ---
+            "tenant_database_url": (
+                f"sqlite:///{self.base_dir / 'tenants'}/{{tenant}}.db"
+            ),
+            "tenant_cache_size": 64,
+            "tenant_idle_timeout": 600,
+            # --- Prompt size defaults ---
+            "oracle_prompt_max_tokens": 4000,
+            "oracle_recent_events": 5,
+            "exact_token_counts": False,
+            # --- Context digest defaults ---
+            "context_digest_mode": "deferred",
+            "context_digest_words": 200,
+            # --- Long act summarization defaults ---
+            "act_prompt_max_tokens": 15000,
+            "summary_concurrency": 4,
+            "summary_chunk_chars": 40000,
+            # --- AI rate limit and retry defaults ---
+            "ai_requests_per_minute": 0,
+            "ai_tokens_per_minute": 0,
+            "ai_max_retries": 3,
+            "ai_retry_base_delay_ms": 500,
+            "ai_retry_max_delay_ms": 30000,
+            "ai_circuit_failures": 5,
+            "ai_circuit_reset_seconds": 30,
+            # --- AI metrics defaults ---
+            "ai_metrics": True,
+            "ai_metrics_file": str(self.base_dir / "ai_metrics.jsonl"),
+            # --- Recorded AI response defaults ---
+            "ai_cassette": "",
+            "ai_cassette_mode": "replay",
+            "ai_replay_match": "request",
+            "ai_replay_latency_ms": 0,
+            "ai_replay_tokens_per_second": 0,
+            "ai_replay_failures": "",
+            "ai_replay_seed": 0,
+            # --- Logging config defaults (flat keys) ---
+            "log_file_path": str(self.base_dir / "sologm.log"),  # Store as string
+            "log_max_bytes": 5 * 1024 * 1024,  # 5 MB
+            "log_backup_count": 1,
+        }
+
     def _load_config(self) -> None:
         """Load configuration from file."""
         # Create base directory if it doesn't exist
         if not self.base_dir.exists():
-            logger.debug(f"Creating base directory: {self.base_dir}")
+            logger.debug("Creating base directory: %s", self.base_dir)
             self.base_dir.mkdir(parents=True, exist_ok=True)
 
         # Create default config if it doesn't exist
         if not self.config_path.exists():
             logger.debug(
-                f"Config file not found, creating default at: {self.config_path}"
+                "Config file not found, creating default at: %s", self.config_path
             )
             # Call _create_default_config WITHOUT the base_dir argument
             self._create_default_config()
         else:
-            logger.debug(f"Loading existing config from: {self.config_path}")
+            logger.debug("Loading existing config from: %s", self.config_path)
 
         # Load config
         try:
             with open(self.config_path, "r") as f:
                 self._config = yaml.safe_load(f) or {}
-                logger.debug(f"Loaded configuration with {len(self._config)} keys")
+                logger.debug("Loaded configuration with %d keys", len(self._config))
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             raise ConfigError(f"Failed to load configuration: {e}") from e
+        self._build_snapshot()
 
     # Removed base_dir argument here
     def _create_default_config(self) -> None:
         """Create default configuration file."""
-        # Use self.base_dir directly
-        # --- Database Default ---
-        default_db_path = self.base_dir / "sologm.db"
-        default_db_url = f"sqlite:///{default_db_path}"
-        logger.debug(f"Using default database URL: {default_db_url}")
-
-        # --- New: Define default log settings using self.base_dir ---
-        default_log_file_path = self.base_dir / "sologm.log"
-        default_log_max_bytes = 5 * 1024 * 1024  # 5 MB
-        default_log_backup_count = 1
-
-        default_config = {
-            "anthropic_api_key": "",
-            "default_interpretations": 5,
-            "oracle_retries": 2,
-            "debug": False,
-            "database_url": default_db_url,
-            # --- Add logging config defaults (flat keys) ---
-            "log_file_path": str(default_log_file_path),  # Store as string
-            "log_max_bytes": default_log_max_bytes,
-            "log_backup_count": default_log_backup_count,
-        }
+        default_config = self._default_values()
 
         try:
-            logger.debug(f"Writing default configuration to: {self.config_path}")
+            logger.debug("Writing default configuration to: %s", self.config_path)
             with open(self.config_path, "w") as f:
                 yaml.dump(default_config, f, default_flow_style=False)
             self._config = default_config
         except Exception as e:
-            logger.error(f"Failed to create default configuration: {e}")
+            logger.error("Failed to create default configuration: %s", e)
             raise ConfigError(f"Failed to create default configuration: {e}") from e
 
+    def _build_snapshot(self) -> None:
+        """Merge defaults and file values into a new immutable snapshot."""
+        resolved = self._default_values()
+        resolved.update(self._config)
+        self._snapshot = MappingProxyType(resolved)
+        self._mtime = self._file_mtime()
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return self.config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def refresh_if_changed(self) -> bool:
+        """Reload the config file if it changed on disk since the last load.
+
+        Long-running processes call this between requests; it costs one
+        ``stat`` when nothing changed.
+
+        Returns:
+            True if the configuration was reloaded.
+        """
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        with self._lock:
+            # Another thread may have reloaded while we waited
+            if self._file_mtime() == self._mtime:
+                return False
+            logger.debug("Config file %s changed, reloading", self.config_path)
+            self._load_config()
+        return True
+
+    @property
+    def snapshot(self) -> Mapping[str, Any]:
+        """Read-only view of the resolved file and default values.
+
+        Environment overrides are not included; use ``get`` for those.
+        """
+        return self._snapshot
+
+    def _env_names_for(self, key: str) -> Tuple[str, ...]:
+        """Get the environment variables that can override a key, by priority."""
+        names = self._env_names.get(key)
+        if names is None:
+            names = (f"SOLOGM_{key.upper()}",)
+            if key.endswith("_api_key"):
+                # API keys also accept the provider's conventional variable
+                names += (f"{key[:-8].upper()}_API_KEY",)
+            self._env_names[key] = names
+        return names
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using flat keys.
 
@@ -124,11 +237,9 @@ class Config:
         Returns:
             Configuration value.
         """
-        # Check environment variables first (using flat key)
-        env_key = f"SOLOGM_{key.upper()}"
-        env_value = os.environ.get(env_key)
+        prefixed, *others = self._env_names_for(key)
+        env_value = os.environ.get(prefixed)
         if env_value is not None:
-            logger.debug(f"Using environment variable {env_key} for config key: {key}")
             # Attempt to convert common types from env vars
             if env_value.isdigit():
                 return int(env_value)
@@ -136,29 +247,69 @@ class Config:
                 return env_value.lower() == "true"
             return env_value
 
-        # Special case for API keys (remains the same)
-        if key.endswith("_api_key"):
-            # Check for environment variable without prefix
-            api_env_key = f"{key[:-8].upper()}_API_KEY"
-            api_env_value = os.environ.get(api_env_key)
-            if api_env_value is not None:
-                logger.debug(
-                    f"Using environment variable {api_env_key} for API key: {key}"
-                )
-                return api_env_value
-
-        # Fall back to config file (direct lookup)
-        value = self._config.get(key, default)
-        # Log appropriately (avoid logging full API keys)
-        log_value = "****" if key.endswith("_api_key") else value
-        if key in self._config:
-            logger.debug(f"Using config file value for key: {key}={log_value}")
-        else:
-            logger.debug(
-                f"Key '{key}' not found in config file, using default: {log_value}"
-            )
+        for name in others:
+            env_value = os.environ.get(name)
+            if env_value is not None:
+                return env_value
+
+        return self._snapshot.get(key, default)
+
+    def get_str(self, key: str, default: Any = _MISSING) -> Optional[str]:
+        """Get a configuration value as a string.
+
+        Args:
+            key: Configuration key.
+            default: Value to return if the key is unset. None if omitted.
+
+        Returns:
+            The value converted to str, or the default.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return None if default is _MISSING else default
+        return str(value)
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        """Get a configuration value as an integer.
+
+        Args:
+            key: Configuration key.
+            default: Value to return if the key is unset.
+
+        Returns:
+            The integer value, or the default.
+
+        Raises:
+            ConfigError: If the value can't be converted to an integer.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        try:
+            return int(value)
+        except (TypeError, ValueError) as e:
+            raise ConfigError(
+                f"Configuration value '{key}' must be an integer, got {value!r}"
+            ) from e
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        """Get a configuration value as a boolean.
+
+        Strings such as "1", "true" and "yes" (any case) count as True.
+
+        Args:
+            key: Configuration key.
+            default: Value to return if the key is unset.
+
+        Returns:
+            The boolean value, or the default.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING or value is None:
             return default
-        return value
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes", "on")
+        return bool(value)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value.
@@ -169,29 +320,34 @@ class Config:
         """
         if key.endswith("_api_key"):
             # Don't log actual API key values
-            logger.debug(f"Setting config value for API key: {key}")
+            logger.debug("Setting config value for API key: %s", key)
         else:
-            logger.debug(f"Setting config value: {key}={value}")
-        # Direct assignment for flat keys
-        self._config[key] = value
-        self._save_config()
+            logger.debug("Setting config value: %s=%s", key, value)
+        with self._lock:
+            # Direct assignment for flat keys
+            self._config[key] = value
+            self._save_config()
+            self._build_snapshot()
 
     def _save_config(self) -> None:
         """Save configuration to file."""
         try:
-            logger.debug(f"Saving configuration to: {self.config_path}")
+            logger.debug("Saving configuration to: %s", self.config_path)
             with open(self.config_path, "w") as f:
                 yaml.dump(self._config, f, default_flow_style=False)
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
             raise ConfigError(f"Failed to save configuration: {e}") from e
 
 
 def get_config() -> Config:
     """Get the global Config instance.
 
+    Picks up edits to the config file made since it was last loaded.
+
     Returns:
         The singleton Config instance
     """
-    logger.debug("Getting global Config instance")
-    return Config.get_instance()
+    config = Config.get_instance()
+    config.refresh_if_changed()
+    return config
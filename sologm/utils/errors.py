@@ -1,5 +1,7 @@
 """Error classes for Solo RPG Helper."""
 
+from typing import Sequence
+
 
 class SoloGMError(Exception):
     """Base exception for all Solo GM errors."""
@@ -37,6 +39,18 @@ class EventError(SoloGMError):
     pass
 
 
+class ConflictError(SoloGMError):
+    """A row was changed by another writer since it was read.
+
+    Attributes:
+        fields: The fields both writers changed, when known.
+    """
+
+    def __init__(self, message: str, fields: Sequence[str] = ()) -> None:
+        super().__init__(message)
+        self.fields = tuple(fields)
+
+
 class OracleError(SoloGMError):
     """Errors related to oracle interpretation."""
 
@@ -59,3 +73,15 @@ class APIError(SoloGMError):
     """Errors related to external API calls."""
 
     pass
+
+
+class CircuitOpenError(APIError):
+    """AI calls are failing fast after repeated failures.
+
+    Attributes:
+        retry_in: Seconds until a trial call is allowed again.
+    """
+
+    def __init__(self, message: str, retry_in: float) -> None:
+        super().__init__(message)
+        self.retry_in = retry_in
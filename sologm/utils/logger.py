@@ -1,11 +1,14 @@
 """Logging utilities for Solo RPG Helper."""
 
+import atexit
 import logging
 import logging.handlers  # Import handlers
 import os
+import queue
 import sys
+import threading
 from pathlib import Path  # Use pathlib for paths
-from typing import Optional
+from typing import Any, Callable, Optional
 
 # Import get_config here
 from sologm.utils.config import ConfigError, get_config
@@ -13,13 +16,99 @@ from sologm.utils.config import ConfigError, get_config
 # Define application name for potential use
 APP_NAME = "sologm"
 
+# Background thread draining the file log queue (non-debug mode only)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def debug_enabled(logger: logging.Logger) -> bool:
+    """Check whether DEBUG records from a logger would be emitted.
+
+    Use this to guard debug output whose arguments are expensive to build.
+    Plain ``logger.debug("... %s", value)`` calls don't need a guard, since
+    %-style arguments are only formatted when the record is emitted.
+
+    Args:
+        logger: The logger to check.
+
+    Returns:
+        True if DEBUG is enabled for the logger.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+class LazyValue:
+    """Defer computing a log argument until the message is formatted.
+
+    Example:
+        logger.debug("Context: %s", LazyValue(build_context_summary, scene))
+    """
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    def __repr__(self) -> str:
+        return repr(self._func(*self._args))
+
+
+def _start_queue_listener(target: logging.Handler) -> logging.Handler:
+    """Route records for a handler through a background thread.
+
+    Records are merged with their arguments in the calling thread (so they
+    never touch objects from another thread), then timestamped, formatted and
+    written by the listener.
+
+    Args:
+        target: The handler that performs the actual output.
+
+    Returns:
+        The QueueHandler to attach to the logger in place of ``target``.
+    """
+    global _queue_listener
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, target, respect_handler_level=True
+    )
+    with _listener_lock:
+        _queue_listener = listener
+    listener.start()
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def stop_queue_listener() -> None:
+    """Flush queued records and stop the background logging thread.
+
+    Safe to call when no listener is running. Registered with ``atexit`` so
+    pending records reach the log file before the process exits.
+    """
+    global _queue_listener
+
+    with _listener_lock:
+        listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_queue_listener)
+
 
 def setup_root_logger(debug: Optional[bool] = None) -> None:
     """Configure the root logger for the application.
 
     Reads logging settings (path, size, backups) from config.
     - In debug mode: Logs DEBUG and above to stdout.
-    - In non-debug mode: Logs INFO and above to a configured rotating file.
+    - In non-debug mode: Logs INFO and above to a configured rotating file,
+      written by a background thread via a QueueHandler/QueueListener pair.
 
     Args:
         debug: Override debug setting from config. If None, checks env var
@@ -34,7 +123,7 @@ def setup_root_logger(debug: Optional[bool] = None) -> None:
         # Setup minimal stderr logging for errors only
         logger = logging.getLogger("sologm")
         logger.setLevel(logging.ERROR)
-        handler = logging.StreamHandler(sys.stderr)
+        handler: logging.Handler = logging.StreamHandler(sys.stderr)
         handler.setLevel(logging.ERROR)
         formatter = logging.Formatter("%(levelname)s: %(message)s")
         handler.setFormatter(formatter)
@@ -48,12 +137,13 @@ def setup_root_logger(debug: Optional[bool] = None) -> None:
     if debug_env is not None:
         debug = debug_env.lower() in ("1", "true", "yes")
     elif debug is None:
-        debug = config.get("debug", False)  # Default to False if key missing
+        debug = config.get_bool("debug", False)  # Default to False if key missing
 
     # Get the root logger for the application package
     logger = logging.getLogger("sologm")
 
     # Remove any existing handlers to prevent duplicates and ensure clean setup
+    stop_queue_listener()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
         handler.close()  # Close handlers before removing
@@ -73,14 +163,14 @@ def setup_root_logger(debug: Optional[bool] = None) -> None:
         # --- Get logging config with defaults ---
         # Use config.base_dir for the default path calculation
         default_log_path = config.base_dir / f"{APP_NAME}.log"  # Calculate default path
-        log_file_path_str = config.get(
+        log_file_path_str = config.get_str(
             "log_file_path", str(default_log_path)
         )  # Use flat key
         log_max_bytes = config.get("log_max_bytes", 5 * 1024 * 1024)  # Use flat key
         log_backup_count = config.get("log_backup_count", 1)  # Use flat key
 
         # --- Determine final log file path ---
-        log_file_path = Path(log_file_path_str)
+        log_file_path = Path(log_file_path_str or default_log_path)
         # Check if the configured path is absolute.
         # If not, make it relative to config.base_dir
         if not log_file_path.is_absolute():
@@ -138,15 +228,20 @@ def setup_root_logger(debug: Optional[bool] = None) -> None:
 
     # Common steps: Set formatter and add handler
     handler.setFormatter(formatter)
+    if isinstance(handler, logging.handlers.RotatingFileHandler):
+        # Keep file I/O off the command's critical path
+        handler = _start_queue_listener(handler)
     logger.addHandler(handler)
 
     # Optional: Log the mode for clarity, especially in the log file
     if not debug:
         # Use the resolved log_file_path here
         logger.info(
-            f"--- Starting sologm session (Log Level: INFO, "
-            f"File: {log_file_path}, MaxBytes: {log_max_bytes}, "
-            f"Backups: {log_backup_count}) ---"
+            "--- Starting sologm session (Log Level: INFO, "
+            "File: %s, MaxBytes: %s, Backups: %s) ---",
+            log_file_path,
+            log_max_bytes,
+            log_backup_count,
         )
     # else: # Debug logging already goes to stdout
     #     logger.debug("--- Starting sologm session "
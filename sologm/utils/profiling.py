@@ -0,0 +1,280 @@
+"""Startup profiler for the sologm command line.
+
+Enabled with ``sologm --profile-startup``. Code marks the phases of a CLI
+invocation (imports, logging, config, database, command, ...) with
+``startup_profiler.phase(name)``; phases nest, and calls are no-ops while the
+profiler is disabled. When the command finishes, a timing tree is printed
+and, if requested, written to a cProfile (``.prof``) or speedscope
+(``.json``) file.
+
+This module only uses the standard library so it can be imported before
+anything else is loaded.
+"""
+
+import cProfile
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+PROFILE_OPTION = "--profile-startup"
+OUTPUT_OPTION = "--profile-output"
+
+# Width of the bar drawn next to each phase in the summary
+BAR_WIDTH = 30
+
+
+@dataclass
+class Phase:
+    """A timed span of the startup sequence.
+
+    Attributes:
+        name: Phase name
+        start: Start time, as returned by the profiler's clock
+        end: End time, or None while the phase is running
+        children: Phases started while this one was running
+    """
+
+    name: str
+    start: float
+    end: Optional[float] = None
+    children: List["Phase"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Length of the phase in seconds (0 while it is still running)."""
+        return (self.end - self.start) if self.end is not None else 0.0
+
+
+class StartupProfiler:
+    """Records nested phase timings and optional cProfile data."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Initialize a disabled profiler.
+
+        Args:
+            clock: Time source in seconds, replaceable in tests
+        """
+        self._clock = clock
+        self.enabled = False
+        self.output: Optional[Path] = None
+        self.root: Optional[Phase] = None
+        self.marks: List[Tuple[str, float]] = []
+        self._stack: List[Phase] = []
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def start(self, output: Optional[Path] = None) -> None:
+        """Start profiling, if not already started.
+
+        Args:
+            output: File to write at the end. A ``.prof`` suffix selects
+                cProfile data for the whole run; anything else gets a
+                speedscope file of the phases.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.output = output
+        self.root = Phase("sologm", self._clock())
+        self._stack = [self.root]
+        if output is not None and output.suffix == ".prof":
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def start_from_argv(self, argv: Sequence[str]) -> None:
+        """Start profiling if the command line asks for it.
+
+        Used by the entry point, before the application is imported, so the
+        import phase is included.
+
+        Args:
+            argv: Command-line arguments, without the program name
+        """
+        output: Optional[str] = None
+        requested = False
+        for index, arg in enumerate(argv):
+            if arg == PROFILE_OPTION:
+                requested = True
+            elif arg.startswith(OUTPUT_OPTION + "="):
+                output = arg.split("=", 1)[1]
+            elif arg == OUTPUT_OPTION and index + 1 < len(argv):
+                output = argv[index + 1]
+        if requested:
+            self.start(Path(output) if output else None)
+
+    def begin(self, name: str) -> None:
+        """Start a phase nested in the currently running one.
+
+        Args:
+            name: Phase name
+        """
+        if not self.enabled:
+            return
+        phase = Phase(name, self._clock())
+        self._stack[-1].children.append(phase)
+        self._stack.append(phase)
+
+    def end(self, name: str) -> None:
+        """End the named phase and any phases still running inside it.
+
+        Args:
+            name: Name passed to ``begin``
+        """
+        if not self.enabled or not self.running(name):
+            return
+        now = self._clock()
+        while True:
+            phase = self._stack.pop()
+            phase.end = now
+            if phase.name == name:
+                return
+
+    def running(self, name: str) -> bool:
+        """Check whether the named phase is currently running.
+
+        Args:
+            name: Phase name
+        """
+        return any(phase.name == name for phase in self._stack[1:])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase.
+
+        Args:
+            name: Phase name
+        """
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def mark(self, name: str) -> None:
+        """Record a point in time, such as the first database query.
+
+        Args:
+            name: Label for the mark
+        """
+        if self.enabled:
+            self.marks.append((name, self._clock()))
+
+    def finish(self, stream: TextIO) -> None:
+        """Stop profiling, print the summary and write the output file.
+
+        Args:
+            stream: Where to print the summary (normally stderr)
+        """
+        if not self.enabled:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        now = self._clock()
+        for phase in self._stack:
+            phase.end = now
+        self._stack = []
+        self.enabled = False
+
+        stream.write(self.format_summary())
+        if self.output is not None:
+            if self._cprofile is not None:
+                self._cprofile.dump_stats(str(self.output))
+            else:
+                self.output.write_text(json.dumps(self.to_speedscope()))
+            stream.write(f"Profile written to {self.output}\n")
+
+    def format_summary(self) -> str:
+        """Render the phase tree as text with a bar per phase.
+
+        Returns:
+            The summary, one line per phase.
+        """
+        root = self.root
+        if root is None:
+            return ""
+        total = root.duration or 1e-9
+        lines = [f"Startup profile: {root.duration * 1000:.1f} ms total"]
+
+        def visit(phase: Phase, depth: int) -> None:
+            share = phase.duration / total
+            bar = "█" * round(share * BAR_WIDTH)
+            label = "  " * depth + phase.name
+            lines.append(
+                f"  {label:<28} {phase.duration * 1000:9.1f} ms "
+                f"{share * 100:5.1f}%  {bar}"
+            )
+            for child in phase.children:
+                visit(child, depth + 1)
+            accounted = sum(child.duration for child in phase.children)
+            if phase.children and phase.duration - accounted > 0.0005:
+                other = Phase("(other)", 0.0, phase.duration - accounted)
+                visit(other, depth + 1)
+
+        for child in root.children:
+            visit(child, 0)
+        for name, at in self.marks:
+            lines.append(f"  {name} at +{(at - root.start) * 1000:.1f} ms")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """Convert the phase tree to a speedscope evented profile.
+
+        Returns:
+            A dict in the speedscope file format.
+        """
+        root = self.root
+        if root is None:
+            return {}
+        frames: List[Dict[str, str]] = []
+        frame_ids: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+
+        def frame(name: str) -> int:
+            if name not in frame_ids:
+                frame_ids[name] = len(frames)
+                frames.append({"name": name})
+            return frame_ids[name]
+
+        def _ms(at: Optional[float]) -> float:
+            return round(((at or root.start) - root.start) * 1000, 3)
+
+        def visit(phase: Phase) -> None:
+            frame_id = frame(phase.name)
+            events.append({"type": "O", "frame": frame_id, "at": _ms(phase.start)})
+            for child in phase.children:
+                visit(child)
+            events.append({"type": "C", "frame": frame_id, "at": _ms(phase.end)})
+
+        visit(root)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "sologm",
+            "name": "sologm startup",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": "sologm startup",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": _ms(root.end),
+                    "events": events,
+                }
+            ],
+        }
+
+
+# Process-wide profiler used by the CLI
+startup_profiler = StartupProfiler()
@@ -0,0 +1,61 @@
+"""Tests for event-loop aware blocking helpers."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import pytest
+
+pytest.importorskip("greenlet")
+
+from sqlalchemy.util import greenlet_spawn  # noqa: E402
+
+from sologm.utils.concurrency import (  # noqa: E402
+    call_blocking,
+    on_event_loop,
+    wait_all,
+)
+
+
+def test_helpers_call_directly_outside_the_loop():
+    """Test the helpers behave like the plain calls in sync code."""
+    assert not on_event_loop()
+    assert call_blocking(lambda x: x * 2, 21) == 42
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(time.sleep, 0.01) for _ in range(2)]
+        wait_all(futures)
+        assert all(future.done() for future in futures)
+
+
+def test_helpers_yield_to_the_loop():
+    """Test blocking waits inside run_sync let other tasks run."""
+    ticks: List[float] = []
+
+    async def slow(value: Any) -> Any:
+        await asyncio.sleep(0.1)
+        return value
+
+    def sync_work() -> Any:
+        assert on_event_loop()
+        result = call_blocking(lambda value: value, "sync", async_function=slow)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(time.sleep, 0.1)
+            wait_all([future])
+        return result, call_blocking(time.sleep, 0.1)
+
+    async def main() -> Any:
+        async def tick() -> None:
+            while True:
+                await asyncio.sleep(0.01)
+                ticks.append(time.perf_counter())
+
+        ticker = asyncio.create_task(tick())
+        result = await greenlet_spawn(sync_work)
+        ticker.cancel()
+        return result
+
+    assert asyncio.run(main()) == ("sync", None)
+    assert len(ticks) >= 15
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.08
@@ -4,9 +4,11 @@ import os
 import tempfile
 from pathlib import Path
 
+import pytest
 import yaml
 
 from sologm.utils.config import Config
+from sologm.utils.errors import ConfigError
 
 
 def test_config_initialization():
@@ -99,3 +101,78 @@ def test_config_environment_variables():
         # Clean up
         del os.environ["SOLOGM_TEST_KEY"]
         del os.environ["ANTHROPIC_API_KEY"]
+
+
+def test_config_env_override_after_load(monkeypatch):
+    """Test environment variables set after loading still take effect."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "config.yaml"
+        with open(temp_path, "w") as f:
+            yaml.dump({"anthropic_api_key": "file_api_key"}, f)
+
+        config = Config(temp_path)
+        assert config.get("anthropic_api_key") == "file_api_key"
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "env_api_key")
+        assert config.get("anthropic_api_key") == "env_api_key"
+
+        monkeypatch.setenv("SOLOGM_ANTHROPIC_API_KEY", "prefixed_api_key")
+        assert config.get("anthropic_api_key") == "prefixed_api_key"
+
+
+def test_config_snapshot_defaults():
+    """Test built-in defaults fill keys missing from the file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "config.yaml"
+        with open(temp_path, "w") as f:
+            yaml.dump({"oracle_retries": 4}, f)
+
+        config = Config(temp_path)
+
+        assert config.snapshot["oracle_retries"] == 4
+        assert config.snapshot["default_interpretations"] == 5
+        with pytest.raises(TypeError):
+            config.snapshot["oracle_retries"] = 1  # type: ignore[index]
+
+
+def test_config_typed_accessors(monkeypatch):
+    """Test typed accessors convert values and fall back to defaults."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "config.yaml"
+        with open(temp_path, "w") as f:
+            yaml.dump({"retries": "3", "flag": "yes", "bad_int": "many"}, f)
+
+        config = Config(temp_path)
+
+        assert config.get_int("retries") == 3
+        assert config.get_int("missing", 7) == 7
+        assert config.get_bool("flag") is True
+        assert config.get_bool("missing", True) is True
+        assert config.get_str("retries") == "3"
+        assert config.get_str("missing") is None
+        with pytest.raises(ConfigError):
+            config.get_int("bad_int")
+
+        monkeypatch.setenv("SOLOGM_FLAG", "false")
+        assert config.get_bool("flag") is False
+
+
+def test_config_refresh_if_changed():
+    """Test the snapshot is rebuilt only when the file's mtime changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir) / "config.yaml"
+        with open(temp_path, "w") as f:
+            yaml.dump({"test_key": "old"}, f)
+
+        config = Config(temp_path)
+        assert config.refresh_if_changed() is False
+
+        with open(temp_path, "w") as f:
+            yaml.dump({"test_key": "new"}, f)
+        stat = temp_path.stat()
+        os.utime(temp_path, (stat.st_atime, stat.st_mtime + 5))
+
+        assert config.get("test_key") == "old"
+        assert config.refresh_if_changed() is True
+        assert config.get("test_key") == "new"
+        assert config.refresh_if_changed() is False
@@ -0,0 +1,96 @@
+"""Tests for logging utilities."""
+
+import logging
+import logging.handlers
+from pathlib import Path
+
+import pytest
+
+from sologm.utils import logger as logger_module
+from sologm.utils.config import Config
+from sologm.utils.logger import (
+    LazyValue,
+    debug_enabled,
+    setup_root_logger,
+    stop_queue_listener,
+)
+
+
+@pytest.fixture
+def app_logger(monkeypatch, tmp_path: Path):
+    """Point logging config at a temp dir and restore the app logger after."""
+    config = Config(tmp_path / "config.yaml")
+    config.set("log_file_path", str(tmp_path / "sologm.log"))
+    monkeypatch.setattr(logger_module, "get_config", lambda: config)
+    monkeypatch.delenv("SOLOGM_DEBUG", raising=False)
+
+    app_logger = logging.getLogger("sologm")
+    saved_handlers, saved_level = app_logger.handlers[:], app_logger.level
+    yield app_logger
+
+    stop_queue_listener()
+    for handler in app_logger.handlers[:]:
+        app_logger.removeHandler(handler)
+    for handler in saved_handlers:
+        app_logger.addHandler(handler)
+    app_logger.setLevel(saved_level)
+
+
+def test_file_logging_goes_through_queue(app_logger, tmp_path: Path):
+    """Test non-debug mode writes the log file from a background listener."""
+    setup_root_logger(debug=False)
+
+    assert len(app_logger.handlers) == 1
+    assert isinstance(app_logger.handlers[0], logging.handlers.QueueHandler)
+
+    logging.getLogger("sologm.test").info("Rolled %s for %s", "2d6", "combat")
+    stop_queue_listener()
+
+    contents = (tmp_path / "sologm.log").read_text()
+    assert "Rolled 2d6 for combat" in contents
+
+
+def test_unset_log_path_uses_default(app_logger, tmp_path: Path):
+    """Test an empty log_file_path falls back to the default log file."""
+    config = logger_module.get_config()
+    config.base_dir = tmp_path
+    config.set("log_file_path", "")
+    setup_root_logger(debug=False)
+
+    logging.getLogger("sologm.test").info("Fallback path")
+    stop_queue_listener()
+
+    assert "Fallback path" in (tmp_path / "sologm.log").read_text()
+
+
+def test_reconfigure_replaces_listener(app_logger):
+    """Test repeated setup doesn't stack handlers or leak listener threads."""
+    setup_root_logger(debug=False)
+    first = logger_module._queue_listener
+    setup_root_logger(debug=False)
+
+    assert logger_module._queue_listener is not first
+    assert len(app_logger.handlers) == 1
+
+    setup_root_logger(debug=True)
+    assert logger_module._queue_listener is None
+    assert isinstance(app_logger.handlers[0], logging.StreamHandler)
+
+
+def test_lazy_value_only_evaluated_when_emitted(app_logger):
+    """Test LazyValue arguments are skipped for disabled levels."""
+    calls = []
+
+    def expensive() -> str:
+        calls.append(1)
+        return "summary"
+
+    setup_root_logger(debug=False)
+    log = logging.getLogger("sologm.test")
+
+    assert not debug_enabled(log)
+    log.debug("Context: %s", LazyValue(expensive))
+    assert calls == []
+
+    log.info("Context: %s", LazyValue(expensive))
+    assert calls
@@ -0,0 +1,110 @@
+"""Tests for the startup profiler."""
+
+import io
+import json
+from pathlib import Path
+from typing import Optional
+
+from sologm.utils.profiling import StartupProfiler
+
+
+class FakeClock:
+    """Clock advanced by the test, in seconds."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _profile(clock: FakeClock, output: Optional[Path] = None) -> StartupProfiler:
+    """Record imports (0-0.3s) and database (0.3-0.5s) with a nested phase."""
+    profiler = StartupProfiler(clock=clock)
+    profiler.start(output)
+    with profiler.phase("imports"):
+        clock.now = 0.3
+    profiler.begin("database")
+    profiler.begin("create_tables")
+    clock.now = 0.4
+    profiler.mark("first query")
+    clock.now = 0.5
+    # Ending the outer phase also ends phases still running inside it
+    profiler.end("database")
+    return profiler
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    """Test phases are ignored until the profiler is started."""
+    profiler = StartupProfiler()
+    with profiler.phase("imports"):
+        pass
+    profiler.finish(io.StringIO())
+
+    assert profiler.root is None
+
+
+def test_start_from_argv() -> None:
+    """Test the entry point only starts profiling when asked."""
+    profiler = StartupProfiler()
+    profiler.start_from_argv(["game", "list"])
+    assert not profiler.enabled
+
+    profiler.start_from_argv(["--profile-startup", "--profile-output=out.json"])
+    assert profiler.enabled
+    assert profiler.output == Path("out.json")
+
+
+def test_summary_shows_nested_phases() -> None:
+    """Test the summary lists phases, nesting and marks."""
+    clock = FakeClock()
+    profiler = _profile(clock)
+    clock.now = 1.0
+    stream = io.StringIO()
+    profiler.finish(stream)
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == "Startup profile: 1000.0 ms total"
+    assert lines[1].split()[:4] == ["imports", "300.0", "ms", "30.0%"]
+    assert lines[2].split()[:2] == ["database", "200.0"]
+    assert lines[3].split()[:2] == ["create_tables", "200.0"]
+    assert lines[3].startswith("    ")
+    assert lines[4].strip() == "first query at +400.0 ms"
+
+
+def test_speedscope_output(tmp_path: Path) -> None:
+    """Test phases are written as a balanced speedscope event list."""
+    clock = FakeClock()
+    output = tmp_path / "startup.json"
+    profiler = _profile(clock, output)
+    profiler.finish(io.StringIO())
+
+    data = json.loads(output.read_text())
+    frames = [frame["name"] for frame in data["shared"]["frames"]]
+    events = [
+        (event["type"], frames[event["frame"]], event["at"])
+        for event in data["profiles"][0]["events"]
+    ]
+    assert events == [
+        ("O", "sologm", 0.0),
+        ("O", "imports", 0.0),
+        ("C", "imports", 300.0),
+        ("O", "database", 300.0),
+        ("O", "create_tables", 300.0),
+        ("C", "create_tables", 500.0),
+        ("C", "database", 500.0),
+        ("C", "sologm", 500.0),
+    ]
+
+
+def test_cprofile_output(tmp_path: Path) -> None:
+    """Test a .prof output file gets cProfile statistics."""
+    import pstats
+
+    output = tmp_path / "startup.prof"
+    profiler = StartupProfiler()
+    profiler.start(output)
+    sorted(range(100))
+    profiler.finish(io.StringIO())
+
+    assert pstats.Stats(str(output)).total_calls > 0